@@ -0,0 +1,110 @@
+"""
+Micro-benchmark for the span payload JSON serializer.
+
+Compares the previous approach (`json.dumps` with a `default` hook calling
+`model_dump()` on pydantic models) with `GentraceJSONSerializer` using the standard
+library backend, and the orjson backend when `orjson` is installed. Payloads are
+shaped like typical LLM function inputs and outputs: chat message lists, pydantic
+response models and large documents (the latter with and without a size limit).
+
+Usage:
+    python scripts/benchmarks/json_serializer.py [--repeat N]
+"""
+
+import json
+import argparse
+from time import perf_counter
+from typing import Any, Dict, List, Callable, Optional
+from datetime import datetime
+
+from pydantic import BaseModel
+
+from gentrace.lib.serialization import GentraceJSONSerializer, orjson_available
+
+
+class Usage(BaseModel):
+    prompt_tokens: int
+    completion_tokens: int
+
+
+class Choice(BaseModel):
+    index: int
+    message: Dict[str, str]
+    finish_reason: str
+
+
+class Completion(BaseModel):
+    id: str
+    created: datetime
+    model: str
+    choices: List[Choice]
+    usage: Usage
+
+
+def _baseline_dumps(value: Any) -> str:
+    def default(obj: Any) -> Any:
+        if isinstance(obj, BaseModel):
+            return obj.model_dump()
+        return str(obj)
+
+    return json.dumps(value, default=default)
+
+
+def build_payloads() -> Dict[str, Any]:
+    messages = [
+        {"role": "system", "content": "You are a helpful assistant. " * 10},
+        *(
+            {"role": "user" if i % 2 else "assistant", "content": f"Message {i}: " + "lorem ipsum " * 40}
+            for i in range(20)
+        ),
+    ]
+    completion = Completion(
+        id="chatcmpl-123",
+        created=datetime(2024, 1, 1),
+        model="gpt-4o",
+        choices=[
+            Choice(index=i, message={"role": "assistant", "content": "An answer. " * 50}, finish_reason="stop")
+            for i in range(4)
+        ],
+        usage=Usage(prompt_tokens=812, completion_tokens=256),
+    )
+    return {
+        "chat messages": [messages, {"temperature": 0.2, "max_tokens": 512}],
+        "pydantic completion": completion,
+        "large document": [{"document": "A long retrieved document. " * 200_000}],
+    }
+
+
+def bench(fn: Callable[[Any], str], value: Any, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        fn(value)
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=20, help="Number of timed runs per payload (best is reported)")
+    options = parser.parse_args()
+
+    limit = 1024 * 1024
+    contenders: Dict[str, Callable[[Any], str]] = {"json.dumps + model_dump": _baseline_dumps}
+    backends: List[Optional[str]] = ["json", "orjson" if orjson_available() else None]
+    for backend in backends:
+        if backend is None:
+            continue
+        unbounded = GentraceJSONSerializer(backend=backend)  # type: ignore[arg-type]
+        bounded = GentraceJSONSerializer(backend=backend, max_bytes=limit)  # type: ignore[arg-type]
+        contenders[f"serializer ({backend})"] = unbounded.dumps
+        contenders[f"serializer ({backend}, 1 MiB cap)"] = bounded.dumps
+
+    for name, payload in build_payloads().items():
+        print(f"{name}:")
+        for label, fn in contenders.items():
+            print(f"  {label:<32} {bench(fn, payload, options.repeat) * 1e6:>12,.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Micro-benchmark for validating eval_dataset test case inputs against a schema.
+
+Validates 10k test case inputs against a TypedDict and a pydantic model schema and
+reports the cost per case of:
+
+- the previous approach, which built a new `TypeAdapter` for every TypedDict case
+  and checked the schema kind and pydantic version each time;
+- a `SchemaValidator` compiled once per schema, validating case by case (the path
+  used for streamed datasets);
+- `SchemaValidator.validate_many`, validating all inputs with one
+  `TypeAdapter(List[schema])` call (the path used for in-memory datasets).
+
+Usage:
+    python scripts/benchmarks/schema_validation.py [--cases N]
+"""
+
+import argparse
+from time import perf_counter
+from typing import Any, Dict, List, Callable
+from typing_extensions import TypedDict, is_typeddict
+
+from pydantic import BaseModel, TypeAdapter
+
+from gentrace.lib.schema_validation import SchemaValidator
+
+
+class QueryDict(TypedDict):
+    query: str
+    top_k: int
+    filters: Dict[str, str]
+
+
+class QueryModel(BaseModel):
+    query: str
+    top_k: int
+    filters: Dict[str, str]
+
+
+def validate_before(inputs: Dict[str, Any], schema: Any) -> Any:
+    from pydantic import VERSION
+
+    if is_typeddict(schema):
+        return dict(TypeAdapter(schema).validate_python(inputs))
+    if VERSION.startswith("1."):
+        return schema.parse_obj(inputs).dict()
+    return schema.model_validate(inputs).model_dump()
+
+
+def per_case_us(fn: Callable[[], Any], cases: int) -> float:
+    best = float("inf")
+    for _ in range(3):
+        start = perf_counter()
+        fn()
+        best = min(best, perf_counter() - start)
+    return best / cases * 1e6
+
+
+def report(schema: Any, inputs: List[Dict[str, Any]]) -> None:
+    cases = len(inputs)
+    validator = SchemaValidator(schema)
+    assert validator.validate_many(inputs) == [validator.validate(case) for case in inputs]
+
+    results = {
+        "before (per case)": per_case_us(lambda: [validate_before(case, schema) for case in inputs], cases),
+        "compiled (per case)": per_case_us(lambda: [validator.validate(case) for case in inputs], cases),
+        "compiled (batch)": per_case_us(lambda: validator.validate_many(inputs), cases),
+    }
+    print(f"{schema.__name__} ({cases} cases)")
+    for label, micros in results.items():
+        print(f"  {label:<22} {micros:>8.2f} us/case")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cases", type=int, default=10_000, help="Test cases per timed run (best of 3 is reported)")
+    options = parser.parse_args()
+
+    inputs: List[Dict[str, Any]] = [
+        {"query": f"question {i}", "top_k": i % 10, "filters": {"lang": "en"}} for i in range(options.cases)
+    ]
+
+    for schema in (QueryDict, QueryModel):
+        report(schema, inputs)
+
+
+if __name__ == "__main__":
+    main()
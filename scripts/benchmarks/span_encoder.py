@@ -0,0 +1,79 @@
+"""
+Micro-benchmark for the vendored OTLP span encoder.
+
+Builds batches of spans shaped like the ones produced by @interaction / @traced
+(a handful of attributes plus gentrace.fn.args / gentrace.fn.output events) and
+reports how many spans per second `_encode_spans(...).SerializePartialToString()`
+can process.
+
+Usage:
+    python scripts/benchmarks/span_encoder.py [--repeat N]
+"""
+
+import json
+import argparse
+from time import perf_counter
+from typing import List, Sequence
+
+from opentelemetry.sdk.trace import ReadableSpan, TracerProvider
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult, SimpleSpanProcessor
+
+from gentrace.lib.vendored_otlp_exporter import GentraceVendoredOTLPSpanExporter
+
+
+class _CollectingExporter(SpanExporter):
+    def __init__(self) -> None:
+        self.spans: List[ReadableSpan] = []
+
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        self.spans.extend(spans)
+        return SpanExportResult.SUCCESS
+
+
+def build_spans(count: int) -> List[ReadableSpan]:
+    collector = _CollectingExporter()
+    provider = TracerProvider(resource=Resource.create({"service.name": "benchmark", "deployment.environment": "dev"}))
+    provider.add_span_processor(SimpleSpanProcessor(collector))
+    tracer = provider.get_tracer("gentrace")
+
+    args = json.dumps([{"prompt": "Summarize the following document. " * 20}, {"temperature": 0.2}])
+    output = json.dumps({"text": "A short summary of the document. " * 10, "tokens": 128})
+
+    for i in range(count):
+        with tracer.start_as_current_span(f"interaction-{i % 10}") as span:
+            span.set_attribute("gentrace.pipeline_id", "76ecc73d-3419-431f-aafc-93a9d1af1b83")
+            span.set_attribute("gentrace.sample", "true")
+            span.set_attribute("llm.token_count", 128)
+            span.set_attribute("llm.temperature", 0.2)
+            span.set_attribute("llm.stop", ["\n\n", "###"])
+            span.add_event("gentrace.fn.args", {"args": args})
+            span.add_event("gentrace.fn.output", {"output": output})
+
+    provider.shutdown()
+    return collector.spans
+
+
+def bench(exporter: GentraceVendoredOTLPSpanExporter, spans: List[ReadableSpan], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        exporter._encode_spans(spans).SerializePartialToString()
+        best = min(best, perf_counter() - start)
+    return len(spans) / best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timed runs per batch size (best is reported)")
+    options = parser.parse_args()
+
+    exporter = GentraceVendoredOTLPSpanExporter(endpoint="http://localhost:4318/v1/traces")
+    for size in (1_000, 10_000):
+        spans = build_spans(size)
+        print(f"{size:>6} spans: {bench(exporter, spans, options.repeat):>12,.0f} spans/sec")
+    exporter.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Micro-benchmark for the per-call overhead of @traced.
+
+Decorates a no-op function taking a few positional and keyword arguments and
+reports the cost per call of:
+
+- the undecorated function;
+- the @traced function when GentraceSampler drops the span (the unsampled hot
+  path, which should cost little more than the undecorated call);
+- the @traced function when the span is sampled, with an SDK tracer provider that
+  has no span processors (so span export does not contribute);
+- argument capture alone, comparing the previous per-call
+  `inspect.signature(fn).bind(...)` + `[{k: v}]` list approach with the binding
+  plan that @traced now computes once at decoration time.
+
+Usage:
+    python scripts/benchmarks/traced_overhead.py [--calls N]
+"""
+
+import inspect
+import argparse
+from time import perf_counter
+from typing import Any, Callable
+
+from opentelemetry import trace, baggage as otel_baggage, context as otel_context
+from opentelemetry.sdk.trace import TracerProvider
+
+from gentrace.lib.utils import _gentrace_event_json_dumps, _gentrace_arguments_json_dumps
+from gentrace.lib.traced import traced
+from gentrace.lib.sampler import GentraceSampler
+from gentrace.lib.constants import ATTR_GENTRACE_SAMPLE_KEY
+from gentrace.lib.argument_binding import ArgumentBinder
+
+
+def noop(prompt: str, temperature: float = 0.0, *, model: str = "gpt-4o", max_tokens: int = 256) -> None:  # noqa: ARG001
+    return None
+
+
+def per_call_us(fn: Callable[[], Any], calls: int) -> float:
+    best = float("inf")
+    for _ in range(5):
+        start = perf_counter()
+        for _ in range(calls):
+            fn()
+        best = min(best, perf_counter() - start)
+    return best / calls * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=20_000, help="Calls per timed run (best of 5 runs is reported)")
+    options = parser.parse_args()
+
+    trace.set_tracer_provider(TracerProvider(sampler=GentraceSampler()))
+    traced_noop = traced()(noop)
+    binder = ArgumentBinder(noop)
+    args = ("Summarize the document.",)
+    kwargs = {"model": "gpt-4o-mini", "max_tokens": 128}
+
+    def capture_before() -> str:
+        bound_arguments = inspect.signature(noop).bind(*args, **kwargs).arguments
+        return _gentrace_event_json_dumps([{k: v} for k, v in bound_arguments.items()])
+
+    def capture_after() -> str:
+        return _gentrace_arguments_json_dumps(binder.bind(args, kwargs))
+
+    assert capture_before() == capture_after()
+
+    def sampled_call() -> None:
+        token = otel_context.attach(otel_baggage.set_baggage(ATTR_GENTRACE_SAMPLE_KEY, "true"))
+        try:
+            traced_noop(*args, **kwargs)
+        finally:
+            otel_context.detach(token)
+
+    results = {
+        "undecorated call": per_call_us(lambda: noop(*args, **kwargs), options.calls),
+        "@traced call (unsampled)": per_call_us(lambda: traced_noop(*args, **kwargs), options.calls),
+        "@traced call (sampled)": per_call_us(sampled_call, options.calls),
+        "argument capture (before)": per_call_us(capture_before, options.calls),
+        "argument capture (after)": per_call_us(capture_after, options.calls),
+    }
+    for label, micros in results.items():
+        print(f"{label:<28} {micros:>8.2f} us/call")
+
+
+if __name__ == "__main__":
+    main()
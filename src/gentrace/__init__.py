@@ -99,7 +99,14 @@ organizations_async = _t.cast(AsyncOrganizationsResource, _ResourceWrapper(_get_
 from .types import Dataset, Pipeline, TestCase, Experiment
 from .lib.eval import eval
 from .lib.init import init
-from .lib.types import OtelConfigOptions
+from .lib.types import (
+    RetryOptions,
+    RateLimitOptions,
+    SpanSpoolOptions,
+    OtelConfigOptions,
+    BatchSpanProcessorOptions,
+    AdaptiveConcurrencyOptions,
+)
 from .lib.traced import traced
 from .lib.sampler import GentraceSampler
 from .lib.constants import (
@@ -113,10 +120,20 @@ from .lib.constants import (
     ATTR_GENTRACE_FN_OUTPUT_EVENT_NAME,
 )
 from .lib.experiment import experiment
+from .lib.memo_cache import MemoCache
 from .lib.otel_setup import setup
 from .lib.interaction import interaction
-from .lib.eval_dataset import TestInput, eval_dataset
+from .lib.eval_dataset import (
+    TestInput,
+    EvalCaseTiming,
+    EvalDatasetResult,
+    EvalCaseTimeoutError,
+    eval_dataset,
+    eval_dataset_iter,
+)
 from .lib.span_processor import GentraceSpanProcessor
+from .lib.stream_capture import TextReducer, StreamReducer, BoundedListReducer
+from .lib.batch_span_processor import GentraceBatchSpanProcessor
 from .lib.custom_otlp_exporter import GentraceOTLPSpanExporter
 
 ### End custom Gentrace imports
@@ -169,6 +186,10 @@ __all__ = [
     "experiment",
     "eval",
     "eval_dataset",
+    "eval_dataset_iter",
+    "EvalDatasetResult",
+    "EvalCaseTiming",
+    "EvalCaseTimeoutError",
     "TestInput",
     "ATTR_GENTRACE_SAMPLE_KEY",
     "ATTR_GENTRACE_IN_EXPERIMENT",
@@ -180,13 +201,23 @@ __all__ = [
     "ATTR_GENTRACE_TEST_CASE_NAME",
     "ATTR_GENTRACE_SAMPLE_KEY",
     "GentraceSampler",
+    "StreamReducer",
+    "BoundedListReducer",
+    "TextReducer",
+    "MemoCache",
     "GentraceSpanProcessor",
     "GentraceOTLPSpanExporter",
+    "GentraceBatchSpanProcessor",
     "TestCase",
     "Experiment",
     "Dataset",
     "Pipeline",
     "OtelConfigOptions",
+    "BatchSpanProcessorOptions",
+    "SpanSpoolOptions",
+    "RateLimitOptions",
+    "RetryOptions",
+    "AdaptiveConcurrencyOptions",
     # End custom Gentrace exports
 ]
 
@@ -0,0 +1,131 @@
+"""
+Argument Binding for Traced Functions
+
+`@traced` records the arguments of every call as `[{"param": value}, ...]`, in
+parameter order and limited to the arguments that were actually passed, which is
+what `inspect.signature(fn).bind(*args, **kwargs).arguments` returns. Computing the
+signature is expensive and its result never changes for a function, so
+`ArgumentBinder` inspects it once at decoration time and precompiles a binding plan.
+Calls that do not fit the plan (e.g. missing or duplicate arguments) are handed to
+`Signature.bind`, which raises the same `TypeError` it always did.
+"""
+
+import inspect
+from typing import Any, Dict, List, Tuple, Callable, Optional
+
+_POSITIONAL_KINDS = (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+
+
+class ArgumentBinder:
+    """Binds call arguments to the parameter names of one function using a precompiled plan."""
+
+    __slots__ = (
+        "_signature",
+        "_positional",
+        "_positional_only",
+        "_required_positional",
+        "_var_positional",
+        "_keyword_only",
+        "_required_keyword_only",
+        "_var_keyword",
+        "_defaults",
+    )
+
+    def __init__(self, fn: Callable[..., Any]) -> None:
+        self._signature: Optional[inspect.Signature]
+        try:
+            self._signature = inspect.signature(fn)
+        except (TypeError, ValueError):
+            # No introspectable signature (some builtins); arguments are recorded as-is
+            self._signature = None
+
+        parameters = list(self._signature.parameters.values()) if self._signature is not None else []
+        positional = [p for p in parameters if p.kind in _POSITIONAL_KINDS]
+        keyword_only = [p for p in parameters if p.kind == inspect.Parameter.KEYWORD_ONLY]
+
+        self._positional: Tuple[str, ...] = tuple(p.name for p in positional)
+        self._positional_only = frozenset(p.name for p in positional if p.kind == inspect.Parameter.POSITIONAL_ONLY)
+        # Positional parameters with defaults always follow the required ones
+        self._required_positional = sum(1 for p in positional if p.default is inspect.Parameter.empty)
+        self._keyword_only: Tuple[str, ...] = tuple(p.name for p in keyword_only)
+        self._required_keyword_only = frozenset(p.name for p in keyword_only if p.default is inspect.Parameter.empty)
+        self._var_positional: Optional[str] = next(
+            (p.name for p in parameters if p.kind == inspect.Parameter.VAR_POSITIONAL), None
+        )
+        self._var_keyword: Optional[str] = next(
+            (p.name for p in parameters if p.kind == inspect.Parameter.VAR_KEYWORD), None
+        )
+        self._defaults: Tuple[Tuple[str, Any], ...] = tuple(
+            (p.name, p.default) for p in parameters if p.default is not inspect.Parameter.empty
+        )
+
+    @property
+    def defaults(self) -> Tuple[Tuple[str, Any], ...]:
+        """The (parameter name, default value) pairs of the parameters that have defaults."""
+        return self._defaults
+
+    def bind(self, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> List[Tuple[str, Any]]:
+        """
+        Return the (parameter name, value) pairs for a call, in parameter order.
+
+        Raises:
+            TypeError: If the arguments do not match the function's signature.
+        """
+        if self._signature is None:
+            return [("args", args), ("kwargs", kwargs)]
+
+        count = len(args)
+        positional = self._positional
+        if not kwargs and self._required_positional <= count and not self._required_keyword_only:
+            if count <= len(positional):
+                return list(zip(positional, args))
+            if self._var_positional is not None:
+                pairs = list(zip(positional, args))
+                pairs.append((self._var_positional, args[len(positional) :]))
+                return pairs
+            return self._bind_slow(args, kwargs)
+
+        return self._bind_with_keywords(args, kwargs)
+
+    def _bind_with_keywords(self, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> List[Tuple[str, Any]]:
+        count = len(args)
+        positional = self._positional
+        if count > len(positional) and self._var_positional is None:
+            return self._bind_slow(args, kwargs)
+
+        pairs: List[Tuple[str, Any]] = []
+        consumed: List[str] = []
+        for index, name in enumerate(positional):
+            by_keyword = name in kwargs and name not in self._positional_only
+            if index < count:
+                if by_keyword:
+                    return self._bind_slow(args, kwargs)
+                pairs.append((name, args[index]))
+            elif by_keyword:
+                pairs.append((name, kwargs[name]))
+                consumed.append(name)
+            elif index < self._required_positional:
+                return self._bind_slow(args, kwargs)
+
+        if count > len(positional) and self._var_positional is not None:
+            pairs.append((self._var_positional, args[len(positional) :]))
+
+        for name in self._keyword_only:
+            if name in kwargs:
+                pairs.append((name, kwargs[name]))
+                consumed.append(name)
+            elif name in self._required_keyword_only:
+                return self._bind_slow(args, kwargs)
+
+        if len(consumed) < len(kwargs):
+            if self._var_keyword is None:
+                return self._bind_slow(args, kwargs)
+            pairs.append((self._var_keyword, {k: v for k, v in kwargs.items() if k not in consumed}))
+        return pairs
+
+    def _bind_slow(self, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> List[Tuple[str, Any]]:
+        assert self._signature is not None
+        return list(self._signature.bind(*args, **kwargs).arguments.items())
+
+
+__all__ = ["ArgumentBinder"]
@@ -0,0 +1,301 @@
+"""
+Batching Span Processor for Gentrace
+
+This processor buffers finished spans in a bounded in-memory queue and exports
+them from a background thread, so that `span.end()` on the request path never
+performs network I/O. Batches are flushed when either the configured batch size
+is reached or the schedule delay elapses, whichever comes first.
+"""
+
+import os
+import logging
+import weakref
+import threading
+from time import monotonic
+from typing import List, Optional
+from collections import deque
+from typing_extensions import Literal, override
+
+from opentelemetry.context import Context
+from opentelemetry.sdk.trace import Span, ReadableSpan, SpanProcessor
+from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
+
+_logger = logging.getLogger(__name__)
+
+QueueFullPolicy = Literal["drop_oldest", "block"]
+
+DEFAULT_MAX_QUEUE_SIZE = 2048
+DEFAULT_MAX_EXPORT_BATCH_SIZE = 512
+DEFAULT_SCHEDULE_DELAY_MILLIS = 5000
+DEFAULT_EXPORT_TIMEOUT_MILLIS = 30000
+
+
+class GentraceBatchSpanProcessor(SpanProcessor):
+    """
+    A span processor that batches finished spans and exports them asynchronously.
+
+    Spans are appended to a bounded queue from `on_end()` and shipped by a single
+    daemon thread. When the queue is full, the `queue_full_policy` decides whether
+    the oldest queued span is discarded ("drop_oldest", the default) or whether the
+    caller waits for room ("block").
+
+    The processor keeps running counters of exported and dropped spans, which can be
+    used to monitor whether the queue is sized appropriately for the span volume.
+    """
+
+    def __init__(
+        self,
+        span_exporter: SpanExporter,
+        *,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        max_export_batch_size: int = DEFAULT_MAX_EXPORT_BATCH_SIZE,
+        schedule_delay_millis: float = DEFAULT_SCHEDULE_DELAY_MILLIS,
+        export_timeout_millis: float = DEFAULT_EXPORT_TIMEOUT_MILLIS,
+        queue_full_policy: QueueFullPolicy = "drop_oldest",
+    ) -> None:
+        """
+        Initialize the batching processor and start its export thread.
+
+        Args:
+            span_exporter: The exporter that receives each batch of spans.
+            max_queue_size: Maximum number of spans buffered in memory.
+            max_export_batch_size: Maximum number of spans handed to the exporter at once.
+                                   Reaching this many queued spans triggers an export.
+            schedule_delay_millis: Maximum time a span waits in the queue before export.
+            export_timeout_millis: Default timeout used by `force_flush()`.
+            queue_full_policy: Either "drop_oldest" or "block".
+        """
+        if max_queue_size <= 0:
+            raise ValueError("max_queue_size must be a positive integer.")
+        if max_export_batch_size <= 0:
+            raise ValueError("max_export_batch_size must be a positive integer.")
+        if max_export_batch_size > max_queue_size:
+            raise ValueError("max_export_batch_size must be less than or equal to max_queue_size.")
+        if schedule_delay_millis <= 0:
+            raise ValueError("schedule_delay_millis must be positive.")
+        if queue_full_policy not in ("drop_oldest", "block"):
+            raise ValueError(f"Unknown queue_full_policy '{queue_full_policy}'. Use 'drop_oldest' or 'block'.")
+
+        self._exporter = span_exporter
+        self._max_queue_size = max_queue_size
+        self._max_export_batch_size = max_export_batch_size
+        self._schedule_delay = schedule_delay_millis / 1e3
+        self._export_timeout_millis = export_timeout_millis
+        self._queue_full_policy = queue_full_policy
+
+        self._queue: "deque[ReadableSpan]" = deque()
+        self._condition = threading.Condition(threading.Lock())
+        self._flush_waiters: List[threading.Event] = []
+        self._export_in_progress = False
+        self._shutdown = False
+
+        self._dropped_spans = 0
+        self._exported_spans = 0
+        self._failed_spans = 0
+
+        self._worker_thread = self._start_worker()
+
+        if hasattr(os, "register_at_fork"):
+            # Fork handlers cannot be unregistered; a weak reference lets a shut down processor be collected
+            weak_reinit = weakref.WeakMethod(self._at_fork_reinit)
+
+            def reinit_in_child() -> None:
+                reinit = weak_reinit()
+                if reinit is not None:
+                    reinit()
+
+            os.register_at_fork(after_in_child=reinit_in_child)
+
+    # Public counters
+
+    @property
+    def dropped_spans(self) -> int:
+        """Number of spans discarded because the queue was full or the processor was shut down."""
+        return self._dropped_spans
+
+    @property
+    def exported_spans(self) -> int:
+        """Number of spans the exporter reported as exported successfully."""
+        return self._exported_spans
+
+    @property
+    def failed_spans(self) -> int:
+        """Number of spans the exporter reported as failed."""
+        return self._failed_spans
+
+    @property
+    def queue_size(self) -> int:
+        """Number of spans currently waiting in the queue."""
+        return len(self._queue)
+
+    # SpanProcessor interface
+
+    @override
+    def on_start(self, span: Span, parent_context: Optional[Context] = None) -> None:
+        """Nothing to do when a span starts."""
+        pass
+
+    @override
+    def on_end(self, span: ReadableSpan) -> None:
+        """Enqueue a finished span for export without blocking on network I/O."""
+        if span.context is None or not span.context.trace_flags.sampled:
+            return
+
+        with self._condition:
+            if self._shutdown:
+                self._dropped_spans += 1
+                _logger.warning("Span processor already shutdown, dropping span")
+                return
+
+            if len(self._queue) >= self._max_queue_size:
+                if self._queue_full_policy == "block":
+                    while len(self._queue) >= self._max_queue_size and not self._shutdown:
+                        self._condition.notify_all()
+                        self._condition.wait()
+                    if self._shutdown:
+                        self._dropped_spans += 1
+                        return
+                else:
+                    self._queue.popleft()
+                    self._dropped_spans += 1
+
+            self._queue.append(span)
+
+            if len(self._queue) >= self._max_export_batch_size:
+                self._condition.notify_all()
+
+    @override
+    def force_flush(self, timeout_millis: Optional[int] = None) -> bool:
+        """
+        Export every span queued at the time of the call.
+
+        Returns:
+            True if the queue was drained within the timeout, False otherwise.
+        """
+        timeout = (timeout_millis if timeout_millis is not None else self._export_timeout_millis) / 1e3
+
+        with self._condition:
+            if self._shutdown:
+                return True
+            flushed: Optional[threading.Event] = None
+            if self._queue or self._export_in_progress:
+                flushed = threading.Event()
+                self._flush_waiters.append(flushed)
+                self._condition.notify_all()
+
+        if flushed is not None and not flushed.wait(timeout):
+            _logger.warning("Timeout was exceeded in force_flush().")
+            return False
+
+        # The exporter may still have requests in flight on its own worker threads
+
+        # The base SpanExporter.force_flush() returns None, so only an explicit False is a failure
+        return self._exporter.force_flush(int(timeout * 1e3)) is not False
+
+    @override
+    def shutdown(self) -> None:
+        """Stop the export thread after draining the queue, then shut down the exporter."""
+        with self._condition:
+            if self._shutdown:
+                return
+            self._shutdown = True
+            self._condition.notify_all()
+
+        self._worker_thread.join()
+        self._exporter.shutdown()
+
+    # Worker thread
+
+    def _start_worker(self) -> threading.Thread:
+        thread = threading.Thread(
+            name="GentraceBatchSpanProcessor",
+            target=self._worker,
+            daemon=True,
+        )
+        thread.start()
+        return thread
+
+    def _at_fork_reinit(self) -> None:
+        """Reset locks and restart the worker in a forked child process."""
+        self._condition = threading.Condition(threading.Lock())
+        self._queue.clear()
+        self._flush_waiters = []
+        self._export_in_progress = False
+        self._worker_thread = self._start_worker()
+
+    def _worker(self) -> None:
+        deadline = monotonic() + self._schedule_delay
+
+        while True:
+            with self._condition:
+                while not self._shutdown and not self._flush_waiters and len(self._queue) < self._max_export_batch_size:
+                    remaining = deadline - monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+
+                shutting_down = self._shutdown
+                waiters = self._flush_waiters
+                self._flush_waiters = []
+
+            # Flush requests and shutdown drain the whole queue
+            self._export_batches(drain=shutting_down or bool(waiters))
+            deadline = monotonic() + self._schedule_delay
+
+            for waiter in waiters:
+                waiter.set()
+
+            if shutting_down:
+                return
+
+    def _export_batches(self, *, drain: bool) -> None:
+        """
+        Export queued spans in batches of at most `max_export_batch_size`.
+
+        Always exports at least one (possibly partial) batch. Keeps going while full
+        batches remain, or until the queue is empty when `drain` is set.
+        """
+        while True:
+            with self._condition:
+                if not self._queue:
+                    return
+                batch = [self._queue.popleft() for _ in range(min(self._max_export_batch_size, len(self._queue)))]
+                self._export_in_progress = True
+                # Wake producers blocked on a full queue
+                self._condition.notify_all()
+
+            try:
+                self._export_batch(batch)
+            finally:
+                with self._condition:
+                    self._export_in_progress = False
+
+            with self._condition:
+                if not drain and len(self._queue) < self._max_export_batch_size:
+                    return
+
+    def _export_batch(self, batch: List[ReadableSpan]) -> None:
+        span_count = len(batch)
+        try:
+            # Exporters that send batches from worker threads of their own report the result
+            # when it is known rather than when the batch is handed off
+            if getattr(type(self._exporter), "export_in_background", None) is not None:
+                self._exporter.export_in_background(  # type: ignore[attr-defined]
+                    batch, lambda result: self._record_result(span_count, result)
+                )
+                return
+            result = self._exporter.export(batch)
+        except Exception:
+            _logger.exception("Exception while exporting span batch.")
+            result = SpanExportResult.FAILURE
+        self._record_result(span_count, result)
+
+    def _record_result(self, span_count: int, result: SpanExportResult) -> None:
+        with self._condition:
+            if result == SpanExportResult.SUCCESS:
+                self._exported_spans += span_count
+            else:
+                self._failed_spans += span_count
+
+
+__all__ = ["GentraceBatchSpanProcessor", "QueueFullPolicy"]
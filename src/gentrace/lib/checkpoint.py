@@ -0,0 +1,181 @@
+"""
+Local Checkpoint Store for Resumable eval_dataset Runs
+
+With `@experiment(options={"checkpoint_path": ...})`, every test case that
+`eval_dataset` completes successfully is recorded in a SQLite database, together
+with its pickled result. If the run crashes part way through, re-running it with
+`resume_experiment_id` set to the crashed experiment skips the recorded cases and
+returns their stored results instead of calling the interaction again.
+
+Rows are keyed by experiment ID, the interaction function (so that several
+`eval_dataset` calls in one experiment do not share results) and the test case:
+its ID, or a hash of its name and inputs for local cases without one. Each case
+is committed as it completes, so at most the cases in flight at the time of a
+crash are lost.
+
+The same database backs incremental runs (`eval_dataset(incremental=True)`): each
+successful result is also stored under a fingerprint of the case's inputs and
+expected outputs and the interaction function and its user-supplied version. A
+later experiment reuses the latest result stored for a matching fingerprint, so
+only new or changed cases are run.
+
+Results are stored with `pickle`; only use checkpoint files you created.
+"""
+
+import json
+import pickle
+import hashlib
+import logging
+import sqlite3
+import threading
+import contextvars
+from typing import Any, Dict, Tuple, Optional
+
+logger = logging.getLogger("gentrace")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS completed_test_cases (
+    experiment_id TEXT NOT NULL,
+    scope TEXT NOT NULL,
+    case_key TEXT NOT NULL,
+    result BLOB NOT NULL,
+    PRIMARY KEY (experiment_id, scope, case_key)
+);
+CREATE TABLE IF NOT EXISTS fingerprinted_results (
+    scope TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    experiment_id TEXT NOT NULL,
+    result BLOB NOT NULL,
+    PRIMARY KEY (scope, fingerprint)
+);
+"""
+
+
+class CheckpointStore:
+    """
+    SQLite-backed record of the test cases completed in each experiment.
+
+    Safe to use from several threads; writes are serialized by a lock.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Open (or create) the checkpoint database.
+
+        Args:
+            path: Path of the SQLite database file.
+        """
+        self._path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock:
+            # WAL keeps each per-case commit cheap and the database readable after a crash
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.executescript(_SCHEMA)
+            self._connection.commit()
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def load(self, experiment_id: str, scope: str) -> Dict[str, bytes]:
+        """The pickled results of the cases completed for `scope` in an experiment, by case key."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT case_key, result FROM completed_test_cases WHERE experiment_id = ? AND scope = ?",
+                (experiment_id, scope),
+            ).fetchall()
+        return {case_key: result for case_key, result in rows}
+
+    def lookup_fingerprint(self, scope: str, fingerprint: str) -> Optional[Tuple[str, bytes]]:
+        """The experiment ID and pickled result last stored for a case fingerprint, if any."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT experiment_id, result FROM fingerprinted_results WHERE scope = ? AND fingerprint = ?",
+                (scope, fingerprint),
+            ).fetchone()
+        return (row[0], row[1]) if row is not None else None
+
+    def record(
+        self,
+        experiment_id: str,
+        scope: str,
+        case_key: str,
+        result: Any,
+        *,
+        fingerprint: Optional[str] = None,
+    ) -> bool:
+        """
+        Record a completed case and its result, also under `fingerprint` if given.
+
+        Returns:
+            False if the result could not be pickled, in which case nothing is recorded
+            and the case will run again on resume.
+        """
+        try:
+            payload = pickle.dumps(result)
+        except Exception as e:
+            logger.warning(f"Result of test case {case_key} cannot be pickled and was not checkpointed: {e}")
+            return False
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO completed_test_cases VALUES (?, ?, ?, ?)",
+                (experiment_id, scope, case_key, payload),
+            )
+            if fingerprint is not None:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO fingerprinted_results VALUES (?, ?, ?, ?)",
+                    (scope, fingerprint, experiment_id, payload),
+                )
+            self._connection.commit()
+        return True
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+checkpoint_store_var: contextvars.ContextVar[Optional[CheckpointStore]] = contextvars.ContextVar(
+    "gentrace_checkpoint_store", default=None
+)
+
+
+def get_current_checkpoint_store() -> Optional[CheckpointStore]:
+    """The checkpoint store of the current experiment, if it has one."""
+    return checkpoint_store_var.get()
+
+
+def checkpoint_scope(interaction: Any) -> str:
+    """Identifies the interaction function whose results are checkpointed."""
+    module = getattr(interaction, "__module__", None) or ""
+    name = getattr(interaction, "__qualname__", None) or getattr(interaction, "__name__", None) or repr(interaction)
+    return f"{module}.{name}" if module else name
+
+
+def checkpoint_case_key(case_id: Optional[str], name: Optional[str], inputs: Any) -> str:
+    """Identifies a test case: its ID, or a hash of its name and inputs."""
+    if case_id:
+        return case_id
+    encoded = json.dumps({"name": name, "inputs": inputs}, sort_keys=True, default=str)
+    return "sha256:" + hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def fingerprint_test_case(inputs: Any, expected_outputs: Any, interaction_version: Optional[str]) -> str:
+    """Fingerprint of what determines a case's result: its inputs, its expected outputs and the interaction version."""
+    encoded = json.dumps(
+        {"inputs": inputs, "expected_outputs": expected_outputs, "interaction_version": interaction_version},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+__all__ = [
+    "CheckpointStore",
+    "checkpoint_store_var",
+    "get_current_checkpoint_store",
+    "checkpoint_scope",
+    "checkpoint_case_key",
+    "fingerprint_test_case",
+]
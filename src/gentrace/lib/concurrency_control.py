@@ -0,0 +1,185 @@
+"""
+Rate Limiting and Adaptive Concurrency for eval_dataset
+
+Interaction functions usually call rate-limited LLM APIs. `EvalConcurrencyController`
+paces the test cases of one `eval_dataset` run:
+
+- `TokenBucket` limits the rate at which cases start (requests per second) and the
+  estimated LLM tokens they use (tokens per minute).
+- An AIMD limit on the number of cases in flight grows by about one per round of
+  successful cases and is cut multiplicatively when a case fails with a rate limit
+  error (HTTP 429) or its latency spikes well above the recent average.
+"""
+
+import json
+import asyncio
+from time import monotonic
+from typing import Any, Optional
+
+from .types import RateLimitOptions, AdaptiveConcurrencyOptions
+
+DEFAULT_INITIAL_CONCURRENCY = 4
+DEFAULT_DECREASE_FACTOR = 0.5
+DEFAULT_LATENCY_SPIKE_FACTOR = 3.0
+
+# Successful cases averaged into the latency baseline before spikes are detected
+_LATENCY_WARMUP_CASES = 5
+# Weight of the latest latency in the moving average
+_LATENCY_SMOOTHING = 0.2
+
+
+class TokenBucket:
+    """
+    Token bucket refilled at `rate` tokens per second, holding at most `capacity`.
+
+    Waiters are served in arrival order.
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        if rate <= 0:
+            raise ValueError("Rate limits must be positive.")
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._updated = monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, amount: float = 1) -> None:
+        """Wait until `amount` tokens are available and take them."""
+        # A request larger than the bucket would never fit; it waits for a full bucket instead
+        amount = min(amount, self._capacity)
+        async with self._lock:
+            while True:
+                now = monotonic()
+                self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return
+                await asyncio.sleep((amount - self._tokens) / self._rate)
+
+
+def estimate_tokens(test_case: Any) -> int:
+    """Rough token estimate of a test case: one token per four characters of its JSON-encoded inputs."""
+    try:
+        encoded = json.dumps(getattr(test_case, "inputs", None), default=str)
+    except (TypeError, ValueError):
+        encoded = str(getattr(test_case, "inputs", ""))
+    return len(encoded) // 4 + 1
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """Whether an exception raised by an interaction signals an HTTP 429 / rate limit response."""
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    return status == 429 or type(error).__name__ in ("RateLimitError", "TooManyRequests")
+
+
+class EvalConcurrencyController:
+    """
+    Paces the test cases of one eval_dataset run.
+
+    Args:
+        max_concurrency: Upper bound of the in-flight limit.
+        rate_limit: Request and token rate limits, if any.
+        adaptive: Adapt the in-flight limit between its bounds (AIMD) instead of
+                  keeping it at `max_concurrency`.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        *,
+        rate_limit: Optional[RateLimitOptions] = None,
+        adaptive: Optional[AdaptiveConcurrencyOptions] = None,
+    ) -> None:
+        self._max = max_concurrency
+        self._adaptive = adaptive is not None
+        options: AdaptiveConcurrencyOptions = adaptive or {}
+        self._min = max(1, min(options.get("min_concurrency", 1), max_concurrency))
+        initial = options.get("initial_concurrency", DEFAULT_INITIAL_CONCURRENCY) if self._adaptive else max_concurrency
+        self._limit = float(max(self._min, min(initial, max_concurrency)))
+        self._decrease_factor = options.get("decrease_factor", DEFAULT_DECREASE_FACTOR)
+        self._latency_spike_factor = options.get("latency_spike_factor", DEFAULT_LATENCY_SPIKE_FACTOR)
+        if not 0 < self._decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1.")
+
+        self._in_flight = 0
+        self._slots = asyncio.Condition()
+        self._latency_average: Optional[float] = None
+        self._latency_samples = 0
+        self._last_decrease = float("-inf")
+
+        rate_limit = rate_limit or {}
+        requests_per_second = rate_limit.get("requests_per_second")
+        tokens_per_minute = rate_limit.get("tokens_per_minute")
+        self._requests = (
+            TokenBucket(requests_per_second, max(1.0, requests_per_second)) if requests_per_second is not None else None
+        )
+        self._tokens = TokenBucket(tokens_per_minute / 60, tokens_per_minute) if tokens_per_minute is not None else None
+        self._estimate_tokens = rate_limit.get("estimate_tokens", estimate_tokens)
+
+    @property
+    def limit(self) -> int:
+        """The current limit on the number of cases in flight."""
+        return int(self._limit)
+
+    async def acquire_slot(self) -> None:
+        """Wait until fewer cases than the limit are in flight and count one more."""
+        async with self._slots:
+            await self._slots.wait_for(lambda: self._in_flight < int(self._limit))
+            self._in_flight += 1
+
+    async def wait_for_rate(self, test_case: Any) -> None:
+        """Wait until the rate limits allow `test_case` to start."""
+        if self._requests is not None:
+            await self._requests.acquire()
+        if self._tokens is not None:
+            await self._tokens.acquire(self._estimate_tokens(test_case))
+
+    async def release_slot(self, latency: float, error: Optional[BaseException]) -> None:
+        """Count a finished case, adapting the limit to its outcome."""
+        if self._adaptive:
+            self._adapt(latency, error)
+        await self.release_unused_slot()
+
+    async def release_unused_slot(self) -> None:
+        """Give back a slot taken for a case that was not run, leaving the limit as it is."""
+        async with self._slots:
+            self._in_flight -= 1
+            self._slots.notify_all()
+
+    def note_failed_attempt(self, error: BaseException) -> None:
+        """Adapt the limit to an attempt of a case that failed and is being retried."""
+        if self._adaptive:
+            self._adapt(0.0, error)
+
+    def _adapt(self, latency: float, error: Optional[BaseException]) -> None:
+        now = monotonic()
+        overloaded = error is not None and is_rate_limit_error(error)
+        if error is None:
+            average = self._latency_average
+            if (
+                average is not None
+                and self._latency_samples >= _LATENCY_WARMUP_CASES
+                and latency > average * self._latency_spike_factor
+            ):
+                overloaded = True
+            else:
+                # Spikes are kept out of the baseline they are measured against
+                self._latency_average = (
+                    latency if average is None else average + _LATENCY_SMOOTHING * (latency - average)
+                )
+                self._latency_samples += 1
+
+        if overloaded:
+            # Cases started before the last cut finish overloaded too; cut once per round trip
+            if now - self._last_decrease >= (self._latency_average or 0.0):
+                self._limit = max(float(self._min), self._limit * self._decrease_factor)
+                self._last_decrease = now
+        elif error is None:
+            self._limit = min(float(self._max), self._limit + 1 / self._limit)
+
+
+__all__ = ["TokenBucket", "EvalConcurrencyController", "estimate_tokens", "is_rate_limit_error"]
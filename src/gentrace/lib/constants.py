@@ -6,6 +6,18 @@ ATTR_GENTRACE_PIPELINE_ID = "gentrace.pipeline_id"
 
 ATTR_GENTRACE_FN_ARGS_EVENT_NAME = "gentrace.fn.args"
 ATTR_GENTRACE_FN_OUTPUT_EVENT_NAME = "gentrace.fn.output"
+ATTR_GENTRACE_FN_OUTPUT_ITEM_EVENT_NAME = "gentrace.fn.output.item"
+
+# Attributes recorded on the spans of traced generator functions
+ATTR_GENTRACE_STREAM_ITEM_COUNT = "gentrace.stream.item_count"
+ATTR_GENTRACE_STREAM_TIME_TO_FIRST_ITEM_MS = "gentrace.stream.time_to_first_item_ms"
+ATTR_GENTRACE_STREAM_INTER_ITEM_MEAN_MS = "gentrace.stream.inter_item_ms.mean"
+ATTR_GENTRACE_STREAM_INTER_ITEM_MAX_MS = "gentrace.stream.inter_item_ms.max"
+ATTR_GENTRACE_STREAM_ITEMS_PER_SECOND = "gentrace.stream.items_per_second"
+ATTR_GENTRACE_STREAM_ABANDONED = "gentrace.stream.abandoned"
+
+# Set on the span of a call to a function with a memo cache: whether the result came from the cache
+ATTR_GENTRACE_CACHE_HIT = "gentrace.cache_hit"
 
 ATTR_GENTRACE_EXPERIMENT_ID = "gentrace.experiment_id"
 ATTR_GENTRACE_TEST_CASE_NAME = "gentrace.test_case_name"
@@ -14,6 +26,17 @@ ATTR_GENTRACE_TEST_CASE_ID = "gentrace.test_case_id"
 ATTR_GENTRACE_SAMPLE_KEY = "gentrace.sample"
 ATTR_GENTRACE_IN_EXPERIMENT = "gentrace.in_experiment"
 
+# Limit on concurrent test cases in effect when an eval_dataset test case started
+ATTR_GENTRACE_CONCURRENCY_LIMIT = "gentrace.eval.concurrency_limit"
+# Set on the span of an eval_dataset test case whose result was reused from an earlier experiment
+ATTR_GENTRACE_REUSED_FROM_EXPERIMENT_ID = "gentrace.eval.reused_from_experiment_id"
+# Set on the span of an eval_dataset test case that was cancelled or abandoned at its timeout
+ATTR_GENTRACE_TIMED_OUT = "gentrace.eval.timed_out"
+# Number of attempts an eval_dataset test case took, set when a retry policy is in effect
+ATTR_GENTRACE_ATTEMPTS = "gentrace.eval.attempts"
+# Span event recorded for each failed attempt of an eval_dataset test case that is retried
+ATTR_GENTRACE_RETRY_EVENT_NAME = "gentrace.eval.retry"
+
 # Maximum allowed concurrency for eval_dataset
 MAX_EVAL_DATASET_CONCURRENCY = 100
 
@@ -21,6 +44,14 @@ __all__ = [
     "ANONYMOUS_SPAN_NAME",
     "ATTR_GENTRACE_FN_ARGS_EVENT_NAME",
     "ATTR_GENTRACE_FN_OUTPUT_EVENT_NAME",
+    "ATTR_GENTRACE_FN_OUTPUT_ITEM_EVENT_NAME",
+    "ATTR_GENTRACE_STREAM_ITEM_COUNT",
+    "ATTR_GENTRACE_STREAM_TIME_TO_FIRST_ITEM_MS",
+    "ATTR_GENTRACE_STREAM_INTER_ITEM_MEAN_MS",
+    "ATTR_GENTRACE_STREAM_INTER_ITEM_MAX_MS",
+    "ATTR_GENTRACE_STREAM_ITEMS_PER_SECOND",
+    "ATTR_GENTRACE_STREAM_ABANDONED",
+    "ATTR_GENTRACE_CACHE_HIT",
     "ATTR_GENTRACE_EXPERIMENT_ID",
     "ATTR_GENTRACE_TEST_CASE_NAME",
     "ATTR_GENTRACE_TEST_CASE_ID",
@@ -28,4 +59,9 @@ __all__ = [
     "ATTR_GENTRACE_SAMPLE_KEY",
     "ATTR_GENTRACE_IN_EXPERIMENT",
     "MAX_EVAL_DATASET_CONCURRENCY",
+    "ATTR_GENTRACE_CONCURRENCY_LIMIT",
+    "ATTR_GENTRACE_REUSED_FROM_EXPERIMENT_ID",
+    "ATTR_GENTRACE_TIMED_OUT",
+    "ATTR_GENTRACE_ATTEMPTS",
+    "ATTR_GENTRACE_RETRY_EVENT_NAME",
 ]
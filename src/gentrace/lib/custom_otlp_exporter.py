@@ -9,7 +9,7 @@ OpenTelemetry versions.
 
 import json
 import logging
-from typing import TYPE_CHECKING, Any, Sequence
+from typing import Any, Callable, Sequence
 from typing_extensions import override
 
 from opentelemetry.sdk.trace import ReadableSpan
@@ -20,11 +20,10 @@ from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import (
 
 from .utils import display_gentrace_warning
 from .warnings import GentraceWarnings
+from .otlp_transport import OTLPResponse
+from .otlp_compression import Compression
 from .vendored_otlp_exporter import GentraceVendoredOTLPSpanExporter
 
-if TYPE_CHECKING:
-    import requests
-
 _logger = logging.getLogger(__name__)
 
 
@@ -45,6 +44,8 @@ class GentraceOTLPSpanExporter(SpanExporter):
         # Store original send_request method so we can intercept responses
         self._original_send_request = self._exporter._send_request
         self._exporter._send_request = self._intercepted_send_request  # type: ignore[method-assign]
+        self._original_send_request_async = self._exporter._send_request_async
+        self._exporter._send_request_async = self._intercepted_send_request_async  # type: ignore[method-assign]
         
         # Store original handle_error method so we can customize error messages
         self._original_handle_error = self._exporter._handle_error
@@ -57,6 +58,24 @@ class GentraceOTLPSpanExporter(SpanExporter):
         """
         return self._exporter.export(spans)
 
+    def export_in_background(
+        self, spans: Sequence[ReadableSpan], on_done: Callable[[SpanExportResult], None]
+    ) -> None:
+        """
+        Export spans, reporting the batch's result to `on_done` once it is known.
+        """
+        self._exporter.export_in_background(spans, on_done)
+
+    async def export_async(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        """
+        Export spans without blocking the event loop, using the vendored exporter's async transport.
+        """
+        return await self._exporter.export_async(spans)
+
+    async def aclose(self) -> None:
+        """Close the underlying exporter's async transport."""
+        await self._exporter.aclose()
+
     @override
     def shutdown(self) -> None:
         """Shutdown the underlying exporter."""
@@ -67,12 +86,14 @@ class GentraceOTLPSpanExporter(SpanExporter):
         """Force flush the underlying exporter."""
         return self._exporter.force_flush(timeout_millis)
 
-    def _intercepted_send_request(self, data: bytes, timeout: float) -> "requests.Response":
+    def _intercepted_send_request(
+        self, data: bytes, timeout: float, compression: Compression = Compression.NoCompression
+    ) -> OTLPResponse:
         """
         Intercept the send_request to check for partial success on 200 OK responses.
         """
         # Call the original send_request
-        resp = self._original_send_request(data, timeout)
+        resp = self._original_send_request(data, timeout, compression)
         
         # If successful, check for partial success
         if resp.ok and resp.content:
@@ -80,7 +101,20 @@ class GentraceOTLPSpanExporter(SpanExporter):
         
         return resp
 
-    def _handle_error_with_gentrace_warnings(self, resp: "requests.Response") -> None:
+    async def _intercepted_send_request_async(
+        self, data: bytes, timeout: float, compression: Compression = Compression.NoCompression
+    ) -> OTLPResponse:
+        """
+        Async counterpart of `_intercepted_send_request`.
+        """
+        resp = await self._original_send_request_async(data, timeout, compression)
+
+        if resp.ok and resp.content:
+            self._check_partial_success(resp)
+
+        return resp
+
+    def _handle_error_with_gentrace_warnings(self, resp: OTLPResponse) -> None:
         """
         Handle errors with Gentrace-specific warnings.
         """
@@ -102,7 +136,7 @@ class GentraceOTLPSpanExporter(SpanExporter):
             # Fall back to the original error handler for other errors
             self._original_handle_error(resp)
 
-    def _check_partial_success(self, resp: "requests.Response") -> None:
+    def _check_partial_success(self, resp: OTLPResponse) -> None:
         """
         Check response for partial success indicators and display warnings.
         """
@@ -0,0 +1,180 @@
+"""
+Deferred Serialization of Function Inputs and Outputs
+
+By default `@traced`, `@eval` and `eval_dataset()` serialize function arguments and
+results to JSON while the function call is in progress. With deferred serialization
+(`setup(deferred_serialization=True)`) they only take a reference to the values (or a
+cheap snapshot, see `capture_copy`). The `gentrace.fn.args` / `gentrace.fn.output`
+event is added with a placeholder value, and the payload is attached to the event. The
+Gentrace exporter serializes the payload when it encodes the span. With the batch span
+processor, that happens on its export worker thread, so the JSON encoding no longer runs
+on the caller's latency-critical path. `setup()` only enables deferral with the batch
+processor: a `SimpleSpanProcessor` exports each span on the thread that ends it, where
+deferring would only add the cost of capturing the values.
+
+Captured values stay referenced until their span is exported. Values that cannot be
+copied as requested are serialized immediately. Exporters other than the Gentrace
+exporter see the placeholder.
+"""
+
+import copy
+import threading
+from typing import Any, List, Tuple, Optional
+
+from pydantic import BaseModel
+from opentelemetry.trace import Span
+from opentelemetry.sdk.trace import Span as SDKSpan, Event
+from opentelemetry.util.types import Attributes
+
+from .types import CaptureCopyType
+from .utils import _gentrace_event_json_dumps, _gentrace_arguments_json_dumps
+from .constants import ATTR_GENTRACE_FN_ARGS_EVENT_NAME, ATTR_GENTRACE_FN_OUTPUT_EVENT_NAME
+
+# Event attribute value standing in for a payload that is serialized at export time
+DEFERRED_PAYLOAD_PLACEHOLDER = "[gentrace.deferred]"
+
+# Python attribute (not an OTel attribute) of a span Event holding its deferred payload
+_EVENT_PAYLOAD_ATTR = "_gentrace_deferred_payload"
+
+_deferred = False
+_capture_copy: CaptureCopyType = "shallow"
+
+
+def configure_deferred_serialization(*, enabled: bool = False, capture_copy: CaptureCopyType = "shallow") -> None:
+    """
+    Enable or disable deferred serialization of function inputs and outputs.
+
+    Args:
+        enabled: Serialize payloads when spans are exported instead of during the call.
+        capture_copy: How values are captured when deferred: "none" keeps a reference,
+                      "shallow" (default) copies lists, dicts, sets and pydantic models one
+                      level deep, "deep" deep-copies every value.
+    """
+    global _deferred, _capture_copy
+    if capture_copy not in ("none", "shallow", "deep"):
+        raise ValueError(f"Unknown capture_copy mode: {capture_copy!r}")
+    _deferred = enabled
+    _capture_copy = capture_copy
+
+
+class DeferredPayload:
+    """A captured function input or output, serialized on first use."""
+
+    __slots__ = ("key", "_value", "_is_arguments", "_serialized", "_lock")
+
+    def __init__(self, key: str, value: Any, *, is_arguments: bool = False) -> None:
+        self.key = key
+        self._value = value
+        self._is_arguments = is_arguments
+        self._serialized: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def serialize(self) -> str:
+        """Serialize the captured value, releasing the reference to it."""
+        with self._lock:
+            if self._serialized is None:
+                try:
+                    if self._is_arguments:
+                        self._serialized = _gentrace_arguments_json_dumps(self._value)
+                    else:
+                        self._serialized = _gentrace_event_json_dumps(self._value)
+                except Exception as e:
+                    # e.g. the caller mutated a referenced container while it was being encoded
+                    self._serialized = _gentrace_event_json_dumps(f"[DeferredSerializationError: {type(e).__name__}]")
+                self._value = None
+            return self._serialized
+
+
+class _CopyFailed(Exception):
+    pass
+
+
+def _snapshot(value: Any) -> Any:
+    if _capture_copy == "none":
+        return value
+    try:
+        if _capture_copy == "deep":
+            return copy.deepcopy(value)
+        if isinstance(value, (list, dict, set)):
+            return copy.copy(value)  # pyright: ignore[reportUnknownVariableType, reportUnknownArgumentType]
+        if isinstance(value, BaseModel):
+            return copy.copy(value)
+        return value
+    except Exception as e:
+        raise _CopyFailed() from e
+
+
+def _add_deferred_event(span: Span, event_name: str, payload: DeferredPayload) -> bool:
+    # The exporter receives a copy of the span that shares its Event objects, so the payload
+    # is attached to the event itself
+    if not isinstance(span, SDKSpan):
+        return False
+    span.add_event(event_name, {payload.key: DEFERRED_PAYLOAD_PLACEHOLDER})
+    for event in reversed(span.events):
+        if (
+            event.name == event_name
+            and event.attributes
+            and event.attributes.get(payload.key) == DEFERRED_PAYLOAD_PLACEHOLDER
+            and get_deferred_payload(event) is None
+        ):
+            setattr(event, _EVENT_PAYLOAD_ATTR, payload)
+            break
+    return True
+
+
+def record_payload_event(span: Span, event_name: str, key: str, value: Any) -> None:
+    """Add an event holding `value` serialized to JSON under `key`, now or at export time."""
+    if _deferred and span.is_recording():
+        try:
+            payload = DeferredPayload(key, _snapshot(value))
+        except _CopyFailed:
+            pass
+        else:
+            if _add_deferred_event(span, event_name, payload):
+                return
+    span.add_event(event_name, {key: _gentrace_event_json_dumps(value)})
+
+
+def record_arguments_event(span: Span, arguments: List[Tuple[str, Any]]) -> None:
+    """Add the `gentrace.fn.args` event for bound call arguments, now or at export time."""
+    if _deferred and span.is_recording():
+        try:
+            snapshot = [(name, _snapshot(value)) for name, value in arguments]
+        except _CopyFailed:
+            pass
+        else:
+            payload = DeferredPayload("args", snapshot, is_arguments=True)
+            if _add_deferred_event(span, ATTR_GENTRACE_FN_ARGS_EVENT_NAME, payload):
+                return
+    span.add_event(ATTR_GENTRACE_FN_ARGS_EVENT_NAME, {"args": _gentrace_arguments_json_dumps(arguments)})
+
+
+def record_output_event(span: Span, value: Any) -> None:
+    """Add the `gentrace.fn.output` event for a function result, now or at export time."""
+    record_payload_event(span, ATTR_GENTRACE_FN_OUTPUT_EVENT_NAME, "output", value)
+
+
+def get_deferred_payload(event: Event) -> Optional[DeferredPayload]:
+    """The deferred payload attached to a span event, if any."""
+    return getattr(event, _EVENT_PAYLOAD_ATTR, None)
+
+
+def resolve_event_attributes(event: Event) -> Attributes:
+    """An event's attributes, with a deferred payload placeholder replaced by the serialized payload."""
+    payload = get_deferred_payload(event)
+    attributes = event.attributes
+    if payload is None or not attributes:
+        return attributes
+    return {**attributes, payload.key: payload.serialize()}
+
+
+__all__ = [
+    "DEFERRED_PAYLOAD_PLACEHOLDER",
+    "DeferredPayload",
+    "configure_deferred_serialization",
+    "get_deferred_payload",
+    "record_arguments_event",
+    "record_output_event",
+    "record_payload_event",
+    "resolve_event_attributes",
+]
@@ -8,7 +8,7 @@ from typing_extensions import ParamSpec
 from opentelemetry import trace, baggage as otel_baggage, context as otel_context
 from opentelemetry.trace.status import Status, StatusCode
 
-from .utils import ensure_initialized, _gentrace_json_dumps
+from .utils import ensure_initialized, gentrace_format_otel_value
 from .constants import (
     ANONYMOUS_SPAN_NAME,
     ATTR_GENTRACE_SAMPLE_KEY,
@@ -19,6 +19,7 @@ from .constants import (
     ATTR_GENTRACE_FN_OUTPUT_EVENT_NAME,
 )
 from .experiment import ExperimentContext, get_current_experiment_context
+from .deferred_payloads import record_output_event, record_payload_event
 
 P = ParamSpec("P")
 R = TypeVar("R")
@@ -108,7 +109,7 @@ def eval(
                             try:
                                 # Attempt to serialize complex types, fallback to string
                                 if isinstance(value, (dict, list, tuple)):
-                                    span.set_attribute(key, _gentrace_json_dumps(value))
+                                    span.set_attribute(key, gentrace_format_otel_value(value))
                                 elif value is not None:
                                     span.set_attribute(key, str(value))
                                 # None values are implicitly ignored by set_attribute
@@ -133,7 +134,7 @@ def eval(
 
                     if input_payload:
                         # Log combined args/kwargs if any exist
-                        span.add_event(ATTR_GENTRACE_FN_ARGS_EVENT_NAME, {"args": _gentrace_json_dumps(input_payload)})
+                        record_payload_event(span, ATTR_GENTRACE_FN_ARGS_EVENT_NAME, "args", input_payload)
 
                     try:
                         if inspect.iscoroutinefunction(func):
@@ -144,7 +145,7 @@ def eval(
                             # func is already Callable[P, Any], no cast needed for sync_func
                             result = func(*args, **kwargs)  # Directly use func
 
-                        span.add_event(ATTR_GENTRACE_FN_OUTPUT_EVENT_NAME, {"output": _gentrace_json_dumps(result)})
+                        record_output_event(span, result)
                         return result  # Runtime result is correct type, static type is Any
                     except Exception as e:
                         span.record_exception(e)
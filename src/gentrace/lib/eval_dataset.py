@@ -1,6 +1,10 @@
+import os
+import pickle
 import asyncio
 import inspect
 import logging
+import multiprocessing.util
+from time import perf_counter
 from typing import (
     Any,
     Dict,
@@ -12,44 +16,61 @@ from typing import (
     Mapping,
     TypeVar,
     Callable,
+    Iterable,
+    Iterator,
     Optional,
     Sequence,
     Awaitable,
+    NamedTuple,
+    AsyncIterable,
+    AsyncIterator,
     cast,
 )
 from datetime import datetime, timezone
+from contextlib import contextmanager
 from contextvars import copy_context
-from typing_extensions import Protocol, TypeAlias, overload, is_typeddict
+from collections.abc import Sized
+from typing_extensions import Literal, Protocol, TypeAlias, overload
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
 
-from pydantic import BaseModel, ValidationError
-
-# Conditional import for TypeAdapter (Pydantic v2 only)
-try:
-    from pydantic import TypeAdapter
-
-    _HAS_TYPE_ADAPTER = True
-except ImportError:
-    TypeAdapter = None  # type: ignore
-    _HAS_TYPE_ADAPTER = False  # pyright: ignore[reportConstantRedefinition]
+from pydantic import BaseModel
 from opentelemetry import trace, baggage as otel_baggage, context as otel_context
 from opentelemetry.trace.status import Status, StatusCode
+from opentelemetry.baggage.propagation import W3CBaggagePropagator
+from opentelemetry.propagators.composite import CompositePropagator
+from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
 
 from gentrace.types.test_case import TestCase
 
-from .utils import is_ci, is_pydantic_v1, ensure_initialized, _gentrace_json_dumps, display_gentrace_warning
+from .types import RetryOptions, RateLimitOptions, AdaptiveConcurrencyOptions
+from .utils import is_ci, ensure_initialized, display_gentrace_warning
 from .progress import ProgressReporter, RichProgressReporter, SimpleProgressReporter
 from .warnings import GentraceWarnings
 from .constants import (
+    ATTR_GENTRACE_ATTEMPTS,
+    ATTR_GENTRACE_TIMED_OUT,
     ATTR_GENTRACE_SAMPLE_KEY,
     ATTR_GENTRACE_TEST_CASE_ID,
     ATTR_GENTRACE_EXPERIMENT_ID,
     ATTR_GENTRACE_IN_EXPERIMENT,
     ATTR_GENTRACE_TEST_CASE_NAME,
     MAX_EVAL_DATASET_CONCURRENCY,
+    ATTR_GENTRACE_RETRY_EVENT_NAME,
+    ATTR_GENTRACE_CONCURRENCY_LIMIT,
     ATTR_GENTRACE_FN_ARGS_EVENT_NAME,
-    ATTR_GENTRACE_FN_OUTPUT_EVENT_NAME,
+    ATTR_GENTRACE_REUSED_FROM_EXPERIMENT_ID,
+)
+from .checkpoint import (
+    checkpoint_scope,
+    checkpoint_case_key,
+    fingerprint_test_case,
+    get_current_checkpoint_store,
 )
-from .experiment import ExperimentContext, get_current_experiment_context
+from .experiment import ExperimentContext, experiment_context_var, get_current_experiment_context
+from .retry_policy import EvalRetryPolicy
+from .deferred_payloads import record_output_event, record_payload_event
+from .schema_validation import SchemaValidator, ValidationResult, get_schema_validator
+from .concurrency_control import EvalConcurrencyController
 
 logger = logging.getLogger("gentrace")
 
@@ -59,6 +80,7 @@ TInput = TypeVar("TInput")  # Type of the (potentially parsed) input to interact
 TResult = TypeVar("TResult")  # Return type of the interaction fn
 SchemaPydanticModel = TypeVar("SchemaPydanticModel", bound=BaseModel)  # Type for Pydantic schema
 SchemaType = Union[Type[BaseModel], Any]  # Type for schema (BaseModel or TypedDict)
+ExecutorType = Literal["thread", "process"]  # Where sync interaction functions run
 
 _tracer = trace.get_tracer("gentrace.sdk")
 
@@ -82,109 +104,295 @@ class TestInput(BaseModel, Generic[TInputDict]):
     id: Optional[str] = None
 
 
+RawTestCase: TypeAlias = Union[TestCase, TestInput[Mapping[str, Any]]]
+
+
+class EvalCaseTimeoutError(TimeoutError):
+    """A dataset test case ran past its `per_case_timeout`, or the run's `total_timeout` expired."""
+
+
+class EvalCaseTiming(NamedTuple):
+    """Timing of one dataset test case."""
+
+    wait_seconds: float
+    """Time spent waiting for the concurrency and rate limits before the case started."""
+
+    duration_seconds: float
+    """Time the case took once started. Zero for results resumed from a checkpoint or reused."""
+
+
+class EvalDatasetResult(NamedTuple):
+    """One completed test case, as yielded by `eval_dataset_iter`."""
+
+    test_case: TestCase
+    """The test case (a `TestInput` is converted to a `TestCase`)."""
+
+    result: Any
+    """The interaction's result, or None if the case failed."""
+
+    timing: EvalCaseTiming
+
+    error: Optional[BaseException]
+    """The input validation error or the exception raised by the interaction, if the case failed."""
+
+
 DataProviderType: TypeAlias = Union[
     Callable[
         [],
         Union[
-            Awaitable[Sequence[Union[TestCase, TestInput[Mapping[str, Any]]]]],
-            Sequence[Union[TestCase, TestInput[Mapping[str, Any]]]],
+            Awaitable[Sequence[RawTestCase]],
+            Sequence[RawTestCase],
+            Iterable[RawTestCase],
+            AsyncIterable[RawTestCase],
         ],
     ],
-    Sequence[Union[TestCase, TestInput[Mapping[str, Any]]]],
+    Sequence[RawTestCase],
+    Iterable[RawTestCase],
+    AsyncIterable[RawTestCase],
 ]
 
 
-def _validate_inputs_with_schema(
-    inputs: Mapping[str, Any], schema: SchemaType
-) -> Tuple[bool, Optional[Dict[str, Any]], Optional[str]]:
-    """
-    Validate inputs using either a Pydantic BaseModel or TypedDict.
+async def _resolve_data_provider(
+    data_provider: DataProviderType,
+) -> Union[Iterable[RawTestCase], AsyncIterable[RawTestCase]]:
+    """Call the data provider if needed and return the (possibly lazy) collection of test cases."""
+    try:
+        if callable(data_provider):
+            data_result = data_provider()
+            if inspect.isawaitable(data_result):
+                return cast(Sequence[RawTestCase], await data_result)
+            return data_result
+        # data_provider is already a sequence or iterable
+        return data_provider
+    except Exception as e:
+        # Potentially log this with a Gentrace SDK logger if available
+        raise RuntimeError(f"Failed to retrieve or process dataset from data provider: {e}") from e
 
-    Returns:
-        Tuple of (is_valid, validated_data, error_message)
-    """
+
+# Returned by next() on an exhausted dataset iterator
+_END_OF_DATASET = object()
+
+
+async def _iterate_test_cases(
+    source: Union[Iterable[RawTestCase], AsyncIterable[RawTestCase]],
+) -> AsyncIterator[TestCase]:
+    """Yield the test cases of a sequence, iterable or async iterable one at a time, converted to TestCase."""
     try:
-        # Check if it's a TypedDict
-        if is_typeddict(schema):
-            if _HAS_TYPE_ADAPTER and TypeAdapter is not None:
-                # Use TypeAdapter for Pydantic v2
-                adapter = TypeAdapter(schema)
-                validated = adapter.validate_python(inputs)
-                # TypeAdapter returns the validated data as a dict for TypedDict
-                validated_dict = cast(Dict[str, Any], dict(validated) if not isinstance(validated, dict) else validated)
-                return True, validated_dict, None
-            else:
-                # For Pydantic v1, we can't validate TypedDict directly
-                # Just return the inputs as-is with a warning
-                logger.warning(
-                    "TypedDict validation requires Pydantic v2. Inputs will be passed through without validation."
-                )
-                return True, dict(inputs), None
+        if isinstance(source, AsyncIterable):
+            async for raw_case in source:
+                yield _to_test_case(raw_case)
+        elif isinstance(source, Sized):
+            # In memory already, so iterating it cannot block the event loop
+            for raw_case in source:
+                yield _to_test_case(raw_case)
         else:
-            # It's a Pydantic BaseModel
-            try:
-                if is_pydantic_v1():
-                    validated = schema.parse_obj(inputs)  # type: ignore
-                else:
-                    validated = schema.model_validate(inputs)  # type: ignore
-
-                # Convert to dict for logging
-                dict_for_log: Dict[str, Any]
-                validated_obj = cast(BaseModel, validated)
-                if hasattr(validated_obj, "model_dump"):
-                    dict_for_log = validated_obj.model_dump()  # type: ignore
-                elif hasattr(validated_obj, "dict"):
-                    dict_for_log = validated_obj.dict()  # type: ignore
-                else:
-                    dict_for_log = dict(validated_obj) if hasattr(validated_obj, "__dict__") else dict(inputs)
-
-                return True, dict_for_log, None
-            except AttributeError:
-                # Not a BaseModel, just return the inputs
-                return True, dict(inputs), None
-
-    except ValidationError as ve:
-        return False, None, str(ve)
+            # Lazy sync iterables (e.g. generators paging through a dataset) may block on I/O,
+            # so they are advanced in the loop's default executor
+            loop = asyncio.get_running_loop()
+            iterator = iter(source)
+            while True:
+                raw_case = await loop.run_in_executor(None, next, iterator, _END_OF_DATASET)
+                if raw_case is _END_OF_DATASET:
+                    return
+                yield _to_test_case(cast(RawTestCase, raw_case))
     except Exception as e:
-        # Handle specific Pydantic errors
-        error_msg = str(e)
-        if "Please use `typing_extensions.TypedDict`" in error_msg:
-            return False, None, "TypedDict must be imported from typing_extensions, not typing module"
-        return False, None, f"Validation error: {error_msg}"
+        raise RuntimeError(f"Failed to retrieve or process dataset from data provider: {e}") from e
+
+
+def _to_test_case(raw_case: RawTestCase) -> TestCase:
+    # Convert TestInput to TestCase internally
+    if isinstance(raw_case, TestCase):
+        # If already a TestCase, use as-is
+        return raw_case
+
+    # Generate values for required fields
+    now = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+    # Convert TestInput to TestCase
+    # At this point, raw_case must be TestInput based on the type annotation
+    return TestCase(
+        id=raw_case.id or "",  # Don't generate ID for local test cases
+        name=raw_case.name or "",  # Let the index-based naming logic handle unnamed cases
+        inputs=dict(raw_case.inputs),  # Convert Mapping to dict
+        expectedOutputs=None,
+        # Fill required fields with sensible defaults
+        datasetId="local",
+        pipelineId="local",
+        createdAt=now,
+        updatedAt=now,
+        archivedAt=None,
+        deletedAt=None,
+    )
+
+
+async def _cancel_all(tasks: "List[asyncio.Future[None]]") -> None:
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def _gather_or_cancel(tasks: "List[asyncio.Future[None]]") -> None:
+    """Wait for all tasks, cancelling the others if one of them fails."""
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        await _cancel_all(tasks)
+        raise
+
+
+# Sent with each case to a worker process, so spans created there join the case's trace and
+# see its baggage (gentrace.sample, gentrace.in_experiment)
+_process_propagator = CompositePropagator([TraceContextTextMapPropagator(), W3CBaggagePropagator()])
+
+
+def _flush_worker_spans() -> None:
+    force_flush = getattr(trace.get_tracer_provider(), "force_flush", None)
+    if force_flush is not None:
+        force_flush()
+
+
+def _init_process_worker() -> None:
+    # Each worker exports its spans through the tracer provider it inherited (or set up itself,
+    # with the "spawn" start method). Worker processes skip atexit handlers, so its spans are
+    # flushed by a multiprocessing finalizer when the pool shuts the worker down.
+    multiprocessing.util.Finalize(None, _flush_worker_spans, exitpriority=10)
+
+
+def _run_in_process_worker(
+    interaction_function: Callable[[TestCase], Any],
+    test_case: TestCase,
+    carrier: Dict[str, str],
+    experiment_context: Optional[ExperimentContext],
+) -> Any:
+    """Run a sync interaction in a worker process under the trace and experiment context of its case."""
+    token = otel_context.attach(_process_propagator.extract(carrier))
+    experiment_token = experiment_context_var.set(experiment_context)
+    try:
+        return interaction_function(test_case)
+    finally:
+        experiment_context_var.reset(experiment_token)
+        otel_context.detach(token)
+
+
+def _create_executor(
+    executor: ExecutorType, max_concurrency: Optional[int], total: Optional[int]
+) -> Union[ThreadPoolExecutor, ProcessPoolExecutor]:
+    """Create the pool that runs a sync interaction function for one eval_dataset run."""
+    limit = max_concurrency if max_concurrency is not None and max_concurrency > 0 else MAX_EVAL_DATASET_CONCURRENCY
+    if total is not None:
+        limit = max(1, min(limit, total))
+    if executor == "process":
+        # CPU-bound work gains nothing from more processes than cores
+        return ProcessPoolExecutor(max_workers=min(limit, os.cpu_count() or 1), initializer=_init_process_worker)
+    # Threads are started on demand, so a large limit costs nothing for small datasets
+    return ThreadPoolExecutor(max_workers=limit, thread_name_prefix="gentrace-eval-dataset")
+
+
+async def _await_with_timeout(awaitable: Awaitable[TResult], timeout: Optional[float], message: str) -> TResult:
+    """
+    Await `awaitable`, giving up after `timeout` seconds (if set) with an `EvalCaseTimeoutError`.
+
+    At the timeout the awaitable is cancelled: an async interaction gets a `CancelledError` and
+    is waited for while it cleans up, a sync call still queued in the pool never starts. A sync
+    call already running cannot be interrupted; it is left to finish in the background and its
+    result is discarded.
+    """
+    if timeout is None:
+        return await awaitable
+    task = asyncio.ensure_future(awaitable)
+    try:
+        return await asyncio.wait_for(task, timeout)
+    except asyncio.TimeoutError:
+        if task.cancelled():
+            raise EvalCaseTimeoutError(message) from None
+        # The awaitable raised a TimeoutError of its own
+        raise
+
+
+async def _next_test_case(test_cases: AsyncIterator[TestCase]) -> Optional[TestCase]:
+    try:
+        return await test_cases.__anext__()
+    except StopAsyncIteration:
+        return None
 
 
 async def _execute_interaction_function(
     interaction_function: Callable[[TestCase], Union[TResult, Awaitable[TResult]]],
     parsed_input: TestCase,
-    semaphore: Optional[asyncio.Semaphore],
+    executor: Optional[Executor] = None,
 ) -> TResult:
     """
-    Execute the interaction function with proper concurrency control.
-    Handles both async and sync functions, and applies semaphore if provided.
+    Execute the interaction function.
+    Handles both async and sync functions; sync functions run in `executor`.
     """
+    if inspect.iscoroutinefunction(interaction_function):
+        # Async function - just await it
+        result = await interaction_function(parsed_input)
+        return cast(TResult, result)
+
+    event_loop = asyncio.get_running_loop()
+    if isinstance(executor, ProcessPoolExecutor):
+        # A context cannot be sent to another process; its trace context, baggage and
+        # experiment context are sent instead
+        carrier: Dict[str, str] = {}
+        _process_propagator.inject(carrier)
+        return await event_loop.run_in_executor(
+            executor,
+            _run_in_process_worker,
+            interaction_function,
+            parsed_input,
+            carrier,
+            get_current_experiment_context(),
+        )
+    else:
+        # Sync function - run in thread pool to avoid blocking
+        ctx = copy_context()
 
-    async def run_function() -> TResult:
-        if inspect.iscoroutinefunction(interaction_function):
-            # Async function - just await it
-            result = await interaction_function(parsed_input)
-            return cast(TResult, result)
-        else:
-            # Sync function - run in thread pool to avoid blocking
-            event_loop = asyncio.get_running_loop()
-            ctx = copy_context()
+        def run_sync() -> Any:
+            """Run the sync function with the captured context."""
+            return ctx.run(interaction_function, parsed_input)
 
-            def run_sync() -> Any:
-                """Run the sync function with the captured context."""
-                return ctx.run(interaction_function, parsed_input)
+        return await event_loop.run_in_executor(executor, run_sync)
 
-            return await event_loop.run_in_executor(None, run_sync)
 
-    # Apply semaphore if provided
-    if semaphore:
-        async with semaphore:
-            return await run_function()
-    else:
-        return await run_function()
+@contextmanager
+def _test_case_span(
+    test_case_name: str,
+    test_case_id: Optional[str],
+    experiment_context: ExperimentContext,
+) -> Iterator[trace.Span]:
+    """The span of one dataset test case, current (with the experiment baggage) inside the block."""
+    # Set up baggage context similar to @interaction()
+    context = otel_context.get_current()
+    context = otel_baggage.set_baggage(ATTR_GENTRACE_SAMPLE_KEY, "true", context=context)
+    context = otel_baggage.set_baggage(ATTR_GENTRACE_IN_EXPERIMENT, "true", context=context)
+    token = otel_context.attach(context)
+
+    try:
+        with _tracer.start_as_current_span(test_case_name) as span:
+            span.set_attribute(ATTR_GENTRACE_EXPERIMENT_ID, experiment_context["experiment_id"])
+            span.set_attribute(ATTR_GENTRACE_TEST_CASE_NAME, test_case_name)
+            if test_case_id:
+                span.set_attribute(ATTR_GENTRACE_TEST_CASE_ID, test_case_id)
+            yield span
+    finally:
+        otel_context.detach(token)
+
+
+def _record_reused_test_case(
+    test_case_name: str,
+    test_case_id: Optional[str],
+    raw_inputs: Any,
+    result: Any,
+    experiment_context: ExperimentContext,
+    source_experiment_id: str,
+) -> None:
+    """Trace a test case whose result is reused from an earlier experiment instead of running it."""
+    with _test_case_span(test_case_name, test_case_id, experiment_context) as span:
+        span.set_attribute(ATTR_GENTRACE_REUSED_FROM_EXPERIMENT_ID, source_experiment_id)
+        if raw_inputs is not None:
+            record_payload_event(span, ATTR_GENTRACE_FN_ARGS_EVENT_NAME, "args", [raw_inputs])
+        record_output_event(span, result)
 
 
 async def _run_single_test_case_for_dataset(
@@ -193,9 +401,16 @@ async def _run_single_test_case_for_dataset(
     raw_inputs: Optional[InputPayload],
     full_test_case: TestCase,
     interaction_function: Callable[[TestCase], Union[TResult, Awaitable[TResult]]],
-    input_schema: Optional[SchemaType],
+    input_validator: Optional[SchemaValidator],
     experiment_context: ExperimentContext,
-    semaphore: Optional[asyncio.Semaphore],
+    executor: Optional[Executor] = None,
+    validation: Optional[ValidationResult] = None,
+    concurrency_limit: Optional[int] = None,
+    on_error: Optional[Callable[[Exception], None]] = None,
+    timeout: Optional[float] = None,
+    timeout_message: str = "",
+    retry_policy: Optional[EvalRetryPolicy] = None,
+    before_retry: Optional[Callable[[Exception], Awaitable[None]]] = None,
 ) -> Optional[TResult]:
     """
     Internal helper to run and trace a single test case from a dataset.
@@ -206,85 +421,122 @@ async def _run_single_test_case_for_dataset(
         test_case_id: Optional ID of the test case
         raw_inputs: The input data for the test case
         interaction_function: The function to test
-        input_schema: Optional Pydantic BaseModel or TypedDict for validation
+        input_validator: Optional validator for the Pydantic BaseModel or TypedDict schema
         experiment_context: The experiment context
-        semaphore: Optional semaphore for concurrency control
+        executor: The pool that runs a sync interaction function
+        validation: The result of validating raw_inputs, if it was computed in advance
+        concurrency_limit: The limit on concurrent test cases when this one started, if any
+        on_error: Called with the exception if input validation or the interaction function fails
+        timeout: Seconds after which the interaction is cancelled (async) or abandoned (sync),
+                 covering all of its attempts
+        timeout_message: Message of the `EvalCaseTimeoutError` recorded when the timeout expires
+        retry_policy: Decides whether failed attempts of the interaction are retried
+        before_retry: Awaited with the error after the backoff, before each retry
     """
-    span_name = test_case_name
     result_value: Any = None  # type: ignore
 
-    # Set up baggage context similar to @interaction()
-    context = otel_context.get_current()
-    context = otel_baggage.set_baggage(ATTR_GENTRACE_SAMPLE_KEY, "true", context=context)
-    context = otel_baggage.set_baggage(ATTR_GENTRACE_IN_EXPERIMENT, "true", context=context)
-    token = otel_context.attach(context)
+    with _test_case_span(test_case_name, test_case_id, experiment_context) as span:
+        if concurrency_limit is not None:
+            span.set_attribute(ATTR_GENTRACE_CONCURRENCY_LIMIT, concurrency_limit)
 
-    try:
-        with _tracer.start_as_current_span(span_name) as span:
-            span.set_attribute(ATTR_GENTRACE_EXPERIMENT_ID, experiment_context["experiment_id"])
-            span.set_attribute(ATTR_GENTRACE_TEST_CASE_NAME, test_case_name)
-            if test_case_id:
-                span.set_attribute(ATTR_GENTRACE_TEST_CASE_ID, test_case_id)
+        try:
+            input_dict_for_log: Any = None
 
-            try:
-                input_dict_for_log: Any = None
+            if input_validator is not None:
+                # Validate the inputs using either Pydantic BaseModel or TypedDict
+                is_valid, validated_data, error_message = (
+                    validation
+                    if validation is not None
+                    else input_validator.validate(raw_inputs or {})  # Ensure we pass a dict
+                )
 
-                if input_schema:
-                    # Validate the inputs using either Pydantic BaseModel or TypedDict
-                    is_valid, validated_data, error_message = _validate_inputs_with_schema(
-                        raw_inputs or {},  # Ensure we pass a dict
-                        input_schema,
+                if not is_valid:
+                    logger.error(
+                        f"Pydantic validation failed for test case {test_case_name}. Inputs: {raw_inputs}. Error: {error_message}"
+                    )
+                    # Use a generic exception for error recording since we can't create ValidationError directly
+                    error = Exception(f"Validation Error: {error_message}")
+                    span.record_exception(error)
+                    span.set_status(Status(StatusCode.ERROR, description="Input validation failed"))
+                    span.set_attribute("error.type", "ValidationError")
+                    if on_error is not None:
+                        on_error(error)
+                    return None
+
+                input_dict_for_log = validated_data
+
+            elif raw_inputs is not None:
+                # No schema → just log the raw dict
+                input_dict_for_log = raw_inputs
+            else:
+                # both schema is None and raw_inputs is None
+                input_dict_for_log = None
+
+            # Attach the inputs as a span event
+            if input_dict_for_log is not None:
+                record_payload_event(span, ATTR_GENTRACE_FN_ARGS_EVENT_NAME, "args", [input_dict_for_log])
+
+            # Call the interaction function
+            case_deadline = perf_counter() + timeout if timeout is not None else None
+            if retry_policy is not None:
+                retry_policy.start_case()
+            attempt = 1
+            while True:
+                if retry_policy is not None:
+                    span.set_attribute(ATTR_GENTRACE_ATTEMPTS, attempt)
+                try:
+                    result_value = await _await_with_timeout(
+                        _execute_interaction_function(interaction_function, full_test_case, executor),
+                        case_deadline - perf_counter() if case_deadline is not None else None,
+                        timeout_message,
+                    )
+                    break
+                except Exception as e:
+                    remaining = case_deadline - perf_counter() if case_deadline is not None else None
+                    delay = retry_policy.retry_delay(e, attempt, remaining) if retry_policy is not None else None
+                    if delay is None:
+                        raise
+                    logger.warning(
+                        f"Attempt {attempt} of test case {test_case_name} failed with {e.__class__.__name__}: {e}; "
+                        f"retrying in {delay:.2f}s"
                     )
-
-                    if not is_valid:
-                        logger.error(
-                            f"Pydantic validation failed for test case {test_case_name}. Inputs: {raw_inputs}. Error: {error_message}"
-                        )
-                        # Use a generic exception for error recording since we can't create ValidationError directly
-                        error = Exception(f"Validation Error: {error_message}")
-                        span.record_exception(error)
-                        span.set_status(Status(StatusCode.ERROR, description="Input validation failed"))
-                        span.set_attribute("error.type", "ValidationError")
-                        return None
-
-                    input_dict_for_log = validated_data
-
-                elif raw_inputs is not None:
-                    # No schema → just log the raw dict
-                    input_dict_for_log = raw_inputs
-                else:
-                    # both schema is None and raw_inputs is None
-                    input_dict_for_log = None
-
-                # Attach the inputs as a span event
-                if input_dict_for_log is not None:
                     span.add_event(
-                        ATTR_GENTRACE_FN_ARGS_EVENT_NAME,
-                        {"args": _gentrace_json_dumps([input_dict_for_log])},
+                        ATTR_GENTRACE_RETRY_EVENT_NAME,
+                        {
+                            "attempt": attempt,
+                            "error.type": e.__class__.__name__,
+                            "error.message": str(e),
+                            "delay_seconds": delay,
+                        },
                     )
-
-                # Call the interaction function with proper concurrency control
-                result_value = await _execute_interaction_function(
-                    interaction_function,
-                    full_test_case,
-                    semaphore,
-                )
-
-                # Log the output
-                span.add_event(ATTR_GENTRACE_FN_OUTPUT_EVENT_NAME, {"output": _gentrace_json_dumps(result_value)})
-                return cast(Optional[TResult], result_value)
-
-            except Exception as e:
+                    await asyncio.sleep(delay)
+                    if before_retry is not None:
+                        await _await_with_timeout(
+                            before_retry(e),
+                            case_deadline - perf_counter() if case_deadline is not None else None,
+                            timeout_message,
+                        )
+                    attempt += 1
+
+            # Log the output
+            record_output_event(span, result_value)
+            return cast(Optional[TResult], result_value)
+
+        except Exception as e:
+            if on_error is not None:
+                on_error(e)
+            if isinstance(e, EvalCaseTimeoutError):
+                logger.warning(f"Test case {test_case_name} timed out: {e}")
+                span.set_attribute(ATTR_GENTRACE_TIMED_OUT, True)
+            else:
                 logger.error(
                     f"Unknown error occurred while running test case {test_case_name}",
                     exc_info=True,
                 )
-                span.record_exception(e)
-                span.set_status(Status(StatusCode.ERROR, description=str(e)))
-                span.set_attribute("error.type", e.__class__.__name__)
-                return None
-    finally:
-        otel_context.detach(token)
+            span.record_exception(e)
+            span.set_status(Status(StatusCode.ERROR, description=str(e)))
+            span.set_attribute("error.type", e.__class__.__name__)
+            return None
 
 
 @overload
@@ -295,6 +547,14 @@ async def eval_dataset(
     interaction: Callable[[TestCase], TResult],
     max_concurrency: Optional[int] = None,
     show_progress_bar: Optional[bool] = None,
+    executor: ExecutorType = "thread",
+    rate_limit: Optional[RateLimitOptions] = None,
+    adaptive_concurrency: Union[bool, AdaptiveConcurrencyOptions] = False,
+    incremental: bool = False,
+    interaction_version: Optional[str] = None,
+    per_case_timeout: Optional[float] = None,
+    total_timeout: Optional[float] = None,
+    retry: Union[bool, RetryOptions] = False,
 ) -> Sequence[Optional[TResult]]: ...
 
 
@@ -306,6 +566,14 @@ async def eval_dataset(
     interaction: Callable[[TestCase], Awaitable[TResult]],
     max_concurrency: Optional[int] = None,
     show_progress_bar: Optional[bool] = None,
+    executor: ExecutorType = "thread",
+    rate_limit: Optional[RateLimitOptions] = None,
+    adaptive_concurrency: Union[bool, AdaptiveConcurrencyOptions] = False,
+    incremental: bool = False,
+    interaction_version: Optional[str] = None,
+    per_case_timeout: Optional[float] = None,
+    total_timeout: Optional[float] = None,
+    retry: Union[bool, RetryOptions] = False,
 ) -> Sequence[Optional[TResult]]: ...
 
 
@@ -316,6 +584,14 @@ async def eval_dataset(
     interaction: Callable[[TestCase], TResult],
     max_concurrency: Optional[int] = None,
     show_progress_bar: Optional[bool] = None,
+    executor: ExecutorType = "thread",
+    rate_limit: Optional[RateLimitOptions] = None,
+    adaptive_concurrency: Union[bool, AdaptiveConcurrencyOptions] = False,
+    incremental: bool = False,
+    interaction_version: Optional[str] = None,
+    per_case_timeout: Optional[float] = None,
+    total_timeout: Optional[float] = None,
+    retry: Union[bool, RetryOptions] = False,
 ) -> Sequence[Optional[TResult]]: ...
 
 
@@ -326,6 +602,14 @@ async def eval_dataset(
     interaction: Callable[[TestCase], Awaitable[TResult]],
     max_concurrency: Optional[int] = None,
     show_progress_bar: Optional[bool] = None,
+    executor: ExecutorType = "thread",
+    rate_limit: Optional[RateLimitOptions] = None,
+    adaptive_concurrency: Union[bool, AdaptiveConcurrencyOptions] = False,
+    incremental: bool = False,
+    interaction_version: Optional[str] = None,
+    per_case_timeout: Optional[float] = None,
+    total_timeout: Optional[float] = None,
+    retry: Union[bool, RetryOptions] = False,
 ) -> Sequence[Optional[TResult]]: ...
 
 
@@ -336,6 +620,14 @@ async def eval_dataset(
     interaction: Callable[[Any], Union[TResult, Awaitable[TResult]]],
     max_concurrency: Optional[int] = None,
     show_progress_bar: Optional[bool] = None,
+    executor: ExecutorType = "thread",
+    rate_limit: Optional[RateLimitOptions] = None,
+    adaptive_concurrency: Union[bool, AdaptiveConcurrencyOptions] = False,
+    incremental: bool = False,
+    interaction_version: Optional[str] = None,
+    per_case_timeout: Optional[float] = None,
+    total_timeout: Optional[float] = None,
+    retry: Union[bool, RetryOptions] = False,
 ) -> Sequence[Optional[TResult]]:
     """
     Runs a series of test cases from a dataset against a specified interaction function,
@@ -346,8 +638,10 @@ async def eval_dataset(
     details from the experiment context and the test case itself.
 
     Args:
-        data (Union[Callable, Sequence]): Either a function/coroutine function that returns a list
-                         of test cases, or a plain list of test cases directly.
+        data (Union[Callable, Sequence, Iterable, AsyncIterable]): Either a function/coroutine function
+                         that returns the test cases, or the test cases directly. The test cases can be
+                         a list, or any iterable or async iterable (e.g. a generator paging through a
+                         large dataset), which is consumed lazily as cases are run.
                          Test cases can be TestCase objects (from API) or TestInput objects (for local tests).
         schema (Optional[Union[Type[pydantic.BaseModel], Type[TypedDict]]]): A Pydantic BaseModel or TypedDict
                                                    to validate the `inputs` of each test case. If validation fails
@@ -359,12 +653,82 @@ async def eval_dataset(
         max_concurrency (Optional[int]): Maximum number of test cases to run concurrently.
                                        If None (default), all test cases run concurrently.
                                        Maximum allowed value is 100.
-                                       For async functions, uses asyncio.Semaphore.
-                                       For sync functions, uses ThreadPoolExecutor.
+                                       Cases are pulled from `data` by a pool of this many
+                                       workers, so memory use is proportional to
+                                       `max_concurrency` rather than to the dataset size
+                                       (apart from the returned results).
+                                       Sync functions run in a pool sized to match
+                                       (see `executor`).
         show_progress_bar (Optional[bool]): Controls progress display during evaluation.
                                           - True: Shows an interactive progress bar
                                           - False: Shows line-by-line output (for CI/CD)
                                           - None (default): Auto-detects CI environment
+        executor (Literal["thread", "process"]): Where a sync `interaction` runs. "thread" (default)
+                                                uses a thread pool owned by this run, with one thread
+                                                per concurrent case. "process" spreads the cases over a
+                                                pool of worker processes (at most one per CPU core), for
+                                                CPU-bound interactions; the function, the test cases and
+                                                the results must be picklable. The trace context, baggage
+                                                and experiment context of each case are propagated to its
+                                                worker, so spans created there are children of the case
+                                                span. Workers export their own spans, through the tracer
+                                                provider they inherit when forked (with the "spawn" start
+                                                method, configure Gentrace when the interaction's module
+                                                is imported). Results are returned in dataset order.
+                                                Both pools are shut down when the run ends.
+        rate_limit (Optional[RateLimitOptions]): Limits the rate at which test cases start
+                                                (`requests_per_second`) and the estimated LLM tokens
+                                                they use (`tokens_per_minute`), as token buckets.
+        adaptive_concurrency (Union[bool, AdaptiveConcurrencyOptions]): Adapt the number of concurrent
+                                                test cases (AIMD): ramp up while cases succeed and back
+                                                off when one fails with a rate limit error (HTTP 429) or
+                                                its latency spikes. Ranges up to `max_concurrency`
+                                                (or 100 if unset). The limit in effect when a case
+                                                starts is recorded on its span as
+                                                `gentrace.eval.concurrency_limit`. With adaptive
+                                                concurrency or rate limits, a case is only read from
+                                                `data` once a slot under the current limit is free.
+        per_case_timeout (Optional[float]): Seconds each test case's interaction may run. An async
+                                                interaction still running then is cancelled. A sync call
+                                                still waiting for a pool worker never starts; one already
+                                                running cannot be interrupted, so it is abandoned (left to
+                                                finish in the background, its result discarded) and keeps
+                                                its pool worker until it returns. Either way the case fails
+                                                with an `EvalCaseTimeoutError`, its span gets an error
+                                                status and `gentrace.eval.timed_out`, and its concurrency
+                                                slot is released right away.
+        total_timeout (Optional[float]): Seconds the whole run may take, including loading and reading
+                                                the dataset and waiting for concurrency slots and rate
+                                                limits. Cases still running when it expires time out as
+                                                above; cases not started by then are not run and return
+                                                None with an `EvalCaseTimeoutError`. A streamed dataset is
+                                                not read further, and if loading the dataset takes too
+                                                long, the run raises `EvalCaseTimeoutError`.
+        retry (Union[bool, RetryOptions]): Retry test cases whose interaction fails with a transient
+                                                error (by default: rate limits, timeouts, connection errors
+                                                and 5xx responses), with exponential backoff and jitter.
+                                                All cases of the run share one retry budget, so a failing
+                                                upstream is not flooded with retries. Each retried attempt
+                                                is recorded as a `gentrace.eval.retry` event on the case
+                                                span, and the number of attempts as `gentrace.eval.attempts`.
+                                                `per_case_timeout` covers all attempts of a case.
+
+    Resuming:
+        If the surrounding `@experiment` has a `checkpoint_path`, each test case that completes
+        successfully is recorded there with its (pickled) result. When the experiment resumes an
+        earlier run (`resume_experiment_id`), cases recorded for the same interaction function are
+        not run or traced again; their stored results are returned in their place. Cases are
+        matched by ID, or by name and inputs if they have no ID.
+
+    Incremental runs:
+        With `incremental=True` (which also requires a `checkpoint_path`), results are reused across
+        experiments. Each case is fingerprinted from its inputs, its expected outputs and
+        `interaction_version`; if a result for the same interaction function and fingerprint is
+        stored from an earlier experiment, it is returned without running the case. The case is
+        still traced in this experiment, with its inputs and the reused output, and its span has a
+        `gentrace.eval.reused_from_experiment_id` attribute (spans created inside the interaction
+        in the earlier run are not repeated). Only new or changed cases run. Bump
+        `interaction_version` whenever the interaction's code, prompts or models change.
 
     Returns:
         A list containing the results of the `interaction` function for each successfully
@@ -374,20 +738,126 @@ async def eval_dataset(
     Raises:
         RuntimeError: If called outside of an active `@experiment` context or if the
                       `data` provider fails catastrophically.
+        ValueError: If `incremental` is set but the experiment has no `checkpoint_path`, a
+                    timeout is not positive, or the `retry` options are invalid.
         Any exception raised during a specific test case interaction (after validation)
         will propagate from that specific test case run.
     """
+    cases = _run_eval_dataset(
+        api_name="eval_dataset",
+        data=data,
+        schema=schema,
+        interaction=interaction,
+        max_concurrency=max_concurrency,
+        show_progress_bar=show_progress_bar,
+        executor=executor,
+        rate_limit=rate_limit,
+        adaptive_concurrency=adaptive_concurrency,
+        incremental=incremental,
+        interaction_version=interaction_version,
+        per_case_timeout=per_case_timeout,
+        total_timeout=total_timeout,
+        retry=retry,
+    )
+    # Results are stored by position, so they come back in dataset order
+    results: Dict[int, Optional[TResult]] = {}
+    try:
+        async for index, completed in cases:
+            results[index] = cast(Optional[TResult], completed.result)
+    finally:
+        await cases.aclose()
+    return [results[index] for index in range(len(results))]
+
+
+async def eval_dataset_iter(
+    *,
+    data: DataProviderType,
+    schema: Optional[SchemaType] = None,
+    interaction: Callable[[Any], Any],
+    max_concurrency: Optional[int] = None,
+    show_progress_bar: Optional[bool] = None,
+    executor: ExecutorType = "thread",
+    rate_limit: Optional[RateLimitOptions] = None,
+    adaptive_concurrency: Union[bool, AdaptiveConcurrencyOptions] = False,
+    incremental: bool = False,
+    interaction_version: Optional[str] = None,
+    per_case_timeout: Optional[float] = None,
+    total_timeout: Optional[float] = None,
+    retry: Union[bool, RetryOptions] = False,
+) -> AsyncIterator[EvalDatasetResult]:
+    """
+    Like `eval_dataset`, but yields each test case as soon as it completes instead of returning
+    all results at the end.
+
+    Takes the same arguments as `eval_dataset` and must also be used within an `@experiment()`
+    context. Yields `EvalDatasetResult` tuples of `(test_case, result, timing, error)` in completion
+    order, so results can be written out or aggregated while the run continues and do not have to
+    be held in memory together.
+
+    With `max_concurrency` (or rate limits / adaptive concurrency), completed cases wait for the
+    consumer in a buffer of at most that many entries; while it is full no further cases are
+    started, so a slow consumer slows the run down rather than letting results pile up.
+
+    To stop early, break out of the loop and close the iterator (`await iterator.aclose()`); cases
+    still running are cancelled and the run's pools are shut down.
+
+    Usage:
+        ```python
+        async for test_case, result, timing, error in eval_dataset_iter(data=cases, interaction=fn):
+            write_row(test_case.id, result, timing.duration_seconds, error)
+        ```
+    """
+    cases = _run_eval_dataset(
+        api_name="eval_dataset_iter",
+        data=data,
+        schema=schema,
+        interaction=interaction,
+        max_concurrency=max_concurrency,
+        show_progress_bar=show_progress_bar,
+        executor=executor,
+        rate_limit=rate_limit,
+        adaptive_concurrency=adaptive_concurrency,
+        incremental=incremental,
+        interaction_version=interaction_version,
+        per_case_timeout=per_case_timeout,
+        total_timeout=total_timeout,
+        retry=retry,
+    )
+    try:
+        async for _, completed in cases:
+            yield completed
+    finally:
+        await cases.aclose()
+
+
+async def _run_eval_dataset(
+    *,
+    api_name: str,
+    data: DataProviderType,
+    schema: Optional[SchemaType],
+    interaction: Callable[[Any], Any],
+    max_concurrency: Optional[int],
+    show_progress_bar: Optional[bool],
+    executor: ExecutorType,
+    rate_limit: Optional[RateLimitOptions],
+    adaptive_concurrency: Union[bool, AdaptiveConcurrencyOptions],
+    incremental: bool,
+    interaction_version: Optional[str],
+    per_case_timeout: Optional[float],
+    total_timeout: Optional[float],
+    retry: Union[bool, RetryOptions],
+) -> AsyncIterator[Tuple[int, EvalDatasetResult]]:
+    """Run a dataset, yielding each completed case with its position in the dataset, in completion order."""
     ensure_initialized()
     experiment_context = get_current_experiment_context()
     if not experiment_context:
-        raise RuntimeError("eval_dataset must be called within the context of an @experiment() decorated function.")
+        raise RuntimeError(f"{api_name} must be called within the context of an @experiment() decorated function.")
 
     interaction_fn = interaction
     data_provider = data
-    input_schema = schema
+    # Compiled once per schema type (and cached across runs) rather than for every case
+    input_validator = get_schema_validator(schema) if schema else None
 
-    # Create a semaphore for concurrency control if max_concurrency is specified
-    semaphore: Optional[asyncio.Semaphore] = None
     if max_concurrency is not None and max_concurrency > 0:
         # Throw exception if max_concurrency is very high
         if max_concurrency > MAX_EVAL_DATASET_CONCURRENCY:
@@ -397,51 +867,55 @@ async def eval_dataset(
                 f"max_concurrency ({max_concurrency}) exceeds maximum allowed value of {MAX_EVAL_DATASET_CONCURRENCY}. Please use a value between 1 and {MAX_EVAL_DATASET_CONCURRENCY}."
             )
 
-        semaphore = asyncio.Semaphore(max_concurrency)
-
-    raw_test_cases: Sequence[Union[TestCase, TestInput[Mapping[str, Any]]]]
-    try:
-        if callable(data_provider):
-            data_result = data_provider()
-            if inspect.isawaitable(data_result):
-                raw_test_cases = await data_result
-            else:
-                raw_test_cases = data_result
-        else:
-            # data_provider is already a sequence
-            raw_test_cases = data_provider
-    except Exception as e:
-        # Potentially log this with a Gentrace SDK logger if available
-        raise RuntimeError(f"Failed to retrieve or process dataset from data provider: {e}") from e
-
-    # Convert all test cases to TestCase objects
-    converted_test_cases: List[TestCase] = []
-    for raw_case in raw_test_cases:
-        # Convert TestInput to TestCase internally
-        if isinstance(raw_case, TestCase):
-            # If already a TestCase, use as-is
-            converted_test_cases.append(raw_case)
-        else:
-            # Generate values for required fields
-            now = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-
-            # Convert TestInput to TestCase
-            # At this point, raw_case must be TestInput based on the type annotation
-            converted_test_cases.append(
-                TestCase(
-                    id=raw_case.id or "",  # Don't generate ID for local test cases
-                    name=raw_case.name or "",  # Let the index-based naming logic handle unnamed cases
-                    inputs=dict(raw_case.inputs),  # Convert Mapping to dict
-                    expectedOutputs=None,
-                    # Fill required fields with sensible defaults
-                    datasetId="local",
-                    pipelineId="local",
-                    createdAt=now,
-                    updatedAt=now,
-                    archivedAt=None,
-                    deletedAt=None,
-                )
-            )
+    is_sync_interaction = not inspect.iscoroutinefunction(interaction_fn)
+    if executor not in ("thread", "process"):
+        raise ValueError(f"Unknown executor: {executor!r}. Use 'thread' or 'process'.")
+    if executor == "process":
+        if not is_sync_interaction:
+            raise ValueError('executor="process" requires a sync interaction function.')
+        try:
+            pickle.dumps(interaction_fn)
+        except Exception as e:
+            raise ValueError(
+                f'executor="process" requires a picklable interaction function (e.g. defined at module level): {e}'
+            ) from e
+
+    for option, value in (("per_case_timeout", per_case_timeout), ("total_timeout", total_timeout)):
+        if value is not None and value <= 0:
+            raise ValueError(f"{option} must be a positive number of seconds, got {value}.")
+
+    # One policy per run, so that all of its cases draw on the same retry budget
+    retry_policy: Optional[EvalRetryPolicy] = None
+    if retry:
+        retry_policy = EvalRetryPolicy({} if retry is True else retry)
+
+    worker_limit = max_concurrency if max_concurrency is not None and max_concurrency > 0 else None
+    # Rate limits and adaptive concurrency pace the cases; a plain max_concurrency needs no controller
+    controller: Optional[EvalConcurrencyController] = None
+    if rate_limit or adaptive_concurrency:
+        adaptive_options: Optional[AdaptiveConcurrencyOptions] = None
+        if adaptive_concurrency:
+            adaptive_options = {} if adaptive_concurrency is True else adaptive_concurrency
+        worker_limit = worker_limit or MAX_EVAL_DATASET_CONCURRENCY
+        controller = EvalConcurrencyController(worker_limit, rate_limit=rate_limit, adaptive=adaptive_options)
+
+    checkpoint_store = get_current_checkpoint_store()
+    if incremental and checkpoint_store is None:
+        raise ValueError(
+            'incremental=True requires a result store: pass options={"checkpoint_path": ...} to @experiment().'
+        )
+
+    deadline = perf_counter() + total_timeout if total_timeout is not None else None
+    total_timeout_message = f"eval_dataset total_timeout ({total_timeout}s) expired"
+
+    def remaining_time() -> Optional[float]:
+        return deadline - perf_counter() if deadline is not None else None
+
+    raw_test_cases = await _await_with_timeout(
+        _resolve_data_provider(data_provider), remaining_time(), f"{total_timeout_message} while loading the dataset"
+    )
+    # Streamed datasets (generators, async iterables) have no known length
+    total = len(raw_test_cases) if isinstance(raw_test_cases, Sized) else None
 
     # Initialize progress reporter based on configuration
     use_progress_bar = show_progress_bar if show_progress_bar is not None else not is_ci()
@@ -464,61 +938,265 @@ async def eval_dataset(
 
     # Start progress reporting with experiment URL if available
     experiment_url = experiment_context.get("experiment_url")
-    progress_reporter.start(experiment_context["pipeline_id"], len(converted_test_cases), experiment_url)
+    progress_reporter.start(experiment_context["pipeline_id"], total, experiment_url)
 
-    evaluation_tasks: List[Tuple[str, Awaitable[Optional[TResult]]]] = []
-    for i, test_case in enumerate(converted_test_cases):
+    async def run_test_case(index: int, test_case: TestCase, slot_acquired: bool) -> EvalDatasetResult:
+        nonlocal abandoned_calls
         # Now test_case is always a TestCase object
-        case_inputs = test_case.inputs
         case_id = test_case.id
-        case_name_prop = test_case.name
-
-        final_case_name: str
-        if case_name_prop:
-            final_case_name = case_name_prop
+        case_name: str
+        if test_case.name:
+            case_name = test_case.name
         elif case_id:
-            final_case_name = f"Test Case (ID: {case_id})"
+            case_name = f"Test Case (ID: {case_id})"
         else:
-            final_case_name = f"Test Case {i + 1}"
-
-        # Create the task - semaphore will be handled inside _run_single_test_case_for_dataset
-        async def run_test_case(
-            case_name: str = final_case_name,
-            case_id_val: Optional[str] = case_id,
-            case_inputs_val: Mapping[str, Any] = case_inputs,
-            full_case: TestCase = test_case,
-        ) -> Optional[TResult]:
+            case_name = f"Test Case {index + 1}"
+
+        case_key: Optional[str] = None
+        if checkpoint_store is not None:
+            case_key = checkpoint_case_key(case_id, test_case.name, test_case.inputs)
+            completed_result = completed.pop(case_key, None)
+            if completed_result is not None:
+                # Completed by the run being resumed
+                if controller is not None and slot_acquired:
+                    await controller.release_unused_slot()
+                progress_reporter.increment(case_name)
+                return EvalDatasetResult(test_case, pickle.loads(completed_result), EvalCaseTiming(0.0, 0.0), None)
+
+        fingerprint: Optional[str] = None
+        if incremental and checkpoint_store is not None and case_key is not None:
+            fingerprint = fingerprint_test_case(test_case.inputs, test_case.expected_outputs, interaction_version)
+            reused = checkpoint_store.lookup_fingerprint(scope, fingerprint)
+            if reused is not None:
+                # Unchanged since an earlier experiment: trace the stored result instead of running the case
+                source_experiment_id, payload = reused
+                reused_result = pickle.loads(payload)
+                _record_reused_test_case(
+                    case_name, case_id, test_case.inputs, reused_result, experiment_context, source_experiment_id
+                )
+                checkpoint_store.record(experiment_id, scope, case_key, reused_result)
+                if controller is not None and slot_acquired:
+                    await controller.release_unused_slot()
+                progress_reporter.increment(case_name)
+                return EvalDatasetResult(test_case, reused_result, EvalCaseTiming(0.0, 0.0), None)
+
+        # The run is out of time: cases that have not started yet are not run
+        not_started_message = f"{total_timeout_message} before the test case started"
+        if controller is not None and not slot_acquired:
+            # total_timeout expired while the worker waited for a slot
+            progress_reporter.increment(case_name)
+            error = EvalCaseTimeoutError(not_started_message)
+            return EvalDatasetResult(test_case, None, EvalCaseTiming(0.0, 0.0), error)
+        errors: List[Exception] = []
+        started = queued = perf_counter()
+
+        try:
+            timeout = per_case_timeout
+            timeout_message = f"Test case did not finish within per_case_timeout ({per_case_timeout}s)"
+            try:
+                if controller is not None:
+                    await _await_with_timeout(
+                        controller.wait_for_rate(test_case), remaining_time(), not_started_message
+                    )
+                    started = perf_counter()
+                if deadline is not None and (timeout is None or deadline - started < timeout):
+                    timeout = deadline - started
+                    timeout_message = total_timeout_message
+                    if timeout <= 0:
+                        raise EvalCaseTimeoutError(not_started_message)
+            except EvalCaseTimeoutError as error:
+                errors.append(error)
+                return EvalDatasetResult(test_case, None, EvalCaseTiming(perf_counter() - queued, 0.0), error)
+
             # Update progress to show current test
             if hasattr(progress_reporter, "update_current_test"):
                 progress_reporter.update_current_test(case_name)
 
-            try:
-                result = await _run_single_test_case_for_dataset(
-                    test_case_name=case_name,
-                    test_case_id=case_id_val,
-                    raw_inputs=case_inputs_val,  # type: ignore[arg-type]
-                    full_test_case=full_case,
-                    interaction_function=interaction_fn,
-                    input_schema=input_schema,
-                    experiment_context=experiment_context,
-                    semaphore=semaphore,
-                )
-                return result
-            finally:
-                # Report progress after test completes (success or failure)
-                progress_reporter.increment(case_name)
+            async def before_retry(error: Exception) -> None:
+                # A retry is another request: it adapts the limit and waits for the rate limits too
+                if controller is not None:
+                    controller.note_failed_attempt(error)
+                    await controller.wait_for_rate(test_case)
+
+            result = await _run_single_test_case_for_dataset(
+                test_case_name=case_name,
+                test_case_id=case_id,
+                raw_inputs=test_case.inputs,  # type: ignore[arg-type]
+                full_test_case=test_case,
+                interaction_function=interaction_fn,
+                input_validator=input_validator,
+                experiment_context=experiment_context,
+                executor=pool,
+                validation=validations[index] if validations is not None else None,
+                concurrency_limit=controller.limit if controller is not None else worker_limit,
+                on_error=errors.append,
+                timeout=timeout,
+                timeout_message=timeout_message,
+                retry_policy=retry_policy,
+                before_retry=before_retry,
+            )
+            if pool is not None and errors and isinstance(errors[0], EvalCaseTimeoutError):
+                abandoned_calls += 1
+            if checkpoint_store is not None and case_key is not None and not errors:
+                checkpoint_store.record(experiment_id, scope, case_key, result, fingerprint=fingerprint)
+            timing = EvalCaseTiming(started - queued, perf_counter() - started)
+            return EvalDatasetResult(test_case, result, timing, errors[0] if errors else None)
+        finally:
+            if controller is not None and slot_acquired:
+                await controller.release_slot(perf_counter() - started, errors[0] if errors else None)
+            # Report progress after test completes (success or failure)
+            progress_reporter.increment(case_name)
+
+    # Cases completed by an earlier run of this experiment are skipped, their stored results returned
+    experiment_id = experiment_context["experiment_id"]
+    scope = checkpoint_scope(interaction_fn)
+    completed: Dict[str, bytes] = {}
+    # When the dataset is already in memory, all inputs are validated in one batch call;
+    # streamed cases are validated one at a time as they run
+    validations: Optional[List[ValidationResult]] = None
+
+    test_cases = _iterate_test_cases(raw_test_cases)
+    # Completed cases are handed over through a queue. With a worker pool it holds at most one
+    # entry per worker, so a consumer that falls behind stops workers from starting more cases
+    completed_cases: "asyncio.Queue[Tuple[int, EvalDatasetResult]]" = asyncio.Queue(maxsize=worker_limit or 0)
+
+    async def run_and_report(index: int, test_case: TestCase, slot_acquired: bool = False) -> None:
+        await completed_cases.put((index, await run_test_case(index, test_case, slot_acquired)))
+
+    dataset_timed_out = False
+
+    async def next_test_case() -> Optional[TestCase]:
+        """The next case of the dataset, or None when it is exhausted or total_timeout expired while reading it."""
+        nonlocal dataset_timed_out
+        if dataset_timed_out:
+            return None
+        try:
+            # Reading an in-memory dataset cannot block; a streamed one is read within the run's time
+            return await _await_with_timeout(
+                _next_test_case(test_cases),
+                remaining_time() if total is None else None,
+                f"{total_timeout_message} while reading the dataset",
+            )
+        except EvalCaseTimeoutError as e:
+            dataset_timed_out = True
+            logger.warning(f"{e}; the test cases not read yet are not run")
+            return None
+
+    # With a worker limit, a fixed pool of workers pulls cases from the dataset as they finish,
+    # so only `max_concurrency` cases are materialized and running at any time
+    pull_lock = asyncio.Lock()
+    pulled = 0
+
+    async def acquire_slot() -> bool:
+        """Wait for a slot under the (adaptive) limit; False without a controller or if total_timeout expired first."""
+        if controller is None:
+            return False
+        try:
+            await _await_with_timeout(controller.acquire_slot(), remaining_time(), total_timeout_message)
+            return True
+        except EvalCaseTimeoutError:
+            return False
+
+    async def worker() -> None:
+        nonlocal pulled
+        while True:
+            # With a controller, a case is only read once it has a slot to run in, so the
+            # cases held stay under the current limit rather than the number of workers
+            slot_acquired = await acquire_slot()
+            async with pull_lock:
+                test_case = await next_test_case()
+                if test_case is None:
+                    if controller is not None and slot_acquired:
+                        await controller.release_unused_slot()
+                    return
+                index = pulled
+                pulled += 1
+            await run_and_report(index, test_case, slot_acquired)
+
+    async def start_all() -> None:
+        """Unbounded concurrency: every case starts as soon as it is pulled from the dataset."""
+        running: List["asyncio.Future[None]"] = []
+        try:
+            while True:
+                test_case = await next_test_case()
+                if test_case is None:
+                    break
+                running.append(asyncio.ensure_future(run_and_report(len(running), test_case)))
+        except BaseException:
+            # The dataset failed part way through; do not leave started cases running
+            await _cancel_all(running)
+            raise
+        await _gather_or_cancel(running)
+
+    # Sync interactions run in a pool owned by this run rather than the loop's default executor,
+    # whose size is independent of max_concurrency
+    pool: Optional[Executor] = None
+    # Sync calls left running in the pool after timing out
+    abandoned_calls = 0
+    all_done: "Optional[asyncio.Future[None]]" = None
+    next_case: "Optional[asyncio.Future[Tuple[int, EvalDatasetResult]]]" = None
+    # Everything from here on runs under the finally that shuts the pool down and stops the reporter
+    try:
+        if checkpoint_store is not None:
+            completed = checkpoint_store.load(experiment_id, scope)
+        if completed:
+            logger.info(f"Resuming experiment {experiment_id}: {len(completed)} test cases already completed")
+
+        if input_validator is not None and total is not None:
+            validations = input_validator.validate_many(
+                [raw_case.inputs or {} for raw_case in cast(Iterable[RawTestCase], raw_test_cases)]
+            )
 
-        evaluation_tasks.append((final_case_name, run_test_case()))
+        if is_sync_interaction:
+            pool = _create_executor(executor, max_concurrency, total)
 
-    try:
-        # Extract just the tasks for gathering
-        tasks_only = [task for _, task in evaluation_tasks]
-        results = await asyncio.gather(*tasks_only)
+        producers: List["asyncio.Future[None]"]
+        if worker_limit is not None:
+            workers = worker_limit if total is None else max(1, min(worker_limit, total))
+            producers = [asyncio.ensure_future(worker()) for _ in range(workers)]
+        else:
+            producers = [asyncio.ensure_future(start_all())]
+
+        all_done = asyncio.ensure_future(_gather_or_cancel(producers))
+        while True:
+            next_case = asyncio.ensure_future(completed_cases.get())
+            await asyncio.wait([next_case, all_done], return_when=asyncio.FIRST_COMPLETED)
+            if next_case.done():
+                yield next_case.result()
+                continue
+            # Every case has been reported, unless the dataset or a worker failed
+            all_done.result()
+            while not completed_cases.empty():
+                yield completed_cases.get_nowait()
+            return
     finally:
+        if next_case is not None and not next_case.done():
+            next_case.cancel()
+        if all_done is not None and not all_done.done():
+            # The consumer stopped early or was cancelled; cancel the cases still running
+            all_done.cancel()
+            await asyncio.gather(all_done, return_exceptions=True)
+        await test_cases.aclose()
+        if isinstance(pool, ProcessPoolExecutor) and not abandoned_calls:
+            # Wait (off the loop) for the workers to exit, which flushes the spans they created
+            await asyncio.get_running_loop().run_in_executor(None, pool.shutdown)
+        elif pool is not None:
+            if isinstance(pool, ProcessPoolExecutor):
+                logger.warning(
+                    f"{abandoned_calls} timed out test cases are still running in worker processes; "
+                    "their workers exit once they finish"
+                )
+            # Every case has finished (or been cancelled); do not block the loop on stragglers
+            pool.shutdown(wait=False)
         # Always stop the progress reporter
         progress_reporter.stop()
 
-    return results
 
-
-__all__ = ["eval_dataset", "TestInput"]
+__all__ = [
+    "eval_dataset",
+    "eval_dataset_iter",
+    "EvalDatasetResult",
+    "EvalCaseTiming",
+    "EvalCaseTimeoutError",
+    "TestInput",
+]
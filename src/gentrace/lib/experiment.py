@@ -7,9 +7,10 @@ from typing import Any, Dict, Union, TypeVar, Callable, Optional, Awaitable, Cor
 from typing_extensions import ParamSpec, TypedDict
 
 from .utils import ensure_initialized
+from .checkpoint import CheckpointStore, checkpoint_store_var
 from .client_instance import _get_async_client_instance
 from ..types.experiment import Experiment
-from .experiment_control import start_experiment_api, finish_experiment_api
+from .experiment_control import start_experiment_api, finish_experiment_api, retrieve_experiment_api
 
 P = ParamSpec("P")
 R = TypeVar("R")
@@ -52,6 +53,11 @@ class ExperimentOptions(TypedDict, total=False):
     """Optional name for the experiment run. This will be used as the name for the root OpenTelemetry span."""
     metadata: Optional[Dict[str, Any]]
     """User-defined metadata for the experiment. This will be added as attributes to the root OpenTelemetry span."""
+    checkpoint_path: str
+    """Path of a local SQLite database recording the test cases `eval_dataset` completes, so an interrupted run can be resumed."""
+    resume_experiment_id: str
+    """ID of an earlier, interrupted experiment to continue instead of starting a new one. With `checkpoint_path`,
+    the test cases it recorded as completed are skipped."""
 
 
 class ExperimentResult(Experiment):
@@ -105,6 +111,12 @@ def experiment(
                                   Gentrace API.
             metadata (Optional[Dict[str, Any]]): User-defined metadata for the Gentrace Experiment.
                                                Passed to the Gentrace API.
+            checkpoint_path (str): A local SQLite database in which `eval_dataset` records each
+                                   test case it completes, with its result.
+            resume_experiment_id (str): Continue this (interrupted) experiment instead of starting
+                                        a new one. Test cases recorded as completed in
+                                        `checkpoint_path` are not run again; `eval_dataset`
+                                        returns their stored results.
 
     Returns:
         A decorator that wraps the user's function, transforming it into an awaitable
@@ -170,14 +182,20 @@ def experiment(
             ensure_initialized()
             exp_name_option = options.get("name") if options else None
             user_metadata = options.get("metadata") if options else None
+            checkpoint_path = options.get("checkpoint_path") if options else None
+            resume_experiment_id = options.get("resume_experiment_id") if options else None
 
             experiment_obj: Optional[Experiment] = None
             try:
-                experiment_obj = await start_experiment_api(
-                    pipelineId=effective_pipeline_id, name=exp_name_option, metadata=user_metadata
-                )
+                if resume_experiment_id:
+                    experiment_obj = await retrieve_experiment_api(id=resume_experiment_id)
+                else:
+                    experiment_obj = await start_experiment_api(
+                        pipelineId=effective_pipeline_id, name=exp_name_option, metadata=user_metadata
+                    )
             except Exception as e:
-                logger.error(f"Failed to start Gentrace experiment via API. Details: {e}")
+                action = "resume" if resume_experiment_id else "start"
+                logger.error(f"Failed to {action} Gentrace experiment via API. Details: {e}")
                 raise
 
             if not experiment_obj:
@@ -204,6 +222,8 @@ def experiment(
             }
 
             token = experiment_context_var.set(context_data)
+            checkpoint_store = CheckpointStore(checkpoint_path) if checkpoint_path else None
+            checkpoint_token = checkpoint_store_var.set(checkpoint_store)
 
             try:
                 if inspect.iscoroutinefunction(func):
@@ -212,6 +232,9 @@ def experiment(
                     func(*args, **kwargs)
 
             finally:
+                checkpoint_store_var.reset(checkpoint_token)
+                if checkpoint_store is not None:
+                    checkpoint_store.close()
                 experiment_context_var.reset(token)
                 if experiment_obj:
                     await finish_experiment_api(id=experiment_obj.id)
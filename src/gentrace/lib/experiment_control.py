@@ -40,6 +40,20 @@ async def start_experiment_api(
     return experiment
 
 
+async def retrieve_experiment_api(*, id: str) -> Experiment:
+    """
+    Retrieves an existing experiment run via the Gentrace API, e.g. to resume it.
+
+    Args:
+        id: The ID of the experiment.
+
+    Returns:
+        Experiment: The experiment object.
+    """
+    logger.debug(f"Attempting to retrieve Gentrace experiment `{id}` via API.")
+    return await experiments_async.retrieve(id)
+
+
 async def finish_experiment_api(*, id: str, error: Optional[Union[Exception, str]] = None) -> None:
     """
     Finishes an experiment run by updating its status via the Gentrace API.
@@ -76,5 +90,6 @@ async def finish_experiment_api(*, id: str, error: Optional[Union[Exception, str
 
 __all__ = [
     "start_experiment_api",
+    "retrieve_experiment_api",
     "finish_experiment_api",
 ]
@@ -86,11 +86,31 @@ def init(
                 - resource_attributes: Additional resource attributes
                 - sampler: Custom sampler (defaults to standard behavior)
                 - debug: Enable console exporter for debugging (default: False)
+                - batch_processor: True (default) exports spans in batches from a background
+                  thread, False exports each span synchronously, or a BatchSpanProcessorOptions
+                  dict tunes the batching processor
+                - spool: SpanSpoolOptions enabling an on-disk spool that keeps spans which
+                  could not be exported and resends them when the endpoint recovers
+                - compression / compression_level: Export payload codec ("none", "gzip",
+                  "deflate", "zstd" or "adaptive") and its level
+                - max_concurrent_exports: Number of export requests allowed in flight at once
+                - max_request_bytes: Size cap for one export request; larger batches are split
+                - max_attribute_bytes / max_event_bytes: Size limits for span attribute values
+                  and fn.args / fn.output event payloads; larger values are truncated
+                  (no limit by default)
+                - max_serialization_depth / max_serialization_items: Nesting depth and per-container
+                  item limits for serialized values
+                - json_backend: "json" (default) or "orjson" encoder for serialized values
+                - deferred_serialization / capture_copy: Serialize function inputs and outputs on
+                  the batch processor's export thread instead of during the call, and how values
+                  are captured
         **kwargs (Any): Additional keyword arguments passed to the underlying
             `Gentrace` (synchronous) and `AsyncGentrace` (asynchronous)
             client constructors. This allows for advanced configuration.
             Common options include `timeout`, `max_retries`, `default_headers`,
-            `default_query`, and `http_client`.
+            `default_query`, and `http_client`. Span export reuses the
+            synchronous client's connection pool, so an `http_client` created
+            with `http2=True` also multiplexes OTLP exports over HTTP/2.
 
     Side Effects:
         - Sets the internal singleton client instances used by the SDK
@@ -1,13 +1,14 @@
 import uuid
 import inspect
 import functools
-from typing import Any, Dict, TypeVar, Callable, Optional, AsyncGenerator, cast
+from typing import Any, Dict, TypeVar, Callable, Optional, Generator, AsyncGenerator, cast
 
 from opentelemetry import baggage as otel_baggage, context as otel_context
 
 from .utils import ensure_initialized, display_pipeline_error
-from .traced import traced
+from .traced import traced, _forward_generator
 from .constants import ATTR_GENTRACE_SAMPLE_KEY, ATTR_GENTRACE_PIPELINE_ID
+from .memo_cache import MemoCache
 from .validation import start_pipeline_validation
 
 F = TypeVar("F", bound=Callable[..., Any])
@@ -22,6 +23,7 @@ def interaction(
     name: Optional[str] = None,
     attributes: Optional[Dict[str, Any]] = None,
     suppress_warnings: bool = False,
+    cache: Optional[MemoCache] = None,
 ) -> Callable[[F], F]:
     """
     A decorator factory that wraps a function with OpenTelemetry tracing to track
@@ -32,7 +34,7 @@ def interaction(
     the pipeline_id. It also sets 'gentrace.sample'="true" in the OpenTelemetry
     baggage for the duration of the traced function's execution.
     It preserves the signature of the decorated function
-    and supports both synchronous and asynchronous functions.
+    and supports synchronous and asynchronous functions and generators.
 
     Args:
         pipeline_id: Optional. The identifier of the pipeline this interaction belongs to.
@@ -46,6 +48,9 @@ def interaction(
                     These will be merged with the 'gentrace.pipeline_id' attribute.
         suppress_warnings: Optional. If True, suppresses auto-initialization warnings.
                           Defaults to False.
+        cache: Optional. A `MemoCache` returning the stored result of an earlier call with
+               the same arguments instead of calling the function (not for generators).
+               Cached calls are still traced, marked with `gentrace.cache_hit`.
 
     Returns:
         A decorator that, when applied to a function, returns a new function
@@ -106,7 +111,7 @@ def interaction(
             ATTR_GENTRACE_PIPELINE_ID: effective_pipeline_id,
         }
 
-        configured_traced_decorator = traced(name=name, attributes=final_span_attributes_for_traced)
+        configured_traced_decorator = traced(name=name, attributes=final_span_attributes_for_traced, cache=cache)
 
         func_instrumented_by_traced = configured_traced_decorator(func)
 
@@ -122,15 +127,46 @@ def interaction(
                     ATTR_GENTRACE_SAMPLE_KEY, "true", context=current_context
                 )
 
-                token = otel_context.attach(context_with_modified_baggage)
+                # The baggage is attached only while the generator runs, not while the consumer
+                # holds a yielded item, so it does not leak into the consumer's context
+                generator = func_instrumented_by_traced(*args, **kwargs)
                 try:
-                    async for item in func_instrumented_by_traced(*args, **kwargs):
+                    while True:
+                        token = otel_context.attach(context_with_modified_baggage)
+                        try:
+                            item = await generator.__anext__()
+                        except StopAsyncIteration:
+                            return
+                        finally:
+                            otel_context.detach(token)
                         yield item
                 finally:
-                    otel_context.detach(token)
+                    token = otel_context.attach(context_with_modified_baggage)
+                    try:
+                        await generator.aclose()
+                    finally:
+                        otel_context.detach(token)
 
             return cast(F, baggage_context_wrapper_async_gen)
 
+        elif inspect.isgeneratorfunction(func):
+
+            @functools.wraps(func)
+            def baggage_context_wrapper_gen(*args: Any, **kwargs: Any) -> Generator[Any, Any, Any]:
+                # Ensure Gentrace is initialized (auto-init if possible)
+                ensure_initialized(suppress_warnings=suppress_warnings)
+
+                current_context = otel_context.get_current()
+                context_with_modified_baggage = otel_baggage.set_baggage(
+                    ATTR_GENTRACE_SAMPLE_KEY, "true", context=current_context
+                )
+
+                # As for async generators, the baggage is attached only while the generator runs
+                generator = func_instrumented_by_traced(*args, **kwargs)
+                return (yield from _forward_generator(generator, context_with_modified_baggage))
+
+            return cast(F, baggage_context_wrapper_gen)
+
         elif inspect.iscoroutinefunction(func):
 
             @functools.wraps(func)
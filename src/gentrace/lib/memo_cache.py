@@ -0,0 +1,241 @@
+"""
+Content-Addressed Memoization of Traced Calls
+
+`@traced(cache=MemoCache(...))` and `@interaction(cache=...)` return the stored
+result of an earlier call with the same arguments instead of calling the function
+again, e.g. to avoid re-sending identical prompts to a model while iterating on an
+experiment. The call is still traced: its span records the arguments and the
+(cached) output and has a `gentrace.cache_hit` attribute.
+
+Keys are SHA-256 hashes of the function's identity and of a canonical JSON encoding
+of the bound arguments, with defaults applied so that equivalent calls share a key
+(dict keys sorted; pydantic models, dataclasses, sets, enums
+and dates converted to JSON types). Calls with arguments that have no canonical
+encoding (arbitrary objects) are not cached.
+
+Entries live in two tiers:
+- an in-memory LRU of at most `max_entries` results;
+- optionally, a SQLite database at `path` holding pickled results, shared by all
+  processes that open it. It is capped at `max_disk_bytes`; the least recently used
+  entries are evicted first.
+
+Entries older than `ttl_seconds` are never returned. Exceptions are not cached.
+Cached results are returned as-is from memory, so callers should not mutate them.
+"""
+
+import enum
+import json
+import pickle
+import hashlib
+import logging
+import sqlite3
+import threading
+import dataclasses
+from time import time
+from typing import Any, List, Tuple, Mapping, Optional
+from datetime import date, datetime
+from collections import OrderedDict
+
+from pydantic import BaseModel
+
+logger = logging.getLogger("gentrace")
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_MAX_DISK_BYTES = 512 * 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS memo_entries (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS memo_entries_last_access ON memo_entries (last_access);
+"""
+
+
+def _canonical_default(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json") if hasattr(value, "model_dump") else json.loads(value.json())
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    if isinstance(value, (set, frozenset)):
+        return sorted(json.dumps(item, sort_keys=True, default=_canonical_default) for item in value)
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, bytes):
+        return value.hex()
+    raise TypeError(f"{type(value).__name__} has no canonical encoding")
+
+
+def memo_key(namespace: str, arguments: Mapping[str, Any]) -> Optional[str]:
+    """
+    Stable hash of a function identity and its arguments by parameter name (with
+    defaults applied), or None if the arguments cannot be encoded canonically.
+    """
+    try:
+        encoded = json.dumps([namespace, arguments], sort_keys=True, default=_canonical_default)
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class MemoCache:
+    """
+    Two-tier (memory LRU, optional SQLite on disk) cache of function results.
+
+    One cache can be shared by several functions; their entries are kept apart by
+    the function's module and qualified name. Thread-safe.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        *,
+        path: Optional[str] = None,
+        max_disk_bytes: int = DEFAULT_MAX_DISK_BYTES,
+        ttl_seconds: Optional[float] = None,
+    ) -> None:
+        """
+        Args:
+            max_entries: Maximum number of results kept in memory.
+            path: SQLite database file for the on-disk tier. Memory only if omitted.
+            max_disk_bytes: Maximum total size of the pickled results on disk.
+            ttl_seconds: Entries older than this are treated as missing. No expiry if omitted.
+        """
+        if max_entries < 0 or max_disk_bytes <= 0:
+            raise ValueError("max_entries must not be negative and max_disk_bytes must be positive.")
+        self._max_entries = max_entries
+        self._max_disk_bytes = max_disk_bytes
+        self._ttl = ttl_seconds
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, Tuple[Optional[float], Any]]" = OrderedDict()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._disk_bytes = 0
+        if path is not None:
+            self._connection = sqlite3.connect(path, check_same_thread=False)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.executescript(_SCHEMA)
+            self._connection.execute("DELETE FROM memo_entries WHERE expires_at < ?", (time(),))
+            self._connection.commit()
+            self._disk_bytes = self._stored_bytes()
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """Return `(True, value)` for a live entry, `(False, None)` otherwise."""
+        now = time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at is None or expires_at > now:
+                    self._memory.move_to_end(key)
+                    return True, value
+                del self._memory[key]
+
+            if self._connection is None:
+                return False, None
+            row = self._connection.execute(
+                "SELECT value, expires_at FROM memo_entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return False, None
+            payload, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                self._delete(key)
+                return False, None
+            try:
+                value = pickle.loads(payload)
+            except Exception as e:
+                logger.warning(f"Discarding unreadable memo cache entry {key}: {e}")
+                self._delete(key)
+                return False, None
+            self._connection.execute("UPDATE memo_entries SET last_access = ? WHERE key = ?", (now, key))
+            self._connection.commit()
+            self._remember(key, expires_at, value)
+            return True, value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a result in memory and, if it can be pickled, on disk."""
+        now = time()
+        expires_at = now + self._ttl if self._ttl is not None else None
+        with self._lock:
+            self._remember(key, expires_at, value)
+            if self._connection is None:
+                return
+            try:
+                payload = pickle.dumps(value)
+            except Exception as e:
+                logger.debug(f"Memo cache result cannot be pickled and is kept in memory only: {e}")
+                return
+            if len(payload) > self._max_disk_bytes:
+                return
+            previous = self._connection.execute("SELECT size FROM memo_entries WHERE key = ?", (key,)).fetchone()
+            self._connection.execute(
+                "INSERT OR REPLACE INTO memo_entries VALUES (?, ?, ?, ?, ?)",
+                (key, payload, len(payload), expires_at, now),
+            )
+            self._disk_bytes += len(payload) - (previous[0] if previous is not None else 0)
+            if self._disk_bytes > self._max_disk_bytes:
+                self._evict()
+            self._connection.commit()
+
+    def clear(self) -> None:
+        """Remove all entries from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            if self._connection is not None:
+                self._connection.execute("DELETE FROM memo_entries")
+                self._connection.commit()
+                self._disk_bytes = 0
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _remember(self, key: str, expires_at: Optional[float], value: Any) -> None:
+        if self._max_entries == 0:
+            return
+        self._memory[key] = (expires_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._max_entries:
+            self._memory.popitem(last=False)
+
+    def _delete(self, key: str) -> None:
+        assert self._connection is not None
+        self._connection.execute("DELETE FROM memo_entries WHERE key = ?", (key,))
+        self._connection.commit()
+        self._disk_bytes = self._stored_bytes()
+
+    def _stored_bytes(self) -> int:
+        assert self._connection is not None
+        return int(self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM memo_entries").fetchone()[0])
+
+    def _evict(self) -> None:
+        assert self._connection is not None
+        self._connection.execute("DELETE FROM memo_entries WHERE expires_at < ?", (time(),))
+        # Other processes may share the database; start from its actual size
+        self._disk_bytes = self._stored_bytes()
+        while self._disk_bytes > self._max_disk_bytes:
+            rows = self._connection.execute(
+                "SELECT key, size FROM memo_entries ORDER BY last_access LIMIT 64"
+            ).fetchall()
+            if not rows:
+                break
+            excess = self._disk_bytes - self._max_disk_bytes
+            evicted: List[str] = []
+            for key, size in rows:
+                evicted.append(key)
+                excess -= size
+                if excess <= 0:
+                    break
+            self._connection.executemany("DELETE FROM memo_entries WHERE key = ?", [(key,) for key in evicted])
+            self._disk_bytes = self._stored_bytes()
+
+
+__all__ = ["MemoCache", "memo_key"]
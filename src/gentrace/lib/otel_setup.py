@@ -2,7 +2,7 @@ import os
 import sys
 import json
 import atexit
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Union, Optional, cast
 from pathlib import Path
 
 from rich.text import Text
@@ -10,16 +10,24 @@ from rich.panel import Panel
 from rich.syntax import Syntax
 from rich.console import Group
 from opentelemetry import trace
-from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace import SpanProcessor, TracerProvider
 from opentelemetry.sdk.resources import Resource
 from opentelemetry.sdk.trace.export import ConsoleSpanExporter, SimpleSpanProcessor
 from opentelemetry.sdk.trace.sampling import Sampler
 
-from .utils import get_console, display_gentrace_warning
+from .types import CaptureCopyType, CompressionType, JSONBackendType, SpanSpoolOptions, BatchSpanProcessorOptions
+from .utils import get_console, display_gentrace_warning, set_serialization_limits
 from .warnings import GentraceWarnings
+from .span_spool import GentraceSpanSpool
+from .serialization import DEFAULT_MAX_DEPTH, DEFAULT_MAX_ITEMS
+from .otlp_transport import get_shared_http_client
 from .span_processor import GentraceSpanProcessor
 from .client_instance import _get_sync_client_instance
+from .otlp_compression import Compression
+from .deferred_payloads import configure_deferred_serialization
+from .batch_span_processor import GentraceBatchSpanProcessor
 from .custom_otlp_exporter import GentraceOTLPSpanExporter
+from .vendored_otlp_exporter import DEFAULT_MAX_REQUEST_BYTES
 
 
 def _display_init_error() -> None:
@@ -156,6 +164,19 @@ def setup(
     resource_attributes: Optional[Dict[str, Any]] = None,
     sampler: Optional[Sampler] = None,
     debug: bool = False,
+    batch_processor: Union[bool, BatchSpanProcessorOptions] = True,
+    spool: Optional[SpanSpoolOptions] = None,
+    compression: Optional[CompressionType] = None,
+    compression_level: Optional[int] = None,
+    max_concurrent_exports: int = 1,
+    max_request_bytes: Optional[int] = DEFAULT_MAX_REQUEST_BYTES,
+    max_attribute_bytes: Optional[int] = None,
+    max_event_bytes: Optional[int] = None,
+    max_serialization_depth: int = DEFAULT_MAX_DEPTH,
+    max_serialization_items: int = DEFAULT_MAX_ITEMS,
+    json_backend: JSONBackendType = "json",
+    deferred_serialization: bool = False,
+    capture_copy: CaptureCopyType = "shallow",
 ) -> TracerProvider:
     """
     Sets up OpenTelemetry with Gentrace configuration.
@@ -180,6 +201,49 @@ def setup(
                  sampling behavior. Use GentraceSampler() to filter spans based on
                  gentrace.sample attribute.
         debug: Whether to include console exporter for debugging (defaults to False).
+        batch_processor: Controls how spans reach the Gentrace exporter.
+                         True (default) queues finished spans and exports them in batches
+                         from a background thread. False exports each span synchronously
+                         when it ends. A BatchSpanProcessorOptions dict tunes the queue size,
+                         batch size, schedule delay and queue-full policy.
+        spool: Optional on-disk spool configuration. When provided, export batches that
+               fail because the endpoint is unreachable are written to `spool["directory"]`
+               and resent in the background once it recovers, including after a restart.
+        compression: Payload codec ("none", "gzip", "deflate", "zstd" or "adaptive").
+                     Defaults to the OTLP compression environment variables, or none.
+                     "zstd" requires the `zstandard` package (`pip install gentrace-py[zstd]`)
+                     and falls back to gzip without it.
+        compression_level: Level for the selected codec (defaults: gzip/deflate 6, zstd 3).
+                           With "adaptive" it must be between 1 and 9 and applies to
+                           gzip and zstd alike.
+        max_concurrent_exports: Number of export requests allowed in flight at once
+                                (defaults to 1). Values above 1 export batches from a pool
+                                of worker threads, which helps with high span volumes.
+        max_request_bytes: Size cap for one export request (defaults to 4 MiB). Larger
+                           batches are split and the parts exported concurrently.
+                           None disables splitting.
+        max_attribute_bytes: Size limit for string and JSON-serialized span attribute values
+                             (None, the default, for no limit).
+        max_event_bytes: Size limit for the serialized inputs/outputs recorded in
+                         gentrace.fn.args / gentrace.fn.output events (None, the default,
+                         for no limit). Oversized values are truncated while they are
+                         serialized and replaced by an object holding the
+                         "gentrace.truncated" marker, the original size and a preview.
+        max_serialization_depth: Maximum nesting depth of serialized values (defaults to 64).
+                                 Deeper containers are replaced by "[MaxDepthExceeded]".
+        max_serialization_items: Maximum number of items serialized per list or dict
+                                 (defaults to 10000).
+        json_backend: Encoder for serialized values, "json" (default) or "orjson". orjson
+                      is faster but produces compact output and requires the `orjson` package
+                      (`pip install gentrace-py[orjson]`).
+        deferred_serialization: Serialize function inputs and outputs when spans are exported,
+                                on the batch processor's export thread, instead of during the
+                                call (defaults to False). Captured values stay referenced until
+                                their span is exported. Ignored with `batch_processor=False`,
+                                which exports spans on the thread that ends them.
+        capture_copy: How values are captured with deferred serialization: "none" keeps a
+                      reference, "shallow" (default) copies lists, dicts, sets and pydantic
+                      models one level deep, "deep" deep-copies them.
 
     Returns:
         The configured TracerProvider instance
@@ -212,6 +276,9 @@ def setup(
         from gentrace import GentraceSampler
 
         setup(sampler=GentraceSampler())
+
+        # Tune the batching export pipeline
+        setup(batch_processor={"max_queue_size": 4096, "queue_full_policy": "block"})
         ```
     """
     # Check if init() has been called
@@ -241,6 +308,19 @@ def setup(
             "Gentrace must be initialized before calling setup()."
         ) from e
 
+    # Limits and encoder used when serializing span attributes and fn.args / fn.output events
+    set_serialization_limits(
+        max_attribute_bytes=max_attribute_bytes,
+        max_event_bytes=max_event_bytes,
+        max_depth=max_serialization_depth,
+        max_items=max_serialization_items,
+        json_backend=json_backend,
+    )
+    # Without the batch processor, spans are exported (and payloads serialized) on the calling thread anyway
+    configure_deferred_serialization(
+        enabled=deferred_serialization and batch_processor is not False, capture_copy=capture_copy
+    )
+
     # Get configuration values with smart defaults
     # Use API key from init() with higher priority than env variable
     api_key = (
@@ -306,10 +386,22 @@ def setup(
     otlp_exporter = GentraceOTLPSpanExporter(
         endpoint=final_trace_endpoint,
         headers=exporter_headers,
+        spool=GentraceSpanSpool(**spool) if spool else None,
+        compression=Compression(compression) if compression else None,
+        compression_level=compression_level,
+        max_concurrent_exports=max_concurrent_exports,
+        max_request_bytes=max_request_bytes,
+        # Share the API client's connection pool (and HTTP/2 setting) for span export
+        http_client=get_shared_http_client(client),
     )
 
     # Add main export processor
-    export_processor = SimpleSpanProcessor(otlp_exporter)
+    export_processor: SpanProcessor
+    if batch_processor is False:
+        export_processor = SimpleSpanProcessor(otlp_exporter)
+    else:
+        batch_options = cast(Dict[str, Any], batch_processor) if isinstance(batch_processor, dict) else {}
+        export_processor = GentraceBatchSpanProcessor(otlp_exporter, **batch_options)
     tracer_provider.add_span_processor(export_processor)
 
     # Add console exporter if debug mode
@@ -0,0 +1,239 @@
+"""
+Payload Compression for OTLP Span Export
+
+Span payloads carry large JSON strings (`gentrace.fn.args`, `gentrace.fn.output`),
+so the codec and level have a direct effect on both export CPU time and bytes on
+the wire. This module provides:
+
+- `Compression`: the codecs understood by the exporter. `zstd` requires the optional
+  `zstandard` package (`pip install gentrace-py[zstd]`); when it is missing the
+  exporter falls back to gzip.
+- `compress_payload()`: one-shot compression at a configurable level.
+- `AdaptiveCompressor`: skips compression for small payloads and otherwise picks the
+  codec with the lowest estimated cost (CPU time plus transfer time), based on a
+  running average of the ratio and speed measured on real batches.
+"""
+
+import gzip
+import zlib
+import logging
+import threading
+from enum import Enum
+from time import perf_counter
+from typing import Any, Dict, List, Tuple, Optional
+
+_logger = logging.getLogger(__name__)
+
+try:
+    import zstandard  # type: ignore[import-not-found, import-untyped, unused-ignore]
+except ImportError:  # pragma: no cover - depends on the environment
+    zstandard = None
+
+
+class Compression(Enum):
+    """Compression algorithms for OTLP export."""
+
+    NoCompression = "none"
+    Gzip = "gzip"
+    Deflate = "deflate"
+    Zstd = "zstd"
+    Adaptive = "adaptive"
+    """Choose a codec per batch with `AdaptiveCompressor`."""
+
+
+DEFAULT_COMPRESSION_LEVELS: Dict[Compression, int] = {
+    Compression.Gzip: 6,
+    Compression.Deflate: 6,
+    Compression.Zstd: 3,
+}
+
+DEFAULT_ADAPTIVE_MIN_BYTES = 1024
+DEFAULT_ADAPTIVE_PROBE_INTERVAL = 100
+DEFAULT_ADAPTIVE_BANDWIDTH_BYTES_PER_SECOND = 10 * 1024 * 1024
+
+# Weight of the newest measurement in the running averages
+_EWMA_ALPHA = 0.2
+
+_zstd_local = threading.local()
+
+
+def zstd_available() -> bool:
+    """Whether the optional `zstandard` package is installed."""
+    return zstandard is not None
+
+
+def resolve_compression(compression: Compression) -> Compression:
+    """Fall back to gzip when zstd is requested but `zstandard` is not installed."""
+    if compression == Compression.Zstd and not zstd_available():
+        _logger.warning(
+            "zstd compression requires the 'zstandard' package (pip install gentrace-py[zstd]); falling back to gzip"
+        )
+        return Compression.Gzip
+    return compression
+
+
+def compress_payload(data: bytes, compression: Compression, level: Optional[int] = None) -> bytes:
+    """
+    Compress `data` with a single codec.
+
+    Args:
+        data: The serialized export request.
+        compression: The codec to use. Must not be `Compression.Adaptive`.
+        level: Codec-specific compression level. Defaults to `DEFAULT_COMPRESSION_LEVELS`.
+    """
+    if compression == Compression.NoCompression:
+        return data
+    if level is None:
+        level = DEFAULT_COMPRESSION_LEVELS[compression]
+    if compression == Compression.Gzip:
+        return gzip.compress(data, compresslevel=level, mtime=0)
+    if compression == Compression.Deflate:
+        return zlib.compress(data, level)
+    if compression == Compression.Zstd:
+        return _zstd_compressor(level).compress(data)
+    raise ValueError(f"Cannot compress a payload with {compression}")
+
+
+def _zstd_compressor(level: int) -> Any:
+    # ZstdCompressor instances are not safe to share between threads
+    compressors: Optional[Dict[int, Any]] = getattr(_zstd_local, "compressors", None)
+    if compressors is None:
+        compressors = _zstd_local.compressors = {}
+    compressor = compressors.get(level)
+    if compressor is None:
+        if zstandard is None:
+            raise RuntimeError("zstd compression requires the 'zstandard' package")
+        compressor = compressors[level] = zstandard.ZstdCompressor(level=level)
+    return compressor
+
+
+class _CodecStats:
+    """Running averages of compressed/original size and CPU seconds per input byte."""
+
+    __slots__ = ("ratio", "seconds_per_byte")
+
+    def __init__(self, ratio: float, seconds_per_byte: float) -> None:
+        self.ratio = ratio
+        self.seconds_per_byte = seconds_per_byte
+
+    def update(self, ratio: float, seconds_per_byte: float) -> None:
+        self.ratio += _EWMA_ALPHA * (ratio - self.ratio)
+        self.seconds_per_byte += _EWMA_ALPHA * (seconds_per_byte - self.seconds_per_byte)
+
+
+class AdaptiveCompressor:
+    """
+    Picks a compression codec per payload.
+
+    Payloads smaller than `min_bytes` are sent uncompressed. Larger payloads use the
+    candidate codec (zstd when available, then gzip, or no compression) with the
+    lowest estimated cost `size * seconds_per_byte + compressed_size / bandwidth`.
+    Every `probe_interval` payloads all codecs are measured again so the choice
+    follows changes in the data.
+    """
+
+    def __init__(
+        self,
+        *,
+        min_bytes: int = DEFAULT_ADAPTIVE_MIN_BYTES,
+        probe_interval: int = DEFAULT_ADAPTIVE_PROBE_INTERVAL,
+        bandwidth_bytes_per_second: float = DEFAULT_ADAPTIVE_BANDWIDTH_BYTES_PER_SECOND,
+        levels: Optional[Dict[Compression, int]] = None,
+    ) -> None:
+        """
+        Args:
+            min_bytes: Payloads below this size are never compressed.
+            probe_interval: Re-measure every codec once per this many compressed payloads.
+            bandwidth_bytes_per_second: Assumed upload bandwidth, used to weigh bytes saved
+                                        against CPU time spent.
+            levels: Per-codec compression levels overriding `DEFAULT_COMPRESSION_LEVELS`.
+        """
+        if probe_interval <= 0 or bandwidth_bytes_per_second <= 0:
+            raise ValueError("probe_interval and bandwidth_bytes_per_second must be positive.")
+
+        self._min_bytes = min_bytes
+        self._probe_interval = probe_interval
+        self._bandwidth = bandwidth_bytes_per_second
+        self._levels = {**DEFAULT_COMPRESSION_LEVELS, **(levels or {})}
+
+        self._candidates: List[Compression] = [Compression.Gzip]
+        if zstd_available():
+            self._candidates.insert(0, Compression.Zstd)
+
+        self._lock = threading.Lock()
+        self._stats: Dict[Compression, _CodecStats] = {}
+        self._payloads = 0
+
+    @property
+    def candidates(self) -> List[Compression]:
+        """The codecs considered for payloads above `min_bytes`."""
+        return list(self._candidates)
+
+    def codec_stats(self) -> Dict[Compression, Tuple[float, float]]:
+        """Current (ratio, seconds per byte) estimates for each measured codec."""
+        with self._lock:
+            return {codec: (stats.ratio, stats.seconds_per_byte) for codec, stats in self._stats.items()}
+
+    def compress(self, data: bytes) -> Tuple[bytes, Compression]:
+        """Compress `data` with the currently preferred codec and return the payload and codec used."""
+        size = len(data)
+        if size < self._min_bytes:
+            return data, Compression.NoCompression
+
+        with self._lock:
+            probe = self._payloads % self._probe_interval == 0 or len(self._stats) < len(self._candidates)
+            self._payloads += 1
+            codec = None if probe else self._preferred(size)
+
+        if codec is None:
+            return self._probe(data)
+        if codec == Compression.NoCompression:
+            return data, codec
+
+        compressed = self._measure(codec, data)
+        return compressed, codec
+
+    def _probe(self, data: bytes) -> Tuple[bytes, Compression]:
+        size = len(data)
+        best: Tuple[float, bytes, Compression] = (size / self._bandwidth, data, Compression.NoCompression)
+        for codec in self._candidates:
+            start = perf_counter()
+            compressed = self._measure(codec, data)
+            cost = (perf_counter() - start) + len(compressed) / self._bandwidth
+            if cost < best[0]:
+                best = (cost, compressed, codec)
+        return best[1], best[2]
+
+    def _measure(self, codec: Compression, data: bytes) -> bytes:
+        start = perf_counter()
+        compressed = compress_payload(data, codec, self._levels.get(codec))
+        elapsed = perf_counter() - start
+
+        ratio = len(compressed) / len(data)
+        seconds_per_byte = elapsed / len(data)
+        with self._lock:
+            stats = self._stats.get(codec)
+            if stats is None:
+                self._stats[codec] = _CodecStats(ratio, seconds_per_byte)
+            else:
+                stats.update(ratio, seconds_per_byte)
+        return compressed
+
+    def _preferred(self, size: int) -> Compression:
+        best_codec = Compression.NoCompression
+        best_cost = size / self._bandwidth
+        for codec, stats in self._stats.items():
+            cost = size * stats.seconds_per_byte + size * stats.ratio / self._bandwidth
+            if cost < best_cost:
+                best_codec, best_cost = codec, cost
+        return best_codec
+
+
+__all__ = [
+    "Compression",
+    "AdaptiveCompressor",
+    "compress_payload",
+    "resolve_compression",
+    "zstd_available",
+    "DEFAULT_COMPRESSION_LEVELS",
+]
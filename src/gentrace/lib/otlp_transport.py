@@ -0,0 +1,133 @@
+"""
+HTTP transports for OTLP span export.
+
+The OTLP exporter posts serialized protobuf payloads through these transports.
+They are built on httpx so the exporter can share the connection pool (and
+limits, proxies and TLS configuration) of the `Gentrace` API client instead of
+opening a second pool. When the shared httpx client was created with
+`http2=True`, span exports are multiplexed over the same HTTP/2 connection as
+API calls.
+
+Both transports return an `OTLPResponse`, a small transport-agnostic view of the
+HTTP response that the exporter uses for retry and partial-success handling.
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional
+from typing_extensions import override
+
+import httpx
+
+from .._constants import DEFAULT_CONNECTION_LIMITS
+
+if TYPE_CHECKING:
+    import requests
+
+
+class OTLPResponse:
+    """The parts of an HTTP response that the OTLP exporter needs."""
+
+    def __init__(self, status_code: int, content: bytes, headers: Mapping[str, str], reason: str) -> None:
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers
+        self.reason = reason
+
+    @property
+    def ok(self) -> bool:
+        """Whether the response has a 2xx status code."""
+        return 200 <= self.status_code < 300
+
+    @property
+    def text(self) -> str:
+        """The response body decoded as UTF-8."""
+        return self.content.decode("utf-8", errors="replace")
+
+    @classmethod
+    def from_httpx(cls, response: httpx.Response) -> "OTLPResponse":
+        return cls(response.status_code, response.content, response.headers, response.reason_phrase)
+
+    @classmethod
+    def from_requests(cls, response: "requests.Response") -> "OTLPResponse":
+        return cls(response.status_code, response.content, response.headers, response.reason or "")
+
+    @override
+    def __repr__(self) -> str:
+        return f"<OTLPResponse [{self.status_code}]>"
+
+
+class HttpxOTLPTransport:
+    """
+    Synchronous OTLP transport backed by an `httpx.Client`.
+
+    If `client` is provided (typically the `Gentrace` API client's httpx client),
+    its connection pool is reused and it is not closed by `close()`. Otherwise a
+    dedicated client is created with the SDK's default connection limits.
+    """
+
+    def __init__(self, client: Optional[httpx.Client] = None, *, http2: bool = False) -> None:
+        """
+        Args:
+            client: An existing httpx client whose connection pool should be shared.
+            http2: Enable HTTP/2 on the dedicated client created when `client` is None.
+                   Requires the `h2` package (`pip install httpx[http2]`).
+        """
+        self._owns_client = client is None
+        self._client = client or httpx.Client(limits=DEFAULT_CONNECTION_LIMITS, http2=http2)
+
+    def post(self, url: str, data: bytes, headers: Dict[str, str], timeout: float) -> OTLPResponse:
+        """POST a payload and return the response."""
+        if self._client.is_closed and not self._owns_client:
+            # The shared API client was closed by its owner; keep exporting on our own pool
+            self._client = httpx.Client(limits=DEFAULT_CONNECTION_LIMITS)
+            self._owns_client = True
+        response = self._client.post(url, content=data, headers=headers, timeout=timeout)
+        return OTLPResponse.from_httpx(response)
+
+    def close(self) -> None:
+        """Close the underlying client if this transport created it."""
+        if self._owns_client:
+            self._client.close()
+
+
+class AsyncHttpxOTLPTransport:
+    """
+    Asynchronous OTLP transport backed by an `httpx.AsyncClient`, for exporting
+    from asyncio applications without blocking the event loop.
+
+    Client ownership follows the same rules as `HttpxOTLPTransport`.
+    """
+
+    def __init__(self, client: Optional[httpx.AsyncClient] = None, *, http2: bool = False) -> None:
+        self._owns_client = client is None
+        self._client = client or httpx.AsyncClient(limits=DEFAULT_CONNECTION_LIMITS, http2=http2)
+
+    async def post(self, url: str, data: bytes, headers: Dict[str, str], timeout: float) -> OTLPResponse:
+        """POST a payload and return the response."""
+        response = await self._client.post(url, content=data, headers=headers, timeout=timeout)
+        return OTLPResponse.from_httpx(response)
+
+    async def aclose(self) -> None:
+        """Close the underlying client if this transport created it."""
+        if self._owns_client:
+            await self._client.aclose()
+
+
+def get_shared_http_client(gentrace_client: Any) -> Optional[httpx.Client]:
+    """Return the httpx client used by a `Gentrace` API client, if it exposes one."""
+    http_client = getattr(gentrace_client, "_client", None)
+    return http_client if isinstance(http_client, httpx.Client) else None
+
+
+def get_shared_async_http_client(gentrace_client: Any) -> Optional[httpx.AsyncClient]:
+    """Return the httpx client used by an `AsyncGentrace` API client, if it exposes one."""
+    http_client = getattr(gentrace_client, "_client", None)
+    return http_client if isinstance(http_client, httpx.AsyncClient) else None
+
+
+__all__ = [
+    "OTLPResponse",
+    "HttpxOTLPTransport",
+    "AsyncHttpxOTLPTransport",
+    "get_shared_http_client",
+    "get_shared_async_http_client",
+]
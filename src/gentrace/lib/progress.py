@@ -34,13 +34,14 @@ class ProgressReporter(ABC):
     """
 
     @abstractmethod
-    def start(self, pipeline_id: str, total: int, experiment_url: Optional[str] = None) -> None:
+    def start(self, pipeline_id: str, total: Optional[int], experiment_url: Optional[str] = None) -> None:
         """
         Initialize the progress reporter for a new evaluation run.
 
         Args:
             pipeline_id: The ID of the pipeline being evaluated.
-            total: The total number of test cases to be executed.
+            total: The total number of test cases to be executed, or None if it is not
+                   known in advance (e.g. the test cases are streamed from a generator).
             experiment_url: Optional URL to view the experiment in the Gentrace UI.
         """
         pass
@@ -88,19 +89,22 @@ class SimpleProgressReporter(ProgressReporter):
         Args:
             logger: Optional logger instance. If not provided, uses the module logger.
         """
-        self.total = 0
+        self.total: Optional[int] = 0
         self.current = 0
         self.pipeline_id = ""
         self.logger = logger if logger is not None else logging.getLogger("gentrace")
 
     @override
-    def start(self, pipeline_id: str, total: int, experiment_url: Optional[str] = None) -> None:
+    def start(self, pipeline_id: str, total: Optional[int], experiment_url: Optional[str] = None) -> None:
         """Initialize a new evaluation run with line-by-line output."""
         self.pipeline_id = pipeline_id
         self.total = total
         self.current = 0
 
-        message = f"\nRunning experiment with {total} test {'case' if total == 1 else 'cases'}..."
+        if total is None:
+            message = "\nRunning experiment..."
+        else:
+            message = f"\nRunning experiment with {total} test {'case' if total == 1 else 'cases'}..."
         self.logger.info(message)
         
         # Display the experiment URL if available
@@ -125,7 +129,8 @@ class SimpleProgressReporter(ProgressReporter):
     def increment(self, test_name: str) -> None:
         """Report the completion of a test case."""
         self.current += 1
-        message = f'[{self.current}/{self.total}] Running test case: "{test_name}"'
+        progress = f"{self.current}/{self.total}" if self.total is not None else str(self.current)
+        message = f'[{progress}] Running test case: "{test_name}"'
         self.logger.info(message)
 
     @override
@@ -157,7 +162,7 @@ class RichProgressReporter(ProgressReporter):
         self.live: Optional[Live] = None
         self.current_test_name = ""
         self.completed_count = 0
-        self.total_count = 0
+        self.total_count: Optional[int] = 0
         self.last_completed_test = ""
         self.experiment_url: Optional[str] = None
 
@@ -184,8 +189,8 @@ class RichProgressReporter(ProgressReporter):
         return table
 
     @override
-    def start(self, pipeline_id: str, total: int, experiment_url: Optional[str] = None) -> None:
-        """Initialize a new progress bar for the evaluation run."""
+    def start(self, pipeline_id: str, total: Optional[int], experiment_url: Optional[str] = None) -> None:
+        """Initialize a new progress bar for the evaluation run (indeterminate if total is None)."""
         self.total_count = total
         self.completed_count = 0
         self.current_test_name = ""
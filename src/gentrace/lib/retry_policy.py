@@ -0,0 +1,143 @@
+"""
+Retries of Transient Interaction Failures in eval_dataset
+
+With `eval_dataset(retry=...)`, a test case whose interaction raises a transient
+error (a rate limit, timeout, connection failure or 5xx response from an upstream
+model) is run again instead of being recorded as failed:
+
+- Each retry waits an exponential backoff, `initial_backoff * backoff_multiplier **
+  (attempt - 1)` capped at `max_backoff`, with full jitter (a random wait between zero
+  and the backoff) so that cases failing together do not retry together. A
+  `Retry-After` header on the error's response is honored, up to `max_backoff`.
+- All cases of a run share a retry budget of `budget_min_retries` plus `budget_ratio`
+  retries per case started. When an upstream fails every request, the budget runs
+  out and cases fail without retrying, rather than multiplying the load on the
+  upstream (a retry storm).
+"""
+
+import random
+import asyncio
+from typing import Any, Callable, Optional
+
+from .types import RetryOptions
+from .concurrency_control import is_rate_limit_error
+
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_INITIAL_BACKOFF = 0.5
+DEFAULT_MAX_BACKOFF = 30.0
+DEFAULT_BACKOFF_MULTIPLIER = 2.0
+DEFAULT_BUDGET_RATIO = 0.2
+DEFAULT_BUDGET_MIN_RETRIES = 10
+
+# Transient errors of common LLM and HTTP client libraries that carry no status code
+_TRANSIENT_ERROR_NAMES = frozenset(
+    ["APIConnectionError", "APITimeoutError", "ServiceUnavailableError", "ConnectTimeout", "ReadTimeout"]
+)
+
+
+def _response_of(error: BaseException) -> Any:
+    return getattr(error, "response", None)
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """Whether an interaction error is worth retrying: a rate limit, timeout, connection failure or 5xx response."""
+    if is_rate_limit_error(error) or isinstance(error, (TimeoutError, asyncio.TimeoutError, ConnectionError)):
+        return True
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(_response_of(error), "status_code", None)
+    if isinstance(status, int):
+        return status == 408 or 500 <= status < 600
+    return type(error).__name__ in _TRANSIENT_ERROR_NAMES
+
+
+def retry_after_seconds(error: BaseException) -> Optional[float]:
+    """The delay requested by a `Retry-After` header (in seconds) on the error's HTTP response, if any."""
+    headers = getattr(_response_of(error), "headers", None)
+    if headers is None:
+        return None
+    try:
+        value = headers.get("retry-after") or headers.get("Retry-After")
+        return max(0.0, float(value)) if value is not None else None
+    except (AttributeError, TypeError, ValueError):
+        # HTTP dates are not supported; the backoff applies instead
+        return None
+
+
+class RetryBudget:
+    """
+    Retries shared by the test cases of one run: `min_retries` plus `ratio` per case started.
+
+    Only used from the event loop, so it needs no lock.
+    """
+
+    def __init__(self, ratio: float, min_retries: int) -> None:
+        if ratio < 0 or min_retries < 0:
+            raise ValueError("budget_ratio and budget_min_retries must not be negative.")
+        self._ratio = ratio
+        self._min_retries = min_retries
+        self._cases = 0
+        self._spent = 0
+
+    def record_case(self) -> None:
+        """Count a case started, which adds `ratio` retries to the budget."""
+        self._cases += 1
+
+    def try_spend(self) -> bool:
+        """Take one retry from the budget, if any is left."""
+        if self._spent + 1 > self._min_retries + self._ratio * self._cases:
+            return False
+        self._spent += 1
+        return True
+
+
+class EvalRetryPolicy:
+    """Decides whether, and after how long, a failed attempt of an eval_dataset test case is retried."""
+
+    def __init__(self, options: RetryOptions) -> None:
+        self.max_attempts = options.get("max_attempts", DEFAULT_MAX_ATTEMPTS)
+        self._initial_backoff = options.get("initial_backoff", DEFAULT_INITIAL_BACKOFF)
+        self._max_backoff = options.get("max_backoff", DEFAULT_MAX_BACKOFF)
+        self._multiplier = options.get("backoff_multiplier", DEFAULT_BACKOFF_MULTIPLIER)
+        self._jitter = options.get("jitter", True)
+        self._retry_on: Callable[[BaseException], bool] = options.get("retry_on", is_transient_error)
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1.")
+        if self._initial_backoff < 0 or self._max_backoff < 0 or self._multiplier < 1:
+            raise ValueError("Backoffs must not be negative and backoff_multiplier must be at least 1.")
+        self._budget = RetryBudget(
+            options.get("budget_ratio", DEFAULT_BUDGET_RATIO),
+            options.get("budget_min_retries", DEFAULT_BUDGET_MIN_RETRIES),
+        )
+
+    def start_case(self) -> None:
+        """Count a test case started, for the retry budget."""
+        self._budget.record_case()
+
+    def retry_delay(self, error: BaseException, attempt: int, remaining: Optional[float] = None) -> Optional[float]:
+        """
+        Seconds to wait before retrying a case whose `attempt` (counted from 1) failed with
+        `error`, or None if it is not retried.
+
+        Args:
+            error: The exception raised by the attempt.
+            attempt: The number of the failed attempt.
+            remaining: Seconds left before the case times out, if it has a timeout. A retry
+                       that could not start in time is not made.
+        """
+        if attempt >= self.max_attempts or not self._retry_on(error):
+            return None
+        delay = min(self._max_backoff, self._initial_backoff * self._multiplier ** (attempt - 1))
+        if self._jitter:
+            delay = random.uniform(0, delay)
+        retry_after = retry_after_seconds(error)
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self._max_backoff))
+        if remaining is not None and delay >= remaining:
+            return None
+        if not self._budget.try_spend():
+            return None
+        return delay
+
+
+__all__ = ["EvalRetryPolicy", "RetryBudget", "is_transient_error", "retry_after_seconds"]
@@ -47,15 +47,26 @@ class GentraceSampler(Sampler):
         Returns:
             A sampling result indicating whether the span should be sampled.
         """
-        sample_baggage_value = get_baggage(ATTR_GENTRACE_SAMPLE_KEY, context=parent_context)
-        if sample_baggage_value == "true":
-            return SamplingResult(Decision.RECORD_AND_SAMPLE, attributes, trace_state)
-
-        if attributes and attributes.get(ATTR_GENTRACE_SAMPLE_KEY) == "true":
+        if self.is_sampled(parent_context, attributes):
             return SamplingResult(Decision.RECORD_AND_SAMPLE, attributes, trace_state)
 
         return SamplingResult(Decision.DROP, attributes, trace_state)
 
+    def is_sampled(self, parent_context: Optional[Context], attributes: Attributes = None) -> bool:
+        """
+        The sampling decision alone, without building a SamplingResult.
+
+        The decision does not depend on the trace ID or span name, so @traced uses it to
+        skip creating spans that would be dropped.
+
+        Args:
+            parent_context: The parent context, or None for the current context.
+            attributes: The attributes the span would be started with.
+        """
+        if get_baggage(ATTR_GENTRACE_SAMPLE_KEY, context=parent_context) == "true":
+            return True
+        return attributes is not None and attributes.get(ATTR_GENTRACE_SAMPLE_KEY) == "true"
+
     @override
     def __str__(self) -> str:
         return "GentraceSampler"
@@ -0,0 +1,158 @@
+"""
+Schema Validation of Test Case Inputs
+
+`eval_dataset(schema=...)` validates the inputs of every test case against a
+Pydantic model or a TypedDict. Working out how to validate a schema (and, for a
+TypedDict, building its `TypeAdapter`) is far more expensive than validating one
+input, so `get_schema_validator` compiles a `SchemaValidator` once per schema and
+keeps it in a bounded LRU cache. `SchemaValidator.validate_many` validates a whole
+batch of inputs with a single `TypeAdapter(List[schema])` call.
+"""
+
+import logging
+from typing import Any, Dict, List, Tuple, Mapping, Optional, Sequence, cast
+from typing_extensions import is_typeddict
+
+from pydantic import BaseModel, ValidationError
+
+from .utils import is_pydantic_v1
+from .._utils import lru_cache
+
+# Conditional import for TypeAdapter (Pydantic v2 only)
+try:
+    from pydantic import TypeAdapter
+
+    _HAS_TYPE_ADAPTER = True
+except ImportError:
+    TypeAdapter = None  # type: ignore
+    _HAS_TYPE_ADAPTER = False  # pyright: ignore[reportConstantRedefinition]
+
+logger = logging.getLogger("gentrace")
+
+# (is_valid, validated_data, error_message)
+ValidationResult = Tuple[bool, Optional[Dict[str, Any]], Optional[str]]
+
+# Distinct schemas seen by one process are few; the bound only guards against schemas created on the fly
+SCHEMA_VALIDATOR_CACHE_SIZE = 64
+
+
+def _error_message(error: Exception) -> str:
+    if isinstance(error, ValidationError):
+        return str(error)
+    # Handle specific Pydantic errors
+    error_msg = str(error)
+    if "Please use `typing_extensions.TypedDict`" in error_msg:
+        return "TypedDict must be imported from typing_extensions, not typing module"
+    return f"Validation error: {error_msg}"
+
+
+def _model_to_dict(validated: Any, inputs: Mapping[str, Any]) -> Dict[str, Any]:
+    # Convert to dict for logging
+    validated_obj = cast(BaseModel, validated)
+    if hasattr(validated_obj, "model_dump"):
+        return validated_obj.model_dump()  # type: ignore
+    if hasattr(validated_obj, "dict"):
+        return validated_obj.dict()  # type: ignore
+    return dict(validated_obj) if hasattr(validated_obj, "__dict__") else dict(inputs)  # type: ignore
+
+
+class SchemaValidator:
+    """Validates test case inputs against one Pydantic BaseModel or TypedDict schema."""
+
+    def __init__(self, schema: Any) -> None:
+        self._schema = schema
+        self._is_typeddict = is_typeddict(schema)
+        self._adapter: Any = None
+        self._list_adapter: Any = None
+        self._compile_error: Optional[str] = None
+        self._validate_model: Any = None
+
+        if self._is_typeddict:
+            if _HAS_TYPE_ADAPTER and TypeAdapter is not None:
+                try:
+                    self._adapter = TypeAdapter(schema)
+                except Exception as e:
+                    self._compile_error = _error_message(e)
+            else:
+                # For Pydantic v1, we can't validate TypedDict directly
+                logger.warning(
+                    "TypedDict validation requires Pydantic v2. Inputs will be passed through without validation."
+                )
+        elif is_pydantic_v1():
+            self._validate_model = getattr(schema, "parse_obj", None)
+        else:
+            self._validate_model = getattr(schema, "model_validate", None)
+
+    def validate(self, inputs: Mapping[str, Any]) -> ValidationResult:
+        """Validate the inputs of one test case."""
+        if self._compile_error is not None:
+            return False, None, self._compile_error
+        try:
+            if self._is_typeddict:
+                if self._adapter is None:
+                    # Just return the inputs as-is (see the warning above)
+                    return True, dict(inputs), None
+                return True, self._typeddict_to_dict(self._adapter.validate_python(inputs)), None
+
+            if self._validate_model is None:
+                # Not a BaseModel, just return the inputs
+                return True, dict(inputs), None
+            try:
+                return True, _model_to_dict(self._validate_model(inputs), inputs), None
+            except AttributeError:
+                return True, dict(inputs), None
+        except Exception as e:
+            return False, None, _error_message(e)
+
+    def validate_many(self, inputs: Sequence[Mapping[str, Any]]) -> List[ValidationResult]:
+        """
+        Validate the inputs of many test cases, returning one result per input.
+
+        With Pydantic v2, all inputs are validated by a single `TypeAdapter(List[schema])`
+        call. If any of them is invalid, the inputs are validated one by one instead, so
+        that every result carries the same error message as `validate`.
+        """
+        list_adapter = self._get_list_adapter()
+        if list_adapter is not None and inputs:
+            try:
+                validated = list_adapter.validate_python(inputs)
+            except Exception:
+                pass
+            else:
+                if self._is_typeddict:
+                    return [(True, self._typeddict_to_dict(value), None) for value in validated]
+                # Dumps every model in one call, like model_dump() on each
+                return [(True, value, None) for value in list_adapter.dump_python(validated)]
+        return [self.validate(case_inputs) for case_inputs in inputs]
+
+    def _get_list_adapter(self) -> Any:
+        if self._list_adapter is None and self._compile_error is None and _HAS_TYPE_ADAPTER and TypeAdapter is not None:
+            if self._adapter is not None or (not self._is_typeddict and self._validate_model is not None):
+                try:
+                    self._list_adapter = TypeAdapter(List[self._schema])
+                except Exception:
+                    # e.g. a class that is not a BaseModel; validated one by one
+                    self._list_adapter = False
+        return self._list_adapter or None
+
+    @staticmethod
+    def _typeddict_to_dict(validated: Any) -> Dict[str, Any]:
+        # TypeAdapter returns the validated data as a dict for TypedDict
+        return cast(Dict[str, Any], dict(validated) if not isinstance(validated, dict) else validated)
+
+
+@lru_cache(maxsize=SCHEMA_VALIDATOR_CACHE_SIZE)
+def _cached_schema_validator(schema: Any) -> SchemaValidator:
+    return SchemaValidator(schema)
+
+
+def get_schema_validator(schema: Any) -> SchemaValidator:
+    """The compiled validator for a schema, cached per schema type."""
+    try:
+        return _cached_schema_validator(schema)
+    except TypeError:
+        # Unhashable schema objects are compiled for every call
+        return SchemaValidator(schema)
+
+
+__all__ = ["SchemaValidator", "ValidationResult", "get_schema_validator"]
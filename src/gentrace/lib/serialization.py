@@ -0,0 +1,395 @@
+"""
+Bounded JSON Serialization for Span Payloads
+
+`GentraceJSONSerializer` turns arbitrary function inputs and outputs into the JSON
+strings recorded on spans. Compared to a plain `json.dumps` it:
+
+- walks the value once, keeping track of the containers on the current path, so a
+  reference cycle is replaced by a placeholder where it occurs while shared
+  (non-cyclic) objects are serialized normally;
+- enforces a maximum nesting depth and a maximum number of items per container;
+- tracks a lower bound of the output size during that walk, so a value known to be
+  larger than `max_bytes` is never fully encoded: its exact size is computed without
+  building the text, and only a bounded prefix is produced and wrapped in a small
+  truncation object together with the original size;
+- converts pydantic v2 models directly through their `__pydantic_serializer__`
+  instead of `model_dump()` plus a `default` hook, with the same output (leaves
+  such as datetimes still go through `str()`);
+- can use `orjson` (the `orjson` extra, `pip install gentrace-py[orjson]`) for the
+  final encoding. orjson produces compact output, so the standard library backend
+  is the default.
+
+Values that are not JSON types are converted with `str()`.
+"""
+
+import json
+from typing import Any, Dict, List, Tuple, Iterable, Optional
+from itertools import islice
+from json.encoder import encode_basestring_ascii
+from typing_extensions import Literal
+
+from pydantic import BaseModel
+
+try:
+    import orjson  # type: ignore[import-not-found, unused-ignore]
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+JSONBackend = Literal["json", "orjson"]
+
+CIRCULAR_REFERENCE_PLACEHOLDER = "[CircularReference]"
+MAX_DEPTH_PLACEHOLDER = "[MaxDepthExceeded]"
+TRUNCATED_ITEMS_KEY = "[TruncatedItems]"
+
+# Key marking a JSON value that was cut short because it exceeded `max_bytes`
+TRUNCATED_VALUE_MARKER = "gentrace.truncated"
+
+DEFAULT_MAX_DEPTH = 64
+DEFAULT_MAX_ITEMS = 10_000
+
+# Non-string scalars json.dumps encodes natively
+_NUMBER_TYPES = frozenset({int, float, bool, type(None)})
+
+# Bytes added by the default separators: ", " between items and ": " after keys
+_ITEM_SEPARATOR_BYTES = 2
+_KEY_SEPARATOR_BYTES = 2
+
+
+def orjson_available() -> bool:
+    """Whether the optional `orjson` package is installed."""
+    return orjson is not None
+
+
+class GentraceJSONSerializer:
+    """
+    Serializes values to JSON with depth, item and size limits.
+
+    Instances hold only configuration and can be shared between threads.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_depth: int = DEFAULT_MAX_DEPTH,
+        max_items: int = DEFAULT_MAX_ITEMS,
+        max_bytes: Optional[int] = None,
+        backend: JSONBackend = "json",
+    ) -> None:
+        """
+        Args:
+            max_depth: Containers nested deeper than this are replaced by a placeholder.
+            max_items: Lists and dicts are cut to this many items; the number of omitted
+                       items is recorded in the output.
+            max_bytes: Serializations longer than this are replaced by a truncation object
+                       with a preview and the original size. None disables the limit.
+            backend: "json" (standard library, default) or "orjson" (compact output,
+                     requires the `orjson` package; falls back to "json" when missing).
+        """
+        if max_depth < 1 or max_items < 1:
+            raise ValueError("max_depth and max_items must be at least 1.")
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("max_bytes must be positive or None.")
+
+        self.max_depth = max_depth
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.backend: JSONBackend = backend if backend == "json" or orjson_available() else "json"
+
+    def dumps(self, value: Any, max_bytes: Optional[int] = None) -> str:
+        """
+        Serialize `value` to a JSON string within the configured limits.
+
+        Args:
+            value: The value to serialize.
+            max_bytes: Overrides the serializer's `max_bytes` for this call.
+        """
+        limit = max_bytes if max_bytes is not None else self.max_bytes
+        sanitized, min_size = self._convert(value, 0, set(), limit)
+        if limit is not None and min_size > limit:
+            # Conversion stopped once the preview was complete; size the rest without converting it
+            return truncated_json(json.dumps(sanitized)[:limit], self._measure(value, 0, set()), limit)
+        return self._dump_sanitized(sanitized, limit)
+
+    def dumps_arguments(self, arguments: Iterable[Tuple[str, Any]], max_bytes: Optional[int] = None) -> str:
+        """
+        Serialize bound call arguments in the `gentrace.fn.args` format, `[{"name": value}, ...]`.
+
+        Equivalent to `dumps([{name: value} for name, value in arguments])` without building
+        that intermediate list.
+        """
+        limit = max_bytes if max_bytes is not None else self.max_bytes
+        arguments = list(arguments)
+        result: List[Any] = []
+        min_size = 1
+        ancestors: "set[int]" = set()
+        for index, (name, value) in enumerate(arguments):
+            if index:
+                min_size += _ITEM_SEPARATOR_BYTES
+            if limit is not None and min_size > limit:
+                break
+            min_size += len(name) + 3 + _KEY_SEPARATOR_BYTES
+            budget = None if limit is None else max(0, limit - min_size)
+            converted, size = self._convert(value, 2, ancestors, budget)
+            result.append({name: converted})
+            min_size += size + 1
+        min_size += 1
+
+        if limit is not None and min_size > limit:
+            original_bytes = 2 + _ITEM_SEPARATOR_BYTES * max(0, len(arguments) - 1)
+            for name, value in arguments:
+                original_bytes += len(encode_basestring_ascii(name)) + 2 + _KEY_SEPARATOR_BYTES
+                original_bytes += self._measure(value, 2, ancestors)
+            return truncated_json(json.dumps(result)[:limit], original_bytes, limit)
+        return self._dump_sanitized(result, limit)
+
+    def _dump_sanitized(self, sanitized: Any, limit: Optional[int]) -> str:
+        text, size = self._encode(sanitized)
+        if limit is None or size <= limit:
+            return text
+        # Escaped or multi-byte characters pushed an almost-fitting value over the limit
+        return truncated_json(text[:limit], size, limit)
+
+    def sanitize(self, value: Any) -> Any:
+        """Convert `value` to JSON types, applying the depth and item limits."""
+        return self._convert(value, 0, set())[0]
+
+    def _encode(self, sanitized: Any) -> Tuple[str, int]:
+        """Encode converted values, returning the text and its size in UTF-8 bytes."""
+        if self.backend == "orjson" and orjson is not None:
+            try:
+                encoded: bytes = orjson.dumps(sanitized)
+                return encoded.decode("utf-8"), len(encoded)
+            except TypeError:
+                # e.g. integers outside the 64-bit range
+                pass
+        # json.dumps escapes non-ASCII characters, so characters and bytes match
+        text = json.dumps(sanitized)
+        return text, len(text)
+
+    # _convert returns the converted value and a cheap lower bound of its encoded size:
+    # string lengths plus quotes and separators, with escapes and numbers counted as one byte.
+    # With a `budget`, the number of output characters still needed for a preview, strings are
+    # clipped and containers stop converting once their size passes it. A result larger than
+    # the budget is then only the beginning of the value, enough to encode the preview.
+    def _convert(self, value: Any, depth: int, ancestors: "set[int]", budget: Optional[int] = None) -> Tuple[Any, int]:
+        value_type = type(value)
+        if value_type is str:
+            if budget is not None and len(value) > budget:
+                return value[:budget], len(value) + 2
+            return value, len(value) + 2
+        if value_type in _NUMBER_TYPES:
+            return value, 1
+        if isinstance(value, str):
+            # Subclasses such as str enums are encoded by their string value, like json.dumps does
+            return self._convert(str.__str__(value), depth, ancestors, budget)
+        if isinstance(value, (int, float)):
+            # Subclasses such as IntEnum are encoded by their numeric value
+            return (float(value) if isinstance(value, float) else int(value)), 1
+
+        if isinstance(value, (list, tuple, dict)):
+            obj_id = id(value)
+            if obj_id in ancestors:
+                return CIRCULAR_REFERENCE_PLACEHOLDER, len(CIRCULAR_REFERENCE_PLACEHOLDER) + 2
+            if depth >= self.max_depth:
+                return MAX_DEPTH_PLACEHOLDER, len(MAX_DEPTH_PLACEHOLDER) + 2
+            ancestors.add(obj_id)
+            try:
+                if isinstance(value, dict):
+                    return self._convert_dict(value, depth, ancestors, budget)  # pyright: ignore[reportUnknownArgumentType]
+                return self._convert_list(value, depth, ancestors, budget)  # pyright: ignore[reportUnknownArgumentType]
+            finally:
+                ancestors.discard(obj_id)
+
+        if isinstance(value, BaseModel):
+            return self._convert(_model_to_python(value), depth, ancestors, budget)
+
+        return self._convert(_leaf_text(value), depth, ancestors, budget)
+
+    # Container sizes leave out the closing bracket until the end, so that while converting
+    # they give the position in the output that is compared with the budget.
+    def _convert_list(
+        self, value: Any, depth: int, ancestors: "set[int]", budget: Optional[int]
+    ) -> Tuple[List[Any], int]:
+        result: List[Any] = []
+        size = 1
+        for index, item in enumerate(value):
+            if index:
+                size += _ITEM_SEPARATOR_BYTES
+            if budget is not None and size > budget:
+                break
+            if index >= self.max_items:
+                marker = f"[{len(value) - index} more items]"
+                result.append(marker)
+                size += len(marker) + 2
+                break
+            # Leaves are handled inline; most payloads are dominated by strings and numbers
+            item_type = type(item)
+            if item_type is str:
+                if budget is not None and len(item) > budget - size:
+                    result.append(item[: budget - size])
+                else:
+                    result.append(item)
+                size += len(item) + 2
+            elif item_type in _NUMBER_TYPES:
+                result.append(item)
+                size += 1
+            else:
+                converted, item_size = self._convert(
+                    item, depth + 1, ancestors, None if budget is None else budget - size
+                )
+                result.append(converted)
+                size += item_size
+        return result, size + 1
+
+    def _convert_dict(
+        self, value: Dict[Any, Any], depth: int, ancestors: "set[int]", budget: Optional[int]
+    ) -> Tuple[Dict[str, Any], int]:
+        result: Dict[str, Any] = {}
+        size = 1
+        for index, (key, item) in enumerate(value.items()):
+            if index:
+                size += _ITEM_SEPARATOR_BYTES
+            if budget is not None and size > budget:
+                break
+            if index >= self.max_items:
+                marker = f"[{len(value) - index} more items]"
+                result[TRUNCATED_ITEMS_KEY] = marker
+                size += len(TRUNCATED_ITEMS_KEY) + len(marker) + 4 + _KEY_SEPARATOR_BYTES
+                break
+            if type(key) is not str:
+                key = _dict_key(key)
+            # Keys are not clipped: a shortened key could replace an earlier one
+            size += len(key) + 2 + _KEY_SEPARATOR_BYTES
+            item_type = type(item)
+            if item_type is str:
+                if budget is not None and len(item) > budget - size:
+                    result[key] = item[: max(0, budget - size)]
+                else:
+                    result[key] = item
+                size += len(item) + 2
+            elif item_type in _NUMBER_TYPES:
+                result[key] = item
+                size += 1
+            else:
+                converted, item_size = self._convert(
+                    item, depth + 1, ancestors, None if budget is None else max(0, budget - size)
+                )
+                result[key] = converted
+                size += item_size
+        return result, size + 1
+
+    def _measure(self, value: Any, depth: int, ancestors: "set[int]") -> int:
+        """Exact length of the standard library encoding of the converted `value`, without converting it."""
+        value_type = type(value)
+        if value_type is str:
+            return len(encode_basestring_ascii(value))
+        if value_type in _NUMBER_TYPES:
+            return len(json.dumps(value))
+
+        if isinstance(value, (list, tuple, dict)) and id(value) not in ancestors and depth < self.max_depth:
+            obj_id = id(value)
+            ancestors.add(obj_id)
+            try:
+                size = 2 + _ITEM_SEPARATOR_BYTES * max(0, min(len(value), self.max_items + 1) - 1)
+                if len(value) > self.max_items:
+                    size += len(f"[{len(value) - self.max_items} more items]") + 2
+                if isinstance(value, dict):
+                    mapping: Dict[Any, Any] = value
+                    if len(mapping) > self.max_items:
+                        size += len(TRUNCATED_ITEMS_KEY) + 2 + _KEY_SEPARATOR_BYTES
+                    for key, item in islice(mapping.items(), self.max_items):
+                        size += len(encode_basestring_ascii(_dict_key(key))) + _KEY_SEPARATOR_BYTES
+                        size += self._measure(item, depth + 1, ancestors)
+                else:
+                    for item in islice(value, self.max_items):  # pyright: ignore[reportUnknownVariableType]
+                        size += self._measure(item, depth + 1, ancestors)
+                return size
+            finally:
+                ancestors.discard(obj_id)
+
+        if isinstance(value, BaseModel):
+            return self._measure(_model_to_python(value), depth, ancestors)
+
+        # Other leaves, subclasses and placeholders are small once converted
+        return _encoded_size(self._convert(value, depth, ancestors)[0])
+
+
+def truncated_json(prefix: str, original_bytes: int, max_bytes: int) -> str:
+    """Wrap the beginning of an oversized JSON text in a small, valid JSON object no larger than `max_bytes`.
+
+    The object carries the truncation marker, the size of the complete serialization and as much of
+    its prefix as fits, e.g. `{"gentrace.truncated": true, "original_bytes": 5242880, "preview": "[{..."}`.
+    """
+    while True:
+        text = json.dumps({TRUNCATED_VALUE_MARKER: True, "original_bytes": original_bytes, "preview": prefix})
+        excess = len(text) - max_bytes
+        if excess <= 0 or not prefix:
+            return text
+        # Escaping can make the preview grow, so shrink by at least the excess and retry
+        prefix = prefix[: max(0, len(prefix) - excess)]
+
+
+def _model_to_python(model: BaseModel) -> Any:
+    """
+    Convert a pydantic model to Python data like `model_dump()`, using the v2 core serializer when present.
+
+    Python mode is used rather than mode="json" so datetimes, UUIDs and other leaves are
+    converted with `str()` like any other value, e.g. "2024-01-02 03:04:05".
+    """
+    try:
+        serializer = getattr(model, "__pydantic_serializer__", None)
+        if serializer is not None:
+            return serializer.to_python(model)
+        if hasattr(model, "model_dump"):
+            return model.model_dump()
+        return model.dict()  # type: ignore[misc, unused-ignore]
+    except Exception:
+        return f"[UnserializableType: {type(model).__name__}]"
+
+
+def _leaf_text(value: Any) -> str:
+    try:
+        return str(value)
+    except Exception:
+        return f"[UnserializableType: {type(value).__name__}]"
+
+
+def _dict_key(key: Any) -> str:
+    if isinstance(key, str):
+        return key
+    if key is None or isinstance(key, (bool, int, float)):
+        # Same conversion json.dumps applies to non-string keys
+        return json.dumps(key)
+    return str(key)
+
+
+def _encoded_size(value: Any) -> int:
+    """Exact length of `json.dumps(value)` for converted values, without building the whole text."""
+    if isinstance(value, str):
+        return len(encode_basestring_ascii(value))
+    if isinstance(value, list):
+        items: List[Any] = value
+        return 2 + sum(_encoded_size(item) for item in items) + _ITEM_SEPARATOR_BYTES * max(0, len(items) - 1)
+    if isinstance(value, dict):
+        mapping: Dict[str, Any] = value
+        return (
+            2
+            + sum(
+                len(encode_basestring_ascii(key)) + _KEY_SEPARATOR_BYTES + _encoded_size(item)
+                for key, item in mapping.items()
+            )
+            + _ITEM_SEPARATOR_BYTES * max(0, len(mapping) - 1)
+        )
+    return len(json.dumps(value))
+
+
+__all__ = [
+    "GentraceJSONSerializer",
+    "JSONBackend",
+    "CIRCULAR_REFERENCE_PLACEHOLDER",
+    "MAX_DEPTH_PLACEHOLDER",
+    "TRUNCATED_ITEMS_KEY",
+    "TRUNCATED_VALUE_MARKER",
+    "orjson_available",
+    "truncated_json",
+]
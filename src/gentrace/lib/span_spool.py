@@ -0,0 +1,400 @@
+"""
+Durable On-Disk Spool for Gentrace Span Export
+
+When the OTLP endpoint cannot be reached, the exporter hands the serialized
+`ExportTraceServiceRequest` payload to this spool instead of dropping it. The
+spool appends payloads to segment files on disk and a background thread replays
+them once the endpoint recovers.
+
+On-disk layout:
+- Each segment is a sequence of records: a 4-byte little-endian payload length,
+  a 4-byte CRC32 of the payload, then the payload bytes.
+- The segment currently being written has the `.open` suffix. On rotation it is
+  fsync'ed and atomically renamed to `.seg`, so a sealed segment is always complete.
+- Replay progress is stored in a small `cursor` file (segment name and byte offset)
+  that is replaced atomically, so a restarted process resumes where it stopped. It is
+  written after every 64 replayed records (or second), and when replay stops, rather
+  than with one fsync per record.
+- A torn record at the end of a segment (e.g. after a crash mid-write) fails its
+  length or CRC check and ends replay of that segment.
+
+Delivery is at-least-once: payloads replayed since the cursor was last written are
+resent if the process crashes. The segment being replayed is never evicted, and an
+evicted segment only counts its records that were not replayed yet.
+"""
+
+import os
+import mmap
+import zlib
+import struct
+import logging
+import threading
+from time import time, monotonic
+from typing import List, Tuple, BinaryIO, Callable, Optional, cast
+
+_logger = logging.getLogger(__name__)
+
+_RECORD_HEADER = struct.Struct("<II")
+_OPEN_SUFFIX = ".open"
+_SEALED_SUFFIX = ".seg"
+_CURSOR_FILE = "cursor"
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_MAX_SEGMENT_BYTES = 16 * 1024 * 1024
+DEFAULT_MAX_AGE_SECONDS = 24 * 60 * 60
+DEFAULT_REPLAY_INTERVAL_SECONDS = 30.0
+
+# The replay cursor is persisted after this many records or seconds, whichever comes first
+_CURSOR_SYNC_RECORDS = 64
+_CURSOR_SYNC_SECONDS = 1.0
+
+
+class GentraceSpanSpool:
+    """
+    An append-only, segment-based spool of serialized OTLP export requests.
+
+    The spool enforces a total size cap (oldest segments are evicted first) and an
+    age limit (segments whose last write is older than `max_age_seconds` are evicted).
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        *,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_segment_bytes: int = DEFAULT_MAX_SEGMENT_BYTES,
+        max_age_seconds: float = DEFAULT_MAX_AGE_SECONDS,
+        replay_interval_seconds: float = DEFAULT_REPLAY_INTERVAL_SECONDS,
+    ) -> None:
+        """
+        Initialize the spool, recovering any segments left behind by a previous process.
+
+        Args:
+            directory: Directory holding the segment files. Created if missing.
+            max_bytes: Maximum total size of all segments on disk.
+            max_segment_bytes: Size at which the active segment is sealed and a new one started.
+            max_age_seconds: Segments not written to for longer than this are discarded.
+            replay_interval_seconds: How often the background thread retries spooled payloads.
+        """
+        if max_segment_bytes <= 0 or max_bytes < max_segment_bytes:
+            raise ValueError("max_bytes must be greater than or equal to max_segment_bytes, and both must be positive.")
+
+        self._directory = directory
+        self._max_bytes = max_bytes
+        self._max_segment_bytes = max_segment_bytes
+        self._max_age_seconds = max_age_seconds
+        self._replay_interval = replay_interval_seconds
+
+        self._lock = threading.RLock()
+        self._replay_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._replay_thread: Optional[threading.Thread] = None
+
+        self._active_file: Optional[str] = None
+        self._active_handle: Optional[BinaryIO] = None
+        self._active_size = 0
+        # Segment the replay thread is reading, which eviction must leave alone
+        self._replaying_segment: Optional[str] = None
+
+        self._evicted_payloads = 0
+        self._replayed_payloads = 0
+
+        os.makedirs(directory, exist_ok=True)
+
+        # Seal segments left open by a previous (possibly crashed) process
+        with self._lock:
+            for name in self._list_segments(_OPEN_SUFFIX):
+                self._seal(os.path.join(directory, name))
+            self._next_sequence = self._compute_next_sequence()
+
+    # Public properties
+
+    @property
+    def directory(self) -> str:
+        """The directory holding the spool segments."""
+        return self._directory
+
+    @property
+    def evicted_payloads(self) -> int:
+        """Number of payloads discarded because of the size cap or the age limit."""
+        return self._evicted_payloads
+
+    @property
+    def replayed_payloads(self) -> int:
+        """Number of payloads successfully replayed from disk."""
+        return self._replayed_payloads
+
+    def pending_bytes(self) -> int:
+        """Total size of all segments currently on disk."""
+        with self._lock:
+            return sum(size for _, size, _ in self._segment_stats())
+
+    # Writing
+
+    def append(self, payload: bytes) -> None:
+        """Durably append a serialized export request to the active segment."""
+        header = _RECORD_HEADER.pack(len(payload), zlib.crc32(payload) & 0xFFFFFFFF)
+        record_size = len(header) + len(payload)
+
+        with self._lock:
+            if self._active_handle is not None and self._active_size + record_size > self._max_segment_bytes:
+                self._rotate()
+
+            if self._active_handle is None:
+                self._open_new_segment()
+
+            handle = cast(BinaryIO, self._active_handle)
+            handle.write(header)
+            handle.write(payload)
+            handle.flush()
+            os.fsync(handle.fileno())
+            self._active_size += record_size
+
+            self._enforce_limits()
+
+    # Replay
+
+    def replay(self, send: Callable[[bytes], bool]) -> bool:
+        """
+        Resend spooled payloads, oldest first.
+
+        Args:
+            send: Called with each payload. Returns True when the payload has been
+                  handled (delivered or permanently rejected) and False when the
+                  endpoint is still unavailable and replay should stop for now.
+
+        Returns:
+            True if the spool was fully drained, False otherwise.
+        """
+        with self._replay_lock:
+            with self._lock:
+                if self._active_handle is not None and self._active_size > 0:
+                    self._rotate()
+                self._enforce_limits()
+                segments = self._list_segments(_SEALED_SUFFIX)
+
+            cursor_segment, cursor_offset = self._read_cursor()
+
+            try:
+                for name in segments:
+                    offset = cursor_offset if name == cursor_segment else 0
+                    path = os.path.join(self._directory, name)
+                    with self._lock:
+                        self._replaying_segment = name
+
+                    finished = self._replay_segment(path, name, offset, send)
+                    if not finished:
+                        return False
+
+                    with self._lock:
+                        self._remove(path)
+                        self._write_cursor(None, 0)
+            finally:
+                with self._lock:
+                    self._replaying_segment = None
+
+            return True
+
+    def start_replay(self, send: Callable[[bytes], bool]) -> None:
+        """Start a daemon thread that periodically calls `replay(send)`."""
+        if self._replay_thread is not None:
+            return
+
+        def run() -> None:
+            while not self._stop_event.wait(self._replay_interval):
+                try:
+                    self.replay(send)
+                except Exception as e:
+                    _logger.error("Failed to replay spooled spans: %s", str(e))
+
+        self._replay_thread = threading.Thread(name="GentraceSpanSpoolReplay", target=run, daemon=True)
+        self._replay_thread.start()
+
+    def close(self) -> None:
+        """Stop the replay thread and seal the active segment."""
+        self._stop_event.set()
+        if self._replay_thread is not None:
+            self._replay_thread.join()
+            self._replay_thread = None
+
+        with self._lock:
+            if self._active_handle is not None:
+                self._rotate()
+
+    # Private helpers
+
+    def _replay_segment(self, path: str, name: str, offset: int, send: Callable[[bytes], bool]) -> bool:
+        """Replay one sealed segment from `offset`. Returns True once the whole segment is handled."""
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            # Evicted concurrently
+            return True
+        if size <= offset:
+            return True
+
+        # Records replayed since the cursor was last written
+        unsynced = 0
+        synced_at = monotonic()
+        try:
+            with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                while offset + _RECORD_HEADER.size <= size:
+                    length, checksum = _RECORD_HEADER.unpack_from(view, offset)
+                    start = offset + _RECORD_HEADER.size
+                    end = start + length
+                    if end > size:
+                        _logger.warning("Truncated record in spool segment %s, skipping remainder", name)
+                        return True
+
+                    payload = view[start:end]
+                    if zlib.crc32(payload) & 0xFFFFFFFF != checksum:
+                        _logger.warning("Corrupt record in spool segment %s, skipping remainder", name)
+                        return True
+
+                    if not send(payload):
+                        return False
+
+                    offset = end
+                    self._replayed_payloads += 1
+                    unsynced += 1
+                    if unsynced >= _CURSOR_SYNC_RECORDS or monotonic() - synced_at >= _CURSOR_SYNC_SECONDS:
+                        self._write_cursor(name, offset)
+                        unsynced = 0
+                        synced_at = monotonic()
+        finally:
+            if unsynced:
+                self._write_cursor(name, offset)
+
+        return True
+
+    def _open_new_segment(self) -> None:
+        name = f"{self._next_sequence:020d}{_OPEN_SUFFIX}"
+        self._next_sequence += 1
+        self._active_file = os.path.join(self._directory, name)
+        self._active_handle = open(self._active_file, "ab")
+        self._active_size = 0
+
+    def _rotate(self) -> None:
+        """Seal the active segment so it becomes eligible for replay."""
+        handle = self._active_handle
+        path = self._active_file
+        self._active_handle = None
+        self._active_file = None
+        self._active_size = 0
+        if handle is None or path is None:
+            return
+        handle.flush()
+        os.fsync(handle.fileno())
+        handle.close()
+        self._seal(path)
+
+    def _seal(self, open_path: str) -> None:
+        if os.path.getsize(open_path) == 0:
+            os.remove(open_path)
+            return
+        sealed_path = open_path[: -len(_OPEN_SUFFIX)] + _SEALED_SUFFIX
+        os.replace(open_path, sealed_path)
+        self._fsync_directory()
+
+    def _enforce_limits(self) -> None:
+        """Evict sealed segments that are too old, then oldest segments until under the size cap."""
+        stats = self._segment_stats()
+        now = time()
+        total = sum(size for _, size, _ in stats)
+        cursor_segment, cursor_offset = self._read_cursor()
+
+        for name, size, mtime in stats:
+            if not name.endswith(_SEALED_SUFFIX) or name == self._replaying_segment:
+                continue
+            too_old = now - mtime > self._max_age_seconds
+            too_big = total > self._max_bytes
+            if not (too_old or too_big):
+                continue
+            _logger.warning(
+                "Evicting spool segment %s (%s)", name, "expired" if too_old else "spool size limit exceeded"
+            )
+            # Records before the cursor were already replayed
+            start = cursor_offset if name == cursor_segment else 0
+            self._evicted_payloads += self._count_records(os.path.join(self._directory, name), start)
+            self._remove(os.path.join(self._directory, name))
+            total -= size
+
+    def _segment_stats(self) -> List[Tuple[str, int, float]]:
+        stats: List[Tuple[str, int, float]] = []
+        for name in sorted(self._list_segments(_SEALED_SUFFIX) + self._list_segments(_OPEN_SUFFIX)):
+            try:
+                st = os.stat(os.path.join(self._directory, name))
+            except OSError:
+                continue
+            stats.append((name, st.st_size, st.st_mtime))
+        return stats
+
+    def _list_segments(self, suffix: str) -> List[str]:
+        return sorted(name for name in os.listdir(self._directory) if name.endswith(suffix))
+
+    def _compute_next_sequence(self) -> int:
+        sequences = [
+            int(name.split(".", 1)[0])
+            for name in self._list_segments(_SEALED_SUFFIX)
+            if name.split(".", 1)[0].isdigit()
+        ]
+        return max(sequences) + 1 if sequences else 0
+
+    def _count_records(self, path: str, offset: int = 0) -> int:
+        count = 0
+        try:
+            with open(path, "rb") as f:
+                f.seek(offset)
+                while True:
+                    header = f.read(_RECORD_HEADER.size)
+                    if len(header) < _RECORD_HEADER.size:
+                        break
+                    length, _ = _RECORD_HEADER.unpack(header)
+                    f.seek(length, os.SEEK_CUR)
+                    count += 1
+        except OSError:
+            pass
+        return count
+
+    def _remove(self, path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def _read_cursor(self) -> Tuple[Optional[str], int]:
+        try:
+            with open(os.path.join(self._directory, _CURSOR_FILE), "r") as f:
+                name, offset = f.read().split()
+                return name, int(offset)
+        except (OSError, ValueError):
+            return None, 0
+
+    def _write_cursor(self, name: Optional[str], offset: int) -> None:
+        cursor_path = os.path.join(self._directory, _CURSOR_FILE)
+        if name is None:
+            self._remove(cursor_path)
+            return
+        tmp_path = cursor_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            f.write(f"{name} {offset}")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, cursor_path)
+
+    def _fsync_directory(self) -> None:
+        if not hasattr(os, "O_DIRECTORY"):
+            return
+        try:
+            fd = os.open(self._directory, os.O_RDONLY | os.O_DIRECTORY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+__all__ = ["GentraceSpanSpool"]
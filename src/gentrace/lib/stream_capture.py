@@ -0,0 +1,181 @@
+"""
+Streaming Output Capture for Generator Functions
+
+`@traced` generator functions record their output as the items are produced
+instead of buffering the whole stream:
+
+- A `StreamReducer` folds the items into the value recorded in the
+  `gentrace.fn.output` event. `BoundedListReducer` (the default) keeps up to a
+  fixed number of items and `TextReducer` concatenates text deltas, e.g. the
+  chunks of an LLM completion stream. Both use bounded memory.
+- Optionally each item is recorded as its own `gentrace.fn.output.item` event.
+- The span gets the item count, time to first item, inter-item latency and
+  throughput as attributes, and is marked when the consumer stops iterating early.
+"""
+
+from abc import ABC, abstractmethod
+from time import time_ns, perf_counter
+from typing import Any, List, Callable, Optional
+
+from opentelemetry.trace import Span
+
+from .constants import (
+    ATTR_GENTRACE_STREAM_ABANDONED,
+    ATTR_GENTRACE_STREAM_ITEM_COUNT,
+    ATTR_GENTRACE_STREAM_ITEMS_PER_SECOND,
+    ATTR_GENTRACE_STREAM_INTER_ITEM_MAX_MS,
+    ATTR_GENTRACE_FN_OUTPUT_ITEM_EVENT_NAME,
+    ATTR_GENTRACE_STREAM_INTER_ITEM_MEAN_MS,
+    ATTR_GENTRACE_STREAM_TIME_TO_FIRST_ITEM_MS,
+)
+from .serialization import DEFAULT_MAX_ITEMS
+from .deferred_payloads import record_output_event, record_payload_event
+
+DEFAULT_MAX_TEXT_CHARS = 1024 * 1024
+
+
+class StreamReducer(ABC):
+    """Folds the items of a stream into the single value recorded as its output."""
+
+    @abstractmethod
+    def add(self, item: Any) -> None:
+        """Fold one item into the aggregate."""
+
+    @abstractmethod
+    def result(self) -> Any:
+        """The aggregate of the items added so far."""
+
+
+class BoundedListReducer(StreamReducer):
+    """
+    Collects items into a list, keeping at most `max_items` of them.
+
+    When more items arrive, the recorded list ends with a "[N more items]" marker,
+    the same marker the JSON serializer uses for long lists.
+    """
+
+    def __init__(self, max_items: int = DEFAULT_MAX_ITEMS) -> None:
+        if max_items < 1:
+            raise ValueError("max_items must be at least 1.")
+        self._max_items = max_items
+        self._items: List[Any] = []
+        self._dropped = 0
+
+    def add(self, item: Any) -> None:
+        if len(self._items) < self._max_items:
+            self._items.append(item)
+        else:
+            self._dropped += 1
+
+    def result(self) -> Any:
+        if self._dropped:
+            return [*self._items, f"[{self._dropped} more items]"]
+        return self._items
+
+
+class TextReducer(StreamReducer):
+    """
+    Concatenates text deltas, keeping at most `max_chars` characters.
+
+    Args:
+        text: Extracts the text delta from an item, e.g.
+              `lambda chunk: chunk.choices[0].delta.content`. Items for which it
+              returns None are skipped. Defaults to using `str` items as they are
+              and skipping everything else.
+        max_chars: Text beyond this length is counted but not kept.
+    """
+
+    def __init__(
+        self, text: Optional[Callable[[Any], Optional[str]]] = None, *, max_chars: int = DEFAULT_MAX_TEXT_CHARS
+    ) -> None:
+        self._text = text
+        self._max_chars = max_chars
+        self._parts: List[str] = []
+        self._kept = 0
+        self._dropped = 0
+
+    def add(self, item: Any) -> None:
+        delta = self._text(item) if self._text is not None else item if isinstance(item, str) else None
+        if not delta:
+            return
+        room = self._max_chars - self._kept
+        if room > 0:
+            kept = delta[:room]
+            self._parts.append(kept)
+            self._kept += len(kept)
+        self._dropped += len(delta) - max(0, min(room, len(delta)))
+
+    def result(self) -> Any:
+        text = "".join(self._parts)
+        # Keep the joined string so later calls do not rebuild it
+        self._parts = [text]
+        if self._dropped:
+            return f"{text}... [{self._dropped} more characters]"
+        return text
+
+
+class StreamCapture:
+    """
+    Records the items produced by a traced generator on its span.
+
+    Args:
+        span: The generator's span.
+        reducer: Aggregates the items into the `gentrace.fn.output` event. None records
+                 no output event.
+        item_events: Also record every item as a `gentrace.fn.output.item` event.
+    """
+
+    def __init__(self, span: Span, reducer: Optional[StreamReducer], *, item_events: bool = False) -> None:
+        self._span = span
+        self._reducer = reducer
+        self._item_events = item_events
+        self._started = perf_counter()
+        self._last_item: Optional[float] = None
+        self._last_activity_ns = time_ns()
+        self._count = 0
+        self._time_to_first_item: Optional[float] = None
+        self._gap_total = 0.0
+        self._gap_max = 0.0
+
+    @property
+    def last_activity_ns(self) -> int:
+        """Wall-clock time of the last item (or of the start), used to end abandoned streams."""
+        return self._last_activity_ns
+
+    def add(self, item: Any) -> None:
+        """Record one produced item."""
+        now = perf_counter()
+        self._last_activity_ns = time_ns()
+        if self._last_item is None:
+            self._time_to_first_item = now - self._started
+        else:
+            gap = now - self._last_item
+            self._gap_total += gap
+            self._gap_max = max(self._gap_max, gap)
+        self._last_item = now
+        self._count += 1
+
+        if self._reducer is not None:
+            self._reducer.add(item)
+        if self._item_events:
+            record_payload_event(self._span, ATTR_GENTRACE_FN_OUTPUT_ITEM_EVENT_NAME, "output", item)
+
+    def finish(self, *, abandoned: bool = False) -> None:
+        """Set the stream attributes and record the aggregated output."""
+        span = self._span
+        span.set_attribute(ATTR_GENTRACE_STREAM_ITEM_COUNT, self._count)
+        if self._time_to_first_item is not None:
+            span.set_attribute(ATTR_GENTRACE_STREAM_TIME_TO_FIRST_ITEM_MS, self._time_to_first_item * 1000)
+        if self._count > 1:
+            span.set_attribute(ATTR_GENTRACE_STREAM_INTER_ITEM_MEAN_MS, self._gap_total / (self._count - 1) * 1000)
+            span.set_attribute(ATTR_GENTRACE_STREAM_INTER_ITEM_MAX_MS, self._gap_max * 1000)
+        if self._last_item is not None and self._last_item > self._started:
+            # Items produced per second from the start of the stream to its last item
+            span.set_attribute(ATTR_GENTRACE_STREAM_ITEMS_PER_SECOND, self._count / (self._last_item - self._started))
+        if abandoned:
+            span.set_attribute(ATTR_GENTRACE_STREAM_ABANDONED, True)
+        if self._reducer is not None:
+            record_output_event(span, self._reducer.result())
+
+
+__all__ = ["StreamReducer", "BoundedListReducer", "TextReducer", "StreamCapture"]
@@ -1,38 +1,119 @@
 import inspect
 import functools
-from typing import Any, Dict, List, TypeVar, Callable, Optional, Coroutine, AsyncGenerator, overload
+from typing import Any, Dict, List, Tuple, TypeVar, Callable, Optional, Coroutine, Generator, AsyncGenerator, overload
 from typing_extensions import ParamSpec
 
-from opentelemetry import trace
+from opentelemetry import trace, context
 from opentelemetry.trace.status import Status, StatusCode
 
-from .utils import ensure_initialized, _gentrace_json_dumps, gentrace_format_otel_attributes
-from .constants import ANONYMOUS_SPAN_NAME, ATTR_GENTRACE_FN_ARGS_EVENT_NAME, ATTR_GENTRACE_FN_OUTPUT_EVENT_NAME
+from .utils import ensure_initialized, gentrace_format_otel_attributes
+from .sampler import GentraceSampler
+from .constants import ANONYMOUS_SPAN_NAME, ATTR_GENTRACE_CACHE_HIT
+from .memo_cache import MemoCache, memo_key
+from .stream_capture import StreamCapture, StreamReducer, BoundedListReducer
+from .argument_binding import ArgumentBinder
+from .deferred_payloads import record_output_event, record_arguments_event
 
 P = ParamSpec("P")
 R = TypeVar("R")  # Represents the return type of a sync function, or the awaitable result of an async function
 F = TypeVar("F", bound=Callable[..., Any])  # Represents the callable being decorated
 
 
+def _is_dropped(attributes: Optional[Dict[str, Any]]) -> bool:
+    """
+    Whether the configured GentraceSampler would drop a span started now with `attributes`.
+
+    Lets the wrappers call the function directly, without creating a span or capturing
+    its arguments and result. Other samplers may depend on the trace ID or parent, so for
+    them the wrappers start the span and check `span.is_recording()` instead.
+    """
+    sampler = getattr(trace.get_tracer_provider(), "sampler", None)
+    return isinstance(sampler, GentraceSampler) and not sampler.is_sampled(None, attributes)
+
+
+def _forward_generator(
+    generator: Generator[Any, Any, Any],
+    ctx: context.Context,
+    on_item: Optional[Callable[[Any], None]] = None,
+) -> Generator[Any, Any, Any]:
+    """
+    Yield from `generator` with `ctx` attached only while it runs, not while the consumer
+    handles its items.
+
+    Values sent and exceptions thrown into the returned generator are forwarded, as they are
+    when the generator object itself is returned. `generator` is closed, also under `ctx`,
+    when the returned generator finishes or is closed.
+    """
+    sent: Any = None
+    thrown: Optional[BaseException] = None
+    try:
+        while True:
+            token = context.attach(ctx)
+            try:
+                item = generator.send(sent) if thrown is None else generator.throw(thrown)
+            except StopIteration as stop:
+                return stop.value
+            finally:
+                context.detach(token)
+            if on_item is not None:
+                on_item(item)
+            sent, thrown = None, None
+            try:
+                sent = yield item
+            except GeneratorExit:
+                raise
+            except BaseException as e:
+                thrown = e
+    finally:
+        # Run the wrapped generator's cleanup if it was left suspended
+        token = context.attach(ctx)
+        try:
+            generator.close()
+        finally:
+            context.detach(token)
+
+
 @overload
 def traced(
-    *, name: Optional[str] = None, attributes: Optional[Dict[str, Any]] = None
+    *,
+    name: Optional[str] = None,
+    attributes: Optional[Dict[str, Any]] = None,
+    output_reducer: Optional[Callable[[], StreamReducer]] = None,
+    output_item_events: bool = False,
+    cache: Optional[MemoCache] = None,
 ) -> Callable[[Callable[P, R]], Callable[P, R]]: ...
 
 
 @overload
 def traced(
-    *, name: Optional[str] = None, attributes: Optional[Dict[str, Any]] = None
+    *,
+    name: Optional[str] = None,
+    attributes: Optional[Dict[str, Any]] = None,
+    output_reducer: Optional[Callable[[], StreamReducer]] = None,
+    output_item_events: bool = False,
+    cache: Optional[MemoCache] = None,
 ) -> Callable[[Callable[P, Coroutine[Any, Any, R]]], Callable[P, Coroutine[Any, Any, R]]]: ...
 
 
 @overload
 def traced(
-    *, name: Optional[str] = None, attributes: Optional[Dict[str, Any]] = None
+    *,
+    name: Optional[str] = None,
+    attributes: Optional[Dict[str, Any]] = None,
+    output_reducer: Optional[Callable[[], StreamReducer]] = None,
+    output_item_events: bool = False,
+    cache: Optional[MemoCache] = None,
 ) -> Callable[[Callable[P, AsyncGenerator[R, None]]], Callable[P, AsyncGenerator[R, None]]]: ...
 
 
-def traced(*, name: Optional[str] = None, attributes: Optional[Dict[str, Any]] = None) -> Any:
+def traced(
+    *,
+    name: Optional[str] = None,
+    attributes: Optional[Dict[str, Any]] = None,
+    output_reducer: Optional[Callable[[], StreamReducer]] = None,
+    output_item_events: bool = False,
+    cache: Optional[MemoCache] = None,
+) -> Any:
     """
     Wraps a function with OpenTelemetry tracing to track its execution.
 
@@ -44,6 +125,24 @@ def traced(*, name: Optional[str] = None, attributes: Optional[Dict[str, Any]] =
               function's __name__ or 'anonymous_function'.
         attributes: Optional dictionary of additional attributes to set on the span.
                     These attributes will be prepared for OTLP compatibility.
+        output_reducer: Generator and async generator functions only. Factory for the
+                        `StreamReducer` that aggregates the yielded items into the
+                        recorded output, e.g. `TextReducer` to concatenate text deltas.
+                        Defaults to `BoundedListReducer`, which records the items as a list.
+        output_item_events: Generator and async generator functions only. Record every
+                            yielded item as a `gentrace.fn.output.item` event. Unless an
+                            `output_reducer` is also given, no aggregated output is
+                            recorded.
+        cache: Sync and async functions only (not generators). A `MemoCache` that returns
+               the stored result of an earlier call with the same arguments instead of
+               calling the function. A cached call is still traced, with its arguments
+               and output; the span's `gentrace.cache_hit` attribute tells hits from misses.
+
+    Generator and async generator functions are captured as they stream: the span stays
+    open while the generator is iterated, the items are not buffered beyond what the
+    reducer keeps, and the span gets the item count, time to first item, inter-item
+    latency and throughput as attributes. If the consumer stops iterating early, the
+    span ends at the last item and is marked with `gentrace.stream.abandoned`.
 
     Returns:
         A decorator that, when applied to a function, returns a new
@@ -64,66 +163,196 @@ def traced(*, name: Optional[str] = None, attributes: Optional[Dict[str, Any]] =
 
         actual_span_name: str = resolved_name
         tracer = trace.get_tracer("gentrace")
+        # Inspect the signature once; each call only applies the precompiled binding plan
+        binder = ArgumentBinder(original_fn)
+        # Keeps the entries of functions sharing a cache apart
+        cache_namespace = (
+            f"{getattr(original_fn, '__module__', '')}.{getattr(original_fn, '__qualname__', resolved_name)}"
+        )
+
+        if cache is not None and (inspect.isasyncgenfunction(original_fn) or inspect.isgeneratorfunction(original_fn)):
+            raise ValueError("cache is not supported for generator functions.")
+
+        def _cache_lookup(
+            args: Any, kwargs: Any, arguments: Optional[List[Tuple[str, Any]]]
+        ) -> Tuple[Optional[str], bool, Any]:
+            """The memo key of a call (None if it cannot be cached) and the cached result, if any."""
+            assert cache is not None
+            if arguments is None:
+                try:
+                    arguments = binder.bind(args, kwargs)
+                except TypeError:
+                    # Let the call itself raise
+                    return None, False, None
+            bound = dict(arguments)
+            for parameter, default in binder.defaults:
+                bound.setdefault(parameter, default)
+            key = memo_key(cache_namespace, bound)
+            if key is None:
+                return None, False, None
+            hit, value = cache.get(key)
+            return key, hit, value
+
+        def _new_reducer() -> Optional[StreamReducer]:
+            if output_reducer is not None:
+                return output_reducer()
+            # Per-item events already record the output of the stream
+            return None if output_item_events else BoundedListReducer()
 
         if inspect.isasyncgenfunction(original_fn):
 
             @functools.wraps(original_fn)
             async def async_gen_wrapper(*args: Any, **kwargs: Any) -> AsyncGenerator[Any, None]:
                 ensure_initialized()
-                with tracer.start_as_current_span(actual_span_name, attributes=final_attributes) as span:
+                if _is_dropped(final_attributes):
+                    async for item in original_fn(*args, **kwargs):
+                        yield item
+                    return
+
+                # The span is made current only while the generator runs, not while the
+                # consumer holds a yielded item, so it is started without activating it
+                span = tracer.start_span(actual_span_name, attributes=final_attributes)
+                if not span.is_recording():
+                    span.end()
+                    async for item in original_fn(*args, **kwargs):
+                        yield item
+                    return
+
+                span_context = trace.set_span_in_context(span)
+                capture = StreamCapture(span, _new_reducer(), item_events=output_item_events)
+                end_time: Optional[int] = None
+                abandoned = False
+                generator: Optional[AsyncGenerator[Any, None]] = None
+                try:
+                    record_arguments_event(span, binder.bind(args, kwargs))
+                    # original_fn is F, which in this branch is an async generator function.
+                    # The result of calling it is an async generator.
+                    generator = original_fn(*args, **kwargs)
+                    while True:
+                        token = context.attach(span_context)
+                        try:
+                            item = await generator.__anext__()
+                        except StopAsyncIteration:
+                            break
+                        finally:
+                            context.detach(token)
+                        capture.add(item)
+                        yield item
+
+                except Exception as e:
+                    span.record_exception(e)
+                    span.set_status(Status(StatusCode.ERROR, description=str(e)))
+                    span.set_attribute("error.type", e.__class__.__name__)
+                    raise
+                except GeneratorExit:
+                    # The consumer stopped iterating; the span covers the stream up to its last item
+                    abandoned = True
+                    end_time = capture.last_activity_ns
+                    raise
+                except BaseException:
+                    # e.g. the consuming task was cancelled while waiting for the next item
+                    abandoned = True
+                    raise
+                finally:
                     try:
-                        sig = inspect.signature(original_fn)
-                        bound_arguments = sig.bind(*args, **kwargs).arguments
-                        transformed_arguments = [{k: v} for k, v in bound_arguments.items()]
-                        serialized_inputs = _gentrace_json_dumps(transformed_arguments)
-                        span.add_event(
-                            ATTR_GENTRACE_FN_ARGS_EVENT_NAME,
-                            {"args": serialized_inputs},
-                        )
-
-                        result_list: List[Any] = []
-                        # original_fn is F, which in this branch is an async generator function.
-                        # The result of calling it is an async generator.
-                        async for item in original_fn(*args, **kwargs):
-                            result_list.append(item)
-                            yield item
-
-                        serialized_result = _gentrace_json_dumps(result_list)
-                        span.add_event(ATTR_GENTRACE_FN_OUTPUT_EVENT_NAME, {"output": serialized_result})
-
-                    except Exception as e:
-                        span.record_exception(e)
-                        span.set_status(Status(StatusCode.ERROR, description=str(e)))
-                        span.set_attribute("error.type", e.__class__.__name__)
-                        raise
+                        if generator is not None:
+                            # Run the wrapped generator's cleanup if it was left suspended
+                            token = context.attach(span_context)
+                            try:
+                                await generator.aclose()
+                            finally:
+                                context.detach(token)
+                    finally:
+                        capture.finish(abandoned=abandoned)
+                        span.end(end_time=end_time)
 
             return async_gen_wrapper  # type: ignore[return-value]
 
-        elif inspect.iscoroutinefunction(original_fn):
+        elif inspect.isgeneratorfunction(original_fn):
 
             @functools.wraps(original_fn)
-            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            def gen_wrapper(*args: Any, **kwargs: Any) -> Generator[Any, Any, Any]:
                 ensure_initialized()
-                with tracer.start_as_current_span(actual_span_name, attributes=final_attributes) as span:
-                    try:
-                        sig = inspect.signature(original_fn)
-                        bound_arguments = sig.bind(*args, **kwargs).arguments
+                if _is_dropped(final_attributes):
+                    return (yield from original_fn(*args, **kwargs))
+
+                # As for async generators, the span is current only while the generator runs
+                span = tracer.start_span(actual_span_name, attributes=final_attributes)
+                if not span.is_recording():
+                    span.end()
+                    return (yield from original_fn(*args, **kwargs))
+
+                span_context = trace.set_span_in_context(span)
+                capture = StreamCapture(span, _new_reducer(), item_events=output_item_events)
+                end_time: Optional[int] = None
+                abandoned = False
+                try:
+                    record_arguments_event(span, binder.bind(args, kwargs))
+                    # original_fn is F, which in this branch is a generator function.
+                    # The result of calling it is a generator.
+                    generator = original_fn(*args, **kwargs)
+                    return (yield from _forward_generator(generator, span_context, capture.add))
+
+                except Exception as e:
+                    span.record_exception(e)
+                    span.set_status(Status(StatusCode.ERROR, description=str(e)))
+                    span.set_attribute("error.type", e.__class__.__name__)
+                    raise
+                except GeneratorExit:
+                    # The consumer stopped iterating; the span covers the stream up to its last item
+                    abandoned = True
+                    end_time = capture.last_activity_ns
+                    raise
+                except BaseException:
+                    abandoned = True
+                    raise
+                finally:
+                    capture.finish(abandoned=abandoned)
+                    span.end(end_time=end_time)
+
+            return gen_wrapper  # type: ignore[return-value]
 
-                        # Transform the arguments dictionary into a list of single-key dictionaries
-                        transformed_arguments = [{k: v} for k, v in bound_arguments.items()]
-                        serialized_inputs = _gentrace_json_dumps(transformed_arguments)
+        elif inspect.iscoroutinefunction(original_fn):
 
-                        span.add_event(
-                            ATTR_GENTRACE_FN_ARGS_EVENT_NAME,
-                            {"args": serialized_inputs},
-                        )
-                        # original_fn is F, which in this branch is Callable[P, Coroutine[Any, Any, R]]
-                        # The result of awaiting it is R.
-                        result = await original_fn(*args, **kwargs)
+            async def cached_call_async(
+                args: Any, kwargs: Any, arguments: Optional[List[Tuple[str, Any]]], span: Optional[trace.Span]
+            ) -> Any:
+                assert cache is not None
+                key, hit, value = _cache_lookup(args, kwargs, arguments)
+                if span is not None and key is not None:
+                    span.set_attribute(ATTR_GENTRACE_CACHE_HIT, hit)
+                if hit:
+                    return value
+                result = await original_fn(*args, **kwargs)
+                if key is not None:
+                    cache.set(key, result)
+                return result
+
+            @functools.wraps(original_fn)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                ensure_initialized()
+                if _is_dropped(final_attributes):
+                    if cache is not None:
+                        return await cached_call_async(args, kwargs, None, None)
+                    return await original_fn(*args, **kwargs)
 
-                        serialized_result = _gentrace_json_dumps(result)
+                with tracer.start_as_current_span(actual_span_name, attributes=final_attributes) as span:
+                    if not span.is_recording():
+                        if cache is not None:
+                            return await cached_call_async(args, kwargs, None, None)
+                        return await original_fn(*args, **kwargs)
 
-                        span.add_event(ATTR_GENTRACE_FN_OUTPUT_EVENT_NAME, {"output": serialized_result})
+                    try:
+                        arguments = binder.bind(args, kwargs)
+                        record_arguments_event(span, arguments)
+                        if cache is not None:
+                            result = await cached_call_async(args, kwargs, arguments, span)
+                        else:
+                            # original_fn is F, which in this branch is Callable[P, Coroutine[Any, Any, R]]
+                            # The result of awaiting it is R.
+                            result = await original_fn(*args, **kwargs)
+
+                        record_output_event(span, result)
                         return result
                     except Exception as e:
                         span.record_exception(e)
@@ -138,32 +367,49 @@ def traced(*, name: Optional[str] = None, attributes: Optional[Dict[str, Any]] =
             return async_wrapper  # type: ignore[return-value]
         else:
 
+            def cached_call(
+                args: Any, kwargs: Any, arguments: Optional[List[Tuple[str, Any]]], span: Optional[trace.Span]
+            ) -> Any:
+                assert cache is not None
+                key, hit, value = _cache_lookup(args, kwargs, arguments)
+                if span is not None and key is not None:
+                    span.set_attribute(ATTR_GENTRACE_CACHE_HIT, hit)
+                if hit:
+                    return value
+                result = original_fn(*args, **kwargs)
+                if key is not None:
+                    cache.set(key, result)
+                return result
+
             @functools.wraps(original_fn)
             def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
                 ensure_initialized()
+                # Attributes are set after the span starts here, so the sampler does not see them
+                if _is_dropped(None):
+                    if cache is not None:
+                        return cached_call(args, kwargs, None, None)
+                    return original_fn(*args, **kwargs)
+
                 with tracer.start_as_current_span(actual_span_name) as span:
+                    if not span.is_recording():
+                        if cache is not None:
+                            return cached_call(args, kwargs, None, None)
+                        return original_fn(*args, **kwargs)
+
                     if final_attributes:
                         span.set_attributes(final_attributes)
 
                     try:
-                        sig = inspect.signature(original_fn)
-                        bound_arguments = sig.bind(*args, **kwargs).arguments
-
-                        # Transform the arguments dictionary into a list of single-key dictionaries
-                        transformed_arguments = [{k: v} for k, v in bound_arguments.items()]
-                        serialized_inputs = _gentrace_json_dumps(transformed_arguments)
-
-                        span.add_event(
-                            ATTR_GENTRACE_FN_ARGS_EVENT_NAME,
-                            {"args": serialized_inputs},
-                        )
-                        # original_fn is F, which in this branch is Callable[P, R]
-                        # The result of calling it is R.
-                        result = original_fn(*args, **kwargs)
-
-                        serialized_result = _gentrace_json_dumps(result)
-
-                        span.add_event(ATTR_GENTRACE_FN_OUTPUT_EVENT_NAME, {"output": serialized_result})
+                        arguments = binder.bind(args, kwargs)
+                        record_arguments_event(span, arguments)
+                        if cache is not None:
+                            result = cached_call(args, kwargs, arguments, span)
+                        else:
+                            # original_fn is F, which in this branch is Callable[P, R]
+                            # The result of calling it is R.
+                            result = original_fn(*args, **kwargs)
+
+                        record_output_event(span, result)
                         return result
                     except Exception as e:
                         span.record_exception(e)
@@ -1,7 +1,7 @@
 """Type definitions for the Gentrace library."""
 
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
-from typing_extensions import TypedDict
+from typing import TYPE_CHECKING, Any, Dict, List, Union, Callable, Optional
+from typing_extensions import Literal, Required, TypedDict
 
 if TYPE_CHECKING:
     from opentelemetry.sdk.trace.sampling import Sampler  # type: ignore
@@ -10,6 +10,142 @@ if TYPE_CHECKING:
 else:
     Sampler = Any
 
+CompressionType = Literal["none", "gzip", "deflate", "zstd", "adaptive"]
+
+JSONBackendType = Literal["json", "orjson"]
+
+CaptureCopyType = Literal["none", "shallow", "deep"]
+
+
+class BatchSpanProcessorOptions(TypedDict, total=False):
+    """
+    Configuration options for the batching span export pipeline.
+
+    All fields are optional. When not provided, the defaults of
+    `GentraceBatchSpanProcessor` are used.
+    """
+
+    max_queue_size: int
+    """Maximum number of finished spans buffered in memory. Defaults to 2048."""
+
+    max_export_batch_size: int
+    """Maximum number of spans sent in a single export request. Defaults to 512."""
+
+    schedule_delay_millis: float
+    """Maximum time a span waits in the queue before it is exported. Defaults to 5000."""
+
+    export_timeout_millis: float
+    """Default timeout for force_flush(). Defaults to 30000."""
+
+    queue_full_policy: Literal["drop_oldest", "block"]
+    """What to do when the queue is full: discard the oldest span or block the caller. Defaults to "drop_oldest"."""
+
+
+class SpanSpoolOptions(TypedDict, total=False):
+    """
+    Configuration options for the on-disk span spool.
+
+    Only `directory` is required. When the OTLP endpoint is unreachable, failed
+    export batches are written to this directory and replayed in the background.
+    """
+
+    directory: Required[str]
+    """Directory holding the spool segment files. Created if missing."""
+
+    max_bytes: int
+    """Maximum total size of the spool on disk. Oldest segments are evicted first. Defaults to 256 MiB."""
+
+    max_segment_bytes: int
+    """Size at which a segment file is sealed and a new one is started. Defaults to 16 MiB."""
+
+    max_age_seconds: float
+    """Segments not written to for longer than this are discarded. Defaults to 24 hours."""
+
+    replay_interval_seconds: float
+    """How often spooled payloads are retried. Defaults to 30 seconds."""
+
+
+class RateLimitOptions(TypedDict, total=False):
+    """
+    Rate limits applied by `eval_dataset` before each test case starts.
+
+    Both limits are token buckets: requests (test cases) per second may burst up to
+    one second's worth, tokens per minute up to one minute's worth.
+    """
+
+    requests_per_second: float
+    """Maximum rate at which test cases are started."""
+
+    tokens_per_minute: float
+    """Maximum number of (estimated) LLM tokens used per minute."""
+
+    estimate_tokens: Callable[[Any], int]
+    """
+    Estimates the tokens one test case (a `TestCase`) will use, for `tokens_per_minute`.
+    Defaults to one token per four characters of the JSON-encoded inputs.
+    """
+
+
+class AdaptiveConcurrencyOptions(TypedDict, total=False):
+    """
+    Configuration of the AIMD (additive increase, multiplicative decrease) limit on
+    the number of test cases `eval_dataset` runs at once.
+
+    The limit grows by about one per round of successful cases and is cut when a
+    case fails with a rate limit error (HTTP 429) or its latency spikes, always
+    staying between `min_concurrency` and `max_concurrency`.
+    """
+
+    initial_concurrency: int
+    """Limit at the start of the run. Defaults to 4 (or max_concurrency if lower)."""
+
+    min_concurrency: int
+    """Lowest limit. Defaults to 1."""
+
+    decrease_factor: float
+    """Factor applied to the limit on overload. Defaults to 0.5."""
+
+    latency_spike_factor: float
+    """A case whose latency exceeds this multiple of the recent average counts as overload. Defaults to 3.0."""
+
+
+class RetryOptions(TypedDict, total=False):
+    """
+    Retry policy for `eval_dataset` test cases whose interaction fails with a
+    transient error.
+
+    Retries wait an exponentially growing backoff (with full jitter) and draw
+    on a budget shared by all cases of the run, so a failing upstream is not
+    flooded with retries.
+    """
+
+    max_attempts: int
+    """Attempts per test case, including the first. Defaults to 3."""
+
+    initial_backoff: float
+    """Seconds to wait before the first retry (before jitter). Defaults to 0.5."""
+
+    max_backoff: float
+    """Upper bound of the wait before a retry, in seconds. Defaults to 30."""
+
+    backoff_multiplier: float
+    """Factor by which the backoff grows with each retry. Defaults to 2."""
+
+    jitter: bool
+    """Wait a random time between zero and the backoff ("full jitter"). Defaults to True."""
+
+    retry_on: Callable[[BaseException], bool]
+    """
+    Whether an exception raised by the interaction is worth retrying. Defaults to
+    `is_transient_error`: rate limits, timeouts, connection errors and 5xx responses.
+    """
+
+    budget_ratio: float
+    """Retries allowed per test case started, across the run. Defaults to 0.2."""
+
+    budget_min_retries: int
+    """Retries allowed regardless of `budget_ratio`, so small runs can retry too. Defaults to 10."""
+
 
 class OtelConfigOptions(TypedDict, total=False):
     """
@@ -36,5 +172,98 @@ class OtelConfigOptions(TypedDict, total=False):
     debug: bool
     """Enable console exporter for debugging. Defaults to False."""
 
+    spool: Optional[SpanSpoolOptions]
+    """Write spans that could not be exported to disk and resend them when the endpoint recovers. Disabled by default."""
+
+    compression: CompressionType
+    """
+    Codec for export payloads: "none" (default unless set via the OTLP environment
+    variables), "gzip", "deflate", "zstd" (requires the `zstd` extra,
+    `pip install gentrace-py[zstd]`) or "adaptive", which skips small batches and
+    picks the cheapest codec per batch.
+    """
+
+    compression_level: int
+    """
+    Compression level for the selected codec. Defaults to 6 for gzip/deflate and 3 for zstd.
+    With "adaptive" it must be between 1 and 9 and applies to gzip and zstd alike.
+    """
+
+    max_concurrent_exports: int
+    """
+    Number of export requests that may be in flight at once. Defaults to 1 (serial
+    export). Higher values export batches from a pool of worker threads.
+    """
+
+    max_request_bytes: Optional[int]
+    """
+    Size cap for a single export request. Larger batches are split into several
+    requests that are exported concurrently. Defaults to 4 MiB; None disables splitting.
+    """
+
+    max_attribute_bytes: Optional[int]
+    """
+    Size limit for string and JSON-serialized span attribute values. Longer values are
+    truncated and marked with their original size. Not limited by default.
+    """
+
+    max_event_bytes: Optional[int]
+    """
+    Size limit for the serialized inputs and outputs recorded in `gentrace.fn.args` /
+    `gentrace.fn.output` events. Larger payloads are replaced by a truncation object with
+    a preview and the original size. Not limited by default.
+    """
+
+    max_serialization_depth: int
+    """
+    Maximum nesting depth of serialized inputs, outputs and attribute values. Deeper
+    containers are replaced by "[MaxDepthExceeded]". Defaults to 64.
+    """
+
+    max_serialization_items: int
+    """
+    Maximum number of items serialized per list or dict; the number of omitted items
+    is recorded in the output. Defaults to 10000.
+    """
+
+    json_backend: JSONBackendType
+    """
+    Encoder used for serialized values: "json" (standard library, default) or "orjson"
+    (faster, compact output; requires the `orjson` extra, `pip install gentrace-py[orjson]`,
+    and falls back to "json" without it).
+    """
+
+    deferred_serialization: bool
+    """
+    Serialize function inputs and outputs when spans are exported, on the batch
+    processor's export thread, instead of during the function call. Defaults to False
+    and has no effect with `batch_processor=False`.
+    """
+
+    capture_copy: CaptureCopyType
+    """
+    How inputs and outputs are captured with deferred serialization: "none" keeps a
+    reference, "shallow" (default) copies lists, dicts, sets and pydantic models one
+    level deep, "deep" deep-copies them.
+    """
+
+    batch_processor: Union[bool, BatchSpanProcessorOptions]
+    """
+    Controls how spans are handed to the Gentrace exporter. True (default) exports
+    spans in the background through a batching processor, False exports each span
+    synchronously when it ends, and a BatchSpanProcessorOptions dict tunes the
+    batching processor.
+    """
+
 
-__all__ = ["OtelConfigOptions"]
+__all__ = [
+    "OtelConfigOptions",
+    "CompressionType",
+    "JSONBackendType",
+    "CaptureCopyType",
+    "BatchSpanProcessorOptions",
+    "SpanSpoolOptions",
+    "RateLimitOptions",
+    "AdaptiveConcurrencyOptions",
+    "RetryOptions",
+]
@@ -3,10 +3,9 @@ import sys
 import json
 import logging
 import warnings
-from typing import Any, Set, Dict, List, Tuple, Union, Optional, Sequence, cast
+from typing import Any, Dict, List, Tuple, Union, Iterable, Optional, Sequence, cast
 from datetime import datetime
 
-from pydantic import BaseModel
 from rich.live import Live
 from rich.text import Text
 from rich.tree import Tree
@@ -30,14 +29,25 @@ from rich.progress import (
 from opentelemetry.util import types as otel_types
 from opentelemetry.sdk.trace import TracerProvider as SDKTracerProvider
 
+from .._utils import lru_cache
 from .warnings import GentraceWarnings
+from .serialization import (
+    DEFAULT_MAX_DEPTH,
+    DEFAULT_MAX_ITEMS,
+    TRUNCATED_VALUE_MARKER,
+    JSONBackend,
+    GentraceJSONSerializer,
+)
 
 logger = logging.getLogger("gentrace")
 
 OTLP_MAX_INT_SIZE = (2**63) - 1  # Max 64-bit signed integer
 OTLP_MIN_INT_SIZE = -(2**63)  # Min 64-bit signed integer
 
-CIRCULAR_REFERENCE_PLACEHOLDER = "[CircularReference]"
+# Size limits for serialized span attribute values and fn.args / fn.output event payloads (opt-in)
+_max_attribute_bytes: Optional[int] = None
+_max_event_bytes: Optional[int] = None
+_serializer = GentraceJSONSerializer()
 
 # Global flag to ensure the OpenTelemetry configuration warning is issued only once per session
 _otel_config_warning_issued = False
@@ -638,83 +648,65 @@ def display_pipeline_error(pipeline_id: str, error_type: str, error: Optional[Ex
     display_gentrace_warning(warning)
 
 
-def _convert_pydantic_model_to_dict_if_applicable(obj: Any) -> Any:
-    """Checks if an object is a Pydantic model and converts it to a dict.
-    Returns the original object if it's not a Pydantic model or conversion fails.
-    """
-    if isinstance(obj, BaseModel):
-        try:
-            # Pydantic V2
-            return obj.model_dump()
-        except AttributeError:
-            # Pydantic V1
-            try:
-                return obj.dict()  # type: ignore
-            except AttributeError:
-                # Should not happen if isinstance check passed and it's a Pydantic model
-                pass  # Fall through, returning original obj
-    return obj
-
-
-def _gentrace_json_dumps(value: Any) -> str:
-    """Helper to dump objects to JSON string, handling circular references and non-serializable types.
+def set_serialization_limits(
+    *,
+    max_attribute_bytes: Optional[int] = None,
+    max_event_bytes: Optional[int] = None,
+    max_depth: int = DEFAULT_MAX_DEPTH,
+    max_items: int = DEFAULT_MAX_ITEMS,
+    json_backend: JSONBackend = "json",
+) -> None:
+    """Configure how span attribute values and fn.args / fn.output events are serialized.
 
-    This is a serialization function designed to help properly convert Open Telemetry span attributes
-    or convert the function arguments and outputs to a serializable format.
+    `max_attribute_bytes` and `max_event_bytes` limit the size of serialized values (None disables
+    a limit, the default). `max_depth`, `max_items` and `json_backend` configure the `GentraceJSONSerializer`.
     """
+    global _max_attribute_bytes, _max_event_bytes, _serializer
+    for limit in (max_attribute_bytes, max_event_bytes):
+        if limit is not None and limit <= 0:
+            raise ValueError("Serialization size limits must be positive or None.")
+    _serializer = GentraceJSONSerializer(max_depth=max_depth, max_items=max_items, backend=json_backend)
+    _max_attribute_bytes = max_attribute_bytes
+    _max_event_bytes = max_event_bytes
 
-    # Attempt to convert top-level value if it's a Pydantic model
-    value = _convert_pydantic_model_to_dict_if_applicable(value)
 
-    seen_objects_for_this_dump: Set[int] = set()
+def _gentrace_event_json_dumps(value: Any) -> str:
+    """Serialize a fn.args / fn.output event payload, truncated to the configured event size limit."""
+    return _serializer.dumps(value, max_bytes=_max_event_bytes)
 
-    def default_handler(obj: Any) -> Any:
-        obj_id = id(obj)
-        if obj_id in seen_objects_for_this_dump:
-            return CIRCULAR_REFERENCE_PLACEHOLDER
 
-        seen_objects_for_this_dump.add(obj_id)
+def _gentrace_arguments_json_dumps(arguments: Iterable[Tuple[str, Any]]) -> str:
+    """Serialize bound call arguments for the fn.args event, truncated to the configured event size limit."""
+    return _serializer.dumps_arguments(arguments, max_bytes=_max_event_bytes)
 
-        # Attempt to convert Pydantic models to dict
-        # Must be done before trying str(obj) as Pydantic models might have custom __str__
-        processed_obj = _convert_pydantic_model_to_dict_if_applicable(obj)
 
-        # If the object was a Pydantic model and successfully converted,
-        # processed_obj will be a dict. Otherwise, it's the original obj.
-        # We only proceed to str(obj) if it wasn't a Pydantic model or conversion failed.
-        if processed_obj is not obj:  # Check if conversion happened
-            # If it was converted (e.g. to a dict), it's ready for json.dumps
-            return processed_obj
+def _truncate_str(value: str, max_bytes: int) -> str:
+    """Truncate a plain string attribute to `max_bytes` UTF-8 bytes, appending a marker with the original size."""
+    if len(value) * 4 <= max_bytes:
+        return value
+    encoded = value.encode("utf-8", errors="surrogatepass")
+    if len(encoded) <= max_bytes:
+        return value
+    marker = f"... [{TRUNCATED_VALUE_MARKER}: original {len(encoded)} bytes]".encode("utf-8")
+    if len(marker) >= max_bytes:
+        # Limits too small to hold the marker get as much of the marker as fits
+        return marker[:max_bytes].decode("utf-8", errors="ignore")
+    return (encoded[: max_bytes - len(marker)] + marker).decode("utf-8", errors="ignore")
 
-        try:
-            return str(obj)
-        except Exception:
-            return f"[UnserializableType: {type(obj).__name__}]"
 
-    try:
-        return json.dumps(value, default=default_handler)
-    except ValueError as e:
-        if "Circular reference detected" in str(e):
-            # This case should ideally be caught by the default_handler.
-            # If it still occurs, it means a very complex or deep cycle was not fully handled before json.dumps itself gave up.
-            # We return a simple placeholder for the entire problematic value.
-            # To be more granular, the default_handler would need to be even more sophisticated
-            # or we'd need a pre-processing step to replace cycles before calling json.dumps.
-            warnings.warn(
-                f"Fallback to placeholder for entire value due to complex circular reference: {e}",
-                UserWarning,
-                stacklevel=2,
-            )
-            return json.dumps(CIRCULAR_REFERENCE_PLACEHOLDER)
-        raise  # Re-raise other ValueErrors
-    except TypeError as e:
-        # Fallback if default_handler somehow returns a type json.dumps still can't handle,
-        # or if the initial `value` itself is problematic in a way that bypasses the default logic early.
-        warnings.warn(
-            f"Fallback JSON serialization due to TypeError: {e}. Result may be lossy.", UserWarning, stacklevel=2
-        )
-        # Final fallback to simple str conversion for the whole object if custom logic fails.
-        return json.dumps(str(value), default=str)
+def _gentrace_json_dumps(value: Any, max_bytes: Optional[int] = None) -> str:
+    """Helper to dump objects to JSON string, handling circular references and non-serializable types.
+
+    This is a serialization function designed to help properly convert Open Telemetry span attributes
+    or convert the function arguments and outputs to a serializable format. It delegates to the
+    serializer configured by `set_serialization_limits()`: reference cycles become
+    "[CircularReference]" where they occur, containers beyond the depth and item limits are cut,
+    pydantic models are encoded through their core serializer and other objects through `str()`.
+
+    If `max_bytes` is set, serializations longer than `max_bytes` are replaced by a truncation
+    object holding their prefix and original size, without encoding the whole value.
+    """
+    return _serializer.dumps(value, max_bytes=max_bytes)
 
 
 def gentrace_format_otel_value(value: Any) -> otel_types.AttributeValue:
@@ -723,8 +715,11 @@ def gentrace_format_otel_value(value: Any) -> otel_types.AttributeValue:
     Simple types (str, bool, float) are passed through.
     Integers are checked against OTel's 64-bit range and converted to string if outside.
     All other types (lists, dicts, complex objects) are JSON stringified using a safe dumper.
+    Strings and JSON values longer than the configured attribute size limit are truncated.
     """
-    if isinstance(value, (str, bool, float)):
+    if isinstance(value, str):
+        return _truncate_str(value, _max_attribute_bytes) if _max_attribute_bytes is not None else value
+    if isinstance(value, (bool, float)):
         return value
     elif isinstance(value, int):
         if not (OTLP_MIN_INT_SIZE <= value <= OTLP_MAX_INT_SIZE):
@@ -738,7 +733,7 @@ def gentrace_format_otel_value(value: Any) -> otel_types.AttributeValue:
         return value
     else:
         # For lists, dicts, complex objects, etc., JSON stringify safely.
-        return _gentrace_json_dumps(value)
+        return _gentrace_json_dumps(value, max_bytes=_max_attribute_bytes)
 
 
 def gentrace_format_otel_attributes(attributes: Dict[str, Any]) -> Dict[str, otel_types.AttributeValue]:
@@ -746,6 +741,7 @@ def gentrace_format_otel_attributes(attributes: Dict[str, Any]) -> Dict[str, ote
     return {key: gentrace_format_otel_value(value) for key, value in attributes.items()}
 
 
+@lru_cache(maxsize=None)
 def is_pydantic_v1() -> bool:
     """Checks if the installed Pydantic version is V1."""
     try:
@@ -34,22 +34,20 @@ This vendored implementation:
 Based on OpenTelemetry Python SDK but simplified for stability and maintainability.
 """
 
-import gzip
 import json
-import zlib
 import random
+import asyncio
 import logging
 import threading
-from io import BytesIO
 from os import environ
-from enum import Enum
 from time import time
-from typing import Any, Dict, List, Optional, Sequence
-from collections import defaultdict
+from typing import Any, Set, Dict, List, Tuple, Callable, Optional, Sequence
 from typing_extensions import override
+from concurrent.futures import Future, ThreadPoolExecutor, wait as futures_wait
 
+import httpx
 import requests
-from opentelemetry.trace import Status, SpanKind, StatusCode
+from opentelemetry.trace import SpanKind, StatusCode
 from opentelemetry.util.re import parse_env_headers
 from opentelemetry.sdk.trace import ReadableSpan
 from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
@@ -73,8 +71,6 @@ from opentelemetry.sdk.environment_variables import (
 )
 from opentelemetry.proto.common.v1.common_pb2 import (
     AnyValue,
-    KeyValue,
-    ArrayValue,
     InstrumentationScope,
 )
 from opentelemetry.proto.resource.v1.resource_pb2 import Resource as PB2Resource
@@ -87,6 +83,10 @@ from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import (
 
 from .utils import display_gentrace_warning
 from .warnings import GentraceWarnings
+from .span_spool import GentraceSpanSpool
+from .otlp_transport import OTLPResponse, HttpxOTLPTransport, AsyncHttpxOTLPTransport
+from .otlp_compression import Compression, AdaptiveCompressor, compress_payload, resolve_compression
+from .deferred_payloads import resolve_event_attributes
 
 _logger = logging.getLogger(__name__)
 
@@ -95,6 +95,17 @@ DEFAULT_ENDPOINT = "http://localhost:4318/"
 DEFAULT_TRACES_EXPORT_PATH = "v1/traces"
 DEFAULT_TIMEOUT = 10  # in seconds
 MAX_RETRIES = 6
+DEFAULT_MAX_REQUEST_BYTES = 4 * 1024 * 1024
+
+# Upper bound on the bytes a length-delimited field adds around its payload (tag + varint length)
+_FIELD_OVERHEAD_BYTES = 6
+# Worker threads used to send the chunks of one oversized batch concurrently in serial export mode
+_CHUNK_EXPORT_WORKERS = 4
+
+# Errors raised when the endpoint cannot be reached or does not answer in time; these are
+# retried with backoff and spooled. Any other exception is a bug or misconfiguration that
+# would fail again on replay, so the batch is dropped instead.
+_CONNECTION_ERRORS = (httpx.TransportError, requests.exceptions.ConnectionError, requests.exceptions.Timeout)
 
 # Headers for OTLP/HTTP
 OTLP_HTTP_HEADERS = {
@@ -102,11 +113,25 @@ OTLP_HTTP_HEADERS = {
 }
 
 
-class Compression(Enum):
-    """Compression algorithms for OTLP export."""
-    NoCompression = "none"
-    Gzip = "gzip"
-    Deflate = "deflate"
+class _BatchOutcome:
+    """Combines the results of the requests of one batch and reports the batch's result once."""
+
+    def __init__(self, requests: int, on_done: Callable[[SpanExportResult], None]) -> None:
+        self._remaining = requests
+        self._failed = False
+        self._on_done = on_done
+        self._lock = threading.Lock()
+
+    def record(self, result: SpanExportResult) -> None:
+        with self._lock:
+            self._remaining -= 1
+            self._failed = self._failed or result != SpanExportResult.SUCCESS
+            if self._remaining:
+                return
+        try:
+            self._on_done(SpanExportResult.FAILURE if self._failed else SpanExportResult.SUCCESS)
+        except Exception:
+            _logger.exception("Exception while reporting the result of a span export.")
 
 
 class GentraceVendoredOTLPSpanExporter(SpanExporter):
@@ -123,9 +148,51 @@ class GentraceVendoredOTLPSpanExporter(SpanExporter):
         headers: Optional[Dict[str, str]] = None,
         timeout: Optional[float] = None,
         compression: Optional[Compression] = None,
+        compression_level: Optional[int] = None,
         session: Optional[requests.Session] = None,
+        spool: Optional[GentraceSpanSpool] = None,
+        http_client: Optional[httpx.Client] = None,
+        async_http_client: Optional[httpx.AsyncClient] = None,
+        http2: bool = False,
+        max_concurrent_exports: int = 1,
+        max_request_bytes: Optional[int] = DEFAULT_MAX_REQUEST_BYTES,
     ):
-        """Initialize the vendored OTLP exporter."""
+        """
+        Initialize the vendored OTLP exporter.
+
+        Requests are sent with httpx. Pass `http_client` (and `async_http_client` for
+        `export_async()`) to share the connection pool of an existing client, such as
+        the one used by the `Gentrace` API client; otherwise a dedicated pool is created,
+        using HTTP/2 when `http2` is set. Passing a `requests.Session` as `session` keeps
+        the legacy requests-based transport.
+
+        `compression` selects the payload codec (defaulting to the OTLP compression
+        environment variables) and `compression_level` its level. `Compression.Zstd`
+        needs the optional `zstandard` package (`pip install gentrace-py[zstd]`) and
+        falls back to gzip without it. `Compression.Adaptive` picks a codec per batch
+        with an `AdaptiveCompressor`, which applies `compression_level` (1 to 9) to
+        gzip and zstd alike.
+
+        If a `spool` is provided, batches that fail for transient reasons are written
+        to disk and replayed in the background once the endpoint is reachable again.
+
+        With `max_concurrent_exports` greater than 1, `export()` hands each encoded
+        batch to a pool of that many worker threads and returns as soon as a worker
+        slot is free, so up to that many requests are in flight at once. Each worker
+        retries with its own backoff. `force_flush()` waits for in-flight requests.
+        Since `export()` returns before the outcome is known, callers that track it
+        (such as `GentraceBatchSpanProcessor`) use `export_in_background()`.
+
+        Batches whose encoded size exceeds `max_request_bytes` are split into
+        several requests under that size, which are exported concurrently. A single
+        span larger than the cap is sent in a request of its own. Pass None to
+        disable splitting.
+        """
+        if max_concurrent_exports < 1:
+            raise ValueError("max_concurrent_exports must be at least 1.")
+        if max_request_bytes is not None and max_request_bytes <= 0:
+            raise ValueError("max_request_bytes must be positive.")
+
         self._shutdown_in_progress = threading.Event()
         self._shutdown = False
         
@@ -153,17 +220,52 @@ class GentraceVendoredOTLPSpanExporter(SpanExporter):
         )
         
         # Configure compression
-        self._compression = compression or self._compression_from_env()
-        
-        # Setup session
-        self._session = session or requests.Session()
-        self._session.headers.update(self._headers)
-        self._session.headers.update(OTLP_HTTP_HEADERS)
+        self._compression = resolve_compression(compression or self._compression_from_env())
+        self._compression_level = compression_level
+        self._adaptive_compressor: Optional[AdaptiveCompressor] = None
+        if self._compression == Compression.Adaptive:
+            levels: Optional[Dict[Compression, int]] = None
+            if compression_level is not None:
+                # The level applies to whichever codec is picked, so it must suit both
+                if not 1 <= compression_level <= 9:
+                    raise ValueError(
+                        "compression_level must be between 1 and 9 with Compression.Adaptive, "
+                        "which applies it to both gzip and zstd."
+                    )
+                levels = {Compression.Gzip: compression_level, Compression.Zstd: compression_level}
+            self._adaptive_compressor = AdaptiveCompressor(levels=levels)
         
-        if self._compression != Compression.NoCompression:
-            self._session.headers.update(
-                {"Content-Encoding": self._compression.value}
-            )
+        # Headers sent with every export request, per content encoding
+        self._request_headers: Dict[str, str] = {**self._headers, **OTLP_HTTP_HEADERS}
+        self._encoded_request_headers: Dict[Compression, Dict[str, str]] = {
+            Compression.NoCompression: self._request_headers
+        }
+
+        # Setup transport
+        self._session = session
+        if self._session is not None:
+            self._session.headers.update(self._request_headers)
+        self._transport = HttpxOTLPTransport(http_client, http2=http2)
+        self._async_http_client = async_http_client
+        self._http2 = http2
+        self._async_transport: Optional[AsyncHttpxOTLPTransport] = None
+
+        # Concurrent export workers, created on first use
+        self._max_concurrent_exports = max_concurrent_exports
+        self._max_request_bytes = max_request_bytes
+        self._export_slots = threading.BoundedSemaphore(max_concurrent_exports)
+        self._export_executor: Optional[ThreadPoolExecutor] = None
+        self._in_flight: Set["Future[SpanExportResult]"] = set()
+        self._in_flight_lock = threading.Lock()
+
+        # Encodings of resources and instrumentation scopes, keyed by object identity
+        self._resource_cache: Dict[int, Any] = {}
+        self._scope_cache: Dict[int, Any] = {}
+
+        # Replay anything left on disk by earlier failures (or a previous process)
+        self._spool = spool
+        if self._spool is not None:
+            self._spool.start_replay(self._replay_spooled)
 
     @override
     def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
@@ -172,59 +274,296 @@ class GentraceVendoredOTLPSpanExporter(SpanExporter):
             _logger.warning("Exporter already shutdown, ignoring batch")
             return SpanExportResult.FAILURE
 
-        # Encode spans to protobuf
-        serialized_data = self._encode_spans(spans).SerializePartialToString()
-        
+        payloads = self._encode_payloads(spans)
+
+        if self._max_concurrent_exports == 1:
+            if len(payloads) == 1:
+                return self._export_or_spool(payloads[0])
+            return self._export_chunks(payloads)
+
+        # The batch is only handed off here; use export_in_background() to learn its outcome
+        return self._submit_payloads(payloads, None)
+
+    def export_in_background(
+        self, spans: Sequence[ReadableSpan], on_done: Callable[[SpanExportResult], None]
+    ) -> None:
+        """
+        Export spans, reporting the result of the whole batch to `on_done` once it is known.
+
+        With `max_concurrent_exports` greater than 1, this returns as soon as the batch's
+        requests are handed to the worker pool, and `on_done` is called by the worker that
+        finishes the batch's last request, before `force_flush()` counts the batch as
+        done. Otherwise the batch is exported and `on_done` called before returning.
+        """
+        if self._max_concurrent_exports == 1 or self._shutdown:
+            on_done(self.export(spans))
+            return
+
+        payloads = self._encode_payloads(spans)
+        self._submit_payloads(payloads, _BatchOutcome(len(payloads), on_done).record)
+
+    def _submit_payloads(
+        self, payloads: List[bytes], on_result: Optional[Callable[[SpanExportResult], None]]
+    ) -> SpanExportResult:
+        """
+        Hand serialized requests to the worker pool, waiting for free worker slots.
+
+        Returns:
+            FAILURE if a request could not be handed off because the pool was shut down,
+            SUCCESS otherwise (the requests' own outcomes are reported to `on_result`).
+        """
+        result = SpanExportResult.SUCCESS
+        for serialized_data in payloads:
+            # Wait for a free worker so at most max_concurrent_exports requests are in flight
+            self._export_slots.acquire()
+            try:
+                future = self._get_export_executor().submit(self._export_and_report, serialized_data, on_result)
+            except RuntimeError:
+                # The executor was shut down concurrently
+                self._export_slots.release()
+                result = SpanExportResult.FAILURE
+                if on_result is not None:
+                    on_result(SpanExportResult.FAILURE)
+                continue
+
+            with self._in_flight_lock:
+                self._in_flight.add(future)
+            future.add_done_callback(self._on_export_done)
+        return result
+
+    def _export_and_report(
+        self, serialized_data: bytes, on_result: Optional[Callable[[SpanExportResult], None]]
+    ) -> SpanExportResult:
+        result = SpanExportResult.FAILURE
+        try:
+            result = self._export_or_spool(serialized_data)
+            return result
+        finally:
+            if on_result is not None:
+                on_result(result)
+
+    def _encode_payloads(self, spans: Sequence[ReadableSpan]) -> List[bytes]:
+        """Encode spans to serialized requests, splitting oversized batches under the size cap."""
+        chunks = self._encode_chunks(spans, self._max_request_bytes)
+        if len(chunks) > 1:
+            _logger.debug("Split export of %d spans into %d requests", len(spans), len(chunks))
+        return [chunk.SerializePartialToString() for chunk in chunks]
+
+    def _export_chunks(self, payloads: List[bytes]) -> SpanExportResult:
+        """Export the requests of one split batch concurrently and wait for all of them."""
+        try:
+            futures = [self._get_export_executor().submit(self._export_or_spool, payload) for payload in payloads]
+        except RuntimeError:
+            return SpanExportResult.FAILURE
+        results = [future.result() for future in futures]
+        if all(result == SpanExportResult.SUCCESS for result in results):
+            return SpanExportResult.SUCCESS
+        return SpanExportResult.FAILURE
+
+    def _export_or_spool(self, serialized_data: bytes) -> SpanExportResult:
+        """Export a serialized request, spooling it if it failed for transient reasons."""
+        result, transient = self._export_serialized(serialized_data)
+
+        # Keep payloads that failed for transient reasons so they can be replayed later
+        if result == SpanExportResult.FAILURE and transient:
+            self._spool_payload(serialized_data)
+
+        return result
+
+    def _spool_payload(self, serialized_data: bytes) -> None:
+        if self._spool is None:
+            return
+        try:
+            self._spool.append(serialized_data)
+            _logger.warning("Spooled %d bytes of spans to disk for later delivery", len(serialized_data))
+        except Exception as e:
+            _logger.error("Failed to spool spans to disk: %s", str(e))
+
+    def _get_export_executor(self) -> ThreadPoolExecutor:
+        with self._in_flight_lock:
+            if self._export_executor is None:
+                self._export_executor = ThreadPoolExecutor(
+                    max_workers=_CHUNK_EXPORT_WORKERS
+                    if self._max_concurrent_exports == 1
+                    else self._max_concurrent_exports,
+                    thread_name_prefix="GentraceOTLPExport",
+                )
+            return self._export_executor
+
+    def _on_export_done(self, future: "Future[SpanExportResult]") -> None:
+        with self._in_flight_lock:
+            self._in_flight.discard(future)
+        self._export_slots.release()
+
+    def _export_serialized(self, serialized_data: bytes) -> Tuple[SpanExportResult, bool]:
+        """
+        Send a serialized export request, retrying transient errors.
+
+        Returns:
+            The export result, and whether a failure was transient (retries or the
+            deadline were exhausted, the endpoint was unreachable, or shutdown began).
+        """
         # Apply compression if needed
-        data = self._compress_data(serialized_data)
+        data, compression = self._compress_data(serialized_data)
         
         deadline_sec = time() + self._timeout
         
         for retry_num in range(MAX_RETRIES):
+            resp: Optional[OTLPResponse] = None
+            error: Optional[Exception] = None
             try:
-                resp = self._send_request(data, deadline_sec - time())
-                
-                if resp.ok:
-                    # Check for partial success
-                    if resp.content:
-                        self._check_partial_success(resp)
-                    return SpanExportResult.SUCCESS
-                
-                # Handle retries
-                if not self._is_retryable(resp):
-                    self._handle_error(resp)
-                    return SpanExportResult.FAILURE
-                
-                if retry_num + 1 == MAX_RETRIES:
-                    _logger.error(
-                        "Max retries reached. Failed to export spans: %s",
-                        resp.text,
-                    )
-                    return SpanExportResult.FAILURE
-                
-                # Calculate backoff with jitter
-                backoff_seconds = 2**retry_num * random.uniform(0.8, 1.2)
-                
-                if backoff_seconds > (deadline_sec - time()):
-                    _logger.error("Export deadline exceeded, aborting retries")
-                    return SpanExportResult.FAILURE
-                
-                _logger.warning(
-                    "Transient error %s encountered, retrying in %.2fs",
-                    resp.reason,
-                    backoff_seconds,
-                )
-                
-                if self._shutdown_in_progress.wait(backoff_seconds):
-                    _logger.warning("Shutdown in progress, aborting retry")
-                    return SpanExportResult.FAILURE
-                    
+                resp = self._send_request(data, deadline_sec - time(), compression)
+            except _CONNECTION_ERRORS as e:
+                # Connection failures are retried with the same backoff as 5xx responses
+                error = e
             except Exception as e:
                 _logger.error("Failed to export spans: %s", str(e))
-                return SpanExportResult.FAILURE
+                return SpanExportResult.FAILURE, False
+
+            outcome, backoff_seconds = self._evaluate_attempt(resp, error, retry_num, deadline_sec)
+            if outcome is not None:
+                return outcome
+                
+            if self._shutdown_in_progress.wait(backoff_seconds):
+                _logger.warning("Shutdown in progress, aborting retry")
+                return SpanExportResult.FAILURE, True
         
+        return SpanExportResult.FAILURE, True
+
+    async def export_async(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        """
+        Export spans without blocking the event loop.
+
+        Behaves like `export()` (retries, partial success handling and spooling) but
+        sends requests through an `httpx.AsyncClient` and backs off with `asyncio.sleep`.
+        """
+        if self._shutdown:
+            _logger.warning("Exporter already shutdown, ignoring batch")
+            return SpanExportResult.FAILURE
+
+        payloads = self._encode_payloads(spans)
+        results = await asyncio.gather(*(self._export_or_spool_async(payload) for payload in payloads))
+        if all(result == SpanExportResult.SUCCESS for result in results):
+            return SpanExportResult.SUCCESS
         return SpanExportResult.FAILURE
 
+    async def _export_or_spool_async(self, serialized_data: bytes) -> SpanExportResult:
+        """Async counterpart of `_export_or_spool`."""
+        data, compression = self._compress_data(serialized_data)
+        deadline_sec = time() + self._timeout
+
+        result, transient = SpanExportResult.FAILURE, True
+        for retry_num in range(MAX_RETRIES):
+            resp: Optional[OTLPResponse] = None
+            error: Optional[Exception] = None
+            try:
+                resp = await self._send_request_async(data, deadline_sec - time(), compression)
+            except _CONNECTION_ERRORS as e:
+                error = e
+            except Exception as e:
+                _logger.error("Failed to export spans: %s", str(e))
+                result, transient = SpanExportResult.FAILURE, False
+                break
+
+            outcome, backoff_seconds = self._evaluate_attempt(resp, error, retry_num, deadline_sec)
+            if outcome is not None:
+                result, transient = outcome
+                break
+
+            await asyncio.sleep(backoff_seconds)
+            if self._shutdown_in_progress.is_set():
+                _logger.warning("Shutdown in progress, aborting retry")
+                break
+
+        if result == SpanExportResult.FAILURE and transient:
+            self._spool_payload(serialized_data)
+
+        return result
+
+    def _evaluate_attempt(
+        self,
+        resp: Optional[OTLPResponse],
+        error: Optional[Exception],
+        retry_num: int,
+        deadline_sec: float,
+    ) -> Tuple[Optional[Tuple[SpanExportResult, bool]], float]:
+        """
+        Decide what to do after one export attempt.
+
+        Returns:
+            Either a final (result, transient) outcome, or None together with the
+            number of seconds to back off before the next attempt.
+        """
+        if resp is not None:
+            if resp.ok:
+                # Check for partial success
+                if resp.content:
+                    self._check_partial_success(resp)
+                return (SpanExportResult.SUCCESS, False), 0.0
+
+            # Handle retries
+            if not self._is_retryable(resp):
+                self._handle_error(resp)
+                return (SpanExportResult.FAILURE, False), 0.0
+
+        if retry_num + 1 == MAX_RETRIES:
+            _logger.error(
+                "Max retries reached. Failed to export spans: %s",
+                resp.text if resp is not None else str(error),
+            )
+            return (SpanExportResult.FAILURE, True), 0.0
+
+        # Calculate backoff with jitter
+        backoff_seconds = 2**retry_num * random.uniform(0.8, 1.2)
+
+        if backoff_seconds > (deadline_sec - time()):
+            _logger.error("Export deadline exceeded, aborting retries")
+            return (SpanExportResult.FAILURE, True), 0.0
+
+        _logger.warning(
+            "Transient error %s encountered, retrying in %.2fs",
+            resp.reason if resp is not None else str(error),
+            backoff_seconds,
+        )
+        return None, backoff_seconds
+
+    def _replay_spooled(self, serialized_data: bytes) -> bool:
+        """
+        Send one spooled payload without retries.
+
+        Returns:
+            True if the payload was delivered or permanently rejected, False if the
+            endpoint is still unavailable.
+        """
+        if self._shutdown:
+            return False
+        try:
+            data, compression = self._compress_data(serialized_data)
+            resp = self._send_request(data, self._timeout, compression)
+        except _CONNECTION_ERRORS as e:
+            _logger.debug("Spooled span replay failed: %s", str(e))
+            return False
+        except Exception as e:
+            # Would fail the same way on every replay
+            _logger.error("Dropping spooled spans that cannot be exported: %s", str(e))
+            return True
+
+        if resp.ok:
+            if resp.content:
+                self._check_partial_success(resp)
+            return True
+        if self._is_retryable(resp):
+            return False
+
+        self._handle_error(resp)
+        return True
+
+    async def aclose(self) -> None:
+        """Close the async transport used by `export_async()`, if one was created."""
+        if self._async_transport is not None:
+            await self._async_transport.aclose()
+            self._async_transport = None
+
     @override
     def shutdown(self) -> None:
         """Shutdown the exporter."""
@@ -232,13 +571,34 @@ class GentraceVendoredOTLPSpanExporter(SpanExporter):
             _logger.warning("Exporter already shutdown, ignoring call")
             return
         self._shutdown = True
+        # Give in-flight requests a chance to finish, then abort their retries
+        self.force_flush(int(self._timeout * 1e3))
         self._shutdown_in_progress.set()
-        self._session.close()
+        if self._export_executor is not None:
+            self._export_executor.shutdown(wait=True)
+        if self._spool is not None:
+            self._spool.close()
+        if self._session is not None:
+            self._session.close()
+        self._transport.close()
 
     @override
     def force_flush(self, timeout_millis: int = 30000) -> bool:
-        """Nothing is buffered in this exporter."""
-        _ = timeout_millis  # Unused but part of the interface
+        """
+        Wait for export requests handed to the worker pool to complete.
+
+        Returns:
+            True if no requests are still in flight when the timeout expires.
+        """
+        with self._in_flight_lock:
+            in_flight = list(self._in_flight)
+        if not in_flight:
+            return True
+
+        _, not_done = futures_wait(in_flight, timeout=timeout_millis / 1e3)
+        if not_done:
+            _logger.warning("Timeout was exceeded in force_flush() with %d exports in flight", len(not_done))
+            return False
         return True
 
     # Private helper methods
@@ -265,34 +625,46 @@ class GentraceVendoredOTLPSpanExporter(SpanExporter):
             _logger.warning("Unknown compression type %s, using none", compression)
             return Compression.NoCompression
 
-    def _compress_data(self, data: bytes) -> bytes:
-        """Compress data based on compression setting."""
-        if self._compression == Compression.Gzip:
-            gzip_data = BytesIO()
-            with gzip.GzipFile(fileobj=gzip_data, mode="w") as gzip_stream:
-                gzip_stream.write(data)
-            return gzip_data.getvalue()
-        elif self._compression == Compression.Deflate:
-            return zlib.compress(data)
-        return data
-
-    def _send_request(self, data: bytes, timeout: float) -> requests.Response:
-        """Send the export request with retry on connection errors."""
-        try:
-            return self._session.post(
-                url=self._endpoint,  # type: ignore[arg-type]
-                data=data,
-                timeout=timeout,
-            )
-        except requests.exceptions.ConnectionError:
-            # Retry once on connection error
-            return self._session.post(
+    def _compress_data(self, data: bytes) -> Tuple[bytes, Compression]:
+        """Compress data based on compression setting, returning the payload and the codec used."""
+        if self._adaptive_compressor is not None:
+            return self._adaptive_compressor.compress(data)
+        return compress_payload(data, self._compression, self._compression_level), self._compression
+
+    def _headers_for(self, compression: Compression) -> Dict[str, str]:
+        """Request headers for a payload compressed with `compression`."""
+        headers = self._encoded_request_headers.get(compression)
+        if headers is None:
+            headers = {**self._request_headers, "Content-Encoding": compression.value}
+            self._encoded_request_headers[compression] = headers
+        return headers
+
+    def _send_request(
+        self, data: bytes, timeout: float, compression: Compression = Compression.NoCompression
+    ) -> OTLPResponse:
+        """Send the export request."""
+        headers = self._headers_for(compression)
+        if self._session is not None:
+            resp = self._session.post(
                 url=self._endpoint,  # type: ignore[arg-type]
                 data=data,
+                headers=headers,
                 timeout=timeout,
             )
+            return OTLPResponse.from_requests(resp)
+        return self._transport.post(self._endpoint, data, headers, timeout)  # type: ignore[arg-type]
 
-    def _is_retryable(self, resp: requests.Response) -> bool:
+    async def _send_request_async(
+        self, data: bytes, timeout: float, compression: Compression = Compression.NoCompression
+    ) -> OTLPResponse:
+        """Send the export request without blocking the event loop."""
+        if self._async_transport is None:
+            self._async_transport = AsyncHttpxOTLPTransport(self._async_http_client, http2=self._http2)
+        return await self._async_transport.post(
+            self._endpoint, data, self._headers_for(compression), timeout  # type: ignore[arg-type]
+        )
+
+    def _is_retryable(self, resp: OTLPResponse) -> bool:
         """Check if the response indicates a retryable error."""
         if resp.status_code == 408:  # Request Timeout
             return True
@@ -300,7 +672,7 @@ class GentraceVendoredOTLPSpanExporter(SpanExporter):
             return True
         return False
 
-    def _handle_error(self, resp: requests.Response) -> None:
+    def _handle_error(self, resp: OTLPResponse) -> None:
         """Handle non-retryable errors with appropriate logging."""
         if resp.status_code == 401:
             warning = GentraceWarnings.OtelAuthenticationError()
@@ -322,7 +694,7 @@ class GentraceVendoredOTLPSpanExporter(SpanExporter):
                 resp.text,
             )
 
-    def _check_partial_success(self, resp: requests.Response) -> None:
+    def _check_partial_success(self, resp: OTLPResponse) -> None:
         """Check response for partial success indicators."""
         try:
             content_type = resp.headers.get('content-type', '').lower()
@@ -366,110 +738,184 @@ class GentraceVendoredOTLPSpanExporter(SpanExporter):
 
     def _encode_spans(self, spans: Sequence[ReadableSpan]) -> ExportTraceServiceRequest:
         """Encode spans to OTLP protobuf format."""
-        # Group spans by resource and instrumentation scope
-        resource_spans_map = defaultdict(lambda: defaultdict(list))  # type: ignore[var-annotated]
-        
+        return self._encode_chunks(spans, None)[0]
+
+    def _encode_chunks(
+        self, spans: Sequence[ReadableSpan], max_bytes: Optional[int]
+    ) -> List[ExportTraceServiceRequest]:
+        """
+        Encode spans to OTLP protobuf requests estimated to stay under `max_bytes`.
+
+        Spans are grouped by resource and instrumentation scope. Grouping keys are the
+        canonical encodings cached per object, so equal resources/scopes held by
+        distinct objects (e.g. one tracer per decorated function) share a group.
+        Spans are encoded directly into their group to avoid copying messages.
+
+        The size of the current request is tracked from the `ByteSize()` of every span
+        plus the framing of the groups it opens, so a batch is split as it is encoded
+        rather than serialized to be measured. A span that does not fit is moved to a
+        new request; one larger than `max_bytes` on its own is placed in a request by
+        itself. With `max_bytes` None, a single request is returned.
+        """
+        chunks: List[ExportTraceServiceRequest] = []
+        request = ExportTraceServiceRequest()
+        request_bytes = 0
+        groups: Dict[bytes, Tuple[ResourceSpans, Dict[bytes, ScopeSpans]]] = {}
+
         for span in spans:
-            resource = span.resource
-            scope = span.instrumentation_scope or None
-            pb_span = self._encode_span(span)
-            resource_spans_map[resource][scope].append(pb_span)  # type: ignore[index]
-        
-        # Build the protobuf message
-        resource_spans_list = []
-        for resource, scope_map in resource_spans_map.items():  # type: ignore[assignment]
-            scope_spans_list = []
-            for scope, pb_spans in scope_map.items():  # type: ignore[assignment]
-                scope_spans = ScopeSpans(
-                    scope=self._encode_instrumentation_scope(scope) if scope else None,
-                    spans=pb_spans,  # type: ignore[arg-type]
-                    schema_url=scope.schema_url if scope else None,  # type: ignore[arg-type, union-attr]
+            resource = self._encoded_resource(span.resource)
+            scope = self._encoded_scope(span.instrumentation_scope)
+            scope_spans, group_bytes = self._group_for(request, groups, resource, scope)
+            pb_span = scope_spans.spans.add()
+            self._fill_span(pb_span, span)
+            if max_bytes is None:
+                continue
+
+            needed = group_bytes + pb_span.ByteSize() + _FIELD_OVERHEAD_BYTES
+            if request_bytes and request_bytes + needed > max_bytes:
+                # Move the span, and any groups opened for it, to a new request
+                moved = PB2Span()
+                moved.CopyFrom(pb_span)
+                del scope_spans.spans[-1]
+                if not scope_spans.spans:
+                    # Groups opened for the span are the last ones of their parent
+                    resource_spans = groups[resource[0]][0]
+                    del resource_spans.scope_spans[-1]
+                    if not resource_spans.scope_spans:
+                        del request.resource_spans[-1]
+                chunks.append(request)
+
+                request = ExportTraceServiceRequest()
+                request_bytes = 0
+                groups = {}
+                scope_spans, group_bytes = self._group_for(request, groups, resource, scope)
+                scope_spans.spans.add().CopyFrom(moved)
+                needed = group_bytes + moved.ByteSize() + _FIELD_OVERHEAD_BYTES
+
+            if needed > max_bytes:
+                _logger.warning(
+                    "Span %s is about %d bytes, larger than the %d byte request limit", span.name, needed, max_bytes
                 )
-                scope_spans_list.append(scope_spans)  # type: ignore[arg-type]
-            
-            resource_spans = ResourceSpans(
-                resource=self._encode_resource(resource),
-                scope_spans=scope_spans_list,  # type: ignore[arg-type]
-                schema_url=resource.schema_url if hasattr(resource, 'schema_url') else None,  # type: ignore[arg-type, union-attr]
-            )
-            resource_spans_list.append(resource_spans)  # type: ignore[arg-type]
-        
-        return ExportTraceServiceRequest(resource_spans=resource_spans_list)  # type: ignore[arg-type]
-
-    def _encode_span(self, span: ReadableSpan) -> PB2Span:
-        """Encode a single span to protobuf format."""
-        # Map span kind
-        span_kind_map = {
-            SpanKind.INTERNAL: PB2Span.SpanKind.SPAN_KIND_INTERNAL,
-            SpanKind.SERVER: PB2Span.SpanKind.SPAN_KIND_SERVER,
-            SpanKind.CLIENT: PB2Span.SpanKind.SPAN_KIND_CLIENT,
-            SpanKind.PRODUCER: PB2Span.SpanKind.SPAN_KIND_PRODUCER,
-            SpanKind.CONSUMER: PB2Span.SpanKind.SPAN_KIND_CONSUMER,
-        }
-        
-        pb_span = PB2Span(
-            trace_id=span.context.trace_id.to_bytes(16, "big"),  # type: ignore[union-attr]
-            span_id=span.context.span_id.to_bytes(8, "big"),  # type: ignore[union-attr]
-            name=span.name,
-            kind=span_kind_map.get(span.kind, PB2Span.SpanKind.SPAN_KIND_UNSPECIFIED),
-            start_time_unix_nano=span.start_time,  # type: ignore[arg-type]
-            end_time_unix_nano=span.end_time,  # type: ignore[arg-type]
-            attributes=self._encode_attributes(span.attributes),  # type: ignore[arg-type]
-        )
+            request_bytes += needed
+
+        chunks.append(request)
+        return chunks
+
+    def _group_for(
+        self,
+        request: ExportTraceServiceRequest,
+        groups: Dict[bytes, Tuple[ResourceSpans, Dict[bytes, ScopeSpans]]],
+        resource: Tuple[bytes, PB2Resource, str],
+        scope: Tuple[bytes, Optional[InstrumentationScope], str],
+    ) -> Tuple[ScopeSpans, int]:
+        """
+        Return the scope group of `request` for a span's resource and scope, opening it
+        if needed, along with the estimated bytes added by the groups opened.
+        """
+        resource_key, pb_resource, resource_schema_url = resource
+        scope_key, pb_scope, scope_schema_url = scope
+        # The grouping keys hold the serialized message and schema URL, so their length
+        # bounds the encoded size of a group without measuring it
+        opened_bytes = 0
+
+        resource_group = groups.get(resource_key)
+        if resource_group is None:
+            resource_spans = request.resource_spans.add(schema_url=resource_schema_url)
+            resource_spans.resource.CopyFrom(pb_resource)
+            resource_group = groups[resource_key] = (resource_spans, {})
+            opened_bytes += len(resource_key) + 2 * _FIELD_OVERHEAD_BYTES
+
+        scope_spans = resource_group[1].get(scope_key)
+        if scope_spans is None:
+            scope_spans = resource_group[0].scope_spans.add(schema_url=scope_schema_url)
+            if pb_scope is not None:
+                scope_spans.scope.CopyFrom(pb_scope)
+            resource_group[1][scope_key] = scope_spans
+            opened_bytes += len(scope_key) + 2 * _FIELD_OVERHEAD_BYTES
+
+        return scope_spans, opened_bytes
+
+    def _fill_span(self, pb_span: PB2Span, span: ReadableSpan) -> None:
+        """Encode a span into an existing (empty) protobuf span message."""
+        pb_span.trace_id = span.context.trace_id.to_bytes(16, "big")  # type: ignore[union-attr]
+        pb_span.span_id = span.context.span_id.to_bytes(8, "big")  # type: ignore[union-attr]
+        pb_span.name = span.name
+        pb_span.kind = _SPAN_KIND_MAP.get(span.kind, PB2Span.SpanKind.SPAN_KIND_UNSPECIFIED)
+        pb_span.start_time_unix_nano = span.start_time  # type: ignore[assignment]
+        pb_span.end_time_unix_nano = span.end_time  # type: ignore[assignment]
+        _add_key_values(pb_span.attributes, span.attributes)
         
         # Set parent span ID if present
         if span.parent and span.parent.span_id:
             pb_span.parent_span_id = span.parent.span_id.to_bytes(8, "big")
         
         # Set status if present
-        if span.status:
-            pb_span.status.CopyFrom(self._encode_status(span.status))
+        status = span.status
+        if status:
+            pb_span.status.code = _STATUS_CODE_MAP.get(status.status_code, PB2Status.StatusCode.STATUS_CODE_UNSET)
+            if status.description:
+                pb_span.status.message = status.description
         
         # Add events
         if span.events:
+            add_event = pb_span.events.add
             for event in span.events:
-                pb_event = PB2Span.Event(
-                    time_unix_nano=event.timestamp,
-                    name=event.name,
-                    attributes=self._encode_attributes(event.attributes),  # type: ignore[arg-type]
-                )
-                pb_span.events.append(pb_event)
+                pb_event = add_event(time_unix_nano=event.timestamp, name=event.name)
+                # Inputs/outputs captured with deferred serialization are encoded here, when the span is exported
+                _add_key_values(pb_event.attributes, resolve_event_attributes(event))
         
         # Add links
         if span.links:
+            add_link = pb_span.links.add
             for link in span.links:
-                pb_link = PB2Span.Link(
+                pb_link = add_link(
                     trace_id=link.context.trace_id.to_bytes(16, "big"),
                     span_id=link.context.span_id.to_bytes(8, "big"),
-                    attributes=self._encode_attributes(link.attributes),  # type: ignore[arg-type]
                 )
-                pb_span.links.append(pb_link)
-        
-        return pb_span
+                _add_key_values(pb_link.attributes, link.attributes)
 
-    def _encode_status(self, status: Status) -> PB2Status:
-        """Encode span status to protobuf format."""
-        
-        status_code_map = {
-            StatusCode.UNSET: PB2Status.StatusCode.STATUS_CODE_UNSET,
-            StatusCode.OK: PB2Status.StatusCode.STATUS_CODE_OK,
-            StatusCode.ERROR: PB2Status.StatusCode.STATUS_CODE_ERROR,
-        }
-        
-        pb_status = PB2Status(
-            code=status_code_map.get(status.status_code, PB2Status.StatusCode.STATUS_CODE_UNSET)
-        )
-        if status.description:
-            pb_status.message = status.description
-        return pb_status
+    def _encoded_resource(self, resource: Any) -> Tuple[bytes, PB2Resource, str]:
+        """
+        Return the grouping key, encoding and schema URL of a resource.
+
+        Resources are immutable and usually shared by every span of a TracerProvider,
+        so encodings are cached by object identity. The cached entry keeps a reference
+        to the resource so its id() cannot be reused while the entry exists.
+        """
+        cached = self._resource_cache.get(id(resource))
+        if cached is not None and cached[0] is resource:
+            return cached[1]
+
+        pb_resource = self._encode_resource(resource)
+        schema_url = getattr(resource, "schema_url", None) or ""
+        key = pb_resource.SerializeToString(deterministic=True) + b"|" + schema_url.encode()
+        encoded = (key, pb_resource, schema_url)
+        _cache_put(self._resource_cache, id(resource), (resource, encoded))
+        return encoded
+
+    def _encoded_scope(self, scope: Any) -> Tuple[bytes, Optional[InstrumentationScope], str]:
+        """Return the grouping key, encoding and schema URL of an instrumentation scope (cached like resources)."""
+        if not scope:
+            return b"", None, ""
+
+        cached = self._scope_cache.get(id(scope))
+        if cached is not None and cached[0] is scope:
+            return cached[1]
+
+        pb_scope = self._encode_instrumentation_scope(scope)
+        schema_url = getattr(scope, "schema_url", None) or ""
+        key = pb_scope.SerializeToString(deterministic=True) + b"|" + schema_url.encode()
+        encoded = (key, pb_scope, schema_url)
+        _cache_put(self._scope_cache, id(scope), (scope, encoded))
+        return encoded
 
     def _encode_resource(self, resource: Any) -> PB2Resource:
         """Encode resource to protobuf format."""
         if not resource:
             return PB2Resource()
-        return PB2Resource(
-            attributes=self._encode_attributes(resource.attributes)
-        )
+        pb_resource = PB2Resource()
+        _add_key_values(pb_resource.attributes, resource.attributes)
+        return pb_resource
 
     def _encode_instrumentation_scope(self, scope: Any) -> InstrumentationScope:
         """Encode instrumentation scope to protobuf format."""
@@ -480,45 +926,119 @@ class GentraceVendoredOTLPSpanExporter(SpanExporter):
         if scope.version:
             pb_scope.version = scope.version
         if hasattr(scope, 'attributes') and scope.attributes:
-            pb_scope.attributes.extend(self._encode_attributes(scope.attributes))
+            _add_key_values(pb_scope.attributes, scope.attributes)
         return pb_scope
 
-    def _encode_attributes(self, attributes: Optional[Dict[str, Any]]) -> List[KeyValue]:
-        """Encode attributes to protobuf format."""
-        if not attributes:
-            return []
-        
-        pb_attributes = []
-        for key, value in attributes.items():
-            pb_attributes.append(KeyValue(  # type: ignore[attr-defined]
-                key=key,
-                value=self._encode_value(value)
-            ))  # type: ignore[arg-type]
-        return pb_attributes  # type: ignore[return-value]
-
-    def _encode_value(self, value: Any) -> AnyValue:
-        """Encode a single value to protobuf format."""
-        any_value = AnyValue()
-        
-        if value is None:
-            pass  # Leave as default (unset)
-        elif isinstance(value, bool):
-            any_value.bool_value = value
-        elif isinstance(value, int):
-            any_value.int_value = value
-        elif isinstance(value, float):
-            any_value.double_value = value
-        elif isinstance(value, str):
-            any_value.string_value = value
-        elif isinstance(value, bytes):
-            any_value.bytes_value = value
-        elif isinstance(value, (list, tuple)):
-            array_value = ArrayValue()
-            for item in value:  # type: ignore[misc]
-                array_value.values.append(self._encode_value(item))
-            any_value.array_value.CopyFrom(array_value)
-        else:
-            # Fallback to string representation
-            any_value.string_value = str(value)
-        
-        return any_value
\ No newline at end of file
+
+# Encoding helpers. These are module-level so the lookup tables are built once
+# instead of on every span, and attribute values are encoded through a dispatch
+# table keyed by their exact type.
+
+_SPAN_KIND_MAP = {
+    SpanKind.INTERNAL: PB2Span.SpanKind.SPAN_KIND_INTERNAL,
+    SpanKind.SERVER: PB2Span.SpanKind.SPAN_KIND_SERVER,
+    SpanKind.CLIENT: PB2Span.SpanKind.SPAN_KIND_CLIENT,
+    SpanKind.PRODUCER: PB2Span.SpanKind.SPAN_KIND_PRODUCER,
+    SpanKind.CONSUMER: PB2Span.SpanKind.SPAN_KIND_CONSUMER,
+}
+
+_STATUS_CODE_MAP = {
+    StatusCode.UNSET: PB2Status.StatusCode.STATUS_CODE_UNSET,
+    StatusCode.OK: PB2Status.StatusCode.STATUS_CODE_OK,
+    StatusCode.ERROR: PB2Status.StatusCode.STATUS_CODE_ERROR,
+}
+
+# Upper bound on cached resource/scope encodings per exporter
+_ENCODING_CACHE_MAX_ENTRIES = 256
+
+
+def _cache_put(cache: Dict[int, Any], key: int, value: Any) -> None:
+    if len(cache) >= _ENCODING_CACHE_MAX_ENTRIES:
+        cache.clear()
+    cache[key] = value
+
+
+def _add_key_values(container: Any, attributes: Any) -> None:
+    """Append attributes to a repeated KeyValue field, encoding each value in place."""
+    if not attributes:
+        return
+    add = container.add
+    for key, value in attributes.items():
+        _set_any_value(add(key=key).value, value)
+
+
+# Filling fields of an existing message avoids the copy protobuf makes when a
+# freshly constructed sub-message is passed to a constructor, which is the
+# dominant cost of encoding attribute-heavy spans.
+
+
+def _set_any_value(target: AnyValue, value: Any) -> None:
+    setter = _VALUE_SETTERS.get(type(value))
+    if setter is not None:
+        setter(target, value)
+    else:
+        _set_other_value(target, value)
+
+
+def _set_bool(target: AnyValue, value: bool) -> None:
+    target.bool_value = value
+
+
+def _set_int(target: AnyValue, value: int) -> None:
+    target.int_value = value
+
+
+def _set_float(target: AnyValue, value: float) -> None:
+    target.double_value = value
+
+
+def _set_str(target: AnyValue, value: str) -> None:
+    target.string_value = value
+
+
+def _set_bytes(target: AnyValue, value: bytes) -> None:
+    target.bytes_value = value
+
+
+def _set_sequence(target: AnyValue, value: Sequence[Any]) -> None:
+    array_value = target.array_value
+    array_value.SetInParent()
+    add = array_value.values.add
+    for item in value:
+        _set_any_value(add(), item)
+
+
+def _set_none(target: AnyValue, value: None) -> None:
+    # Leave as default (unset)
+    pass
+
+
+def _set_other_value(target: AnyValue, value: Any) -> None:
+    """Slow path for subclasses of the supported types and for unsupported types."""
+    if isinstance(value, bool):
+        _set_bool(target, value)
+    elif isinstance(value, int):
+        _set_int(target, value)
+    elif isinstance(value, float):
+        _set_float(target, value)
+    elif isinstance(value, str):
+        _set_str(target, value)
+    elif isinstance(value, bytes):
+        _set_bytes(target, value)
+    elif isinstance(value, (list, tuple)):
+        _set_sequence(target, value)  # type: ignore[arg-type]
+    else:
+        # Fallback to string representation
+        _set_str(target, str(value))
+
+
+_VALUE_SETTERS: Dict[type, Callable[[AnyValue, Any], None]] = {
+    bool: _set_bool,
+    int: _set_int,
+    float: _set_float,
+    str: _set_str,
+    bytes: _set_bytes,
+    list: _set_sequence,
+    tuple: _set_sequence,
+    type(None): _set_none,
+}
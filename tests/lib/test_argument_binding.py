@@ -0,0 +1,63 @@
+import inspect
+from typing import Any, Dict, Tuple, Callable
+from unittest.mock import patch
+
+import pytest
+
+from gentrace.lib.argument_binding import ArgumentBinder
+
+
+def no_params() -> None: ...
+
+
+def with_default(a: Any, b: Any = 1) -> None: ...
+
+
+def positional_only(a: Any, /, b: Any, *, c: Any, d: Any = 4) -> None: ...
+
+
+def variadic(a: Any, b: Any = 2, *args: Any, c: Any = 3, **kw: Any) -> None: ...
+
+
+def positional_only_with_kwargs(a: Any, /, **kw: Any) -> None: ...
+
+
+CALLS: "list[tuple[Callable[..., Any], Tuple[Any, ...], Dict[str, Any]]]" = [
+    (no_params, (), {}),
+    (with_default, (1,), {}),
+    (with_default, (), {"b": 2, "a": 1}),
+    (positional_only, (1, 2), {"c": 3}),
+    (positional_only, (1,), {"d": 5, "c": 3, "b": 2}),
+    (variadic, (1, 2, 3, 4), {"x": 5, "c": 6}),
+    (variadic, (1,), {"kw": 1}),
+    (positional_only_with_kwargs, (1,), {"a": 2}),
+]
+
+
+@pytest.mark.parametrize("fn, args, kwargs", CALLS)
+def test_bind_matches_signature_bind(fn: Callable[..., Any], args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> None:
+    expected = list(inspect.signature(fn).bind(*args, **kwargs).arguments.items())
+    assert ArgumentBinder(fn).bind(args, kwargs) == expected
+
+
+@pytest.mark.parametrize(
+    "fn, args, kwargs",
+    [
+        (no_params, (1,), {}),
+        (with_default, (), {}),
+        (with_default, (1,), {"a": 1}),
+        (positional_only, (1, 2), {}),
+        (positional_only, (), {"a": 1, "b": 2, "c": 3}),
+        (with_default, (1,), {"unknown": 1}),
+    ],
+)
+def test_invalid_calls_raise_type_error(fn: Callable[..., Any], args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> None:
+    with pytest.raises(TypeError):
+        ArgumentBinder(fn).bind(args, kwargs)
+
+
+def test_functions_without_signature_record_raw_arguments() -> None:
+    with patch("gentrace.lib.argument_binding.inspect.signature", side_effect=ValueError("no signature")):
+        binder = ArgumentBinder(dict.fromkeys)
+
+    assert binder.bind((1,), {"x": 2}) == [("args", (1,)), ("kwargs", {"x": 2})]
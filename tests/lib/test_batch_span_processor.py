@@ -0,0 +1,212 @@
+import gc
+import time
+import weakref
+import threading
+from typing import List, Sequence
+from unittest.mock import Mock, patch
+from typing_extensions import override
+
+import pytest
+from opentelemetry.sdk.trace import ReadableSpan, TracerProvider
+from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
+
+from gentrace.lib.batch_span_processor import GentraceBatchSpanProcessor
+from gentrace.lib.vendored_otlp_exporter import GentraceVendoredOTLPSpanExporter
+
+
+class RecordingExporter(SpanExporter):
+    """Exporter that records every batch it receives."""
+
+    def __init__(self, result: SpanExportResult = SpanExportResult.SUCCESS, delay: float = 0.0) -> None:
+        self.batches: List[List[str]] = []
+        self.result = result
+        self.delay = delay
+        self.is_shutdown = False
+        self.export_threads: List[str] = []
+
+    @override
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        if self.delay:
+            time.sleep(self.delay)
+        self.export_threads.append(threading.current_thread().name)
+        self.batches.append([span.name for span in spans])
+        return self.result
+
+    @override
+    def shutdown(self) -> None:
+        self.is_shutdown = True
+
+
+def _make_provider(processor: GentraceBatchSpanProcessor) -> TracerProvider:
+    provider = TracerProvider()
+    provider.add_span_processor(processor)
+    return provider
+
+
+def _emit(provider: TracerProvider, count: int, prefix: str = "span") -> None:
+    tracer = provider.get_tracer("test")
+    for i in range(count):
+        with tracer.start_as_current_span(f"{prefix}-{i}"):
+            pass
+
+
+def test_spans_are_exported_off_the_calling_thread() -> None:
+    exporter = RecordingExporter()
+    processor = GentraceBatchSpanProcessor(exporter, schedule_delay_millis=60_000)
+    provider = _make_provider(processor)
+
+    _emit(provider, 3)
+    assert exporter.batches == []
+
+    assert processor.force_flush(5_000)
+    assert exporter.batches == [["span-0", "span-1", "span-2"]]
+    assert exporter.export_threads == ["GentraceBatchSpanProcessor"]
+    assert processor.exported_spans == 3
+    assert processor.dropped_spans == 0
+
+    provider.shutdown()
+    assert exporter.is_shutdown
+
+
+def test_full_batch_triggers_export_before_schedule_delay() -> None:
+    exporter = RecordingExporter()
+    processor = GentraceBatchSpanProcessor(exporter, max_export_batch_size=2, schedule_delay_millis=60_000)
+    provider = _make_provider(processor)
+
+    _emit(provider, 4)
+
+    deadline = time.monotonic() + 5
+    while processor.exported_spans < 4 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert exporter.batches == [["span-0", "span-1"], ["span-2", "span-3"]]
+    provider.shutdown()
+
+
+def test_schedule_delay_triggers_export_of_partial_batch() -> None:
+    exporter = RecordingExporter()
+    processor = GentraceBatchSpanProcessor(exporter, schedule_delay_millis=20)
+    provider = _make_provider(processor)
+
+    _emit(provider, 1)
+
+    deadline = time.monotonic() + 5
+    while not exporter.batches and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert exporter.batches == [["span-0"]]
+    provider.shutdown()
+
+
+def test_drop_oldest_policy_discards_oldest_spans() -> None:
+    exporter = RecordingExporter(delay=0.2)
+    processor = GentraceBatchSpanProcessor(
+        exporter,
+        max_queue_size=2,
+        max_export_batch_size=2,
+        schedule_delay_millis=60_000,
+        queue_full_policy="drop_oldest",
+    )
+    # Keep the worker busy so the queue fills up behind it
+    provider = _make_provider(processor)
+    _emit(provider, 2, prefix="first")
+    time.sleep(0.05)
+
+    _emit(provider, 4, prefix="second")
+    assert processor.dropped_spans == 2
+
+    assert processor.force_flush(5_000)
+    assert exporter.batches[-1] == ["second-2", "second-3"]
+    provider.shutdown()
+
+
+def test_block_policy_waits_for_room_instead_of_dropping() -> None:
+    exporter = RecordingExporter(delay=0.05)
+    processor = GentraceBatchSpanProcessor(
+        exporter,
+        max_queue_size=2,
+        max_export_batch_size=2,
+        schedule_delay_millis=60_000,
+        queue_full_policy="block",
+    )
+    provider = _make_provider(processor)
+
+    _emit(provider, 10)
+    assert processor.force_flush(5_000)
+
+    assert processor.dropped_spans == 0
+    assert processor.exported_spans == 10
+    assert [name for batch in exporter.batches for name in batch] == [f"span-{i}" for i in range(10)]
+    provider.shutdown()
+
+
+def test_failed_exports_are_counted() -> None:
+    exporter = RecordingExporter(result=SpanExportResult.FAILURE)
+    processor = GentraceBatchSpanProcessor(exporter, schedule_delay_millis=60_000)
+    provider = _make_provider(processor)
+
+    _emit(provider, 2)
+    assert processor.force_flush(5_000)
+
+    assert processor.exported_spans == 0
+    assert processor.failed_spans == 2
+    provider.shutdown()
+
+
+def test_failed_concurrent_exports_are_counted_when_they_finish() -> None:
+    exporter = GentraceVendoredOTLPSpanExporter(
+        endpoint="http://localhost:4318/v1/traces", max_concurrent_exports=2, timeout=5
+    )
+    rejected = Mock(ok=False, status_code=400, reason="Bad Request", text="invalid", content=b"")
+    processor = GentraceBatchSpanProcessor(exporter, max_export_batch_size=2, schedule_delay_millis=60_000)
+    provider = _make_provider(processor)
+
+    with patch.object(exporter, "_send_request", return_value=rejected):
+        _emit(provider, 5)
+        assert processor.force_flush(5_000)
+
+    assert processor.exported_spans == 0
+    assert processor.failed_spans == 5
+    provider.shutdown()
+
+
+def test_shutdown_drains_queue_and_drops_later_spans() -> None:
+    exporter = RecordingExporter()
+    processor = GentraceBatchSpanProcessor(exporter, schedule_delay_millis=60_000)
+    provider = _make_provider(processor)
+
+    _emit(provider, 3)
+    processor.shutdown()
+
+    assert processor.exported_spans == 3
+    assert exporter.is_shutdown
+
+    _emit(provider, 1)
+    assert processor.dropped_spans == 1
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"max_queue_size": 0},
+        {"max_export_batch_size": 0},
+        {"max_queue_size": 1, "max_export_batch_size": 2},
+        {"schedule_delay_millis": 0},
+        {"queue_full_policy": "unknown"},
+    ],
+)
+def test_invalid_configuration_is_rejected(kwargs: dict) -> None:  # type: ignore[type-arg]
+    with pytest.raises(ValueError):
+        GentraceBatchSpanProcessor(RecordingExporter(), **kwargs)
+
+
+def test_shut_down_processor_can_be_garbage_collected() -> None:
+    processor = GentraceBatchSpanProcessor(RecordingExporter(), schedule_delay_millis=10)
+    processor.shutdown()
+    reference = weakref.ref(processor)
+
+    del processor
+    gc.collect()
+
+    # The fork handler must not keep the processor alive
+    assert reference() is None
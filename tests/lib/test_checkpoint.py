@@ -0,0 +1,241 @@
+# pyright: reportUnknownVariableType=false, reportUnknownArgumentType=false, reportArgumentType=false, reportCallIssue=false
+"""Tests for resumable and incremental eval_dataset runs."""
+
+import json
+from typing import Any, Dict, List, Mapping, Iterator, Sequence
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+from typing_extensions import override
+
+import pytest
+from opentelemetry.sdk.trace import ReadableSpan, TracerProvider
+from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult, SimpleSpanProcessor
+
+import gentrace.lib.experiment as exp_mod
+from gentrace import TestInput as GentraceTestInput, init, experiment, eval_dataset
+from gentrace.types import TestCase as GentraceTestCase
+from gentrace.lib.constants import ATTR_GENTRACE_FN_OUTPUT_EVENT_NAME, ATTR_GENTRACE_REUSED_FROM_EXPERIMENT_ID
+from gentrace.lib.checkpoint import CheckpointStore, checkpoint_case_key, fingerprint_test_case
+from gentrace.types.experiment import Experiment
+
+PIPELINE_ID = "76ecc73d-3419-431f-aafc-93a9d1af1b83"
+
+
+def _experiment(experiment_id: str) -> Experiment:
+    return Experiment(
+        id=experiment_id,
+        createdAt="2023-01-01T00:00:00Z",
+        metadata=None,
+        name=None,
+        pipelineId=PIPELINE_ID,
+        resourcePath=f"/experiments/{experiment_id}",
+        updatedAt="2023-01-01T00:00:00Z",
+    )
+
+
+class CollectingExporter(SpanExporter):
+    def __init__(self) -> None:
+        self.spans: List[ReadableSpan] = []
+
+    @override
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        self.spans.extend(spans)
+        return SpanExportResult.SUCCESS
+
+
+@pytest.fixture
+def collector() -> Iterator[CollectingExporter]:
+    exporter = CollectingExporter()
+    tracer_provider = TracerProvider()
+    tracer_provider.add_span_processor(SimpleSpanProcessor(exporter))
+    with patch("gentrace.lib.eval_dataset._tracer", tracer_provider.get_tracer("gentrace")):
+        yield exporter
+
+
+@pytest.fixture
+def experiment_api(monkeypatch: Any) -> Dict[str, List[str]]:
+    """Stubs the experiment API, recording which experiments were started and retrieved."""
+    calls: Dict[str, List[str]] = {"started": [], "retrieved": []}
+
+    async def fake_start_experiment_api(*_: Any, **__: Any) -> Experiment:
+        experiment_id = f"experiment-{len(calls['started']) + 1}"
+        calls["started"].append(experiment_id)
+        return _experiment(experiment_id)
+
+    async def fake_retrieve_experiment_api(*, id: str) -> Experiment:
+        calls["retrieved"].append(id)
+        return _experiment(id)
+
+    async def fake_finish_experiment_api(*_: Any, **__: Any) -> None:
+        return None
+
+    mock_client = MagicMock()
+    mock_client.base_url = "https://gentrace.ai/api"
+
+    monkeypatch.setattr(exp_mod, "start_experiment_api", fake_start_experiment_api)
+    monkeypatch.setattr(exp_mod, "retrieve_experiment_api", fake_retrieve_experiment_api)
+    monkeypatch.setattr(exp_mod, "finish_experiment_api", fake_finish_experiment_api)
+    monkeypatch.setattr(exp_mod, "_get_async_client_instance", lambda: mock_client)
+    init(api_key="test-key", base_url="https://gentrace.ai/api", otel_setup=False)
+    return calls
+
+
+def test_store_records_results_per_experiment_and_scope(tmp_path: Path) -> None:
+    store = CheckpointStore(str(tmp_path / "checkpoints.db"))
+    assert store.record("exp-1", "module.fn", "case-1", {"answer": 42})
+    assert store.record("exp-1", "module.other_fn", "case-2", "other")
+    assert not store.record("exp-1", "module.fn", "case-3", lambda: None)
+    store.close()
+
+    reopened = CheckpointStore(str(tmp_path / "checkpoints.db"))
+    completed = reopened.load("exp-1", "module.fn")
+    assert list(completed) == ["case-1"]
+    assert reopened.load("exp-2", "module.fn") == {}
+    reopened.close()
+
+
+def test_case_key_uses_id_or_hash_of_name_and_inputs() -> None:
+    assert checkpoint_case_key("case-id", "name", {"a": 1}) == "case-id"
+    assert checkpoint_case_key(None, "name", {"a": 1, "b": 2}) == checkpoint_case_key(None, "name", {"b": 2, "a": 1})
+    assert checkpoint_case_key(None, "name", {"a": 1}) != checkpoint_case_key(None, "name", {"a": 2})
+    assert checkpoint_case_key(None, "name", {"a": 1}) != checkpoint_case_key(None, "other", {"a": 1})
+
+
+@pytest.mark.asyncio
+async def test_resumed_run_skips_completed_cases(tmp_path: Path, experiment_api: Dict[str, List[str]]) -> None:
+    checkpoint_path = str(tmp_path / "checkpoints.db")
+    data: List[GentraceTestInput[Mapping[str, Any]]] = [
+        GentraceTestInput(inputs={"value": i}, id=f"case-{i}") if i % 2 else GentraceTestInput(inputs={"value": i})
+        for i in range(6)
+    ]
+    calls: List[int] = []
+    failing = {2, 5}
+
+    async def square(test_case: GentraceTestCase) -> int:
+        value = int(test_case.inputs["value"])
+        calls.append(value)
+        if value in failing:
+            raise RuntimeError("LLM call failed")
+        return value * value
+
+    results: List[Any] = []
+
+    @experiment(pipeline_id=PIPELINE_ID, options={"checkpoint_path": checkpoint_path})
+    async def first_run() -> None:
+        results.extend(await eval_dataset(data=data, interaction=square, max_concurrency=2))
+
+    await first_run()
+    assert results == [0, 1, None, 9, 16, None]
+    assert experiment_api["started"] == ["experiment-1"]
+
+    calls.clear()
+    failing.clear()
+    results.clear()
+
+    @experiment(
+        pipeline_id=PIPELINE_ID,
+        options={"checkpoint_path": checkpoint_path, "resume_experiment_id": "experiment-1"},
+    )
+    async def resumed_run() -> None:
+        results.extend(await eval_dataset(data=data, interaction=square))
+
+    resumed = await resumed_run()
+    assert resumed.id == "experiment-1"
+    assert experiment_api == {"started": ["experiment-1"], "retrieved": ["experiment-1"]}
+    # Only the failed cases run again
+    assert sorted(calls) == [2, 5]
+    assert results == [0, 1, 4, 9, 16, 25]
+
+
+@pytest.mark.asyncio
+async def test_checkpoints_are_per_experiment(tmp_path: Path, experiment_api: Dict[str, List[str]]) -> None:
+    checkpoint_path = str(tmp_path / "checkpoints.db")
+    calls: List[int] = []
+
+    def double(test_case: GentraceTestCase) -> int:
+        calls.append(int(test_case.inputs["value"]))
+        return int(test_case.inputs["value"]) * 2
+
+    @experiment(pipeline_id=PIPELINE_ID, options={"checkpoint_path": checkpoint_path})
+    async def run() -> None:
+        await eval_dataset(data=[GentraceTestInput(inputs={"value": i}) for i in range(3)], interaction=double)
+
+    await run()
+    await run()
+
+    # A new experiment does not reuse the results of another one
+    assert experiment_api["started"] == ["experiment-1", "experiment-2"]
+    assert sorted(calls) == [0, 0, 1, 1, 2, 2]
+
+
+def test_fingerprint_covers_inputs_expected_outputs_and_version() -> None:
+    base = fingerprint_test_case({"q": "a"}, {"answer": "b"}, "v1")
+    assert base == fingerprint_test_case({"q": "a"}, {"answer": "b"}, "v1")
+    assert base != fingerprint_test_case({"q": "changed"}, {"answer": "b"}, "v1")
+    assert base != fingerprint_test_case({"q": "a"}, {"answer": "changed"}, "v1")
+    assert base != fingerprint_test_case({"q": "a"}, {"answer": "b"}, "v2")
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("experiment_api")
+async def test_incremental_run_reuses_unchanged_cases(tmp_path: Path, collector: CollectingExporter) -> None:
+    checkpoint_path = str(tmp_path / "checkpoints.db")
+    calls: List[str] = []
+
+    async def shout(test_case: GentraceTestCase) -> str:
+        calls.append(str(test_case.inputs["text"]))
+        return str(test_case.inputs["text"]).upper()
+
+    def run_with(texts: List[str], version: str) -> Any:
+        @experiment(pipeline_id=PIPELINE_ID, options={"checkpoint_path": checkpoint_path})
+        async def run() -> None:
+            results.extend(
+                await eval_dataset(
+                    data=[GentraceTestInput(inputs={"text": text}) for text in texts],
+                    interaction=shout,
+                    incremental=True,
+                    interaction_version=version,
+                )
+            )
+
+        return run()
+
+    results: List[Any] = []
+    await run_with(["a", "b", "c"], "v1")
+    assert calls == ["a", "b", "c"]
+
+    calls.clear()
+    results.clear()
+    collector.spans.clear()
+    await run_with(["a", "b", "changed"], "v1")
+
+    # Only the changed case runs; the others are reused from the first experiment
+    assert calls == ["changed"]
+    assert results == ["A", "B", "CHANGED"]
+    reused = {
+        span.name: span.attributes.get(ATTR_GENTRACE_REUSED_FROM_EXPERIMENT_ID)  # type: ignore[union-attr]
+        for span in collector.spans
+    }
+    assert reused == {"Test Case 1": "experiment-1", "Test Case 2": "experiment-1", "Test Case 3": None}
+    (reused_span,) = [span for span in collector.spans if span.name == "Test Case 1"]
+    (output_event,) = [event for event in reused_span.events if event.name == ATTR_GENTRACE_FN_OUTPUT_EVENT_NAME]
+    assert json.loads(str(output_event.attributes["output"])) == "A"  # type: ignore[index]
+
+    # A new interaction version invalidates every stored result
+    calls.clear()
+    await run_with(["a", "b", "changed"], "v2")
+    assert sorted(calls) == ["a", "b", "changed"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("experiment_api")
+async def test_incremental_requires_checkpoint_path() -> None:
+    async def identity(test_case: GentraceTestCase) -> Any:
+        return test_case.inputs
+
+    @experiment(pipeline_id=PIPELINE_ID)
+    async def run() -> None:
+        await eval_dataset(data=[GentraceTestInput(inputs={"a": 1})], interaction=identity, incremental=True)
+
+    with pytest.raises(ValueError, match="checkpoint_path"):
+        await run()
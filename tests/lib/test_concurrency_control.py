@@ -0,0 +1,119 @@
+import asyncio
+from time import monotonic
+from typing import Optional
+
+import pytest
+
+from gentrace.lib.concurrency_control import TokenBucket, EvalConcurrencyController, is_rate_limit_error
+
+
+class RateLimitError(Exception):
+    pass
+
+
+class HTTPError(Exception):
+    def __init__(self, status_code: int) -> None:
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+async def _finish(controller: EvalConcurrencyController, latency: float, error: Optional[Exception] = None) -> None:
+    await controller.acquire_slot()
+    await controller.release_slot(latency, error)
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_paces_acquisitions() -> None:
+    bucket = TokenBucket(rate=50, capacity=1)
+    start = monotonic()
+    for _ in range(6):
+        await bucket.acquire()
+    # The first token is available immediately, the other five take 1/50 s each
+    assert monotonic() - start >= 0.09
+
+
+def test_token_bucket_rejects_non_positive_rate() -> None:
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0, capacity=1)
+
+
+def test_is_rate_limit_error() -> None:
+    assert is_rate_limit_error(RateLimitError())
+    assert is_rate_limit_error(HTTPError(429))
+    assert not is_rate_limit_error(HTTPError(500))
+    assert not is_rate_limit_error(ValueError())
+
+
+@pytest.mark.asyncio
+async def test_fixed_limit_without_adaptive_options() -> None:
+    controller = EvalConcurrencyController(8, rate_limit={"requests_per_second": 1000})
+    for _ in range(20):
+        await _finish(controller, 0.01)
+    await _finish(controller, 0.01, RateLimitError())
+    assert controller.limit == 8
+
+
+@pytest.mark.asyncio
+async def test_adaptive_limit_increases_additively_and_backs_off_on_429() -> None:
+    controller = EvalConcurrencyController(10, adaptive={"initial_concurrency": 2})
+    assert controller.limit == 2
+
+    # About one more slot per round of `limit` successful cases
+    for _ in range(2):
+        await _finish(controller, 0.01)
+    assert controller.limit == 2
+    await _finish(controller, 0.01)
+    assert controller.limit == 3
+    for _ in range(60):
+        await _finish(controller, 0.01)
+    assert controller.limit == 10
+
+    await _finish(controller, 0.01, RateLimitError())
+    assert controller.limit == 5
+    await _finish(controller, 0.01, HTTPError(500))
+    assert controller.limit == 5
+
+
+@pytest.mark.asyncio
+async def test_adaptive_limit_backs_off_on_latency_spike() -> None:
+    controller = EvalConcurrencyController(
+        16, adaptive={"initial_concurrency": 16, "min_concurrency": 3, "latency_spike_factor": 2.0}
+    )
+    for _ in range(5):
+        await _finish(controller, 0.05)
+    assert controller.limit == 16
+
+    await _finish(controller, 1.0)
+    assert controller.limit == 8
+    # Overload reported within one round trip of the last cut does not cut again
+    await _finish(controller, 0.01, RateLimitError())
+    assert controller.limit == 8
+
+
+@pytest.mark.asyncio
+async def test_limit_stays_within_bounds() -> None:
+    controller = EvalConcurrencyController(4, adaptive={"initial_concurrency": 50, "min_concurrency": 2})
+    assert controller.limit == 4
+    for _ in range(5):
+        await _finish(controller, 0.0, RateLimitError())
+    assert controller.limit == 2
+
+
+@pytest.mark.asyncio
+async def test_slots_are_limited() -> None:
+    controller = EvalConcurrencyController(10, adaptive={"initial_concurrency": 3})
+    in_flight = 0
+    peak = 0
+
+    async def case() -> None:
+        nonlocal in_flight, peak
+        await controller.acquire_slot()
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        await controller.release_slot(0.01, RateLimitError())
+
+    await asyncio.gather(*(case() for _ in range(12)))
+
+    assert peak == 3
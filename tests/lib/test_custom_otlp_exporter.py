@@ -47,7 +47,7 @@ class TestCustomOTLPExporter:
         mock_proto = MagicMock()
         mock_proto.SerializePartialToString.return_value = b"serialized"
         
-        with patch("gentrace.lib.vendored_otlp_exporter.GentraceVendoredOTLPSpanExporter._encode_spans", return_value=mock_proto):
+        with patch("gentrace.lib.vendored_otlp_exporter.GentraceVendoredOTLPSpanExporter._encode_chunks", return_value=[mock_proto]):
             with patch.object(exporter._exporter, "_send_request", return_value=mock_response):
                 result = exporter.export(mock_spans)
 
@@ -77,7 +77,7 @@ class TestCustomOTLPExporter:
         mock_proto = MagicMock()
         mock_proto.SerializePartialToString.return_value = b"serialized"
         
-        with patch("gentrace.lib.vendored_otlp_exporter.GentraceVendoredOTLPSpanExporter._encode_spans", return_value=mock_proto):
+        with patch("gentrace.lib.vendored_otlp_exporter.GentraceVendoredOTLPSpanExporter._encode_chunks", return_value=[mock_proto]):
             with patch.object(exporter._exporter, "_send_request", return_value=mock_response):
                 # Capture debug output to verify partial success was detected
                 with caplog.at_level(logging.DEBUG):
@@ -109,7 +109,7 @@ class TestCustomOTLPExporter:
         mock_proto = MagicMock()
         mock_proto.SerializePartialToString.return_value = b"serialized"
         
-        with patch("gentrace.lib.vendored_otlp_exporter.GentraceVendoredOTLPSpanExporter._encode_spans", return_value=mock_proto):
+        with patch("gentrace.lib.vendored_otlp_exporter.GentraceVendoredOTLPSpanExporter._encode_chunks", return_value=[mock_proto]):
             with patch.object(exporter._exporter, "_send_request", return_value=mock_response):
                 result = exporter.export(mock_spans)
 
@@ -130,7 +130,7 @@ class TestCustomOTLPExporter:
         mock_proto = MagicMock()
         mock_proto.SerializePartialToString.return_value = b"serialized"
         
-        with patch("gentrace.lib.vendored_otlp_exporter.GentraceVendoredOTLPSpanExporter._encode_spans", return_value=mock_proto):
+        with patch("gentrace.lib.vendored_otlp_exporter.GentraceVendoredOTLPSpanExporter._encode_chunks", return_value=[mock_proto]):
             with patch.object(exporter._exporter, "_send_request", return_value=mock_response):
                 with caplog.at_level(logging.DEBUG):
                     result = exporter.export(mock_spans)
@@ -154,7 +154,7 @@ class TestCustomOTLPExporter:
         mock_proto = MagicMock()
         mock_proto.SerializePartialToString.return_value = b"serialized"
         
-        with patch("gentrace.lib.vendored_otlp_exporter.GentraceVendoredOTLPSpanExporter._encode_spans", return_value=mock_proto):
+        with patch("gentrace.lib.vendored_otlp_exporter.GentraceVendoredOTLPSpanExporter._encode_chunks", return_value=[mock_proto]):
             with patch.object(exporter._exporter, "_send_request", return_value=mock_response):
                 with patch("gentrace.lib.vendored_otlp_exporter.GentraceVendoredOTLPSpanExporter._is_retryable", return_value=False):
                     with caplog.at_level(logging.ERROR):
@@ -183,7 +183,7 @@ class TestCustomOTLPExporter:
         mock_proto = MagicMock()
         mock_proto.SerializePartialToString.return_value = b"serialized"
         
-        with patch("gentrace.lib.vendored_otlp_exporter.GentraceVendoredOTLPSpanExporter._encode_spans", return_value=mock_proto):
+        with patch("gentrace.lib.vendored_otlp_exporter.GentraceVendoredOTLPSpanExporter._encode_chunks", return_value=[mock_proto]):
             with patch.object(exporter._exporter, "_send_request", side_effect=responses):
                 with patch("gentrace.lib.vendored_otlp_exporter.GentraceVendoredOTLPSpanExporter._is_retryable", side_effect=[True, False]):
                     with patch.object(exporter._exporter, "_shutdown_in_progress") as mock_shutdown:
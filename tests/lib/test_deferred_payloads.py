@@ -0,0 +1,111 @@
+import json
+import threading
+from typing import Any, Dict, List, Iterator, Sequence
+from unittest.mock import patch
+from typing_extensions import override
+
+import pytest
+from opentelemetry.sdk.trace import ReadableSpan, TracerProvider
+from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult, SimpleSpanProcessor
+
+from gentrace.lib.traced import traced
+from gentrace.lib.constants import ATTR_GENTRACE_FN_ARGS_EVENT_NAME, ATTR_GENTRACE_FN_OUTPUT_EVENT_NAME
+from gentrace.lib.deferred_payloads import (
+    DEFERRED_PAYLOAD_PLACEHOLDER,
+    record_output_event,
+    get_deferred_payload,
+    record_payload_event,
+    configure_deferred_serialization,
+)
+from gentrace.lib.vendored_otlp_exporter import GentraceVendoredOTLPSpanExporter
+
+
+class CollectingExporter(SpanExporter):
+    def __init__(self) -> None:
+        self.spans: List[ReadableSpan] = []
+
+    @override
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        self.spans.extend(spans)
+        return SpanExportResult.SUCCESS
+
+
+@pytest.fixture
+def provider() -> "Iterator[tuple[TracerProvider, CollectingExporter]]":
+    collector = CollectingExporter()
+    tracer_provider = TracerProvider()
+    tracer_provider.add_span_processor(SimpleSpanProcessor(collector))
+    yield tracer_provider, collector
+    configure_deferred_serialization()
+
+
+def _encoded_events(span: ReadableSpan) -> Dict[str, str]:
+    exporter = GentraceVendoredOTLPSpanExporter(endpoint="http://localhost:4318/v1/traces")
+    pb_span = exporter._encode_spans([span]).resource_spans[0].scope_spans[0].spans[0]
+    return {event.name: event.attributes[0].value.string_value for event in pb_span.events}
+
+
+def test_traced_payloads_are_serialized_at_export(provider: "tuple[TracerProvider, CollectingExporter]") -> None:
+    tracer_provider, collector = provider
+    configure_deferred_serialization(enabled=True)
+
+    with patch("gentrace.lib.traced.trace.get_tracer", return_value=tracer_provider.get_tracer("gentrace")):
+
+        @traced()
+        def summarize(messages: List[str], max_tokens: int = 10) -> Dict[str, Any]:
+            return {"summary": " ".join(messages), "max_tokens": max_tokens}
+
+        summarize(["a", "b"], max_tokens=5)
+
+    (span,) = collector.spans
+    assert [event.attributes for event in span.events] == [
+        {"args": DEFERRED_PAYLOAD_PLACEHOLDER},
+        {"output": DEFERRED_PAYLOAD_PLACEHOLDER},
+    ]
+    assert _encoded_events(span) == {
+        ATTR_GENTRACE_FN_ARGS_EVENT_NAME: '[{"messages": ["a", "b"]}, {"max_tokens": 5}]',
+        ATTR_GENTRACE_FN_OUTPUT_EVENT_NAME: '{"summary": "a b", "max_tokens": 5}',
+    }
+
+
+@pytest.mark.parametrize("capture_copy, expected", [("shallow", "[1, 2]"), ("none", "[1, 2, 3]")])
+def test_capture_copy_controls_visibility_of_later_mutation(
+    provider: "tuple[TracerProvider, CollectingExporter]", capture_copy: Any, expected: str
+) -> None:
+    tracer_provider, collector = provider
+    configure_deferred_serialization(enabled=True, capture_copy=capture_copy)
+    value = [1, 2]
+
+    with tracer_provider.get_tracer("gentrace").start_as_current_span("span") as span:
+        record_output_event(span, value)
+    value.append(3)
+
+    assert _encoded_events(collector.spans[0])[ATTR_GENTRACE_FN_OUTPUT_EVENT_NAME] == expected
+
+
+def test_uncopyable_values_are_serialized_immediately(provider: "tuple[TracerProvider, CollectingExporter]") -> None:
+    tracer_provider, collector = provider
+    configure_deferred_serialization(enabled=True, capture_copy="deep")
+
+    with tracer_provider.get_tracer("gentrace").start_as_current_span("span") as span:
+        record_payload_event(span, ATTR_GENTRACE_FN_ARGS_EVENT_NAME, "args", {"lock": threading.Lock()})
+
+    (span,) = collector.spans
+    assert get_deferred_payload(span.events[0]) is None
+    assert json.loads(str(span.events[0].attributes["args"]))["lock"].startswith("<unlocked _thread.lock")  # type: ignore[index]
+
+
+def test_disabled_mode_serializes_inline(provider: "tuple[TracerProvider, CollectingExporter]") -> None:
+    tracer_provider, collector = provider
+
+    with tracer_provider.get_tracer("gentrace").start_as_current_span("span") as span:
+        record_output_event(span, {"a": 1})
+
+    (span,) = collector.spans
+    assert span.events[0].attributes == {"output": '{"a": 1}'}
+    assert get_deferred_payload(span.events[0]) is None
+
+
+def test_unknown_capture_copy_mode_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        configure_deferred_serialization(enabled=True, capture_copy="weird")  # type: ignore[arg-type]
@@ -1,21 +1,59 @@
 # pyright: reportUnknownVariableType=false, reportUnknownArgumentType=false, reportArgumentType=false, reportCallIssue=false, reportTypedDictNotRequiredAccess=false
 """Tests for eval_dataset concurrency control."""
 
+import os
 import time
 import asyncio
 import threading
-from typing import Any, Dict, List, Mapping
-from unittest.mock import MagicMock
+from typing import Any, Dict, List, Mapping, Iterator, AsyncIterator
+from unittest.mock import MagicMock, patch
 
 import pytest
+from opentelemetry import trace, baggage as otel_baggage
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
 
 import gentrace.lib.experiment as exp_mod
 import gentrace.lib.experiment_control as exp_ctrl
-from gentrace import TestInput as GentraceTestInput, init, experiment, eval_dataset
+from gentrace import (
+    TestInput as GentraceTestInput,
+    EvalCaseTimeoutError,
+    init,
+    experiment,
+    eval_dataset,
+    eval_dataset_iter,
+)
 from gentrace.types import TestCase as GentraceTestCase
-from gentrace.lib.constants import MAX_EVAL_DATASET_CONCURRENCY
+from gentrace.lib.constants import (
+    ATTR_GENTRACE_ATTEMPTS,
+    ATTR_GENTRACE_TIMED_OUT,
+    ATTR_GENTRACE_SAMPLE_KEY,
+    ATTR_GENTRACE_IN_EXPERIMENT,
+    MAX_EVAL_DATASET_CONCURRENCY,
+    ATTR_GENTRACE_RETRY_EVENT_NAME,
+)
+from gentrace.lib.experiment import get_current_experiment_context
 from gentrace.types.experiment import Experiment
 
+
+def square_input(test_case: GentraceTestCase) -> Dict[str, Any]:
+    """Module-level (picklable) interaction for the process executor."""
+    value = int(test_case.inputs["id"])
+    return {"square": value * value, "pid": os.getpid()}
+
+
+def describe_worker_context(_: GentraceTestCase) -> Dict[str, Any]:
+    """Module-level interaction reporting the context it sees in a worker process."""
+    experiment_context = get_current_experiment_context()
+    return {
+        "sample": otel_baggage.get_baggage(ATTR_GENTRACE_SAMPLE_KEY),
+        "in_experiment": otel_baggage.get_baggage(ATTR_GENTRACE_IN_EXPERIMENT),
+        "experiment_id": experiment_context["experiment_id"] if experiment_context else None,
+        "trace_id": trace.get_current_span().get_span_context().trace_id,
+    }
+
+
 # Use same pipeline ID as other tests
 PIPELINE_ID = "76ecc73d-3419-431f-aafc-93a9d1af1b83"
 
@@ -95,7 +133,7 @@ def tracker():
 @pytest.fixture(autouse=True)
 def init_gentrace():
     """Initialize Gentrace for tests."""
-    init(api_key="test-key", base_url="https://gentrace.ai/api")
+    init(api_key="test-key", base_url="https://gentrace.ai/api", otel_setup=False)
 
 
 def create_test_data(num_items: int) -> List[GentraceTestInput[Mapping[str, Any]]]:
@@ -294,4 +332,538 @@ async def test_max_concurrency_exceeds_limit() -> None:
         max_concurrency=MAX_EVAL_DATASET_CONCURRENCY,
     )
     
-    assert len(results) == 5
\ No newline at end of file
+    assert len(results) == 5
+
+@experiment(pipeline_id=PIPELINE_ID)
+@pytest.mark.asyncio
+async def test_generator_data_is_pulled_lazily() -> None:
+    """Test that cases from a generator are pulled as workers free up, not all up front."""
+
+    pulled: List[int] = []
+    finished = 0
+    max_pulled_ahead = 0
+
+    def generate_cases() -> Iterator[GentraceTestInput[Mapping[str, Any]]]:
+        for i in range(20):
+            pulled.append(i)
+            yield GentraceTestInput(inputs={"id": i})
+
+    async def counting_task(test_case: GentraceTestCase) -> int:
+        nonlocal finished, max_pulled_ahead
+        # Cases pulled from the dataset but not yet finished
+        max_pulled_ahead = max(max_pulled_ahead, len(pulled) - finished)
+        await asyncio.sleep(0.01)
+        finished += 1
+        return int(test_case.inputs["id"])
+
+    results = await eval_dataset(data=generate_cases(), interaction=counting_task, max_concurrency=3)
+
+    assert results == list(range(20))
+    assert max_pulled_ahead <= 3, f"Expected at most 3 cases pulled ahead, but got {max_pulled_ahead}"
+
+
+@experiment(pipeline_id=PIPELINE_ID)
+@pytest.mark.asyncio
+async def test_adaptive_concurrency_pulls_cases_only_when_a_slot_is_free() -> None:
+    """Test that with adaptive concurrency, cases are read as slots free up rather than one per worker."""
+
+    pulled: List[int] = []
+    finished = 0
+    max_pulled_ahead = 0
+
+    def generate_cases() -> Iterator[GentraceTestInput[Mapping[str, Any]]]:
+        for i in range(40):
+            pulled.append(i)
+            yield GentraceTestInput(inputs={"id": i})
+
+    async def counting_task(test_case: GentraceTestCase) -> int:
+        nonlocal finished, max_pulled_ahead
+        max_pulled_ahead = max(max_pulled_ahead, len(pulled) - finished)
+        await asyncio.sleep(0.01)
+        finished += 1
+        return int(test_case.inputs["id"])
+
+    results = await eval_dataset(
+        data=generate_cases(), interaction=counting_task, adaptive_concurrency={"initial_concurrency": 2}
+    )
+
+    assert results == list(range(40))
+    # The limit starts at 2 and grows by about one per round of successful cases
+    assert max_pulled_ahead <= 10, f"Expected cases to be pulled as slots free up, but got {max_pulled_ahead}"
+
+
+@experiment(pipeline_id=PIPELINE_ID)
+@pytest.mark.asyncio
+async def test_slow_generator_data_does_not_block_the_event_loop() -> None:
+    """Test that a sync generator blocking on I/O is advanced off the event loop."""
+
+    def generate_cases() -> Iterator[GentraceTestInput[Mapping[str, Any]]]:
+        for i in range(3):
+            time.sleep(0.1)
+            yield GentraceTestInput(inputs={"id": i})
+
+    async def async_task(test_case: GentraceTestCase) -> int:
+        return int(test_case.inputs["id"])
+
+    ticks: List[float] = []
+
+    async def heartbeat() -> None:
+        while True:
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.01)
+
+    beating = asyncio.ensure_future(heartbeat())
+    try:
+        results = await eval_dataset(data=generate_cases(), interaction=async_task, max_concurrency=2)
+    finally:
+        beating.cancel()
+
+    assert results == [0, 1, 2]
+    assert max(later - earlier for earlier, later in zip(ticks, ticks[1:])) < 0.08
+
+
+@experiment(pipeline_id=PIPELINE_ID)
+@pytest.mark.asyncio
+async def test_async_generator_data_provider() -> None:
+    """Test that a data provider returning an async generator is consumed in order."""
+
+    async def generate_cases() -> AsyncIterator[GentraceTestInput[Mapping[str, Any]]]:
+        for i in range(5):
+            await asyncio.sleep(0)
+            yield GentraceTestInput(name=f"case-{i}", inputs={"id": i})
+
+    async def async_task(test_case: GentraceTestCase) -> str:
+        await asyncio.sleep(0.01 * (5 - int(test_case.inputs["id"])))
+        return test_case.name
+
+    for max_concurrency in (None, 2):
+        results = await eval_dataset(data=generate_cases, interaction=async_task, max_concurrency=max_concurrency)
+        assert results == [f"case-{i}" for i in range(5)]
+
+
+@experiment(pipeline_id=PIPELINE_ID)
+@pytest.mark.asyncio
+async def test_data_failure_mid_stream_raises() -> None:
+    """Test that an error raised while iterating the dataset fails the run."""
+
+    def generate_cases() -> Iterator[GentraceTestInput[Mapping[str, Any]]]:
+        yield GentraceTestInput(inputs={"id": 0})
+        raise ConnectionError("page 2 unavailable")
+
+    async def async_task(_: GentraceTestCase) -> str:
+        await asyncio.sleep(0.01)
+        return "ok"
+
+    for max_concurrency in (None, 2):
+        with pytest.raises(RuntimeError, match="page 2 unavailable"):
+            await eval_dataset(data=generate_cases(), interaction=async_task, max_concurrency=max_concurrency)
+
+
+@experiment(pipeline_id=PIPELINE_ID)
+@pytest.mark.asyncio
+async def test_sync_thread_pool_is_sized_from_max_concurrency() -> None:
+    """Test that sync functions get as many threads as max_concurrency, independent of CPU count."""
+
+    sync_lock = threading.Lock()
+    barrier = threading.Barrier(40, timeout=5)
+    thread_names: List[str] = []
+
+    def sync_task(_: GentraceTestCase) -> str:
+        with sync_lock:
+            thread_names.append(threading.current_thread().name)
+        # Only returns once all 40 cases are running at the same time
+        barrier.wait()
+        return "ok"
+
+    results = await eval_dataset(
+        data=lambda: create_test_data(40),
+        interaction=sync_task,
+        max_concurrency=40,
+    )
+
+    assert results == ["ok"] * 40
+    assert all(name.startswith("gentrace-eval-dataset") for name in thread_names)
+
+
+@experiment(pipeline_id=PIPELINE_ID)
+@pytest.mark.asyncio
+async def test_process_executor_runs_in_worker_processes() -> None:
+    """Test that executor="process" runs a picklable sync interaction in other processes."""
+
+    results = await eval_dataset(
+        data=[GentraceTestInput(inputs={"id": i}) for i in range(6)],
+        interaction=square_input,
+        max_concurrency=2,
+        executor="process",
+    )
+
+    assert [result["square"] for result in results if result is not None] == [i * i for i in range(6)]
+    assert all(result is not None and result["pid"] != os.getpid() for result in results)
+
+
+@experiment(pipeline_id=PIPELINE_ID)
+@pytest.mark.asyncio
+async def test_process_executor_rejects_unsuitable_interactions() -> None:
+    """Test that executor="process" rejects async and unpicklable interaction functions."""
+
+    async def async_task(_: GentraceTestCase) -> str:
+        return "ok"
+
+    with pytest.raises(ValueError, match="requires a sync interaction"):
+        await eval_dataset(data=create_test_data(1), interaction=async_task, executor="process")
+
+    with pytest.raises(ValueError, match="requires a picklable interaction"):
+        await eval_dataset(data=create_test_data(1), interaction=lambda _: "ok", executor="process")
+
+
+@experiment(pipeline_id=PIPELINE_ID)
+@pytest.mark.asyncio
+async def test_process_executor_propagates_trace_and_experiment_context() -> None:
+    """Test that worker processes run each case under its trace context, baggage and experiment."""
+
+    tracer_provider = TracerProvider()
+    tracer_provider.add_span_processor(SimpleSpanProcessor(InMemorySpanExporter()))
+    with patch("gentrace.lib.eval_dataset._tracer", tracer_provider.get_tracer("gentrace")):
+        results = await eval_dataset(
+            data=create_test_data(3),
+            interaction=describe_worker_context,
+            executor="process",
+        )
+
+    for result in results:
+        assert result is not None
+        assert result["sample"] == "true"
+        assert result["in_experiment"] == "true"
+        assert result["experiment_id"] == "dummy-experiment-id"
+        assert result["trace_id"] != 0
+
+
+@experiment(pipeline_id=PIPELINE_ID)
+@pytest.mark.asyncio
+async def test_rate_limit_paces_case_starts() -> None:
+    """Test that requests_per_second spaces out the start of test cases."""
+
+    starts: List[float] = []
+
+    async def timed_task(test_case: GentraceTestCase) -> int:
+        starts.append(time.monotonic())
+        return int(test_case.inputs["id"])
+
+    data = [GentraceTestInput(inputs={"id": i}) for i in range(24)]
+    results = await eval_dataset(data=data, interaction=timed_task, rate_limit={"requests_per_second": 20})
+
+    assert results == list(range(24))
+    # A burst of one second's worth of requests, then one every 1/20 s
+    assert starts[-1] - starts[0] >= 0.19
+
+
+@experiment(pipeline_id=PIPELINE_ID)
+@pytest.mark.asyncio
+async def test_adaptive_concurrency_backs_off_on_rate_limit_errors(tracker: ConcurrencyTracker) -> None:
+    """Test that rate limit errors shrink the number of test cases in flight."""
+
+    class RateLimitError(Exception):
+        pass
+
+    async def throttled_task(test_case: GentraceTestCase) -> int:
+        task_id = str(test_case.inputs["id"])
+        current = await tracker.increment(task_id)
+        await asyncio.sleep(0.01)
+        await tracker.decrement(task_id)
+        if current > 1:
+            raise RateLimitError("429 Too Many Requests")
+        return int(test_case.inputs["id"])
+
+    results = await eval_dataset(
+        data=[GentraceTestInput(inputs={"id": i}) for i in range(12)],
+        interaction=throttled_task,
+        max_concurrency=8,
+        adaptive_concurrency={"initial_concurrency": 4},
+    )
+
+    assert tracker.max_concurrent == 4
+    # Once the rate limit errors come back, the limit is cut and only probes back up to two cases
+    later_starts = [entry for entry in tracker.execution_log if entry["event"] == "start"][-4:]
+    assert max(entry["concurrent"] for entry in later_starts) <= 2
+    assert 0 in results and None in results
+
+
+@experiment(pipeline_id=PIPELINE_ID)
+@pytest.mark.asyncio
+async def test_eval_dataset_iter_yields_in_completion_order() -> None:
+    """Test that eval_dataset_iter yields each case as it finishes, with its timing and error."""
+
+    async def async_task(test_case: GentraceTestCase) -> int:
+        value = int(test_case.inputs["id"])
+        await asyncio.sleep(0.01 * (4 - value))
+        if value == 1:
+            raise ValueError("bad case")
+        return value
+
+    for max_concurrency in (None, 4):
+        completed = [
+            item
+            async for item in eval_dataset_iter(
+                data=[GentraceTestInput(inputs={"id": i}) for i in range(4)],
+                interaction=async_task,
+                max_concurrency=max_concurrency,
+            )
+        ]
+
+        assert [item.test_case.inputs["id"] for item in completed] == [3, 2, 1, 0]
+        assert [item.result for item in completed] == [3, 2, None, 0]
+        assert isinstance(completed[2].error, ValueError)
+        assert all(item.error is None for item in completed if item.result is not None)
+        assert completed[0].timing.duration_seconds < completed[-1].timing.duration_seconds
+        assert all(item.timing.wait_seconds >= 0 for item in completed)
+
+
+@experiment(pipeline_id=PIPELINE_ID)
+@pytest.mark.asyncio
+async def test_eval_dataset_iter_applies_backpressure() -> None:
+    """Test that a slow consumer stops new cases from starting, and that closing early cancels the run."""
+
+    started: List[int] = []
+
+    async def async_task(test_case: GentraceTestCase) -> int:
+        started.append(int(test_case.inputs["id"]))
+        await asyncio.sleep(0)
+        return int(test_case.inputs["id"])
+
+    results = eval_dataset_iter(
+        data=[GentraceTestInput(inputs={"id": i}) for i in range(50)], interaction=async_task, max_concurrency=2
+    )
+    first = await results.__anext__()
+    # Give the workers time to run ahead of the consumer
+    await asyncio.sleep(0.05)
+    # At most one buffered result per worker, plus one case in flight per worker
+    assert len(started) <= 1 + 2 * 2
+    await results.aclose()
+
+    assert first.result == 0
+    assert len(started) < 50
+
+
+@experiment(pipeline_id=PIPELINE_ID)
+@pytest.mark.asyncio
+async def test_per_case_timeout_cancels_async_interactions() -> None:
+    """Test that a hung async case is cancelled at its timeout, marked on its span, and frees its slot."""
+
+    exporter = InMemorySpanExporter()
+    tracer_provider = TracerProvider()
+    tracer_provider.add_span_processor(SimpleSpanProcessor(exporter))
+    cancelled: List[int] = []
+
+    async def async_task(test_case: GentraceTestCase) -> int:
+        value = int(test_case.inputs["id"])
+        try:
+            await asyncio.sleep(10 if value == 0 else 0)
+        except asyncio.CancelledError:
+            cancelled.append(value)
+            raise
+        return value
+
+    start = time.monotonic()
+    with patch("gentrace.lib.eval_dataset._tracer", tracer_provider.get_tracer("gentrace")):
+        results = await eval_dataset(
+            data=[GentraceTestInput(inputs={"id": i}) for i in range(4)],
+            interaction=async_task,
+            max_concurrency=1,
+            per_case_timeout=0.1,
+        )
+
+    assert results == [None, 1, 2, 3]
+    assert time.monotonic() - start < 2
+    await asyncio.sleep(0)
+    assert cancelled == [0]
+    timed_out = {span.name: (span.attributes or {}).get(ATTR_GENTRACE_TIMED_OUT) for span in exporter.get_finished_spans()}
+    assert timed_out == {"Test Case 1": True, "Test Case 2": None, "Test Case 3": None, "Test Case 4": None}
+
+
+@experiment(pipeline_id=PIPELINE_ID)
+@pytest.mark.asyncio
+async def test_per_case_timeout_abandons_sync_interactions() -> None:
+    """Test that a hung sync case is abandoned, and a timed out call still queued in the pool never starts."""
+
+    release = threading.Event()
+    started: List[int] = []
+
+    def sync_task(test_case: GentraceTestCase) -> int:
+        value = int(test_case.inputs["id"])
+        started.append(value)
+        if value in (0, 1):
+            release.wait(10)
+        return value
+
+    start = time.monotonic()
+    try:
+        completed = [
+            item
+            async for item in eval_dataset_iter(
+                data=[GentraceTestInput(inputs={"id": i}) for i in range(5)],
+                interaction=sync_task,
+                max_concurrency=2,
+                per_case_timeout=0.1,
+            )
+        ]
+    finally:
+        release.set()
+
+    assert time.monotonic() - start < 2
+    # Cases 0 and 1 hold both pool workers; the cases after them time out waiting for one
+    assert all(item.result is None and isinstance(item.error, EvalCaseTimeoutError) for item in completed)
+    assert len(completed) == 5
+    await asyncio.sleep(0.1)
+    assert sorted(started) == [0, 1]
+
+
+@experiment(pipeline_id=PIPELINE_ID)
+@pytest.mark.asyncio
+async def test_total_timeout_stops_the_run() -> None:
+    """Test that cases still running or not yet started when total_timeout expires time out."""
+
+    async def async_task(test_case: GentraceTestCase) -> int:
+        await asyncio.sleep(0.1)
+        return int(test_case.inputs["id"])
+
+    completed = [
+        item
+        async for item in eval_dataset_iter(
+            data=[GentraceTestInput(inputs={"id": i}) for i in range(10)],
+            interaction=async_task,
+            max_concurrency=1,
+            total_timeout=0.25,
+        )
+    ]
+
+    assert [item.result for item in completed[:2]] == [0, 1]
+    assert all(isinstance(item.error, EvalCaseTimeoutError) for item in completed[2:])
+    assert len(completed) == 10
+
+    with pytest.raises(ValueError, match="per_case_timeout"):
+        await eval_dataset(data=[], interaction=async_task, per_case_timeout=0)
+
+
+@experiment(pipeline_id=PIPELINE_ID)
+@pytest.mark.asyncio
+async def test_total_timeout_bounds_dataset_reads_and_rate_limit_waits() -> None:
+    """Test that total_timeout stops reading a stalled dataset and waiting for the rate limits."""
+
+    async def async_task(test_case: GentraceTestCase) -> int:
+        return int(test_case.inputs["id"])
+
+    async def stalled_dataset() -> AsyncIterator[GentraceTestInput[Dict[str, Any]]]:
+        yield GentraceTestInput(inputs={"id": 0})
+        await asyncio.sleep(10)
+        yield GentraceTestInput(inputs={"id": 1})
+
+    start = time.monotonic()
+    results = await eval_dataset(data=stalled_dataset(), interaction=async_task, max_concurrency=2, total_timeout=0.2)
+    assert results == [0]
+    assert time.monotonic() - start < 2
+
+    start = time.monotonic()
+    completed = [
+        item
+        async for item in eval_dataset_iter(
+            data=[GentraceTestInput(inputs={"id": i}) for i in range(5)],
+            interaction=async_task,
+            rate_limit={"requests_per_second": 0.5},
+            total_timeout=0.2,
+        )
+    ]
+    assert time.monotonic() - start < 2
+    assert [item.result for item in completed if item.error is None] == [0]
+    assert sum(isinstance(item.error, EvalCaseTimeoutError) for item in completed) == 4
+
+
+@experiment(pipeline_id=PIPELINE_ID)
+@pytest.mark.asyncio
+async def test_retry_reruns_transient_failures_and_records_attempts() -> None:
+    """Test that transient failures are retried with events on the case span, and other errors are not."""
+
+    exporter = InMemorySpanExporter()
+    tracer_provider = TracerProvider()
+    tracer_provider.add_span_processor(SimpleSpanProcessor(exporter))
+    attempts: Dict[str, int] = {}
+
+    async def flaky_task(test_case: GentraceTestCase) -> str:
+        name = str(test_case.inputs["id"])
+        attempts[name] = attempts.get(name, 0) + 1
+        if name == "flaky" and attempts[name] < 3:
+            raise ConnectionResetError("connection reset by peer")
+        if name == "broken":
+            raise ValueError("invalid prompt")
+        return name
+
+    with patch("gentrace.lib.eval_dataset._tracer", tracer_provider.get_tracer("gentrace")):
+        results = await eval_dataset(
+            data=[GentraceTestInput(name=name, inputs={"id": name}) for name in ("flaky", "broken", "ok")],
+            interaction=flaky_task,
+            retry={"initial_backoff": 0.01},
+        )
+
+    assert results == ["flaky", None, "ok"]
+    assert attempts == {"flaky": 3, "broken": 1, "ok": 1}
+    spans = {span.name: span for span in exporter.get_finished_spans()}
+    assert (spans["flaky"].attributes or {})[ATTR_GENTRACE_ATTEMPTS] == 3
+    retries = [event for event in spans["flaky"].events if event.name == ATTR_GENTRACE_RETRY_EVENT_NAME]
+    assert [(event.attributes or {})["attempt"] for event in retries] == [1, 2]
+    assert (retries[0].attributes or {})["error.type"] == "ConnectionResetError"
+    assert (spans["broken"].attributes or {})[ATTR_GENTRACE_ATTEMPTS] == 1
+
+
+@experiment(pipeline_id=PIPELINE_ID)
+@pytest.mark.asyncio
+async def test_retry_budget_is_shared_by_the_run() -> None:
+    """Test that once the run's retry budget is spent, failing cases are not retried."""
+
+    calls = 0
+
+    async def failing_task(_: GentraceTestCase) -> None:
+        nonlocal calls
+        calls += 1
+        raise TimeoutError("upstream timed out")
+
+    results = await eval_dataset(
+        data=[GentraceTestInput(inputs={"id": i}) for i in range(10)],
+        interaction=failing_task,
+        max_concurrency=2,
+        retry={"max_attempts": 5, "initial_backoff": 0, "budget_ratio": 0.1, "budget_min_retries": 2},
+    )
+
+    assert results == [None] * 10
+    # Ten first attempts, plus two retries and one more earned by the ten cases
+    assert calls == 13
+
+
+@experiment(pipeline_id=PIPELINE_ID)
+@pytest.mark.asyncio
+async def test_setup_errors_do_not_leak_the_pool_or_progress_reporter() -> None:
+    """Test that invalid options and failing setup steps leave no pool or progress display behind."""
+
+    def sync_task(_: GentraceTestCase) -> str:
+        return "ok"
+
+    reporter_class = MagicMock()
+    with patch("gentrace.lib.eval_dataset.SimpleProgressReporter", reporter_class), patch(
+        "gentrace.lib.eval_dataset._create_executor"
+    ) as create_executor:
+        with pytest.raises(ValueError, match="decrease_factor"):
+            await eval_dataset(
+                data=create_test_data(2),
+                interaction=sync_task,
+                show_progress_bar=False,
+                adaptive_concurrency={"decrease_factor": 2},
+            )
+        create_executor.assert_not_called()
+        reporter_class.assert_not_called()
+
+        validator = MagicMock()
+        validator.validate_many.side_effect = RuntimeError("validator failed")
+        with patch("gentrace.lib.eval_dataset.get_schema_validator", return_value=validator):
+            with pytest.raises(RuntimeError, match="validator failed"):
+                await eval_dataset(
+                    data=create_test_data(2), interaction=sync_task, schema=dict, show_progress_bar=False
+                )
+        reporter_class.return_value.stop.assert_called_once()
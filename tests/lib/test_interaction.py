@@ -220,6 +220,76 @@ class TestInteraction(unittest.TestCase):
         )
         mock_tracer.start_as_current_span.assert_called_once_with("sync_check_baggage")
 
+    @patch("gentrace.lib.traced.trace.get_tracer")
+    def test_interaction_generator_baggage_does_not_leak_to_consumer(self, mock_get_tracer: MagicMock) -> None:
+        _mock_span, mock_tracer = self.common_test_setup()
+        mock_get_tracer.return_value = mock_tracer
+
+        inside: list = []
+
+        @interaction(pipeline_id=str(uuid.uuid4()))
+        def numbers() -> Any:
+            for i in range(2):
+                inside.append(otel_baggage.get_baggage(ATTR_GENTRACE_SAMPLE_KEY))
+                yield i
+
+        first, second = numbers(), numbers()
+        self.assertEqual(next(first), 0)
+        # The consumer holding an item does not see the interaction's baggage
+        self.assertIsNone(otel_baggage.get_baggage(ATTR_GENTRACE_SAMPLE_KEY))
+        self.assertEqual(next(second), 0)
+        self.assertEqual(next(first), 1)
+        self.assertIsNone(otel_baggage.get_baggage(ATTR_GENTRACE_SAMPLE_KEY))
+        # Closing out of LIFO order leaves no baggage attached either
+        first.close()
+        second.close()
+        self.assertIsNone(otel_baggage.get_baggage(ATTR_GENTRACE_SAMPLE_KEY))
+        self.assertEqual(inside, ["true", "true", "true"])
+
+    @patch("gentrace.lib.traced.trace.get_tracer")
+    def test_interaction_generator_forwards_send_and_throw(self, mock_get_tracer: MagicMock) -> None:
+        _mock_span, mock_tracer = self.common_test_setup()
+        mock_get_tracer.return_value = mock_tracer
+
+        @interaction(pipeline_id=str(uuid.uuid4()))
+        def echo() -> Any:
+            received = yield "ready"
+            try:
+                yield received
+            except KeyError:
+                yield "recovered"
+            return "done"
+
+        stream = echo()
+        self.assertEqual(next(stream), "ready")
+        self.assertEqual(stream.send(4), 4)
+        self.assertEqual(stream.throw(KeyError("x")), "recovered")
+        with self.assertRaises(StopIteration) as stop:
+            next(stream)
+        self.assertEqual(stop.exception.value, "done")
+
+    @patch("gentrace.lib.traced.trace.get_tracer")
+    def test_interaction_async_generator_baggage_does_not_leak_to_consumer(self, mock_get_tracer: MagicMock) -> None:
+        _mock_span, mock_tracer = self.common_test_setup()
+        mock_get_tracer.return_value = mock_tracer
+
+        inside: list = []
+
+        @interaction(pipeline_id=str(uuid.uuid4()))
+        async def numbers() -> Any:
+            for i in range(2):
+                inside.append(otel_baggage.get_baggage(ATTR_GENTRACE_SAMPLE_KEY))
+                yield i
+
+        async def consume() -> list:
+            between: list = []
+            async for _ in numbers():
+                between.append(otel_baggage.get_baggage(ATTR_GENTRACE_SAMPLE_KEY))
+            return between
+
+        self.assertEqual(asyncio.run(consume()), [None, None])
+        self.assertEqual(inside, ["true", "true"])
+
     @patch("gentrace.lib.traced.trace.get_tracer")
     def test_interaction_async_no_pipeline_id_uses_default(self, mock_get_tracer: MagicMock) -> None:
         _mock_span, mock_tracer = self.common_test_setup()
@@ -1,6 +1,6 @@
 import json
 import warnings
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Iterator
 from dataclasses import dataclass
 from typing_extensions import override
 
@@ -9,10 +9,12 @@ import pytest
 from gentrace.lib.utils import (
     OTLP_MAX_INT_SIZE,
     OTLP_MIN_INT_SIZE,
-    CIRCULAR_REFERENCE_PLACEHOLDER,
     _gentrace_json_dumps,
+    set_serialization_limits,
+    _gentrace_event_json_dumps,
     gentrace_format_otel_value,
 )
+from gentrace.lib.serialization import TRUNCATED_VALUE_MARKER, CIRCULAR_REFERENCE_PLACEHOLDER
 
 
 class UnserializableObj:
@@ -67,15 +69,13 @@ def test_json_dumps_custom_objects() -> None:
 def test_json_dumps_circular_list() -> None:
     a: List[Any] = [1, 2]
     a.append(a)
-    with pytest.warns(UserWarning, match="Fallback to placeholder for entire value due to complex circular reference"):
-        assert _gentrace_json_dumps(a) == json.dumps(CIRCULAR_REFERENCE_PLACEHOLDER)
+    assert _gentrace_json_dumps(a) == f'[1, 2, "{CIRCULAR_REFERENCE_PLACEHOLDER}"]'
 
 
 def test_json_dumps_circular_dict() -> None:
     a: Dict[str, Any] = {"key1": "value1"}
     a["self"] = a
-    with pytest.warns(UserWarning, match="Fallback to placeholder for entire value due to complex circular reference"):
-        assert _gentrace_json_dumps(a) == json.dumps(CIRCULAR_REFERENCE_PLACEHOLDER)
+    assert _gentrace_json_dumps(a) == f'{{"key1": "value1", "self": "{CIRCULAR_REFERENCE_PLACEHOLDER}"}}'
 
 
 def test_json_dumps_mutual_circular_references() -> None:
@@ -84,11 +84,14 @@ def test_json_dumps_mutual_circular_references() -> None:
     obj1["ref_to_obj2"] = obj2
     obj2["ref_to_obj1"] = obj1
 
-    with pytest.warns(UserWarning, match="Fallback to placeholder for entire value due to complex circular reference"):
-        assert _gentrace_json_dumps(obj1) == json.dumps(CIRCULAR_REFERENCE_PLACEHOLDER)
-
-    with pytest.warns(UserWarning, match="Fallback to placeholder for entire value due to complex circular reference"):
-        assert _gentrace_json_dumps(obj2) == json.dumps(CIRCULAR_REFERENCE_PLACEHOLDER)
+    assert json.loads(_gentrace_json_dumps(obj1)) == {
+        "name": "obj1",
+        "ref_to_obj2": {"name": "obj2", "ref_to_obj1": CIRCULAR_REFERENCE_PLACEHOLDER},
+    }
+    assert json.loads(_gentrace_json_dumps(obj2)) == {
+        "name": "obj2",
+        "ref_to_obj1": {"name": "obj1", "ref_to_obj2": CIRCULAR_REFERENCE_PLACEHOLDER},
+    }
 
 
 def test_gentrace_format_otel_value_int_range() -> None:
@@ -113,8 +116,7 @@ def test_gentrace_format_otel_value_int_range() -> None:
 def test_gentrace_format_otel_value_complex_object_uses_safe_dumper() -> None:
     circular_list: List[Any] = [1]
     circular_list.append(circular_list)
-    with pytest.warns(UserWarning, match="Fallback to placeholder for entire value due to complex circular reference"):
-        assert gentrace_format_otel_value(circular_list) == json.dumps(CIRCULAR_REFERENCE_PLACEHOLDER)
+    assert gentrace_format_otel_value(circular_list) == f'[1, "{CIRCULAR_REFERENCE_PLACEHOLDER}"]'
 
 
 def test_shared_object_not_circular() -> None:
@@ -141,3 +143,79 @@ def test_dict_with_unserializable_value() -> None:
     data = {"a": 1, "b": UnserializableObj(), "c": 3}
     expected = f'{{"a": 1, "b": "[UnserializableType: UnserializableObj]", "c": 3}}'
     assert _gentrace_json_dumps(data) == expected
+
+
+@pytest.fixture
+def serialization_limits() -> Iterator[None]:
+    yield
+    set_serialization_limits()
+
+
+def test_json_dumps_within_limit_is_unchanged() -> None:
+    value = {"prompt": "hello", "items": [1, 2, 3]}
+    assert _gentrace_json_dumps(value, max_bytes=1000) == _gentrace_json_dumps(value)
+
+
+def test_json_dumps_truncates_with_marker_and_original_size() -> None:
+    value = [{"prompt": "x" * 10_000}, {"temperature": 0.2}]
+    full = _gentrace_json_dumps(value)
+
+    truncated = _gentrace_json_dumps(value, max_bytes=200)
+
+    assert len(truncated) <= 200
+    parsed = json.loads(truncated)
+    assert parsed[TRUNCATED_VALUE_MARKER] is True
+    assert parsed["original_bytes"] == len(full.encode("utf-8"))
+    assert full.startswith(parsed["preview"])
+    assert parsed["preview"]
+
+
+def test_json_dumps_truncation_counts_bytes_of_non_ascii_text() -> None:
+    value = {"text": "\u00e9" * 1000}
+    truncated = json.loads(_gentrace_json_dumps(value, max_bytes=100))
+    assert truncated["original_bytes"] == len(_gentrace_json_dumps(value))
+
+
+def test_event_payloads_use_configured_limit(serialization_limits: None) -> None:
+    _ = serialization_limits
+    set_serialization_limits(max_event_bytes=100)
+    assert json.loads(_gentrace_event_json_dumps(["y" * 500]))[TRUNCATED_VALUE_MARKER] is True
+
+    set_serialization_limits(max_event_bytes=None)
+    assert _gentrace_event_json_dumps(["y" * 500]) == json.dumps(["y" * 500])
+
+
+def test_size_limits_are_off_by_default(serialization_limits: None) -> None:
+    _ = serialization_limits
+    large = "y" * (2 * 1024 * 1024)
+
+    assert _gentrace_event_json_dumps([large]) == json.dumps([large])
+    assert gentrace_format_otel_value(large) == large
+
+
+def test_attribute_values_use_configured_limit(serialization_limits: None) -> None:
+    _ = serialization_limits
+    set_serialization_limits(max_attribute_bytes=64)
+
+    long_string = gentrace_format_otel_value("z" * 1000)
+    assert isinstance(long_string, str)
+    assert len(long_string.encode("utf-8")) <= 64
+    assert long_string.endswith(f"[{TRUNCATED_VALUE_MARKER}: original 1000 bytes]")
+
+    assert gentrace_format_otel_value("short") == "short"
+    assert json.loads(str(gentrace_format_otel_value({"k": "v" * 1000})))["original_bytes"] > 1000
+
+
+def test_attribute_truncation_never_exceeds_tiny_limits(serialization_limits: None) -> None:
+    _ = serialization_limits
+    for limit in (1, 10, 40):
+        set_serialization_limits(max_attribute_bytes=limit)
+        for value in ("z" * 1000, "\u00e9" * 1000):
+            truncated = gentrace_format_otel_value(value)
+            assert isinstance(truncated, str)
+            assert len(truncated.encode("utf-8")) <= limit
+
+
+def test_invalid_serialization_limits_are_rejected() -> None:
+    with pytest.raises(ValueError):
+        set_serialization_limits(max_event_bytes=0)
@@ -0,0 +1,164 @@
+import json
+import asyncio
+from typing import Any, List, Iterator, Sequence
+from pathlib import Path
+from dataclasses import dataclass
+from unittest.mock import patch
+from typing_extensions import override
+
+import pytest
+from pydantic import BaseModel
+from opentelemetry.sdk.trace import ReadableSpan, TracerProvider
+from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult, SimpleSpanProcessor
+
+import gentrace.lib.memo_cache as memo_cache_module
+from gentrace.lib.traced import traced
+from gentrace.lib.constants import ATTR_GENTRACE_CACHE_HIT, ATTR_GENTRACE_FN_OUTPUT_EVENT_NAME
+from gentrace.lib.memo_cache import MemoCache, memo_key
+
+
+class CollectingExporter(SpanExporter):
+    def __init__(self) -> None:
+        self.spans: List[ReadableSpan] = []
+
+    @override
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        self.spans.extend(spans)
+        return SpanExportResult.SUCCESS
+
+
+@pytest.fixture
+def collector() -> Iterator[CollectingExporter]:
+    exporter = CollectingExporter()
+    tracer_provider = TracerProvider()
+    tracer_provider.add_span_processor(SimpleSpanProcessor(exporter))
+    with patch("gentrace.lib.traced.trace.get_tracer", return_value=tracer_provider.get_tracer("gentrace")):
+        yield exporter
+
+
+class Prompt(BaseModel):
+    text: str
+    temperature: float = 0.0
+
+
+@dataclass
+class Options:
+    model: str
+
+
+def test_memo_key_is_stable_and_content_addressed() -> None:
+    key = memo_key("fn", {"prompt": Prompt(text="hi"), "params": {"b": 1, "a": {2, 1}}})
+    assert key == memo_key("fn", {"params": {"a": {1, 2}, "b": 1}, "prompt": Prompt(text="hi")})
+    assert key != memo_key("fn", {"prompt": Prompt(text="hello"), "params": {"b": 1, "a": {2, 1}}})
+    assert key != memo_key("other_fn", {"prompt": Prompt(text="hi"), "params": {"b": 1, "a": {2, 1}}})
+    assert memo_key("fn", {"options": Options(model="m")}) == memo_key("fn", {"options": Options(model="m")})
+    # Objects without a canonical encoding are not cacheable
+    assert memo_key("fn", {"client": object()}) is None
+
+
+def test_memory_tier_is_lru() -> None:
+    cache = MemoCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == (True, 1)
+    cache.set("c", 3)
+    assert cache.get("b") == (False, None)
+    assert cache.get("a") == (True, 1)
+    assert cache.get("c") == (True, 3)
+
+
+def test_entries_expire_after_ttl(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [1000.0]
+    monkeypatch.setattr(memo_cache_module, "time", lambda: now[0])
+    cache = MemoCache(path=str(tmp_path / "memo.db"), ttl_seconds=60)
+    cache.set("key", "value")
+    now[0] += 59
+    assert cache.get("key") == (True, "value")
+    now[0] += 2
+    assert cache.get("key") == (False, None)
+
+    # Expired entries on disk are not returned either
+    reopened = MemoCache(path=str(tmp_path / "memo.db"), ttl_seconds=60)
+    assert reopened.get("key") == (False, None)
+
+
+def test_disk_tier_persists_and_evicts_least_recently_used(tmp_path: Path) -> None:
+    path = str(tmp_path / "memo.db")
+    cache = MemoCache(max_entries=0, path=path, max_disk_bytes=2500)
+    cache.set("first", "x" * 1000)
+    cache.set("second", "y" * 1000)
+    assert cache.get("first")[0]
+    cache.set("third", "z" * 1000)
+    cache.close()
+
+    reopened = MemoCache(path=path, max_disk_bytes=2500)
+    assert reopened.get("first") == (True, "x" * 1000)
+    assert reopened.get("second") == (False, None)
+    assert reopened.get("third") == (True, "z" * 1000)
+
+
+def test_traced_sync_function_returns_cached_result(collector: CollectingExporter) -> None:
+    calls: List[str] = []
+
+    @traced(cache=MemoCache())
+    def complete(prompt: str, temperature: float = 0.0) -> str:
+        calls.append(prompt)
+        return prompt.upper() if temperature == 0.0 else prompt
+
+    assert complete("hi") == "HI"
+    assert complete(prompt="hi", temperature=0.0) == "HI"
+    assert complete("other") == "OTHER"
+    assert complete("hi", 1.0) == "hi"
+
+    assert calls == ["hi", "other", "hi"]
+    assert [span.attributes[ATTR_GENTRACE_CACHE_HIT] for span in collector.spans] == [False, True, False, False]  # type: ignore[index]
+    # A hit still records the output on its span
+    (output_event,) = [event for event in collector.spans[1].events if event.name == ATTR_GENTRACE_FN_OUTPUT_EVENT_NAME]
+    assert json.loads(str(output_event.attributes["output"])) == "HI"  # type: ignore[index]
+
+
+@pytest.mark.asyncio
+async def test_traced_async_function_returns_cached_result(collector: CollectingExporter) -> None:
+    calls: List[Prompt] = []
+
+    @traced(cache=MemoCache())
+    async def complete(prompt: Prompt) -> str:
+        calls.append(prompt)
+        await asyncio.sleep(0)
+        return prompt.text[::-1]
+
+    assert [await complete(Prompt(text="abc")), await complete(Prompt(text="abc"))] == ["cba", "cba"]
+    assert len(calls) == 1
+    assert [span.attributes[ATTR_GENTRACE_CACHE_HIT] for span in collector.spans] == [False, True]  # type: ignore[index]
+
+
+def test_exceptions_and_uncacheable_arguments_are_not_cached(collector: CollectingExporter) -> None:
+    calls: List[Any] = []
+
+    @traced(cache=MemoCache())
+    def flaky(value: Any) -> Any:
+        calls.append(value)
+        if len(calls) == 1:
+            raise RuntimeError("first call fails")
+        return value
+
+    with pytest.raises(RuntimeError):
+        flaky(1)
+    assert flaky(1) == 1
+    assert flaky(1) == 1
+
+    unhashable = object()
+    assert flaky(unhashable) is unhashable
+    assert flaky(unhashable) is unhashable
+
+    assert calls == [1, 1, unhashable, unhashable]
+    # Calls that cannot be cached are not marked either way
+    assert ATTR_GENTRACE_CACHE_HIT not in (collector.spans[-1].attributes or {})
+
+
+def test_cache_is_rejected_for_generators() -> None:
+    with pytest.raises(ValueError, match="generator"):
+
+        @traced(cache=MemoCache())
+        def stream() -> Iterator[int]:
+            yield 1
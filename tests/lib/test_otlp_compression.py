@@ -0,0 +1,111 @@
+import os
+import gzip
+import zlib
+from typing import Dict
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+from opentelemetry.sdk.trace.export import SpanExportResult
+
+from gentrace.lib.otlp_compression import (
+    Compression,
+    AdaptiveCompressor,
+    zstd_available,
+    compress_payload,
+    resolve_compression,
+)
+from gentrace.lib.vendored_otlp_exporter import GentraceVendoredOTLPSpanExporter
+
+PAYLOAD = b'{"prompt": "Summarize the following document."}' * 200
+
+
+def test_gzip_and_deflate_round_trip_at_configured_level() -> None:
+    fast = compress_payload(PAYLOAD, Compression.Gzip, 1)
+    best = compress_payload(PAYLOAD, Compression.Gzip, 9)
+    assert gzip.decompress(fast) == PAYLOAD
+    assert gzip.decompress(best) == PAYLOAD
+    assert len(best) <= len(fast)
+
+    assert zlib.decompress(compress_payload(PAYLOAD, Compression.Deflate)) == PAYLOAD
+    assert compress_payload(PAYLOAD, Compression.NoCompression) is PAYLOAD
+
+
+def test_gzip_output_is_deterministic() -> None:
+    assert compress_payload(PAYLOAD, Compression.Gzip) == compress_payload(PAYLOAD, Compression.Gzip)
+
+
+@pytest.mark.skipif(zstd_available(), reason="zstandard is installed")
+def test_zstd_falls_back_to_gzip_without_zstandard() -> None:
+    assert resolve_compression(Compression.Zstd) == Compression.Gzip
+
+
+@pytest.mark.skipif(not zstd_available(), reason="zstandard is not installed")
+def test_zstd_round_trip() -> None:
+    import zstandard  # type: ignore[import-not-found, import-untyped, unused-ignore]
+
+    compressed = compress_payload(PAYLOAD, Compression.Zstd)
+    assert zstandard.ZstdDecompressor().decompress(compressed) == PAYLOAD
+
+
+def test_adaptive_skips_small_payloads() -> None:
+    compressor = AdaptiveCompressor(min_bytes=1024)
+    data, codec = compressor.compress(b"x" * 100)
+    assert codec == Compression.NoCompression
+    assert data == b"x" * 100
+    assert compressor.codec_stats() == {}
+
+
+def test_adaptive_picks_a_codec_for_compressible_payloads() -> None:
+    compressor = AdaptiveCompressor(min_bytes=0, probe_interval=10, bandwidth_bytes_per_second=1024 * 1024)
+    for _ in range(5):
+        data, codec = compressor.compress(PAYLOAD)
+        assert codec in compressor.candidates
+        assert len(data) < len(PAYLOAD)
+    assert set(compressor.codec_stats()) == set(compressor.candidates)
+
+
+def test_adaptive_sends_incompressible_payloads_uncompressed() -> None:
+    compressor = AdaptiveCompressor(min_bytes=0, bandwidth_bytes_per_second=1024 * 1024)
+    random_bytes = os.urandom(64 * 1024)
+    for _ in range(3):
+        data, codec = compressor.compress(random_bytes)
+    assert codec == Compression.NoCompression
+    assert data is random_bytes
+
+
+def test_exporter_sets_content_encoding_per_batch() -> None:
+    received: Dict[str, bytes] = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        received[request.headers.get("Content-Encoding", "none")] = request.content
+        return httpx.Response(200)
+
+    exporter = GentraceVendoredOTLPSpanExporter(
+        endpoint="http://collector.test/v1/traces",
+        compression=Compression.Gzip,
+        compression_level=1,
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+    with patch.object(exporter, "_encode_chunks") as encode:
+        encode.return_value = [MagicMock()]
+        encode.return_value[0].SerializePartialToString.return_value = PAYLOAD
+        assert exporter.export([]) == SpanExportResult.SUCCESS
+    exporter.shutdown()
+
+    assert gzip.decompress(received["gzip"]) == PAYLOAD
+
+
+def test_adaptive_compression_uses_the_configured_level() -> None:
+    exporter = GentraceVendoredOTLPSpanExporter(
+        endpoint="http://collector.test/v1/traces", compression=Compression.Adaptive, compression_level=1
+    )
+    compressor = exporter._adaptive_compressor
+    assert compressor is not None
+    assert compressor._levels[Compression.Gzip] == compressor._levels[Compression.Zstd] == 1
+    exporter.shutdown()
+
+    with pytest.raises(ValueError, match="compression_level"):
+        GentraceVendoredOTLPSpanExporter(
+            endpoint="http://collector.test/v1/traces", compression=Compression.Adaptive, compression_level=12
+        )
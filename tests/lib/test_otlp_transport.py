@@ -0,0 +1,118 @@
+import asyncio
+from typing import List
+from unittest.mock import patch
+
+import httpx
+from opentelemetry.sdk.trace.export import SpanExportResult
+
+from gentrace.lib.otlp_transport import OTLPResponse, HttpxOTLPTransport, get_shared_http_client
+from gentrace.lib.custom_otlp_exporter import GentraceOTLPSpanExporter
+from gentrace.lib.vendored_otlp_exporter import GentraceVendoredOTLPSpanExporter
+
+ENDPOINT = "http://collector.test/v1/traces"
+
+
+def _client(transport: httpx.MockTransport) -> httpx.Client:
+    return httpx.Client(transport=transport)
+
+
+def test_exporter_posts_through_shared_client_and_leaves_it_open() -> None:
+    requests_seen: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests_seen.append(request)
+        return httpx.Response(200)
+
+    shared = _client(httpx.MockTransport(handler))
+    exporter = GentraceVendoredOTLPSpanExporter(
+        endpoint=ENDPOINT, headers={"Authorization": "Bearer key"}, http_client=shared
+    )
+
+    assert exporter.export([]) == SpanExportResult.SUCCESS
+    exporter.shutdown()
+
+    assert len(requests_seen) == 1
+    assert requests_seen[0].headers["Content-Type"] == "application/x-protobuf"
+    assert requests_seen[0].headers["Authorization"] == "Bearer key"
+    assert not shared.is_closed
+    shared.close()
+
+
+def test_dedicated_client_is_closed_on_shutdown() -> None:
+    transport = HttpxOTLPTransport()
+    transport.close()
+    assert transport._client.is_closed
+
+
+def test_closed_shared_client_falls_back_to_a_dedicated_pool() -> None:
+    shared = httpx.Client()
+    shared.close()
+    transport = HttpxOTLPTransport(shared)
+
+    with patch.object(httpx.Client, "post", return_value=httpx.Response(200)):
+        assert transport.post(ENDPOINT, b"", {}, 1.0).ok
+
+    assert transport._client is not shared
+    transport.close()
+
+
+def test_connection_errors_are_retried() -> None:
+    attempts: List[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(200)
+
+    exporter = GentraceVendoredOTLPSpanExporter(
+        endpoint=ENDPOINT, http_client=_client(httpx.MockTransport(handler)), timeout=5
+    )
+    with patch("gentrace.lib.vendored_otlp_exporter.random.uniform", return_value=0.01):
+        assert exporter.export([]) == SpanExportResult.SUCCESS
+    assert len(attempts) == 2
+    exporter.shutdown()
+
+
+def test_export_async_uses_async_client_and_checks_partial_success() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.headers["Content-Type"] == "application/x-protobuf"
+        return httpx.Response(
+            200,
+            headers={"content-type": "application/json"},
+            json={"partialSuccess": {"rejectedSpans": 1, "errorMessage": "bad span"}},
+        )
+
+    async def run() -> SpanExportResult:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as async_client:
+            exporter = GentraceOTLPSpanExporter(endpoint=ENDPOINT, async_http_client=async_client)
+            try:
+                with patch("gentrace.lib.custom_otlp_exporter.display_gentrace_warning") as warn:
+                    result = await exporter.export_async([])
+                warn.assert_called_once()
+                return result
+            finally:
+                await exporter.aclose()
+                exporter.shutdown()
+
+    assert asyncio.run(run()) == SpanExportResult.SUCCESS
+
+
+def test_otlp_response_adapters() -> None:
+    response = OTLPResponse.from_httpx(httpx.Response(503, content=b"busy"))
+    assert not response.ok
+    assert response.status_code == 503
+    assert response.reason == "Service Unavailable"
+    assert response.text == "busy"
+
+
+def test_get_shared_http_client() -> None:
+    class FakeGentrace:
+        def __init__(self, client: object) -> None:
+            self._client = client
+
+    http_client = httpx.Client()
+    assert get_shared_http_client(FakeGentrace(http_client)) is http_client
+    assert get_shared_http_client(FakeGentrace(object())) is None
+    assert get_shared_http_client(object()) is None
+    http_client.close()
@@ -217,6 +217,17 @@ class TestSimpleProgressReporter:
         assert reporter.current == 2
         mock_logger.info.assert_called_with('[2/3] Running test case: "Test Case 2"')
 
+    def test_unknown_total(self) -> None:
+        """Test progress output when the number of test cases is not known up front."""
+        mock_logger = Mock(spec=logging.Logger)
+        reporter = SimpleProgressReporter(logger=mock_logger)
+
+        reporter.start("pipeline-123", None)
+        mock_logger.info.assert_called_once_with("\nRunning experiment...")
+
+        reporter.increment("Test Case 1")
+        mock_logger.info.assert_called_with('[1] Running test case: "Test Case 1"')
+
     def test_stop(self) -> None:
         """Test stopping the reporter."""
         mock_logger = Mock(spec=logging.Logger)
@@ -0,0 +1,83 @@
+import asyncio
+from typing import Any, Dict, Optional
+
+import pytest
+
+from gentrace.lib.retry_policy import RetryBudget, EvalRetryPolicy, is_transient_error, retry_after_seconds
+
+
+class _Response:
+    def __init__(self, status_code: int, headers: Optional[Dict[str, str]] = None) -> None:
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class APIStatusError(Exception):
+    def __init__(self, status_code: int, headers: Optional[Dict[str, str]] = None) -> None:
+        super().__init__(f"HTTP {status_code}")
+        self.response = _Response(status_code, headers)
+
+
+class APIConnectionError(Exception):
+    pass
+
+
+def test_transient_errors_are_classified() -> None:
+    assert is_transient_error(APIStatusError(429))
+    assert is_transient_error(APIStatusError(503))
+    assert is_transient_error(APIStatusError(408))
+    assert is_transient_error(TimeoutError())
+    assert is_transient_error(asyncio.TimeoutError())
+    assert is_transient_error(ConnectionResetError())
+    assert is_transient_error(APIConnectionError())
+
+    assert not is_transient_error(APIStatusError(400))
+    assert not is_transient_error(ValueError("bad prompt"))
+
+
+def test_retry_after_header_is_parsed() -> None:
+    assert retry_after_seconds(APIStatusError(429, {"retry-after": "2.5"})) == 2.5
+    assert retry_after_seconds(APIStatusError(429, {"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"})) is None
+    assert retry_after_seconds(ValueError()) is None
+
+
+def test_budget_allows_minimum_plus_ratio_of_cases() -> None:
+    budget = RetryBudget(ratio=0.5, min_retries=1)
+    assert budget.try_spend()
+    assert not budget.try_spend()
+    budget.record_case()
+    budget.record_case()
+    assert budget.try_spend()
+    assert not budget.try_spend()
+
+
+def test_backoff_grows_exponentially_up_to_the_cap() -> None:
+    policy = EvalRetryPolicy(
+        {"max_attempts": 10, "initial_backoff": 1, "max_backoff": 5, "jitter": False, "budget_min_retries": 100}
+    )
+    error = TimeoutError()
+    assert [policy.retry_delay(error, attempt) for attempt in range(1, 6)] == [1, 2, 4, 5, 5]
+    assert policy.retry_delay(error, 10) is None
+    assert policy.retry_delay(ValueError(), 1) is None
+    # A retry that could not start before the case times out is not made
+    assert policy.retry_delay(error, 3, remaining=3.0) is None
+
+
+def test_jitter_and_retry_after_bound_the_delay() -> None:
+    policy = EvalRetryPolicy({"initial_backoff": 1, "max_backoff": 10, "budget_min_retries": 100})
+    delays = [policy.retry_delay(TimeoutError(), 1) for _ in range(50)]
+    assert all(delay is not None and 0 <= delay <= 1 for delay in delays)
+    assert len(set(delays)) > 1
+    assert policy.retry_delay(APIStatusError(429, {"retry-after": "3"}), 1) == 3
+    assert policy.retry_delay(APIStatusError(429, {"retry-after": "60"}), 1) == 10
+
+
+def test_custom_classifier_and_invalid_options() -> None:
+    policy = EvalRetryPolicy({"retry_on": lambda error: isinstance(error, KeyError), "jitter": False})
+    assert policy.retry_delay(KeyError("x"), 1) == 0.5
+    assert policy.retry_delay(TimeoutError(), 1) is None
+
+    invalid: Dict[str, Any]
+    for invalid in ({"max_attempts": 0}, {"initial_backoff": -1}, {"backoff_multiplier": 0.5}, {"budget_ratio": -1}):
+        with pytest.raises(ValueError):
+            EvalRetryPolicy(invalid)  # type: ignore[arg-type]
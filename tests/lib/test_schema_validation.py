@@ -0,0 +1,75 @@
+import sys
+from typing import Any, Dict, List
+from typing_extensions import TypedDict
+
+import pytest
+from pydantic import BaseModel
+
+from gentrace.lib.utils import is_pydantic_v1
+from gentrace.lib.schema_validation import SchemaValidator, get_schema_validator
+
+pytestmark = pytest.mark.skipif(is_pydantic_v1(), reason="Batch validation requires Pydantic v2")
+
+
+class QueryModel(BaseModel):
+    query: str
+    limit: int = 10
+
+
+class QueryDict(TypedDict):
+    query: str
+    limit: int
+
+
+def test_validator_is_compiled_once_per_schema() -> None:
+    assert get_schema_validator(QueryModel) is get_schema_validator(QueryModel)
+    assert get_schema_validator(QueryDict) is get_schema_validator(QueryDict)
+    assert get_schema_validator(QueryModel) is not get_schema_validator(QueryDict)
+
+
+def test_validate_model_and_typeddict() -> None:
+    assert get_schema_validator(QueryModel).validate({"query": "a"}) == (True, {"query": "a", "limit": 10}, None)
+    assert get_schema_validator(QueryDict).validate({"query": "a", "limit": "3"}) == (
+        True,
+        {"query": "a", "limit": 3},
+        None,
+    )
+
+    is_valid, data, error = get_schema_validator(QueryDict).validate({"query": "a"})
+    assert (is_valid, data) == (False, None)
+    assert error is not None and "limit" in error
+
+
+@pytest.mark.parametrize("schema", [QueryModel, QueryDict])
+def test_validate_many_matches_validate(schema: Any) -> None:
+    validator = get_schema_validator(schema)
+    valid: List[Dict[str, Any]] = [{"query": str(i), "limit": i} for i in range(5)]
+    mixed = [*valid, {"query": 1}]
+
+    assert validator.validate_many(valid) == [validator.validate(inputs) for inputs in valid]
+    assert validator.validate_many(mixed) == [validator.validate(inputs) for inputs in mixed]
+    assert validator.validate_many([]) == []
+
+
+def test_non_model_schema_passes_inputs_through() -> None:
+    class NotAModel:
+        pass
+
+    validator = SchemaValidator(NotAModel)
+    assert validator.validate({"query": "a"}) == (True, {"query": "a"}, None)
+    assert validator.validate_many([{"query": "a"}]) == [(True, {"query": "a"}, None)]
+
+
+@pytest.mark.skipif(sys.version_info >= (3, 12), reason="typing.TypedDict is supported by Pydantic on 3.12+")
+def test_typing_typeddict_error_is_reported_per_case() -> None:
+    import typing
+
+    class LegacyDict(typing.TypedDict):
+        query: str
+
+    validator = SchemaValidator(LegacyDict)
+    assert validator.validate({"query": "a"}) == (
+        False,
+        None,
+        "TypedDict must be imported from typing_extensions, not typing module",
+    )
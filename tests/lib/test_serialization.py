@@ -0,0 +1,148 @@
+import json
+from uuid import UUID
+from typing import Any, Dict, List, Optional
+from datetime import datetime
+
+import pytest
+from pydantic import BaseModel
+
+from gentrace.lib.serialization import (
+    TRUNCATED_ITEMS_KEY,
+    MAX_DEPTH_PLACEHOLDER,
+    TRUNCATED_VALUE_MARKER,
+    GentraceJSONSerializer,
+    _encoded_size,
+    orjson_available,
+)
+
+
+class Message(BaseModel):
+    role: str
+    content: str
+    created_at: datetime
+    id: Optional[UUID] = None
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"text": 'quote " backslash \\ newline \n tab \t'},
+        ["é中", "\U0001f600", "\x00\x1f\x7f"],
+        {1: "int key", 2.5: "float key", None: "none key", True: "bool key"},
+        [1.5, -0.0, 10**30, float("inf"), [], {}],
+    ],
+)
+def test_output_and_encoded_size_match_json_dumps(value: Any) -> None:
+    serializer = GentraceJSONSerializer()
+
+    assert serializer.dumps(value) == json.dumps(value)
+    assert _encoded_size(serializer.sanitize(value)) == len(json.dumps(value))
+
+
+def test_max_depth_replaces_deeper_containers() -> None:
+    serializer = GentraceJSONSerializer(max_depth=2)
+    assert json.loads(serializer.dumps({"a": {"b": {"c": 1}}, "d": [1]})) == {
+        "a": {"b": MAX_DEPTH_PLACEHOLDER},
+        "d": [1],
+    }
+
+
+def test_max_items_records_the_number_of_omitted_items() -> None:
+    serializer = GentraceJSONSerializer(max_items=3)
+
+    assert json.loads(serializer.dumps(list(range(10)))) == [0, 1, 2, "[7 more items]"]
+    assert json.loads(serializer.dumps({str(i): i for i in range(5)})) == {
+        "0": 0,
+        "1": 1,
+        "2": 2,
+        TRUNCATED_ITEMS_KEY: "[2 more items]",
+    }
+
+
+def test_deeply_nested_cycle_does_not_recurse_past_max_depth() -> None:
+    node: Dict[str, Any] = {}
+    root = node
+    for _ in range(5000):
+        child: Dict[str, Any] = {}
+        node["next"] = child
+        node = child
+
+    assert MAX_DEPTH_PLACEHOLDER in GentraceJSONSerializer().dumps(root)
+
+
+def test_pydantic_models_keep_the_model_dump_format() -> None:
+    created_at = datetime(2024, 1, 2, 3, 4, 5)
+    message_id = UUID("12345678-1234-5678-1234-567812345678")
+    messages: List[Any] = [Message(role="user", content="hi", created_at=created_at, id=message_id)]
+
+    assert GentraceJSONSerializer().dumps(messages) == json.dumps(
+        [model.model_dump() for model in messages], default=str
+    )
+    assert json.loads(GentraceJSONSerializer().dumps(messages))[0]["created_at"] == "2024-01-02 03:04:05"
+
+
+@pytest.mark.skipif(not orjson_available(), reason="orjson is not installed")
+def test_orjson_output_is_limited_in_utf8_bytes() -> None:
+    serializer = GentraceJSONSerializer(backend="orjson", max_bytes=100)
+    # 92 characters with the quotes is under the limit, but 182 bytes in UTF-8
+    text = serializer.dumps("\u00e9" * 90)
+
+    assert len(text.encode("utf-8")) <= 100
+    assert json.loads(text)[TRUNCATED_VALUE_MARKER] is True
+
+
+def test_truncation_only_encodes_the_preview() -> None:
+    value = ["x" * 100_000, {"nested": list(range(1000))}]
+    serializer = GentraceJSONSerializer(max_bytes=256)
+
+    truncated = json.loads(serializer.dumps(value))
+
+    assert truncated[TRUNCATED_VALUE_MARKER] is True
+    assert truncated["original_bytes"] == len(json.dumps(value))
+    assert json.dumps(value).startswith(truncated["preview"])
+    assert len(serializer.dumps(value)) <= 256
+
+
+def test_orjson_backend_falls_back_when_not_installed() -> None:
+    serializer = GentraceJSONSerializer(backend="orjson")
+    value = {"a": [1, "b"]}
+
+    assert json.loads(serializer.dumps(value)) == value
+    assert serializer.backend == ("orjson" if orjson_available() else "json")
+
+
+def test_dumps_arguments_matches_the_single_key_object_format() -> None:
+    serializer = GentraceJSONSerializer()
+    shared = {"k": "v"}
+    arguments = [("prompt", "hi"), ("options", shared), ("again", shared)]
+
+    assert serializer.dumps_arguments(arguments) == serializer.dumps([{name: value} for name, value in arguments])
+    assert json.loads(serializer.dumps_arguments([("text", "x" * 1000)], max_bytes=100))[TRUNCATED_VALUE_MARKER]
+
+
+def test_invalid_limits_are_rejected() -> None:
+    with pytest.raises(ValueError):
+        GentraceJSONSerializer(max_depth=0)
+    with pytest.raises(ValueError):
+        GentraceJSONSerializer(max_bytes=0)
+
+
+def test_truncation_stops_converting_once_the_preview_is_complete() -> None:
+    value = [{"index": i} for i in range(10_000)]
+
+    partial, min_size = GentraceJSONSerializer()._convert(value, 0, set(), 256)
+
+    assert min_size > 256
+    assert len(partial) < 50
+
+
+@pytest.mark.parametrize("max_bytes", range(60, 140, 7))
+def test_truncation_preview_is_a_prefix_of_the_full_output(max_bytes: int) -> None:
+    value = {"k": True, "kk": ["x" * 100, {"nested": "é" * 50}], 1: [None] * 20}
+    serializer = GentraceJSONSerializer()
+    full = serializer.dumps(value)
+
+    truncated = json.loads(serializer.dumps(value, max_bytes=max_bytes))
+
+    assert truncated["original_bytes"] == len(full)
+    assert full.startswith(truncated["preview"])
@@ -0,0 +1,233 @@
+import os
+import time
+from typing import List
+from pathlib import Path
+from unittest.mock import Mock, MagicMock, patch
+
+import pytest
+import requests
+from opentelemetry.sdk.trace.export import SpanExportResult
+
+from gentrace.lib.span_spool import GentraceSpanSpool
+from gentrace.lib.vendored_otlp_exporter import GentraceVendoredOTLPSpanExporter
+
+
+def _segments(directory: Path) -> List[str]:
+    return sorted(name for name in os.listdir(directory) if name.endswith((".seg", ".open")))
+
+
+def test_appended_payloads_are_replayed_in_order(tmp_path: Path) -> None:
+    spool = GentraceSpanSpool(str(tmp_path))
+    spool.append(b"first")
+    spool.append(b"second")
+
+    sent: List[bytes] = []
+    assert spool.replay(lambda payload: sent.append(payload) or True)
+
+    assert sent == [b"first", b"second"]
+    assert spool.replayed_payloads == 2
+    assert _segments(tmp_path) == []
+    spool.close()
+
+
+def test_replay_stops_when_endpoint_is_unavailable_and_resumes_after_restart(tmp_path: Path) -> None:
+    spool = GentraceSpanSpool(str(tmp_path))
+    for payload in (b"a", b"b", b"c"):
+        spool.append(payload)
+
+    sent: List[bytes] = []
+
+    def send_until_b(payload: bytes) -> bool:
+        if payload == b"b":
+            return False
+        sent.append(payload)
+        return True
+
+    assert not spool.replay(send_until_b)
+    assert sent == [b"a"]
+    spool.close()
+
+    # A new process picks up after the last delivered record
+    restarted = GentraceSpanSpool(str(tmp_path))
+    assert restarted.replay(lambda payload: sent.append(payload) or True)
+    assert sent == [b"a", b"b", b"c"]
+    restarted.close()
+
+
+def test_segments_rotate_at_size_limit(tmp_path: Path) -> None:
+    spool = GentraceSpanSpool(str(tmp_path), max_segment_bytes=32, max_bytes=1024)
+    for _ in range(4):
+        spool.append(b"x" * 20)
+
+    segments = _segments(tmp_path)
+    assert len(segments) == 4
+    assert sum(name.endswith(".open") for name in segments) == 1
+    spool.close()
+    assert all(name.endswith(".seg") for name in _segments(tmp_path))
+
+
+def test_unsealed_segment_with_torn_tail_is_recovered(tmp_path: Path) -> None:
+    spool = GentraceSpanSpool(str(tmp_path))
+    spool.append(b"complete")
+    # Simulate a crash in the middle of writing the next record
+    open_segment = tmp_path / _segments(tmp_path)[0]
+    with open(open_segment, "ab") as f:
+        f.write(b"\xff\x00\x00\x00partial")
+
+    recovered = GentraceSpanSpool(str(tmp_path))
+    sent: List[bytes] = []
+    assert recovered.replay(lambda payload: sent.append(payload) or True)
+    assert sent == [b"complete"]
+    recovered.close()
+
+
+def test_oldest_segments_are_evicted_over_size_cap(tmp_path: Path) -> None:
+    spool = GentraceSpanSpool(str(tmp_path), max_segment_bytes=32, max_bytes=64)
+    for i in range(5):
+        spool.append(bytes([i]) * 20)
+
+    assert spool.evicted_payloads == 3
+    assert spool.pending_bytes() <= 64
+
+    sent: List[bytes] = []
+    spool.replay(lambda payload: sent.append(payload) or True)
+    assert sent == [bytes([3]) * 20, bytes([4]) * 20]
+    spool.close()
+
+
+def test_expired_segments_are_evicted(tmp_path: Path) -> None:
+    spool = GentraceSpanSpool(str(tmp_path), max_age_seconds=60)
+    spool.append(b"stale")
+    spool.close()
+
+    stale_time = time.time() - 120
+    for name in _segments(tmp_path):
+        os.utime(tmp_path / name, (stale_time, stale_time))
+
+    sent: List[bytes] = []
+    spool = GentraceSpanSpool(str(tmp_path), max_age_seconds=60)
+    assert spool.replay(lambda payload: sent.append(payload) or True)
+    assert sent == []
+    assert spool.evicted_payloads == 1
+    spool.close()
+
+
+def test_replay_cursor_is_not_synced_per_record(tmp_path: Path) -> None:
+    spool = GentraceSpanSpool(str(tmp_path), max_segment_bytes=1024 * 1024)
+    for i in range(200):
+        spool.append(b"payload-%d" % i)
+
+    sent: List[bytes] = []
+    with patch("gentrace.lib.span_spool.os.fsync", wraps=os.fsync) as fsync:
+        assert spool.replay(lambda payload: sent.append(payload) or True)
+
+    assert len(sent) == 200
+    assert fsync.call_count < 10
+    spool.close()
+
+
+def test_eviction_skips_segment_being_replayed(tmp_path: Path) -> None:
+    spool = GentraceSpanSpool(str(tmp_path), max_segment_bytes=100, max_bytes=200)
+    for i in range(3):
+        spool.append(bytes([i]) * 20)
+
+    sent: List[bytes] = []
+
+    def send(payload: bytes) -> bool:
+        if not sent:
+            # New spans spooled during replay push the spool over its size cap
+            for j in range(8):
+                spool.append(bytes([100 + j]) * 20)
+        sent.append(payload)
+        return True
+
+    assert spool.replay(send)
+
+    # The segment being replayed is delivered in full; newer segments are evicted instead
+    assert sent == [bytes([i]) * 20 for i in range(3)]
+    assert spool.evicted_payloads == 6
+    spool.close()
+
+
+def test_evicted_segment_counts_only_records_not_yet_replayed(tmp_path: Path) -> None:
+    spool = GentraceSpanSpool(str(tmp_path), max_segment_bytes=100, max_bytes=200)
+    for i in range(3):
+        spool.append(bytes([i]) * 20)
+
+    # The endpoint goes down again after the first record
+    sent: List[bytes] = []
+    assert not spool.replay(lambda payload: not sent and (sent.append(payload) or True))
+
+    for j in range(6):
+        spool.append(bytes([100 + j]) * 20)
+
+    assert spool.evicted_payloads == 2
+    spool.close()
+
+
+def test_invalid_limits_are_rejected(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        GentraceSpanSpool(str(tmp_path), max_segment_bytes=100, max_bytes=10)
+
+
+class TestExporterSpooling:
+    def _exporter(self, spool: GentraceSpanSpool) -> GentraceVendoredOTLPSpanExporter:
+        # A short timeout keeps connection-error retries from backing off for long
+        return GentraceVendoredOTLPSpanExporter(endpoint="http://localhost:4318/v1/traces", spool=spool, timeout=0.5)
+
+    def test_unreachable_endpoint_spools_payload_and_replay_delivers_it(self, tmp_path: Path) -> None:
+        spool = GentraceSpanSpool(str(tmp_path), replay_interval_seconds=3600)
+        exporter = self._exporter(spool)
+
+        mock_proto = MagicMock()
+        mock_proto.SerializePartialToString.return_value = b"serialized"
+        with patch.object(exporter, "_encode_chunks", return_value=[mock_proto]), patch.object(
+            exporter, "_send_request", side_effect=requests.exceptions.ConnectionError("down")
+        ):
+            assert exporter.export([Mock()]) == SpanExportResult.FAILURE
+
+        assert spool.pending_bytes() > 0
+
+        ok_response = Mock(ok=True, content=b"")
+        with patch.object(exporter, "_send_request", return_value=ok_response) as send:
+            assert spool.replay(exporter._replay_spooled)
+        send.assert_called_once()
+        assert send.call_args[0][0] == b"serialized"
+        assert spool.pending_bytes() == 0
+
+        exporter.shutdown()
+
+    def test_non_retryable_errors_are_not_spooled(self, tmp_path: Path) -> None:
+        spool = GentraceSpanSpool(str(tmp_path), replay_interval_seconds=3600)
+        exporter = self._exporter(spool)
+
+        mock_proto = MagicMock()
+        mock_proto.SerializePartialToString.return_value = b"serialized"
+        bad_request = Mock(ok=False, status_code=400, text="bad request")
+        with patch.object(exporter, "_encode_chunks", return_value=[mock_proto]), patch.object(
+            exporter, "_send_request", return_value=bad_request
+        ):
+            assert exporter.export([Mock()]) == SpanExportResult.FAILURE
+
+        assert spool.pending_bytes() == 0
+        exporter.shutdown()
+
+    def test_unexpected_errors_are_not_spooled_or_replayed_again(self, tmp_path: Path) -> None:
+        spool = GentraceSpanSpool(str(tmp_path), replay_interval_seconds=3600)
+        exporter = self._exporter(spool)
+
+        mock_proto = MagicMock()
+        mock_proto.SerializePartialToString.return_value = b"serialized"
+        with patch.object(exporter, "_encode_chunks", return_value=[mock_proto]), patch.object(
+            exporter, "_send_request", side_effect=ValueError("invalid header value")
+        ):
+            assert exporter.export([Mock()]) == SpanExportResult.FAILURE
+        assert spool.pending_bytes() == 0
+
+        # A spooled payload that fails deterministically is dropped rather than kept for replay
+        spool.append(b"serialized")
+        with patch.object(exporter, "_send_request", side_effect=ValueError("invalid header value")):
+            assert spool.replay(exporter._replay_spooled)
+        assert spool.pending_bytes() == 0
+
+        exporter.shutdown()
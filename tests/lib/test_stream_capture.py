@@ -0,0 +1,290 @@
+import json
+import asyncio
+from typing import Any, List, Iterator, Sequence, Generator, AsyncGenerator
+from unittest.mock import patch
+from typing_extensions import override
+
+import pytest
+from opentelemetry import trace, baggage as otel_baggage
+from opentelemetry.sdk.trace import ReadableSpan, TracerProvider
+from opentelemetry.trace.status import StatusCode
+from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult, SimpleSpanProcessor
+
+from gentrace.lib.traced import traced
+from gentrace.lib.constants import (
+    ATTR_GENTRACE_SAMPLE_KEY,
+    ATTR_GENTRACE_STREAM_ABANDONED,
+    ATTR_GENTRACE_STREAM_ITEM_COUNT,
+    ATTR_GENTRACE_FN_OUTPUT_EVENT_NAME,
+    ATTR_GENTRACE_STREAM_ITEMS_PER_SECOND,
+    ATTR_GENTRACE_STREAM_INTER_ITEM_MAX_MS,
+    ATTR_GENTRACE_FN_OUTPUT_ITEM_EVENT_NAME,
+    ATTR_GENTRACE_STREAM_INTER_ITEM_MEAN_MS,
+    ATTR_GENTRACE_STREAM_TIME_TO_FIRST_ITEM_MS,
+)
+from gentrace.lib.interaction import interaction
+from gentrace.lib.stream_capture import TextReducer, BoundedListReducer
+
+
+class CollectingExporter(SpanExporter):
+    def __init__(self) -> None:
+        self.spans: List[ReadableSpan] = []
+
+    @override
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        self.spans.extend(spans)
+        return SpanExportResult.SUCCESS
+
+
+@pytest.fixture
+def collector() -> Iterator[CollectingExporter]:
+    exporter = CollectingExporter()
+    tracer_provider = TracerProvider()
+    tracer_provider.add_span_processor(SimpleSpanProcessor(exporter))
+    with patch("gentrace.lib.traced.trace.get_tracer", return_value=tracer_provider.get_tracer("gentrace")):
+        yield exporter
+
+
+def _output(span: ReadableSpan) -> Any:
+    (event,) = [event for event in span.events if event.name == ATTR_GENTRACE_FN_OUTPUT_EVENT_NAME]
+    return json.loads(str(event.attributes["output"]))  # type: ignore[index]
+
+
+def test_bounded_list_reducer_keeps_first_items() -> None:
+    reducer = BoundedListReducer(max_items=2)
+    for item in range(5):
+        reducer.add(item)
+    assert reducer.result() == [0, 1, "[3 more items]"]
+
+
+def test_text_reducer_concatenates_deltas() -> None:
+    reducer = TextReducer(lambda chunk: chunk["delta"], max_chars=8)
+    for delta in ["Hello", None, ", ", "world"]:
+        reducer.add({"delta": delta})
+    assert reducer.result() == "Hello, w... [4 more characters]"
+    assert reducer.result() == "Hello, w... [4 more characters]"
+
+
+def test_stream_is_recorded_with_latency_attributes(collector: CollectingExporter) -> None:
+    @traced()
+    async def numbers() -> AsyncGenerator[int, None]:
+        for n in range(3):
+            await asyncio.sleep(0.01)
+            yield n
+
+    async def consume() -> List[int]:
+        return [n async for n in numbers()]
+
+    assert asyncio.run(consume()) == [0, 1, 2]
+
+    (span,) = collector.spans
+    assert _output(span) == [0, 1, 2]
+    assert span.attributes is not None
+    assert span.attributes[ATTR_GENTRACE_STREAM_ITEM_COUNT] == 3
+    assert span.attributes[ATTR_GENTRACE_STREAM_TIME_TO_FIRST_ITEM_MS] >= 5  # type: ignore[operator]
+    assert span.attributes[ATTR_GENTRACE_STREAM_INTER_ITEM_MEAN_MS] >= 5  # type: ignore[operator]
+    assert span.attributes[ATTR_GENTRACE_STREAM_INTER_ITEM_MAX_MS] >= 5  # type: ignore[operator]
+    assert ATTR_GENTRACE_STREAM_ABANDONED not in span.attributes
+
+
+def test_reducer_and_item_events(collector: CollectingExporter) -> None:
+    @traced(output_reducer=TextReducer, output_item_events=True)
+    async def completion() -> AsyncGenerator[str, None]:
+        yield "Hel"
+        yield "lo"
+
+    async def consume() -> List[str]:
+        return [chunk async for chunk in completion()]
+
+    asyncio.run(consume())
+
+    (span,) = collector.spans
+    assert _output(span) == "Hello"
+    items = [event.attributes for event in span.events if event.name == ATTR_GENTRACE_FN_OUTPUT_ITEM_EVENT_NAME]
+    assert items == [{"output": '"Hel"'}, {"output": '"lo"'}]
+
+
+def test_item_events_without_reducer_record_no_aggregate(collector: CollectingExporter) -> None:
+    @traced(output_item_events=True)
+    async def numbers() -> AsyncGenerator[int, None]:
+        yield 1
+
+    async def consume() -> List[int]:
+        return [n async for n in numbers()]
+
+    asyncio.run(consume())
+
+    (span,) = collector.spans
+    assert [event.name for event in span.events][1:] == [ATTR_GENTRACE_FN_OUTPUT_ITEM_EVENT_NAME]
+
+
+def test_abandoned_stream_ends_span_and_closes_generator(collector: CollectingExporter) -> None:
+    closed: List[bool] = []
+
+    @traced()
+    async def numbers() -> AsyncGenerator[int, None]:
+        try:
+            for n in range(100):
+                yield n
+        finally:
+            closed.append(True)
+
+    async def consume() -> None:
+        stream = numbers()
+        async for n in stream:
+            if n == 1:
+                break
+        await stream.aclose()  # type: ignore[attr-defined]
+
+    asyncio.run(consume())
+
+    assert closed == [True]
+    (span,) = collector.spans
+    assert span.status.status_code == StatusCode.UNSET
+    assert span.attributes is not None
+    assert span.attributes[ATTR_GENTRACE_STREAM_ABANDONED] is True
+    assert span.attributes[ATTR_GENTRACE_STREAM_ITEM_COUNT] == 2
+    assert _output(span) == [0, 1]
+
+
+def test_generator_error_is_recorded_with_partial_output(collector: CollectingExporter) -> None:
+    @traced()
+    async def failing() -> AsyncGenerator[int, None]:
+        yield 1
+        raise ValueError("boom")
+
+    async def consume() -> List[int]:
+        return [n async for n in failing()]
+
+    with pytest.raises(ValueError):
+        asyncio.run(consume())
+
+    (span,) = collector.spans
+    assert span.status.status_code == StatusCode.ERROR
+    assert span.attributes is not None
+    assert span.attributes["error.type"] == "ValueError"
+    assert _output(span) == [1]
+
+
+def test_span_is_current_only_inside_the_generator(collector: CollectingExporter) -> None:
+    inside: List[bool] = []
+    outside: List[bool] = []
+
+    @traced()
+    async def numbers() -> AsyncGenerator[int, None]:
+        for n in range(2):
+            inside.append(trace.get_current_span().is_recording())
+            yield n
+
+    async def consume() -> None:
+        async for _ in numbers():
+            outside.append(trace.get_current_span().is_recording())
+
+    asyncio.run(consume())
+
+    assert inside == [True, True]
+    assert outside == [False, False]
+    assert len(collector.spans) == 1
+
+
+def test_sync_generator_span_covers_iteration(collector: CollectingExporter) -> None:
+    @traced()
+    def numbers(count: int) -> Generator[int, None, None]:
+        for n in range(count):
+            yield n
+
+    stream = numbers(3)
+    assert collector.spans == []
+    assert list(stream) == [0, 1, 2]
+
+    (span,) = collector.spans
+    assert _output(span) == [0, 1, 2]
+    assert span.attributes is not None
+    assert span.attributes[ATTR_GENTRACE_STREAM_ITEM_COUNT] == 3
+    assert ATTR_GENTRACE_STREAM_TIME_TO_FIRST_ITEM_MS in span.attributes
+    assert span.attributes[ATTR_GENTRACE_STREAM_ITEMS_PER_SECOND] > 0  # type: ignore[operator]
+
+
+def test_sync_generator_forwards_send_and_return_value(collector: CollectingExporter) -> None:
+    @traced()
+    def accumulate() -> Generator[int, int, str]:
+        total = 0
+        while total < 10:
+            total += yield total
+        return f"total={total}"
+
+    def drive() -> Generator[int, int, str]:
+        return (yield from accumulate())
+
+    stream = drive()
+    assert next(stream) == 0
+    assert stream.send(4) == 4
+    with pytest.raises(StopIteration) as stop:
+        stream.send(7)
+
+    assert stop.value.value == "total=11"
+    (span,) = collector.spans
+    assert _output(span) == [0, 4]
+
+
+def test_sync_generator_forwards_thrown_exceptions(collector: CollectingExporter) -> None:
+    @traced()
+    def resilient() -> Generator[str, None, None]:
+        try:
+            yield "first"
+        except KeyError:
+            yield "recovered"
+
+    stream = resilient()
+    assert next(stream) == "first"
+    assert stream.throw(KeyError("x")) == "recovered"
+    assert list(stream) == []
+
+    (span,) = collector.spans
+    assert span.status.status_code == StatusCode.UNSET
+    assert _output(span) == ["first", "recovered"]
+
+
+def test_abandoned_sync_generator_ends_span(collector: CollectingExporter) -> None:
+    @traced()
+    def numbers() -> Generator[int, None, None]:
+        yield from range(100)
+
+    stream = numbers()
+    assert next(stream) == 0
+    stream.close()
+
+    (span,) = collector.spans
+    assert span.status.status_code == StatusCode.UNSET
+    assert span.attributes is not None
+    assert span.attributes[ATTR_GENTRACE_STREAM_ABANDONED] is True
+    assert _output(span) == [0]
+
+
+def test_sync_generator_error_is_recorded(collector: CollectingExporter) -> None:
+    @traced()
+    def failing() -> Generator[int, None, None]:
+        yield 1
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        list(failing())
+
+    (span,) = collector.spans
+    assert span.status.status_code == StatusCode.ERROR
+    assert _output(span) == [1]
+
+
+def test_interaction_sync_generator_is_sampled(collector: CollectingExporter) -> None:
+    seen: List[Any] = []
+
+    @interaction()
+    def numbers() -> Generator[int, None, None]:
+        seen.append(otel_baggage.get_baggage(ATTR_GENTRACE_SAMPLE_KEY))
+        yield 1
+
+    assert list(numbers()) == [1]
+
+    assert seen == ["true"]
+    (span,) = collector.spans
+    assert _output(span) == [1]
@@ -0,0 +1,314 @@
+import threading
+from typing import Any, List, Sequence
+from unittest.mock import Mock, patch
+from typing_extensions import override
+
+import pytest
+from opentelemetry.trace import SpanKind, StatusCode
+from opentelemetry.sdk.trace import ReadableSpan, TracerProvider
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult, SimpleSpanProcessor
+from opentelemetry.proto.trace.v1.trace_pb2 import Span as PB2Span, Status as PB2Status
+from opentelemetry.proto.common.v1.common_pb2 import AnyValue
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import ExportTraceServiceRequest
+
+from gentrace.lib.vendored_otlp_exporter import GentraceVendoredOTLPSpanExporter, _set_any_value
+
+
+class CollectingExporter(SpanExporter):
+    def __init__(self) -> None:
+        self.spans: List[ReadableSpan] = []
+
+    @override
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        self.spans.extend(spans)
+        return SpanExportResult.SUCCESS
+
+
+@pytest.fixture
+def provider_and_spans() -> "tuple[TracerProvider, CollectingExporter]":
+    collector = CollectingExporter()
+    provider = TracerProvider(resource=Resource.create({"service.name": "encoder-test"}))
+    provider.add_span_processor(SimpleSpanProcessor(collector))
+    return provider, collector
+
+
+@pytest.fixture
+def exporter() -> GentraceVendoredOTLPSpanExporter:
+    return GentraceVendoredOTLPSpanExporter(endpoint="http://localhost:4318/v1/traces")
+
+
+def test_encodes_span_fields_attributes_and_events(
+    provider_and_spans: "tuple[TracerProvider, CollectingExporter]", exporter: GentraceVendoredOTLPSpanExporter
+) -> None:
+    provider, collector = provider_and_spans
+    tracer = provider.get_tracer("gentrace", "1.0")
+
+    with tracer.start_as_current_span("parent"):
+        with tracer.start_as_current_span("child", kind=SpanKind.CLIENT) as span:
+            span.set_attribute("str", "value")
+            span.set_attribute("bool", True)
+            span.set_attribute("int", 42)
+            span.set_attribute("float", 0.5)
+            span.set_attribute("list", ["a", "b"])
+            span.set_attribute("empty", [])
+            span.add_event("gentrace.fn.args", {"args": "[]"})
+            span.set_status(StatusCode.ERROR, "boom")
+
+    request = exporter._encode_spans(collector.spans)
+
+    assert len(request.resource_spans) == 1
+    resource_spans = request.resource_spans[0]
+    assert {kv.key: kv.value.string_value for kv in resource_spans.resource.attributes}["service.name"] == (
+        "encoder-test"
+    )
+    assert len(resource_spans.scope_spans) == 1
+    scope_spans = resource_spans.scope_spans[0]
+    assert scope_spans.scope.name == "gentrace"
+    assert scope_spans.scope.version == "1.0"
+
+    child, parent = scope_spans.spans
+    assert child.name == "child"
+    assert child.kind == PB2Span.SpanKind.SPAN_KIND_CLIENT
+    assert child.parent_span_id == parent.span_id
+    assert child.trace_id == parent.trace_id
+    assert child.status.code == PB2Status.StatusCode.STATUS_CODE_ERROR
+    assert child.status.message == "boom"
+
+    attributes = {kv.key: kv.value for kv in child.attributes}
+    assert attributes["str"].string_value == "value"
+    assert attributes["bool"].bool_value is True
+    assert attributes["int"].int_value == 42
+    assert attributes["float"].double_value == 0.5
+    assert [v.string_value for v in attributes["list"].array_value.values] == ["a", "b"]
+    assert attributes["empty"].HasField("array_value")
+
+    assert [event.name for event in child.events] == ["gentrace.fn.args"]
+    assert child.events[0].attributes[0].key == "args"
+    assert child.events[0].attributes[0].value.string_value == "[]"
+
+
+def test_equal_scopes_from_distinct_tracers_share_a_group(
+    provider_and_spans: "tuple[TracerProvider, CollectingExporter]", exporter: GentraceVendoredOTLPSpanExporter
+) -> None:
+    provider, collector = provider_and_spans
+
+    # @traced creates one tracer per decorated function
+    for name in ("first", "second"):
+        with provider.get_tracer("gentrace").start_as_current_span(name):
+            pass
+    with provider.get_tracer("other").start_as_current_span("third"):
+        pass
+
+    request = exporter._encode_spans(collector.spans)
+
+    scope_spans = request.resource_spans[0].scope_spans
+    assert [(s.scope.name, [span.name for span in s.spans]) for s in scope_spans] == [
+        ("gentrace", ["first", "second"]),
+        ("other", ["third"]),
+    ]
+
+
+def test_resource_encoding_is_cached_by_identity(
+    provider_and_spans: "tuple[TracerProvider, CollectingExporter]", exporter: GentraceVendoredOTLPSpanExporter
+) -> None:
+    provider, collector = provider_and_spans
+    with provider.get_tracer("gentrace").start_as_current_span("span"):
+        pass
+
+    first = exporter._encode_spans(collector.spans)
+    assert len(exporter._resource_cache) == 1
+    second = exporter._encode_spans(collector.spans)
+    assert len(exporter._resource_cache) == 1
+
+    assert first.SerializeToString(deterministic=True) == second.SerializeToString(deterministic=True)
+
+
+def test_encode_value_falls_back_for_subclasses_and_unknown_types() -> None:
+    class MyStr(str):
+        pass
+
+    class Custom:
+        def __str__(self) -> str:
+            return "custom"
+
+    def encode(value: Any) -> AnyValue:
+        any_value = AnyValue()
+        _set_any_value(any_value, value)
+        return any_value
+
+    assert encode(MyStr("sub")).string_value == "sub"
+    assert encode(Custom()).string_value == "custom"
+    assert encode(None).WhichOneof("value") is None
+    assert [v.int_value for v in encode((1, 2)).array_value.values] == [1, 2]
+
+
+class TestConcurrentExport:
+    def _exporter(self, workers: int) -> GentraceVendoredOTLPSpanExporter:
+        return GentraceVendoredOTLPSpanExporter(
+            endpoint="http://localhost:4318/v1/traces", max_concurrent_exports=workers, timeout=5
+        )
+
+    def test_batches_are_exported_concurrently_and_force_flush_waits(self) -> None:
+        exporter = self._exporter(3)
+        release = threading.Event()
+        started = threading.Semaphore(0)
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0, "done": 0}
+
+        def slow_export(_data: bytes) -> "tuple[SpanExportResult, bool]":
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            started.release()
+            release.wait(5)
+            with lock:
+                state["active"] -= 1
+                state["done"] += 1
+            return SpanExportResult.SUCCESS, False
+
+        with patch.object(exporter, "_export_serialized", side_effect=slow_export):
+            for _ in range(3):
+                assert exporter.export([]) == SpanExportResult.SUCCESS
+            for _ in range(3):
+                assert started.acquire(timeout=5)
+
+            assert not exporter.force_flush(timeout_millis=50)
+            release.set()
+            assert exporter.force_flush(timeout_millis=5000)
+
+        assert state == {"active": 0, "peak": 3, "done": 3}
+        exporter.shutdown()
+
+    def test_export_blocks_when_all_workers_are_busy(self) -> None:
+        exporter = self._exporter(2)
+        release = threading.Event()
+
+        def slow_export(_data: bytes) -> "tuple[SpanExportResult, bool]":
+            release.wait(5)
+            return SpanExportResult.SUCCESS, False
+
+        with patch.object(exporter, "_export_serialized", side_effect=slow_export):
+            exporter.export([])
+            exporter.export([])
+
+            third = threading.Thread(target=exporter.export, args=([],))
+            third.start()
+            third.join(0.1)
+            assert third.is_alive()
+
+            release.set()
+            third.join(5)
+            assert not third.is_alive()
+            assert exporter.force_flush()
+        exporter.shutdown()
+
+    def test_shutdown_aborts_backoff_of_in_flight_exports(self) -> None:
+        exporter = GentraceVendoredOTLPSpanExporter(
+            endpoint="http://localhost:4318/v1/traces", max_concurrent_exports=2, timeout=0.2
+        )
+        unavailable = Mock(ok=False, status_code=503, reason="Service Unavailable", text="")
+
+        with patch.object(exporter, "_send_request", return_value=unavailable), patch(
+            "gentrace.lib.vendored_otlp_exporter.random.uniform", return_value=0.05
+        ):
+            exporter.export([])
+            exporter.shutdown()
+
+        assert exporter.force_flush()
+
+    def test_invalid_worker_count_is_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            self._exporter(0)
+
+
+class TestRequestSplitting:
+    def _build_spans(
+        self, provider_and_spans: "tuple[TracerProvider, CollectingExporter]", count: int
+    ) -> List[ReadableSpan]:
+        provider, collector = provider_and_spans
+        for i in range(count):
+            tracer = provider.get_tracer("gentrace" if i % 2 else "other")
+            with tracer.start_as_current_span(f"span-{i}") as span:
+                span.set_attribute("gentrace.fn.output", "x" * 1000)
+        return collector.spans
+
+    def test_oversized_request_is_split_under_the_cap(
+        self,
+        provider_and_spans: "tuple[TracerProvider, CollectingExporter]",
+        exporter: GentraceVendoredOTLPSpanExporter,
+    ) -> None:
+        spans = self._build_spans(provider_and_spans, 20)
+        request = exporter._encode_spans(spans)
+
+        chunks = exporter._encode_chunks(spans, 4000)
+
+        assert len(chunks) > 1
+        assert all(chunk.ByteSize() <= 4000 for chunk in chunks)
+        names = [
+            span.name
+            for chunk in chunks
+            for resource_spans in chunk.resource_spans
+            for scope_spans in resource_spans.scope_spans
+            for span in scope_spans.spans
+        ]
+        assert sorted(names) == sorted(span.name for span in spans)
+        for chunk in chunks:
+            resource_spans = chunk.resource_spans[0]
+            assert resource_spans.resource == request.resource_spans[0].resource
+            assert all(scope_spans.scope.name in ("gentrace", "other") for scope_spans in resource_spans.scope_spans)
+
+    def test_span_larger_than_the_cap_is_sent_alone(
+        self,
+        provider_and_spans: "tuple[TracerProvider, CollectingExporter]",
+        exporter: GentraceVendoredOTLPSpanExporter,
+    ) -> None:
+        spans = self._build_spans(provider_and_spans, 3)
+
+        chunks = exporter._encode_chunks(spans, 100)
+
+        assert [sum(len(s.spans) for s in chunk.resource_spans[0].scope_spans) for chunk in chunks] == [1, 1, 1]
+
+    def test_groups_opened_for_a_moved_span_are_not_left_empty(
+        self, exporter: GentraceVendoredOTLPSpanExporter
+    ) -> None:
+        spans: List[ReadableSpan] = []
+        for service in ("first", "second", "first"):
+            collector = CollectingExporter()
+            provider = TracerProvider(resource=Resource.create({"service.name": service}))
+            provider.add_span_processor(SimpleSpanProcessor(collector))
+            with provider.get_tracer(service).start_as_current_span(f"span-{len(spans)}") as span:
+                span.set_attribute("gentrace.fn.output", "x" * 1000)
+            spans.extend(collector.spans)
+
+        chunks = exporter._encode_chunks(spans, 2500)
+
+        assert len(chunks) > 1
+        assert all(chunk.ByteSize() <= 2500 for chunk in chunks)
+        for chunk in chunks:
+            assert all(scope_spans.spans for r in chunk.resource_spans for scope_spans in r.scope_spans)
+        assert sum(len(s.spans) for chunk in chunks for r in chunk.resource_spans for s in r.scope_spans) == 3
+
+    def test_export_sends_every_chunk(self, provider_and_spans: "tuple[TracerProvider, CollectingExporter]") -> None:
+        spans = self._build_spans(provider_and_spans, 20)
+        exporter = GentraceVendoredOTLPSpanExporter(endpoint="http://localhost:4318/v1/traces", max_request_bytes=4000)
+        sent: List[bytes] = []
+        lock = threading.Lock()
+
+        def record(data: bytes) -> "tuple[SpanExportResult, bool]":
+            with lock:
+                sent.append(data)
+            return SpanExportResult.SUCCESS, False
+
+        with patch.object(exporter, "_export_serialized", side_effect=record):
+            assert exporter.export(spans) == SpanExportResult.SUCCESS
+        exporter.shutdown()
+
+        assert len(sent) > 1
+        assert all(len(payload) <= 4000 for payload in sent)
+        spans_sent = 0
+        for payload in sent:
+            request = ExportTraceServiceRequest()
+            request.ParseFromString(payload)
+            spans_sent += sum(len(s.spans) for r in request.resource_spans for s in r.scope_spans)
+        assert spans_sent == 20
@@ -1,11 +1,19 @@
+import asyncio
+import inspect
 import unittest
-from typing import Tuple
+from typing import List, Tuple, AsyncGenerator
 from unittest.mock import MagicMock, patch
 
+from opentelemetry import baggage as otel_baggage, context as otel_context
 from opentelemetry.trace.status import Status, StatusCode
 
 from gentrace.lib.traced import traced
-from gentrace.lib.constants import ATTR_GENTRACE_FN_ARGS_EVENT_NAME, ATTR_GENTRACE_FN_OUTPUT_EVENT_NAME
+from gentrace.lib.sampler import GentraceSampler
+from gentrace.lib.constants import (
+    ATTR_GENTRACE_SAMPLE_KEY,
+    ATTR_GENTRACE_FN_ARGS_EVENT_NAME,
+    ATTR_GENTRACE_FN_OUTPUT_EVENT_NAME,
+)
 
 
 class TestTraced(unittest.TestCase):
@@ -125,6 +133,118 @@ class TestTraced(unittest.TestCase):
         func_no_attrs()
         mock_span.set_attributes.assert_not_called()
 
+    @patch("gentrace.lib.traced.trace.get_tracer")
+    def test_traced_records_keyword_and_variadic_arguments(self, mock_get_tracer: MagicMock) -> None:
+        mock_span, mock_tracer = self.common_test_setup()
+        mock_get_tracer.return_value = mock_tracer
+
+        @traced()
+        def func(a: int, *rest: int, flag: bool = False, **extra: str) -> None:
+            pass
+
+        with patch("gentrace.lib.argument_binding.inspect.signature", wraps=inspect.signature) as mock_signature:
+            func(1, 2, 3, flag=True, note="x")
+            func(4)
+
+        mock_signature.assert_not_called()
+        mock_span.add_event.assert_any_call(
+            ATTR_GENTRACE_FN_ARGS_EVENT_NAME,
+            {"args": '[{"a": 1}, {"rest": [2, 3]}, {"flag": true}, {"extra": {"note": "x"}}]'},
+        )
+        mock_span.add_event.assert_any_call(ATTR_GENTRACE_FN_ARGS_EVENT_NAME, {"args": '[{"a": 4}]'})
+
+    @patch("gentrace.lib.traced.trace.get_tracer")
+    def test_traced_invalid_call_raises_type_error(self, mock_get_tracer: MagicMock) -> None:
+        mock_span, mock_tracer = self.common_test_setup()
+        mock_get_tracer.return_value = mock_tracer
+
+        @traced()
+        def func(a: int) -> int:
+            return a
+
+        with self.assertRaises(TypeError):
+            func(1, a=2)  # type: ignore[misc]
+
+        mock_span.set_attribute.assert_called_once_with("error.type", "TypeError")
+
+
+class TestTracedUnsampled(unittest.TestCase):
+    def setUp(self) -> None:
+        self.mock_span = MagicMock()
+        self.mock_tracer = MagicMock()
+        self.mock_tracer.start_as_current_span.return_value.__enter__.return_value = self.mock_span
+        get_tracer = patch("gentrace.lib.traced.trace.get_tracer", return_value=self.mock_tracer)
+        get_tracer.start()
+        self.addCleanup(get_tracer.stop)
+
+    def _use_gentrace_sampler(self) -> None:
+        provider = patch(
+            "gentrace.lib.traced.trace.get_tracer_provider", return_value=MagicMock(sampler=GentraceSampler())
+        )
+        provider.start()
+        self.addCleanup(provider.stop)
+
+    def test_span_dropped_by_gentrace_sampler_is_not_started(self) -> None:
+        self._use_gentrace_sampler()
+
+        @traced()
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        @traced()
+        async def add_async(a: int, b: int) -> int:
+            return a + b
+
+        @traced()
+        async def numbers() -> AsyncGenerator[int, None]:
+            yield 1
+            yield 2
+
+        async def collect() -> List[int]:
+            return [n async for n in numbers()]
+
+        with patch("gentrace.lib.traced.record_arguments_event") as mock_record:
+            self.assertEqual(add(2, 3), 5)
+            self.assertEqual(asyncio.run(add_async(2, 3)), 5)
+            self.assertEqual(asyncio.run(collect()), [1, 2])
+
+        self.mock_tracer.start_as_current_span.assert_not_called()
+        mock_record.assert_not_called()
+
+    def test_sampled_baggage_starts_the_span(self) -> None:
+        self._use_gentrace_sampler()
+
+        @traced()
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        token = otel_context.attach(otel_baggage.set_baggage(ATTR_GENTRACE_SAMPLE_KEY, "true"))
+        try:
+            add(2, 3)
+        finally:
+            otel_context.detach(token)
+
+        self.mock_tracer.start_as_current_span.assert_called_once_with("add")
+        self.mock_span.add_event.assert_any_call(ATTR_GENTRACE_FN_ARGS_EVENT_NAME, {"args": '[{"a": 2}, {"b": 3}]'})
+
+    def test_non_recording_span_skips_capture(self) -> None:
+        self.mock_span.is_recording.return_value = False
+
+        @traced()
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        @traced()
+        async def add_async(a: int, b: int) -> int:
+            return a + b
+
+        self.assertEqual(add(2, 3), 5)
+        self.assertEqual(asyncio.run(add_async(2, 3)), 5)
+
+        self.assertEqual(self.mock_tracer.start_as_current_span.call_count, 2)
+        self.mock_span.add_event.assert_not_called()
+        self.mock_span.set_attributes.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main()